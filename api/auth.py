@@ -6,6 +6,7 @@ import secrets
 import hashlib
 import base64
 from fastapi import HTTPException, Request, Depends
+from fastapi.requests import HTTPConnection
 from .dependencies import auth_config
 
 def hash_password(password: str) -> str:
@@ -13,8 +14,8 @@ def hash_password(password: str) -> str:
     return hashlib.sha256(password.encode()).hexdigest()
 
 
-def get_current_user(request: Request) -> str:
-    """Get current user with optional authentication"""
+def get_current_user(request: HTTPConnection) -> str:
+    """Get current user with optional authentication (HTTP requests and WebSockets)"""
     if not auth_config.get("enabled", False):
         return "anonymous"
     
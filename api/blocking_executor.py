@@ -0,0 +1,115 @@
+"""
+Blocking Call Executor
+Bounded thread pool for running synchronous JIRA/Confluence/Bitbucket/LLM client calls
+from async ARQ workers without blocking the event loop
+"""
+import asyncio
+import contextvars
+import functools
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Default thread count when the worker does not configure one explicitly
+DEFAULT_MAX_THREADS = 20
+
+# How often (seconds) a cancellable blocking call re-checks the job's cancellation flag
+CANCELLATION_POLL_INTERVAL = 2.0
+
+_executor: Optional[ThreadPoolExecutor] = None
+_max_threads: int = DEFAULT_MAX_THREADS
+
+
+class JobCancelledError(Exception):
+    """Raised when a job is cancelled while waiting on a blocking call."""
+    pass
+
+
+def configure_executor(max_threads: int) -> None:
+    """
+    Set the size of the blocking-call thread pool.
+
+    Must be called before the first blocking call (typically at worker startup).
+    Reconfiguring an already-running pool shuts the old pool down without waiting.
+
+    Args:
+        max_threads: Maximum number of threads used for blocking client calls
+    """
+    global _executor, _max_threads
+    _max_threads = max(1, int(max_threads))
+    if _executor is not None:
+        _executor.shutdown(wait=False)
+        _executor = None
+    logger.info(f"Blocking call executor configured with {_max_threads} threads")
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """Get or create the shared blocking-call thread pool"""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=_max_threads, thread_name_prefix="augment-blocking")
+    return _executor
+
+
+def shutdown_executor(wait: bool = False) -> None:
+    """Shut down the blocking-call thread pool (worker shutdown)"""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=wait)
+        _executor = None
+        logger.info("Blocking call executor shut down")
+
+
+async def run_blocking(func: Callable[..., Any], *args: Any,
+                       cancel_check: Optional[Callable[[], Awaitable[bool]]] = None,
+                       **kwargs: Any) -> Any:
+    """
+    Run a synchronous callable on the bounded thread pool and await its result.
+
+    The event loop stays free while the call runs, so other jobs on the same
+    worker keep making progress and can check their own cancellation flags.
+
+    Args:
+        func: Synchronous callable (e.g. jira_client.get_ticket)
+        *args: Positional arguments for func
+        cancel_check: Optional coroutine factory returning True when the job was cancelled
+                      (e.g. lambda: check_cancellation(job_id, job)). It is polled while the
+                      call is in flight; on cancellation we stop waiting and raise JobCancelledError.
+                      The thread itself cannot be interrupted and finishes in the background,
+                      so only pass cancel_check for calls that are safe to abandon (no JIRA writes).
+        **kwargs: Keyword arguments for func
+
+    Returns:
+        Whatever func returns
+
+    Raises:
+        JobCancelledError: If cancel_check reported cancellation before func finished
+    """
+    loop = asyncio.get_running_loop()
+    # Preserve contextvars (request-scoped logging context etc.) inside the thread
+    ctx = contextvars.copy_context()
+    call = functools.partial(ctx.run, func, *args, **kwargs)
+    future = loop.run_in_executor(get_executor(), call)
+
+    if cancel_check is None:
+        return await future
+
+    while True:
+        done, _ = await asyncio.wait({future}, timeout=CANCELLATION_POLL_INTERVAL)
+        if done:
+            return future.result()
+        if await cancel_check():
+            # Consume the eventual result so an abandoned failure is logged, not reported as unretrieved
+            future.add_done_callback(_log_abandoned_result)
+            raise JobCancelledError(f"Job cancelled while waiting on {getattr(func, '__name__', 'blocking call')}")
+
+
+def _log_abandoned_result(future: "asyncio.Future") -> None:
+    """Done-callback for blocking calls abandoned after cancellation"""
+    if future.cancelled():
+        return
+    error = future.exception()
+    if error is not None:
+        logger.debug(f"Abandoned blocking call finished with error after cancellation: {error}")
@@ -3,13 +3,21 @@ Shared Dependencies
 Global clients and configuration shared across all routes
 """
 from datetime import timedelta
-from typing import Optional, Any
+from typing import Optional, Any, Dict, List
 from src.config import Config
 from src.jira_client import JiraClient
 from src.bitbucket_client import BitbucketClient
 from src.confluence_client import ConfluenceClient
 from src.llm_client import LLMClient
 from src.generator import DescriptionGenerator
+from src.backend_limiter import BackendLimiter
+from src.llm_cache import configure_llm_cache
+from src.jira_issue_cache import configure_jira_issue_cache
+from src.stage_timings import configure_stage_timings
+from src.llm_rate_limiter import configure_llm_rate_limiter
+from src.llm_registry import configure_llm_registry
+from .job_store import JobStore, configure_job_store
+from .ticket_registry import TicketRegistry, configure_ticket_registry
 import logging
 
 logger = logging.getLogger(__name__)
@@ -23,12 +31,13 @@ generator: Optional[DescriptionGenerator] = None
 config: Optional[Config] = None
 _sandbox_client: Optional[Any] = None
 
-# In-memory storage for job tracking
-jobs: dict = {}
+# Job tracking (job_id -> JobStatus); shared through Redis once initialize_services() configures it
+jobs: JobStore = JobStore()
 
-# Ticket-to-job mapping for active jobs (ticket_key -> job_id)
+# Ticket-to-job mapping for active jobs (ticket_key -> job_id); claims are shared through Redis
+# with lease TTLs once initialize_services() configures it
 # Only tracks jobs with status "started" or "processing"
-ticket_jobs: dict[str, str] = {}
+ticket_jobs: TicketRegistry = TicketRegistry()
 
 # Authentication configuration (will be loaded from config)
 auth_config: dict = {
@@ -142,16 +151,24 @@ def get_sandbox_code_runner() -> Optional[Any]:
     return _sandbox_code_runner
 
 
+def _is_active_job(job_id: str) -> bool:
+    """Whether a job holding a ticket claim is still started or processing"""
+    job = jobs.get(job_id)
+    return job is not None and job.status in ("started", "processing")
+
+
 def get_active_job_for_ticket(ticket_key: str) -> Optional[str]:
     """
     Get active job ID for a ticket key if one exists.
     Returns job_id if ticket is actively being processed (started or processing status).
-    Automatically cleans up stale jobs that have been stuck in "started" status for too long.
+    Automatically cleans up stale jobs that have been stuck in "started" status for too long
+    (with the Redis registry the claim's lease expiry does this instead, since jobs can wait
+    in their class's queue for longer).
     """
-    if ticket_key not in ticket_jobs:
+    job_id = ticket_jobs.get(ticket_key)
+    if job_id is None:
         return None
     
-    job_id = ticket_jobs[ticket_key]
     if job_id in jobs:
         job = jobs[job_id]
         if job.status == "processing":
@@ -159,7 +176,7 @@ def get_active_job_for_ticket(ticket_key: str) -> Optional[str]:
         elif job.status == "started":
             # Check if job has been stuck in "started" for too long (5 minutes)
             from datetime import datetime, timedelta
-            if job.started_at:
+            if job.started_at and not ticket_jobs.shared:
                 elapsed = datetime.now() - job.started_at
                 if elapsed > timedelta(minutes=5):
                     # Job stuck in "started" for too long - likely worker isn't processing it
@@ -168,39 +185,62 @@ def get_active_job_for_ticket(ticket_key: str) -> Optional[str]:
                     job.completed_at = datetime.now()
                     job.error = "Job stuck in started status - worker may not be running"
                     job.progress = {"message": "Job timed out waiting for worker"}
-                    del ticket_jobs[ticket_key]
+                    ticket_jobs.release_many([ticket_key], job_id)
                     return None
             return job_id
         else:
             # Job is no longer active (completed, failed, cancelled), clean up mapping
-            del ticket_jobs[ticket_key]
+            ticket_jobs.release_many([ticket_key], job_id)
             return None
     
     # Job not found, clean up mapping
-    if ticket_key in ticket_jobs:
-        del ticket_jobs[ticket_key]
+    ticket_jobs.release_many([ticket_key], job_id)
     return None
 
 
-def register_ticket_job(ticket_key: str, job_id: str):
+def register_ticket_job(ticket_key: str, job_id: str) -> Optional[str]:
     """
     Register a ticket key to job ID mapping for active job tracking.
     Should be called when creating a new job for a ticket.
+    
+    Returns:
+        The other active job already holding the ticket (then the ticket is not registered), or None
+    """
+    holder = ticket_jobs.claim(ticket_key, job_id, _is_active_job)
+    if holder:
+        logger.warning(f"Ticket {ticket_key} is already claimed by active job {holder}; not registered for job {job_id}")
+    else:
+        logger.debug(f"Registered ticket {ticket_key} -> job {job_id}")
+    return holder
+
+
+def claim_ticket_jobs(ticket_keys: List[str], job_id: str) -> Dict[str, str]:
     """
-    ticket_jobs[ticket_key] = job_id
-    logger.debug(f"Registered ticket {ticket_key} -> job {job_id}")
+    Register many ticket keys for a job at once (one Redis round trip for batch jobs).
+    
+    Returns:
+        ticket_key -> other active job for tickets that were not registered
+    """
+    conflicts = ticket_jobs.claim_many(ticket_keys, job_id, _is_active_job)
+    logger.debug(f"Registered {len(set(ticket_keys)) - len(conflicts)} tickets for job {job_id} ({len(conflicts)} held by other jobs)")
+    return conflicts
 
 
-def unregister_ticket_job(ticket_key: str):
+def unregister_ticket_job(ticket_key: str, job_id: Optional[str] = None):
     """
     Unregister a ticket key from active job tracking.
     Should be called when job completes, fails, or is cancelled.
+    With job_id, only removes the mapping if that job holds it.
     """
-    if ticket_key in ticket_jobs:
-        del ticket_jobs[ticket_key]
+    if ticket_jobs.release_many([ticket_key], job_id):
         logger.debug(f"Unregistered ticket {ticket_key}")
 
 
+def release_ticket_jobs(job_id: str, ticket_keys: Optional[List[str]] = None) -> int:
+    """Unregister the ticket keys a job holds (default: all of them) in one round trip"""
+    return ticket_jobs.release_many(ticket_keys, job_id)
+
+
 def get_job_by_ticket_key(ticket_key: str) -> Optional[dict]:
     """
     Get current job status for a ticket key.
@@ -213,18 +253,12 @@ def get_job_by_ticket_key(ticket_key: str) -> Optional[dict]:
         job = jobs[active_job_id]
         return job.dict()
     
-    # Search all jobs for latest job with this ticket_key
-    matching_jobs = []
-    for job_id, job in jobs.items():
-        if job.ticket_key == ticket_key or (job.ticket_keys and ticket_key in job.ticket_keys):
-            matching_jobs.append(job)
-    
+    # Most recent job (by started_at) with this ticket_key, from the ticket index
+    matching_jobs, _ = jobs.query(ticket_key=ticket_key, limit=1)
     if not matching_jobs:
         return None
     
-    # Return most recent job (by started_at)
-    latest_job = max(matching_jobs, key=lambda j: j.started_at)
-    return latest_job.dict()
+    return matching_jobs[0].dict()
 
 
 def initialize_services():
@@ -287,7 +321,17 @@ def initialize_services():
             api_token=config.confluence.get('api_token', '')
         )
         
-        llm_client = LLMClient(config.get_llm_config())
+        configure_job_store(jobs, config.get_job_store_config(), config._config.get('redis', {}))
+        configure_ticket_registry(ticket_jobs, config.get_ticket_registry_config(), jobs.redis)
+        configure_stage_timings(config.get_stage_timing_config(), jobs.redis)
+        configure_llm_cache(config.get_llm_cache_config(), config._config.get('redis', {}))
+        configure_jira_issue_cache(config.get_jira_cache_config(), config._config.get('redis', {}))
+        configure_llm_rate_limiter(config.get_llm_rate_limit_config(), config._config.get('redis', {}))
+        llm_registry = configure_llm_registry(
+            idle_seconds=int(config.llm.get('client_pool_idle_seconds') or 900),
+            max_providers=int(config.llm.get('client_pool_max') or 32)
+        )
+        llm_client = llm_registry.get_client(config.get_llm_config())
         
         generator = DescriptionGenerator(
             jira_client=jira_client,
@@ -297,7 +341,8 @@ def initialize_services():
             prompt_template=config.prompts.get('description_template'),
             include_code_analysis=True,
             story_description_max_length=config.processing.get('story_description_max_length', 300),
-            story_description_summary_threshold=config.processing.get('story_description_summary_threshold', 500)
+            story_description_summary_threshold=config.processing.get('story_description_summary_threshold', 500),
+            backend_limiter=BackendLimiter.from_config(config.processing)
         )
         
         logger.info("All services initialized successfully")
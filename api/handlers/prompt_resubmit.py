@@ -17,7 +17,8 @@ async def _handle_generate_single_resubmit(
     modified_user_prompt: str,
     llm_provider: Optional[str],
     llm_model: Optional[str],
-    original_result: Optional[Dict[str, Any]]
+    original_result: Optional[Dict[str, Any]],
+    refresh_cache: bool = False
 ) -> Dict[str, Any]:
     """Handle resubmission for /generate/single operation"""
     generator = get_generator()
@@ -45,7 +46,8 @@ async def _handle_generate_single_resubmit(
         # Generate description using the modified prompt
         description_text = custom_llm_client.generate_content(
             prompt=modified_user_prompt,
-            system_prompt=modified_system_prompt
+            system_prompt=modified_system_prompt,
+            refresh_cache=refresh_cache
         )
         
         new_result = {
@@ -70,7 +72,8 @@ async def _handle_plan_tasks_resubmit(
     modified_user_prompt: str,
     llm_provider: Optional[str],
     llm_model: Optional[str],
-    original_result: Optional[Dict[str, Any]]
+    original_result: Optional[Dict[str, Any]],
+    refresh_cache: bool = False
 ) -> Dict[str, Any]:
     """Handle resubmission for /plan/tasks/generate operation"""
     try:
@@ -97,7 +100,8 @@ async def _handle_coverage_analysis_resubmit(
     modified_user_prompt: str,
     llm_provider: Optional[str],
     llm_model: Optional[str],
-    original_result: Optional[Dict[str, Any]]
+    original_result: Optional[Dict[str, Any]],
+    refresh_cache: bool = False
 ) -> Dict[str, Any]:
     """Handle resubmission for /analyze/story-coverage operation"""
     try:
@@ -119,7 +123,8 @@ async def _handle_coverage_analysis_resubmit(
         response_text = custom_llm_client.generate_content_json(
             prompt=modified_user_prompt,
             system_prompt=modified_system_prompt,
-            max_tokens=None
+            max_tokens=None,
+            refresh_cache=refresh_cache
         )
         
         # Parse JSON response (should already be valid JSON from generate_content_json)
@@ -0,0 +1,198 @@
+"""
+Job Events
+Real-time job progress fan-out for the /jobs/{job_id}/events (SSE) and WebSocket endpoints.
+
+The job store publishes one event per written change to a job's progress-related fields:
+to the Redis channel `jobs:events:{job_id}` when shared, or to in-process listeners
+otherwise. Each API process holds a single pattern subscription and fans events out to
+its local subscribers. Event ids are the job's store version, so a client reconnecting
+with a last-event-id gets a snapshot only if it missed something.
+"""
+import asyncio
+import json
+import logging
+import threading
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional, Set, Tuple
+
+from .blocking_executor import run_blocking
+
+logger = logging.getLogger(__name__)
+
+EVENT_CHANNEL_PREFIX = "jobs:events:"
+# JobStatus fields whose changes are streamed to subscribers
+EVENT_FIELDS = {"status", "progress", "stage", "processed_tickets", "successful_tickets",
+                "failed_tickets", "error", "completed_at"}
+TERMINAL_STATUSES = {"completed", "failed", "cancelled"}
+HEARTBEAT_SECONDS = 15.0
+
+
+def event_channel(job_id: str) -> str:
+    return f"{EVENT_CHANNEL_PREFIX}{job_id}"
+
+
+def job_event(job: Any, event_id: int) -> Dict[str, Any]:
+    """Progress event payload for the current state of a JobStatus"""
+    return {
+        "id": event_id,
+        "job_id": job.job_id,
+        "status": job.status,
+        "stage": job.stage,
+        "progress": job.progress,
+        "processed_tickets": job.processed_tickets,
+        "successful_tickets": job.successful_tickets,
+        "failed_tickets": job.failed_tickets,
+        "error": job.error,
+        "completed_at": job.completed_at.isoformat() if job.completed_at else None,
+    }
+
+
+class JobEventHub:
+    """Per-process fan-out of job events to SSE/WebSocket subscribers"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers: Dict[str, Set[Tuple[asyncio.AbstractEventLoop, asyncio.Queue]]] = {}
+        self._store = None
+        self._redis = None
+        self._reader: Optional[asyncio.Task] = None
+
+    async def start(self, store: Any, redis_config: Optional[Dict[str, Any]] = None) -> None:
+        """Listen for events from the job store's backend"""
+        self._store = store
+        if not store.shared:
+            store.add_listener(self.dispatch)
+            return
+        try:
+            import redis.asyncio as aioredis
+            redis_config = redis_config or {}
+            self._redis = aioredis.Redis(
+                host=redis_config.get('host', 'localhost'),
+                port=int(redis_config.get('port', 6379)),
+                password=redis_config.get('password') or None,
+                db=int(redis_config.get('database', 0)),
+                socket_connect_timeout=2,
+            )
+            self._reader = asyncio.create_task(self._read_loop())
+        except Exception as e:
+            logger.warning(f"Job event subscription unavailable, streams fall back to polling the job store: {e}")
+
+    async def stop(self) -> None:
+        if self._store is not None and not self._store.shared:
+            self._store.remove_listener(self.dispatch)
+        if self._reader is not None:
+            self._reader.cancel()
+            try:
+                await self._reader
+            except asyncio.CancelledError:
+                pass
+            self._reader = None
+        if self._redis is not None:
+            await self._redis.close()
+            self._redis = None
+
+    async def _read_loop(self) -> None:
+        backoff = 1.0
+        while True:
+            pubsub = self._redis.pubsub()
+            try:
+                await pubsub.psubscribe(f"{EVENT_CHANNEL_PREFIX}*")
+                backoff = 1.0
+                async for message in pubsub.listen():
+                    if message.get("type") != "pmessage":
+                        continue
+                    channel = message["channel"]
+                    channel = channel.decode("utf-8") if isinstance(channel, bytes) else channel
+                    try:
+                        self.dispatch(channel[len(EVENT_CHANNEL_PREFIX):], json.loads(message["data"]))
+                    except ValueError:
+                        logger.debug(f"Ignoring malformed job event on {channel}")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Job event subscription lost, reconnecting in {backoff:.0f}s: {e}")
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, 30.0)
+            finally:
+                try:
+                    await pubsub.aclose()
+                except Exception:
+                    pass
+
+    def dispatch(self, job_id: str, event: Dict[str, Any]) -> None:
+        """Deliver an event to this process's subscribers of a job (callable from any thread)"""
+        with self._lock:
+            targets = list(self._subscribers.get(job_id, ()))
+        for loop, queue in targets:
+            try:
+                loop.call_soon_threadsafe(queue.put_nowait, event)
+            except RuntimeError:
+                pass  # subscriber's loop already closed
+
+    @asynccontextmanager
+    async def subscribe(self, job_id: str) -> AsyncIterator[asyncio.Queue]:
+        entry = (asyncio.get_running_loop(), asyncio.Queue())
+        with self._lock:
+            self._subscribers.setdefault(job_id, set()).add(entry)
+        try:
+            yield entry[1]
+        finally:
+            with self._lock:
+                subscribers = self._subscribers.get(job_id)
+                if subscribers is not None:
+                    subscribers.discard(entry)
+                    if not subscribers:
+                        del self._subscribers[job_id]
+
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return sum(len(subscribers) for subscribers in self._subscribers.values())
+
+    def _snapshot(self, store: Any, job_id: str) -> Optional[Dict[str, Any]]:
+        job = store.get(job_id)
+        return job_event(job, store.version(job_id)) if job is not None else None
+
+    async def events(self, store: Any, job_id: str, last_event_id: Optional[int] = None,
+                     heartbeat: float = HEARTBEAT_SECONDS) -> AsyncIterator[Optional[Dict[str, Any]]]:
+        """
+        Events for one job until it reaches a terminal status.
+
+        Starts with a snapshot of the current state unless last_event_id is already current,
+        then yields each published change. Yields None every `heartbeat` seconds without
+        events (for keep-alives); a missed publish is caught up from the store at that point.
+        Ends once the job is no longer in the store (deleted or expired).
+        """
+        last = last_event_id if last_event_id is not None else -1
+        async with self.subscribe(job_id) as queue:
+            snapshot = await run_blocking(self._snapshot, store, job_id)
+            if snapshot is None:
+                return
+            if snapshot["id"] > last:
+                last = snapshot["id"]
+                yield snapshot
+            if snapshot["status"] in TERMINAL_STATUSES:
+                return
+            while True:
+                try:
+                    event = await asyncio.wait_for(queue.get(), heartbeat)
+                except asyncio.TimeoutError:
+                    event = await run_blocking(self._snapshot, store, job_id)
+                    if event is None:
+                        return
+                    if event["id"] <= last:
+                        yield None
+                        continue
+                if event["id"] <= last:
+                    continue
+                last = event["id"]
+                yield event
+                if event["status"] in TERMINAL_STATUSES:
+                    return
+
+
+_hub = JobEventHub()
+
+
+def get_job_event_hub() -> JobEventHub:
+    """Process-wide job event hub"""
+    return _hub
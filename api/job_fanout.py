@@ -0,0 +1,175 @@
+"""
+Job Fan-out
+Split a batch job into child ARQ jobs that any worker can pick up.
+
+The parent job records how many children it started, enqueues them and returns. Each child
+records its result under the parent with one atomic script call, which also bumps the
+parent's done/succeeded/failed counters. A result is recorded at most once per child, so a
+retried child cannot double count. The child whose result completes the set sees
+`finished=True` and aggregates the results into the parent's JobStatus. All keys expire
+with the job store's retention.
+
+Every start_fanout begins a new run with its own child job ids: ARQ keeps a finished child's
+job and result keys for keep_result, and a resumed parent re-submitting a child under an id
+that still has them would see the child silently dropped.
+"""
+import json
+import logging
+import uuid
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from .blocking_executor import run_blocking
+from .job_queue import get_redis_pool, is_job_cancelled
+
+logger = logging.getLogger(__name__)
+
+FANOUT_KEY_PREFIX = "job:fanout:"
+FANOUT_TTL = 86400 * 7  # 7 days, same retention as the job store
+
+# KEYS[1] = state hash, KEYS[2] = results hash
+# ARGV = child index, result JSON, counter to bump (succeeded/failed), ttl seconds
+_RECORD_SCRIPT = """
+local recorded = redis.call('HSETNX', KEYS[2], ARGV[1], ARGV[2])
+if recorded == 1 then
+  redis.call('HINCRBY', KEYS[1], 'done', 1)
+  redis.call('HINCRBY', KEYS[1], ARGV[3], 1)
+  redis.call('EXPIRE', KEYS[2], ARGV[4])
+end
+local state = redis.call('HMGET', KEYS[1], 'done', 'total', 'succeeded', 'failed')
+return {recorded, tonumber(state[1] or 0), tonumber(state[2] or 0), tonumber(state[3] or 0), tonumber(state[4] or 0)}
+"""
+
+
+@dataclass
+class FanoutProgress:
+    """Parent counters after a child recorded its result"""
+    done: int
+    total: int
+    succeeded: int
+    failed: int
+    finished: bool = False  # True only for the call whose result completed the set
+
+
+def _decode(value: Any) -> Any:
+    return value.decode("utf-8") if isinstance(value, bytes) else value
+
+
+def _state_key(parent_job_id: str) -> str:
+    return f"{FANOUT_KEY_PREFIX}{parent_job_id}"
+
+
+def _results_key(parent_job_id: str) -> str:
+    return f"{FANOUT_KEY_PREFIX}{parent_job_id}:results"
+
+
+def _children_key(parent_job_id: str) -> str:
+    return f"{FANOUT_KEY_PREFIX}{parent_job_id}:children"
+
+
+def is_child_job_id(arq_job_id: str) -> bool:
+    return ":child:" in arq_job_id
+
+
+def child_job_id(parent_job_id: str, run_id: str, index: int) -> str:
+    """ARQ job id of a child: fixed within a fan-out run, so re-enqueueing the same child is a no-op"""
+    return f"{parent_job_id}:child:{run_id}:{index}"
+
+
+async def start_fanout(parent_job_id: str, total: int, plan: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Reset the parent's counters before any child (or pre-recorded result) is added.
+
+    Args:
+        parent_job_id: The parent job's ID
+        total: Number of results that complete the parent
+        plan: Optional JSON-serialisable data the finishing child needs to aggregate
+
+    Returns:
+        The new run's id (part of every child job id)
+    """
+    pool = await get_redis_pool()
+    run_id = uuid.uuid4().hex[:8]
+    state = {"total": total, "done": 0, "succeeded": 0, "failed": 0, "run": run_id}
+    if plan is not None:
+        state["plan"] = json.dumps(plan, default=str)
+    pipe = pool.pipeline(transaction=True)
+    pipe.delete(_state_key(parent_job_id), _results_key(parent_job_id), _children_key(parent_job_id))
+    pipe.hset(_state_key(parent_job_id), mapping=state)
+    pipe.expire(_state_key(parent_job_id), FANOUT_TTL)
+    await pipe.execute()
+    return run_id
+
+
+async def enqueue_children(parent_job_id: str, function_name: str, children: List[Tuple[int, tuple]]) -> int:
+    """
+    Enqueue child jobs of the current run (see start_fanout); each gets (parent_job_id, index, *args).
+
+    Returns:
+        Number of children enqueued
+    """
+    from .job_scheduler import get_job_owner, submit_job
+    pool = await get_redis_pool()
+    run_id = _decode(await pool.hget(_state_key(parent_job_id), "run"))
+    if run_id is None:
+        raise RuntimeError(f"Job {parent_job_id}: enqueue_children called before start_fanout")
+    owner = await get_job_owner(parent_job_id)  # children share the parent's fair share, not its per-user cap
+    child_ids = []
+    for index, args in children:
+        job_id = child_job_id(parent_job_id, run_id, index)
+        await submit_job(function_name, parent_job_id, index, *args, _job_id=job_id, _user=owner,
+                         _per_user_cap=False)
+        child_ids.append(job_id)
+    if child_ids:
+        await pool.sadd(_children_key(parent_job_id), *child_ids)
+        await pool.expire(_children_key(parent_job_id), FANOUT_TTL)
+    logger.info(f"Job {parent_job_id}: fanned out {len(child_ids)} child jobs ({function_name})")
+    return len(child_ids)
+
+
+async def record_child_result(parent_job_id: str, index: int, result: Dict[str, Any], success: bool) -> FanoutProgress:
+    """Record one child's result and return the parent's counters"""
+    pool = await get_redis_pool()
+    recorded, done, total, succeeded, failed = await pool.eval(
+        _RECORD_SCRIPT, 2, _state_key(parent_job_id), _results_key(parent_job_id),
+        str(index), json.dumps(result, default=str), "succeeded" if success else "failed", FANOUT_TTL
+    )
+    return FanoutProgress(done, total, succeeded, failed, finished=bool(recorded) and total > 0 and done == total)
+
+
+async def get_child_results(parent_job_id: str) -> Dict[int, Dict[str, Any]]:
+    """All recorded child results by index"""
+    pool = await get_redis_pool()
+    raw = await pool.hgetall(_results_key(parent_job_id))
+    return {int(index): json.loads(value) for index, value in raw.items()}
+
+
+async def get_fanout_plan(parent_job_id: str) -> Optional[Dict[str, Any]]:
+    pool = await get_redis_pool()
+    plan = await pool.hget(_state_key(parent_job_id), "plan")
+    return json.loads(plan) if plan else None
+
+
+async def get_child_job_ids(parent_job_id: str) -> List[str]:
+    pool = await get_redis_pool()
+    return sorted(_decode(member) for member in await pool.smembers(_children_key(parent_job_id)))
+
+
+async def is_parent_cancelled(parent_job_id: str) -> bool:
+    """
+    Whether the parent was cancelled (the flag is left in place for the other children).
+    Children are not aborted through ARQ: one that never ran would never record its
+    result, so the parent would never finish; instead each checks this and records
+    itself as cancelled.
+    """
+    from .dependencies import jobs
+    if await is_job_cancelled(parent_job_id):
+        return True
+    job = await run_blocking(jobs.get, parent_job_id)
+    return job is not None and job.status == "cancelled"
+
+
+async def clear_fanout(parent_job_id: str) -> None:
+    """Drop the parent's fan-out state once its results are aggregated"""
+    pool = await get_redis_pool()
+    await pool.delete(_state_key(parent_job_id), _results_key(parent_job_id), _children_key(parent_job_id))
@@ -4,9 +4,13 @@ Redis connection pool management for ARQ background jobs
 """
 from arq import create_pool, ArqRedis
 from arq.connections import RedisSettings
-from typing import Optional, Dict, Any
+from datetime import datetime
+from typing import Optional, Dict, Any, List
+import hashlib
+import json
 import os
 import logging
+import zlib
 
 logger = logging.getLogger(__name__)
 
@@ -121,13 +125,43 @@ async def clear_cancellation_flag(job_id: str):
 
 # Job status persistence constants and functions
 JOB_STATUS_KEY_PREFIX = "job:status:"
+JOB_STATUS_RESULTS_SUFFIX = ":results"
+JOB_STATUS_DIGEST_SUFFIX = ":digest"
 JOB_STATUS_TTL = 86400 * 7  # 7 days - job status persists for a week
 
+# KEYS[1] = the results key, KEYS[2] = the digest of the results stored there
+# ARGV = digest of the results to persist, ttl seconds; returns 1 (and refreshes the TTLs)
+# when Redis already holds those results, else 0 and the caller writes them
+_KEEP_RESULTS_SCRIPT = """
+if redis.call('GET', KEYS[2]) == ARGV[1] and redis.call('EXPIRE', KEYS[1], ARGV[2]) == 1 then
+  redis.call('EXPIRE', KEYS[2], ARGV[2])
+  return 1
+end
+return 0
+"""
+
+
+def _json_serializer(obj):
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Type {type(obj)} not serializable")
+
+
+def _unpack_status_value(raw: bytes) -> Any:
+    """Stored values are zlib-compressed JSON (plain JSON from before compression)"""
+    if raw[:1] in (b"{", b"[", "{", "["):
+        return json.loads(raw)
+    return json.loads(zlib.decompress(raw))
+
 
 async def persist_job_status(job_id: str, job_status: dict) -> bool:
     """
     Persist job status to Redis for crash recovery.
     
+    The status header (everything but results) and the results are stored compressed under
+    separate keys; results are only rewritten when they differ from what Redis holds, going
+    by a digest stored next to them (whichever process wrote them).
+    
     Args:
         job_id: The ID of the job
         job_status: Job status dictionary (from JobStatus.dict())
@@ -136,20 +170,24 @@ async def persist_job_status(job_id: str, job_status: dict) -> bool:
         True if persistence succeeded
     """
     try:
-        import json
-        from datetime import datetime
-        
         pool = await get_redis_pool()
         key = f"{JOB_STATUS_KEY_PREFIX}{job_id}"
+        results_key = f"{key}{JOB_STATUS_RESULTS_SUFFIX}"
+        digest_key = f"{results_key}{JOB_STATUS_DIGEST_SUFFIX}"
         
-        # Serialize job status, handling datetime objects
-        def json_serializer(obj):
-            if isinstance(obj, datetime):
-                return obj.isoformat()
-            raise TypeError(f"Type {type(obj)} not serializable")
+        header = {name: value for name, value in job_status.items() if name != "results"}
+        results_json = json.dumps(job_status.get("results"), default=_json_serializer).encode("utf-8")
+        digest = hashlib.blake2b(results_json, digest_size=16).hexdigest()
         
-        status_json = json.dumps(job_status, default=json_serializer)
-        await pool.set(key, status_json, ex=JOB_STATUS_TTL)
+        pipe = pool.pipeline(transaction=False)
+        pipe.set(key, zlib.compress(json.dumps(header, default=_json_serializer).encode("utf-8")), ex=JOB_STATUS_TTL)
+        pipe.eval(_KEEP_RESULTS_SCRIPT, 2, results_key, digest_key, digest, JOB_STATUS_TTL)
+        _, kept = await pipe.execute()
+        if not kept:
+            pipe = pool.pipeline(transaction=False)
+            pipe.set(results_key, zlib.compress(results_json), ex=JOB_STATUS_TTL)
+            pipe.set(digest_key, digest, ex=JOB_STATUS_TTL)
+            await pipe.execute()
         logger.debug(f"Persisted job status for {job_id} to Redis")
         return True
     except Exception as e:
@@ -168,27 +206,16 @@ async def retrieve_job_status(job_id: str) -> Optional[dict]:
         Job status dictionary or None if not found
     """
     try:
-        import json
-        from datetime import datetime
-        
         pool = await get_redis_pool()
         key = f"{JOB_STATUS_KEY_PREFIX}{job_id}"
         
-        status_json = await pool.get(key)
-        if not status_json:
+        status_raw, results_raw = await pool.mget([key, f"{key}{JOB_STATUS_RESULTS_SUFFIX}"])
+        if not status_raw:
             return None
         
-        # Deserialize job status, handling datetime strings
-        def json_deserializer(dct):
-            for key, value in dct.items():
-                if isinstance(value, str) and 'T' in value and ('+' in value or value.endswith('Z')):
-                    try:
-                        dct[key] = datetime.fromisoformat(value.replace('Z', '+00:00'))
-                    except (ValueError, AttributeError):
-                        pass
-            return dct
-        
-        status = json.loads(status_json)
+        status = _unpack_status_value(status_raw)
+        if results_raw:
+            status["results"] = _unpack_status_value(results_raw)
         return status
     except Exception as e:
         logger.warning(f"Failed to retrieve job status for {job_id}: {e}")
@@ -258,3 +285,80 @@ async def clear_sandbox_id(job_id: str) -> None:
     except Exception as e:
         logger.warning(f"Failed to clear sandbox_id for job {job_id}: {e}")
 
+
+
+# Batch job checkpoints (per-item progress, so a retried or resumed job skips finished work)
+JOB_CHECKPOINT_KEY_PREFIX = "job:checkpoint:"
+JOB_CHECKPOINT_TTL = 86400 * 7  # 7 days - same retention as job status
+RESUME_CHECKPOINT_FIELD = "_resume"  # worker function and kwargs used by POST /jobs/{job_id}/resume
+
+
+async def save_job_checkpoint(job_id: str, entries: Dict[str, Any]) -> bool:
+    """
+    Record finished items of a batch job.
+
+    Args:
+        job_id: The job identifier
+        entries: Checkpoint field -> JSON-serialisable value (e.g. "ticket:PROJ-1" -> result)
+
+    Returns:
+        True if the checkpoint was written
+    """
+    if not entries:
+        return True
+    try:
+        import json
+        pool = await get_redis_pool()
+        key = f"{JOB_CHECKPOINT_KEY_PREFIX}{job_id}"
+        pipe = pool.pipeline(transaction=False)
+        pipe.hset(key, mapping={field: json.dumps(value, default=str) for field, value in entries.items()})
+        pipe.expire(key, JOB_CHECKPOINT_TTL)
+        await pipe.execute()
+        return True
+    except Exception as e:
+        logger.warning(f"Failed to save checkpoint for job {job_id}: {e}")
+        return False
+
+
+async def load_job_checkpoint(job_id: str, fields: Optional[List[str]] = None) -> Dict[str, Any]:
+    """
+    Retrieve a batch job's checkpoint.
+
+    Args:
+        job_id: The job identifier
+        fields: Only these checkpoint fields (default: all)
+
+    Returns:
+        Checkpoint field -> value (empty if there is no checkpoint or Redis is unavailable)
+    """
+    try:
+        import json
+        pool = await get_redis_pool()
+        key = f"{JOB_CHECKPOINT_KEY_PREFIX}{job_id}"
+        if fields is None:
+            raw = await pool.hgetall(key)
+        else:
+            raw = dict(zip(fields, await pool.hmget(key, fields))) if fields else {}
+        checkpoint = {}
+        for field, value in raw.items():
+            if value is not None:
+                checkpoint[field.decode("utf-8") if isinstance(field, bytes) else field] = json.loads(value)
+        return checkpoint
+    except Exception as e:
+        logger.warning(f"Failed to load checkpoint for job {job_id}: {e}")
+        return {}
+
+
+async def clear_job_checkpoint(job_id: str) -> None:
+    """
+    Drop a batch job's checkpoint once it has completed.
+
+    Args:
+        job_id: The job identifier
+    """
+    try:
+        pool = await get_redis_pool()
+        await pool.delete(f"{JOB_CHECKPOINT_KEY_PREFIX}{job_id}")
+        logger.debug(f"Cleared checkpoint for job {job_id}")
+    except Exception as e:
+        logger.warning(f"Failed to clear checkpoint for job {job_id}: {e}")
@@ -0,0 +1,442 @@
+"""
+Job Scheduler
+Priority classes and weighted fair dispatch of background jobs across users and job types.
+
+Jobs are split into classes (interactive, bulk, sandbox), each with its own ARQ queue so
+every class can have its own worker pool. A submitted job is not handed to ARQ straight
+away: it waits in a per-user list of its class until a dispatch moves it into the class's
+ARQ queue. Dispatch is stride scheduling over the users with waiting jobs: the user with
+the lowest pass goes next and their pass advances by 1 / (job type weight * user weight),
+so one user's 1000-ticket batch interleaves with everyone else's jobs rather than queueing
+ahead of them. A class never holds more than `dispatch_limit` dispatched (ready or running)
+jobs, and a user never more than `per_user_max` of them. Children of a fanned-out job are
+charged to the parent's user for fair share but exempt from (and not counted against) the
+per-user cap, so one batch can spread across every worker of its class.
+
+Dispatch is one Lua call that also writes the ARQ job (serialized at submit time), so a
+job is either waiting here or in ARQ, never lost between the two. Dispatch runs after a
+submit, after a job ends (worker hook) and periodically in every worker. The worker's
+job-start hook records how long each job waited, which `get_queue_stats` reports with
+queue depth per class.
+"""
+import logging
+import statistics
+import time
+import uuid
+from typing import Any, Dict, List, Optional
+
+from src.metrics import REGISTRY
+
+from .job_queue import get_redis_pool
+
+logger = logging.getLogger(__name__)
+
+JOB_CLASSES = ("interactive", "bulk", "sandbox")
+DEFAULT_JOB_CLASS = "interactive"
+SCHED_KEY_PREFIX = "sched:"
+SCHED_JOB_KEY_PREFIX = f"{SCHED_KEY_PREFIX}job:"
+SCHED_OWNER_KEY_PREFIX = f"{SCHED_KEY_PREFIX}owner:"
+SCHED_TTL = 86400 * 7  # 7 days, same retention as the job store
+WAIT_SAMPLES = 500  # Recent wait times kept per class for stats
+ANONYMOUS_USER = "anonymous"
+
+# Worker function -> job type (JobStatus.job_type); job types pick the class and weight
+FUNCTION_JOB_TYPES = {
+    'process_single_ticket_worker': 'single',
+    'process_batch_tickets_worker': 'batch',
+    'process_batch_ticket_child_worker': 'batch',
+    'process_story_generation_worker': 'story_generation',
+    'process_task_generation_worker': 'task_generation',
+    'process_test_generation_worker': 'test_generation',
+    'process_story_coverage_worker': 'story_coverage',
+    'process_prd_story_sync_worker': 'prd_story_sync',
+    'process_bulk_story_update_worker': 'bulk_story_update',
+    'process_bulk_task_creation_worker': 'bulk_task_creation',
+    'process_bulk_task_creation_child_worker': 'bulk_task_creation',
+    'process_epic_creation_worker': 'epic_creation',
+    'process_story_creation_worker': 'story_creation',
+    'process_task_creation_worker': 'task_creation',
+    'process_sprint_planning_worker': 'sprint_planning',
+    'process_timeline_planning_worker': 'timeline_planning',
+    'process_draft_pr_worker': 'draft_pr',
+}
+
+# Job types outside the interactive class (overridable with scheduling.job_classes)
+DEFAULT_JOB_TYPE_CLASSES = {
+    'batch': 'bulk',
+    'bulk_story_update': 'bulk',
+    'bulk_task_creation': 'bulk',
+    'prd_story_sync': 'bulk',
+    'draft_pr': 'sandbox',
+}
+
+# KEYS[1] = class flows zset, KEYS[2] = class passes hash, KEYS[3] = class virtual time,
+# KEYS[4] = user's pending list, KEYS[5] = job meta hash
+# ARGV = user, job_id, ttl seconds, meta field/value pairs...
+_SUBMIT_SCRIPT = """
+if redis.call('EXISTS', KEYS[5]) == 1 then return 0 end
+redis.call('HSET', KEYS[5], unpack(ARGV, 4))
+redis.call('EXPIRE', KEYS[5], ARGV[3])
+redis.call('RPUSH', KEYS[4], ARGV[2])
+redis.call('EXPIRE', KEYS[4], ARGV[3])
+if not redis.call('ZSCORE', KEYS[1], ARGV[1]) then
+  local pass = tonumber(redis.call('HGET', KEYS[2], ARGV[1]) or 0)
+  local vtime = tonumber(redis.call('GET', KEYS[3]) or 0)
+  if vtime > pass then pass = vtime end
+  redis.call('ZADD', KEYS[1], pass, ARGV[1])
+end
+return 1
+"""
+
+# KEYS[1] = class flows zset, KEYS[2] = class passes hash, KEYS[3] = class virtual time,
+# KEYS[4] = class active zset, KEYS[5] = class ARQ queue
+# ARGV = class key prefix, job meta key prefix, dispatch limit, per-user max (0 = none),
+# now ms, stale-before ms, ARQ job expiry ms, max jobs to dispatch, ARQ job key prefix,
+# ARQ result key prefix
+_DISPATCH_SCRIPT = """
+redis.call('ZREMRANGEBYSCORE', KEYS[4], '-inf', ARGV[6])
+local limit = tonumber(ARGV[3])
+local per_user = tonumber(ARGV[4])
+local budget = tonumber(ARGV[8])
+local dispatched = {}
+while budget > 0 and redis.call('ZCARD', KEYS[4]) < limit do
+  local picked, pass, active_key
+  local flows = redis.call('ZRANGE', KEYS[1], 0, -1, 'WITHSCORES')
+  for i = 1, #flows, 2 do
+    local user_active = ARGV[1] .. 'active:' .. flows[i]
+    redis.call('ZREMRANGEBYSCORE', user_active, '-inf', ARGV[6])
+    local capped = per_user > 0 and redis.call('ZCARD', user_active) >= per_user
+    if capped then
+      local head = redis.call('LINDEX', ARGV[1] .. 'pending:' .. flows[i], 0)
+      capped = not (head and redis.call('HGET', ARGV[2] .. head, 'uncapped') == '1')
+    end
+    if not capped then
+      picked, pass, active_key = flows[i], tonumber(flows[i + 1]), user_active
+      break
+    end
+  end
+  if not picked then break end
+  local pending_key = ARGV[1] .. 'pending:' .. picked
+  local job_id = redis.call('LPOP', pending_key)
+  local meta = {false, false, false}
+  if job_id then meta = redis.call('HMGET', ARGV[2] .. job_id, 'payload', 'stride', 'uncapped') end
+  local next_pass = pass
+  if meta[1] then next_pass = pass + tonumber(meta[2] or 1) end
+  if redis.call('LLEN', pending_key) == 0 then
+    redis.call('ZREM', KEYS[1], picked)
+  else
+    redis.call('ZADD', KEYS[1], next_pass, picked)
+  end
+  if meta[1] then
+    redis.call('HSET', KEYS[2], picked, next_pass)
+    if pass > tonumber(redis.call('GET', KEYS[3]) or 0) then redis.call('SET', KEYS[3], pass) end
+    if redis.call('EXISTS', ARGV[9] .. job_id, ARGV[10] .. job_id) == 0 then
+      redis.call('PSETEX', ARGV[9] .. job_id, ARGV[7], meta[1])
+      redis.call('ZADD', KEYS[5], ARGV[5], job_id)
+      redis.call('ZADD', KEYS[4], ARGV[5], job_id)
+      if meta[3] ~= '1' then
+        redis.call('ZADD', active_key, ARGV[5], job_id)
+        redis.call('EXPIRE', active_key, 86400)
+      end
+      redis.call('HSET', ARGV[2] .. job_id, 'state', 'dispatched', 'dispatched_at', ARGV[5])
+      table.insert(dispatched, job_id)
+    else
+      redis.call('DEL', ARGV[2] .. job_id)
+    end
+    budget = budget - 1
+  end
+end
+return dispatched
+"""
+
+# KEYS[1] = job meta hash; ARGV = job_id
+_CANCEL_PENDING_SCRIPT = """
+local meta = redis.call('HMGET', KEYS[1], 'state', 'pending_key')
+if meta[1] ~= 'pending' then return 0 end
+redis.call('LREM', meta[2], 0, ARGV[1])
+redis.call('DEL', KEYS[1])
+return 1
+"""
+
+
+def _decode(value: Any) -> Any:
+    return value.decode("utf-8") if isinstance(value, bytes) else value
+
+
+def _class_prefix(job_class: str) -> str:
+    return f"{SCHED_KEY_PREFIX}{job_class}:"
+
+
+def _job_key(job_id: str) -> str:
+    return f"{SCHED_JOB_KEY_PREFIX}{job_id}"
+
+
+def get_scheduling_config() -> Dict[str, Any]:
+    from .dependencies import get_config
+    return get_config().get_scheduling_config()
+
+
+def queue_name_for(job_class: str) -> str:
+    """ARQ queue of a class; interactive keeps ARQ's default queue so existing workers still drain it"""
+    from arq.constants import default_queue_name
+    if job_class == DEFAULT_JOB_CLASS:
+        return default_queue_name
+    return f"{default_queue_name}:{job_class}"
+
+
+def job_type_for(function_name: str) -> str:
+    return FUNCTION_JOB_TYPES.get(function_name, function_name)
+
+
+def job_class_for(job_type: str, config: Optional[Dict[str, Any]] = None) -> str:
+    """Scheduling class of a job type"""
+    config = config if config is not None else get_scheduling_config()
+    job_class = config['job_classes'].get(job_type) or DEFAULT_JOB_TYPE_CLASSES.get(job_type, DEFAULT_JOB_CLASS)
+    return job_class if job_class in JOB_CLASSES else DEFAULT_JOB_CLASS
+
+
+def _stride(job_type: str, user: str, config: Dict[str, Any]) -> float:
+    weight = float(config['job_type_weights'].get(job_type, 1.0)) * float(config['user_weights'].get(user, 1.0))
+    return 1.0 / max(weight, 0.001)
+
+
+async def get_job_owner(job_id: str) -> Optional[str]:
+    """User who submitted a job (children of a fanned-out job are charged to the same user)"""
+    pool = await get_redis_pool()
+    return _decode(await pool.get(f"{SCHED_OWNER_KEY_PREFIX}{job_id}"))
+
+
+async def submit_job(function_name: str, *args, _job_id: Optional[str] = None, _user: Optional[str] = None,
+                     _per_user_cap: bool = True, **kwargs) -> str:
+    """
+    Queue a worker function call in its class, charged to a user.
+
+    Drop-in for ArqRedis.enqueue_job: with scheduling disabled the job goes straight to
+    ARQ's default queue.
+
+    Args:
+        function_name: Worker function name
+        _job_id: ARQ job id (default: random)
+        _user: Submitting user (fair share and per-user caps are per user)
+        _per_user_cap: False for fan-out children, which do not count against per_user_max
+
+    Returns:
+        The ARQ job id
+    """
+    pool = await get_redis_pool()
+    config = get_scheduling_config()
+    arq_job_id = _job_id or uuid.uuid4().hex
+    user = _user or ANONYMOUS_USER
+    if kwargs.get('job_id'):
+        await pool.set(f"{SCHED_OWNER_KEY_PREFIX}{kwargs['job_id']}", user, ex=SCHED_TTL)
+
+    if not config['enabled']:
+        await pool.enqueue_job(function_name, *args, _job_id=arq_job_id, **kwargs)
+        return arq_job_id
+
+    from arq.jobs import serialize_job
+    job_type = job_type_for(function_name)
+    job_class = job_class_for(job_type, config)
+    now = time.time()
+    payload = serialize_job(function_name, args, kwargs, None, int(now * 1000),
+                            serializer=getattr(pool, 'job_serializer', None))
+    prefix = _class_prefix(job_class)
+    pending_key = f"{prefix}pending:{user}"
+    meta = {
+        'function': function_name,
+        'payload': payload,
+        'job_class': job_class,
+        'job_type': job_type,
+        'user': user,
+        'stride': _stride(job_type, user, config),
+        'submitted_at': now,
+        'state': 'pending',
+        'pending_key': pending_key,
+        'uncapped': 0 if _per_user_cap else 1,
+    }
+    fields = [item for pair in meta.items() for item in pair]
+    added = await pool.eval(_SUBMIT_SCRIPT, 5, f"{prefix}flows", f"{prefix}passes", f"{prefix}vtime",
+                            pending_key, _job_key(arq_job_id), user, arq_job_id, SCHED_TTL, *fields)
+    if added:
+        logger.info(f"Queued job {arq_job_id} ({function_name}) in class {job_class} for user {user}")
+    await dispatch(job_class)
+    return arq_job_id
+
+
+async def dispatch(job_class: str, max_jobs: int = 100) -> List[str]:
+    """
+    Move waiting jobs of a class into its ARQ queue, fairest first, within the class and
+    per-user limits.
+
+    Returns:
+        ARQ job ids dispatched
+    """
+    from arq.constants import job_key_prefix, result_key_prefix
+    pool = await get_redis_pool()
+    config = get_scheduling_config()
+    limits = config['classes'][job_class]
+    prefix = _class_prefix(job_class)
+    now_ms = int(time.time() * 1000)
+    stale_before_ms = now_ms - config['stale_after_seconds'] * 1000
+    dispatched = await pool.eval(
+        _DISPATCH_SCRIPT, 5, f"{prefix}flows", f"{prefix}passes", f"{prefix}vtime", f"{prefix}active",
+        queue_name_for(job_class),
+        prefix, SCHED_JOB_KEY_PREFIX, limits['dispatch_limit'], limits['per_user_max'], now_ms,
+        stale_before_ms, getattr(pool, 'expires_extra_ms', 86400000), max_jobs, job_key_prefix, result_key_prefix
+    )
+    dispatched = [_decode(job_id) for job_id in dispatched]
+    if dispatched:
+        logger.debug(f"Dispatched {len(dispatched)} {job_class} jobs")
+    return dispatched
+
+
+async def cancel_pending_job(job_id: str) -> bool:
+    """
+    Drop a job that is still waiting to be dispatched.
+
+    Returns:
+        True if the job was waiting (and will now never run)
+    """
+    pool = await get_redis_pool()
+    return bool(await pool.eval(_CANCEL_PENDING_SCRIPT, 1, _job_key(job_id), job_id))
+
+
+async def on_job_start(ctx: Dict[str, Any]) -> None:
+    """ARQ on_job_start hook: record how long the job waited for its class"""
+    job_id = ctx.get('job_id')
+    try:
+        pool = await get_redis_pool()
+        job_class, user, submitted_at, started_at = await pool.hmget(
+            _job_key(job_id), ['job_class', 'user', 'submitted_at', 'started_at'])
+        if job_class is None or started_at is not None:
+            return
+        prefix = _class_prefix(_decode(job_class))
+        now = time.time()
+        stale_before_ms = int((now - get_scheduling_config()['stale_after_seconds']) * 1000)
+        pipe = pool.pipeline(transaction=False)
+        pipe.hset(_job_key(job_id), 'started_at', now)
+        pipe.lpush(f"{prefix}waits", round(now - float(submitted_at), 3))
+        pipe.ltrim(f"{prefix}waits", 0, WAIT_SAMPLES - 1)
+        pipe.zremrangebyscore(f"{prefix}running", "-inf", stale_before_ms)
+        pipe.zadd(f"{prefix}running", {job_id: int(now * 1000)})
+        await pipe.execute()
+    except Exception as e:
+        logger.warning(f"Failed to record start of job {job_id}: {e}")
+
+
+async def after_job_end(ctx: Dict[str, Any]) -> None:
+    """ARQ after_job_end hook: free the job's slot and dispatch the next waiting job"""
+    job_id = ctx.get('job_id')
+    try:
+        pool = await get_redis_pool()
+        job_class, user = await pool.hmget(_job_key(job_id), ['job_class', 'user'])
+        if job_class is None:
+            return
+        job_class, user = _decode(job_class), _decode(user)
+        # A job ARQ is going to retry stays in its queue and keeps its slot
+        if await pool.zscore(queue_name_for(job_class), job_id) is not None:
+            return
+        prefix = _class_prefix(job_class)
+        pipe = pool.pipeline(transaction=False)
+        pipe.zrem(f"{prefix}active", job_id)
+        pipe.zrem(f"{prefix}active:{user}", job_id)
+        pipe.zrem(f"{prefix}running", job_id)
+        pipe.delete(_job_key(job_id))
+        await pipe.execute()
+        await dispatch(job_class)
+    except Exception as e:
+        logger.warning(f"Failed to release scheduler slot of job {job_id}: {e}")
+
+
+async def run_dispatch_loop(job_classes: List[str], interval_seconds: float) -> None:
+    """Dispatch periodically, so slots freed by crashed jobs (after stale_after_seconds) are reused"""
+    import asyncio
+    while True:
+        for job_class in job_classes:
+            try:
+                await dispatch(job_class)
+            except Exception as e:
+                logger.warning(f"Periodic dispatch of {job_class} jobs failed: {e}")
+        await asyncio.sleep(interval_seconds)
+
+
+async def get_queue_stats() -> Dict[str, Any]:
+    """Queue depth, running jobs and recent wait times per class"""
+    pool = await get_redis_pool()
+    config = get_scheduling_config()
+    now = time.time()
+    stale_before = now - config['stale_after_seconds']
+    stats = {}
+    for job_class in JOB_CLASSES:
+        prefix = _class_prefix(job_class)
+        pipe = pool.pipeline(transaction=False)
+        pipe.zrange(f"{prefix}flows", 0, -1)
+        pipe.zcount(f"{prefix}active", stale_before * 1000, "+inf")
+        pipe.zcount(f"{prefix}running", stale_before * 1000, "+inf")
+        pipe.lrange(f"{prefix}waits", 0, -1)
+        users, dispatched, running, waits = await pipe.execute()
+        users = [_decode(user) for user in users]
+
+        pipe = pool.pipeline(transaction=False)
+        for user in users:
+            pipe.llen(f"{prefix}pending:{user}")
+            pipe.lindex(f"{prefix}pending:{user}", 0)
+            pipe.zcount(f"{prefix}active:{user}", stale_before * 1000, "+inf")
+        per_user_raw = await pipe.execute() if users else []
+
+        per_user, heads = {}, []
+        for i, user in enumerate(users):
+            pending, head, active = per_user_raw[3 * i:3 * i + 3]
+            per_user[user] = {"pending": pending, "active": active}
+            if head is not None:
+                heads.append(_decode(head))
+        oldest = None
+        if heads:
+            pipe = pool.pipeline(transaction=False)
+            for job_id in heads:
+                pipe.hget(_job_key(job_id), 'submitted_at')
+            submitted = [float(value) for value in await pipe.execute() if value is not None]
+            oldest = round(now - min(submitted), 3) if submitted else None
+
+        waits = sorted(float(value) for value in waits)
+        limits = config['classes'][job_class]
+        stats[job_class] = {
+            "queue": queue_name_for(job_class),
+            "pending": sum(user_stats["pending"] for user_stats in per_user.values()),
+            "dispatched": dispatched,
+            "running": running,
+            "ready": max(dispatched - running, 0),
+            "oldest_pending_seconds": oldest,
+            "wait_seconds": {
+                "samples": len(waits),
+                "mean": round(statistics.fmean(waits), 3) if waits else None,
+                "p50": waits[int(0.5 * (len(waits) - 1))] if waits else None,
+                "p95": waits[int(0.95 * (len(waits) - 1))] if waits else None,
+                "max": waits[-1] if waits else None,
+            },
+            "dispatch_limit": limits['dispatch_limit'],
+            "per_user_max": limits['per_user_max'],
+            "users": per_user,
+        }
+    return stats
+
+
+QUEUE_PENDING = REGISTRY.gauge("job_queue_pending", "Jobs waiting in the scheduler for a dispatch slot", ["job_class"])
+QUEUE_READY = REGISTRY.gauge("job_queue_ready", "Jobs in the ARQ queue not yet picked up by a worker", ["job_class"])
+QUEUE_RUNNING = REGISTRY.gauge("job_queue_running", "Jobs running on workers", ["job_class"])
+QUEUE_OLDEST_PENDING = REGISTRY.gauge("job_queue_oldest_pending_seconds",
+                                      "Age of the oldest job waiting in the scheduler", ["job_class"])
+
+
+async def update_queue_metrics() -> None:
+    """Refresh the queue depth gauges from Redis (cluster-wide, so only the API reports them)"""
+    if not get_scheduling_config()['enabled']:
+        from arq.constants import default_queue_name
+        pool = await get_redis_pool()
+        QUEUE_READY.set(await pool.zcard(default_queue_name), job_class="default")
+        return
+    for job_class, stats in (await get_queue_stats()).items():
+        QUEUE_PENDING.set(stats["pending"], job_class=job_class)
+        QUEUE_READY.set(stats["ready"], job_class=job_class)
+        QUEUE_RUNNING.set(stats["running"], job_class=job_class)
+        QUEUE_OLDEST_PENDING.set(stats["oldest_pending_seconds"] or 0, job_class=job_class)
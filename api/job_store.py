@@ -0,0 +1,819 @@
+"""
+Job Store
+Shared job status storage for API processes and ARQ workers.
+
+`api.dependencies.jobs` is a JobStore: a mapping of job_id -> JobStatus. With the Redis
+backend each job is a hash (one field per JobStatus attribute) and sorted-set indexes by
+status, job_type, ticket key, story key and started_at (all scored by started_at) serve
+filtered listing. `page()` pages with an opaque cursor over (started_at, job_id), so each
+page costs O(log n + page) however much history is retained. Assignments to a stored
+JobStatus's fields are written back automatically by a background flusher, never on the
+assigning thread (often the event loop): status changes right away, other fields
+coalesced. Writes touching progress fields are published as job events (see api.job_events). Without Redis it behaves like the old dict.
+
+`results` (which can be megabytes for a large batch) is kept out of the hash: it is a list
+of zlib-compressed JSON chunks, and a results list that only grew since the last write is
+written as one new chunk holding the new items. Progress ticks rewrite only the changed
+header fields.
+"""
+import base64
+import json
+import logging
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+from pydantic_core import to_jsonable_python
+
+from .job_events import EVENT_FIELDS, event_channel, job_event
+from .models.generation import JobStatus
+
+logger = logging.getLogger(__name__)
+
+JOB_KEY_PREFIX = "job:data:"
+INDEX_KEY_PREFIX = "jobs:idx:"
+ALL_JOBS_INDEX = f"{INDEX_KEY_PREFIX}all"
+DEFAULT_TTL_SECONDS = 86400 * 7  # 7 days, same retention as persisted job status
+DEFAULT_FLUSH_INTERVAL = 0.2
+DEFAULT_REFRESH_INTERVAL = 0.25
+DEFAULT_MAX_LOCAL_JOBS = 5000
+SCAN_CHUNK = 200
+# Upper bound on index entries examined for one multi-filter page; a sparse match returns a
+# short page with a cursor to continue from rather than walking the whole index
+MAX_PAGE_SCAN = 5000
+
+# Fields that feed an index; changing one re-indexes the job
+INDEXED_FIELDS = {"status", "job_type", "ticket_key", "ticket_keys", "story_key", "story_keys", "started_at"}
+# Fields the background flusher writes without waiting to coalesce further changes
+IMMEDIATE_FIELDS = {"status"}
+# Stored as compressed chunks beside the hash rather than as a hash field
+CHUNKED_FIELDS = {"results"}
+RESULTS_COMPRESSION_LEVEL = 6
+
+# KEYS[1] = the job hash, KEYS[2] = its results chunk list
+# ARGV = items already stored ('' = replace the chunks), results type, item count after this
+# write, ttl seconds, chunks...; an append whose expected count does not match what is
+# stored (another process rewrote the results) returns 0 and is retried as a replace
+_RESULTS_SCRIPT = """
+if ARGV[1] ~= '' then
+  if redis.call('HGET', KEYS[1], '_results') ~= 'list' or
+     tonumber(redis.call('HGET', KEYS[1], '_results_n') or '-1') ~= tonumber(ARGV[1]) then
+    return 0
+  end
+else
+  redis.call('DEL', KEYS[2])
+end
+for i = 5, #ARGV do redis.call('RPUSH', KEYS[2], ARGV[i]) end
+redis.call('HSET', KEYS[1], '_results', ARGV[2], '_results_n', ARGV[3])
+redis.call('HDEL', KEYS[1], 'results')
+if #ARGV >= 5 then redis.call('EXPIRE', KEYS[2], ARGV[4]) end
+return 1
+"""
+
+# KEYS[1] = the job's index membership set
+# ARGV = job_id, score, ttl seconds, index keys the job now belongs to...
+_REINDEX_SCRIPT = """
+local job_id = ARGV[1]
+local wanted = {}
+for i = 4, #ARGV do wanted[ARGV[i]] = true end
+for _, key in ipairs(redis.call('SMEMBERS', KEYS[1])) do
+  if not wanted[key] then redis.call('ZREM', key, job_id) end
+end
+redis.call('DEL', KEYS[1])
+for i = 4, #ARGV do
+  redis.call('ZADD', ARGV[i], ARGV[2], job_id)
+  redis.call('SADD', KEYS[1], ARGV[i])
+end
+if #ARGV >= 4 then redis.call('EXPIRE', KEYS[1], ARGV[3]) end
+return #ARGV - 3
+"""
+
+
+def _job_key(job_id: str) -> str:
+    return f"{JOB_KEY_PREFIX}{job_id}"
+
+
+def _results_key(job_id: str) -> str:
+    return f"{JOB_KEY_PREFIX}{job_id}:results"
+
+
+def compress_chunk(value: Any) -> bytes:
+    """zlib-compressed JSON of a results chunk"""
+    return zlib.compress(json.dumps(to_jsonable_python(value)).encode("utf-8"), RESULTS_COMPRESSION_LEVEL)
+
+
+def decompress_chunk(chunk: bytes) -> Any:
+    return json.loads(zlib.decompress(chunk))
+
+
+def _index_key(kind: str, value: str) -> str:
+    return f"{INDEX_KEY_PREFIX}{kind}:{value}"
+
+
+def _score(started_at: Optional[datetime]) -> float:
+    return started_at.timestamp() if isinstance(started_at, datetime) else 0.0
+
+
+def _decode(value: Any) -> str:
+    return value.decode("utf-8") if isinstance(value, bytes) else value
+
+
+def index_keys_for(job: JobStatus) -> List[str]:
+    """Index keys a job belongs to"""
+    keys = [ALL_JOBS_INDEX]
+    if job.status:
+        keys.append(_index_key("status", job.status))
+    if job.job_type:
+        keys.append(_index_key("type", job.job_type))
+    for ticket in {job.ticket_key, *(job.ticket_keys or [])}:
+        if ticket:
+            keys.append(_index_key("ticket", ticket))
+    for story in {job.story_key, *(job.story_keys or [])}:
+        if story:
+            keys.append(_index_key("story", story))
+    return keys
+
+
+def encode_cursor(score: float, job_id: str) -> str:
+    """Opaque cursor pointing just past (started_at score, job_id)"""
+    return base64.urlsafe_b64encode(json.dumps([score, job_id]).encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Tuple[float, str]:
+    """Inverse of encode_cursor; raises ValueError for a malformed cursor"""
+    try:
+        score, job_id = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+    except Exception:
+        raise ValueError(f"Invalid cursor: {cursor}")
+    if not isinstance(score, (int, float)) or not isinstance(job_id, str):
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return float(score), job_id
+
+
+def cursor_for(job: JobStatus) -> str:
+    """Cursor continuing a started_at-ordered listing after `job`"""
+    return encode_cursor(_score(job.started_at), job.job_id)
+
+
+@dataclass
+class JobPage:
+    """One cursor page of jobs"""
+    jobs: List[JobStatus]
+    next_cursor: Optional[str] = None
+    total: Optional[int] = None
+    total_is_estimate: bool = False
+
+
+def _matches(job: JobStatus, status: Optional[str], job_type: Optional[str],
+             ticket_key: Optional[str], story_key: Optional[str]) -> bool:
+    if status and job.status != status:
+        return False
+    if job_type and job.job_type != job_type:
+        return False
+    if ticket_key and not (job.ticket_key == ticket_key or (job.ticket_keys and ticket_key in job.ticket_keys)):
+        return False
+    if story_key and not (job.story_key == story_key or (job.story_keys and story_key in job.story_keys)):
+        return False
+    return True
+
+
+class JobStore(MutableMapping):
+    """job_id -> JobStatus mapping, in-process or shared through Redis"""
+
+    def __init__(self, redis_client: Any = None, ttl_seconds: int = DEFAULT_TTL_SECONDS,
+                 flush_interval: float = DEFAULT_FLUSH_INTERVAL, refresh_interval: float = DEFAULT_REFRESH_INTERVAL,
+                 max_local_jobs: int = DEFAULT_MAX_LOCAL_JOBS):
+        self._lock = threading.RLock()
+        self._local: "OrderedDict[str, JobStatus]" = OrderedDict()
+        self._dirty: Dict[str, Set[str]] = {}
+        self._versions: Dict[str, int] = {}
+        self._checked: Dict[str, float] = {}
+        # Result items this process last wrote (or read) per job, to write only appended ones
+        self._results_written: Dict[str, List[Any]] = {}
+        self._flusher: Optional[threading.Thread] = None
+        self._wake = threading.Event()
+        self._urgent = threading.Event()
+        self._stop = threading.Event()
+        self._listeners: List[Callable[[str, Dict[str, Any]], None]] = []
+        self.redis = None
+        self.configure(redis_client, ttl_seconds, flush_interval, refresh_interval, max_local_jobs)
+
+    def configure(self, redis_client: Any = None, ttl_seconds: int = DEFAULT_TTL_SECONDS,
+                  flush_interval: float = DEFAULT_FLUSH_INTERVAL, refresh_interval: float = DEFAULT_REFRESH_INTERVAL,
+                  max_local_jobs: int = DEFAULT_MAX_LOCAL_JOBS) -> None:
+        """(Re)point the store at a backend; jobs already held locally are written to Redis"""
+        self.ttl_seconds = ttl_seconds
+        self.flush_interval = flush_interval
+        self.refresh_interval = refresh_interval
+        self.max_local_jobs = max_local_jobs
+        self.redis = redis_client
+        self._reindex = redis_client.register_script(_REINDEX_SCRIPT) if redis_client is not None else None
+        self._write_results = redis_client.register_script(_RESULTS_SCRIPT) if redis_client is not None else None
+        if redis_client is not None:
+            with self._lock:
+                for job_id in self._local:
+                    self._dirty[job_id] = set(JobStatus.model_fields)
+            self.flush()
+
+    @property
+    def shared(self) -> bool:
+        """True when job state is shared with other processes through Redis"""
+        return self.redis is not None
+
+    # ----- change tracking -----
+
+    def _bind(self, job: JobStatus) -> None:
+        job._on_change = self._mark_dirty
+
+    def add_listener(self, listener: Callable[[str, Dict[str, Any]], None]) -> None:
+        """Receive job events in-process (memory backend; with Redis events go to pub/sub)"""
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[str, Dict[str, Any]], None]) -> None:
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def version(self, job_id: str) -> int:
+        """Change counter of a job, used as its event id"""
+        if self.redis is not None:
+            self._load(job_id)
+        with self._lock:
+            return self._versions.get(job_id, 0)
+
+    def _publish_local(self, job_id: str) -> None:
+        with self._lock:
+            job = self._local.get(job_id)
+            if job is None:
+                return
+            version = self._versions.get(job_id, 0) + 1
+            self._versions[job_id] = version
+        if self._listeners:
+            event = job_event(job, version)
+            for listener in list(self._listeners):
+                listener(job_id, event)
+
+    def _mark_dirty(self, job_id: str, field: str) -> None:
+        if self.redis is None:
+            if field in EVENT_FIELDS:
+                self._publish_local(job_id)
+            return
+        with self._lock:
+            if job_id not in self._local:
+                return
+            self._dirty.setdefault(job_id, set()).add(field)
+        self._ensure_flusher()
+        if field in IMMEDIATE_FIELDS:
+            self._urgent.set()
+        self._wake.set()
+
+    def _ensure_flusher(self) -> None:
+        if self._flusher is not None and self._flusher.is_alive():
+            return
+        with self._lock:
+            if self._flusher is not None and self._flusher.is_alive():
+                return
+            self._stop.clear()
+            self._flusher = threading.Thread(target=self._flush_loop, name="job-store-flusher", daemon=True)
+            self._flusher.start()
+
+    def _flush_loop(self) -> None:
+        while not self._stop.is_set():
+            self._wake.wait()
+            self._wake.clear()
+            # Coalesce bursts of field updates; a status change (or close) ends the wait early
+            self._urgent.wait(self.flush_interval)
+            self._urgent.clear()
+            self.flush()
+        self.flush()
+
+    def flush(self, job_id: Optional[str] = None) -> None:
+        """Write pending field changes (of one job, or all) to Redis"""
+        if self.redis is None:
+            return
+        with self._lock:
+            if job_id is not None:
+                pending = {job_id: self._dirty.pop(job_id)} if job_id in self._dirty else {}
+            else:
+                pending, self._dirty = self._dirty, {}
+            batch = [(jid, self._local.get(jid), fields) for jid, fields in pending.items()]
+        for jid, job, fields in batch:
+            if job is not None:
+                self._write(job, fields)
+
+    def close(self) -> None:
+        """Stop the background flusher after writing pending changes"""
+        self._stop.set()
+        self._urgent.set()
+        self._wake.set()
+        if self._flusher is not None:
+            self._flusher.join(timeout=5)
+        self.flush()
+
+    # ----- Redis I/O -----
+
+    def _store_results(self, job: JobStatus) -> None:
+        """Write job.results as compressed chunks, appending when the list only grew"""
+        results = job.results
+        key = _job_key(job.job_id)
+        if not isinstance(results, list):
+            chunks = [] if results is None else [compress_chunk(results)]
+            self._write_results(keys=[key, _results_key(job.job_id)],
+                                args=["", "none" if results is None else "dict", len(chunks), self.ttl_seconds, *chunks])
+            with self._lock:
+                self._results_written.pop(job.job_id, None)
+            return
+        items = list(results)
+        with self._lock:
+            written = self._results_written.get(job.job_id)
+        appended = False
+        if written is not None and len(written) <= len(items) and \
+                all(old is new for old, new in zip(written, items)):
+            new_items = items[len(written):]
+            chunks = [compress_chunk(new_items)] if new_items else []
+            appended = bool(self._write_results(keys=[key, _results_key(job.job_id)],
+                                                args=[len(written), "list", len(items), self.ttl_seconds, *chunks]))
+        if not appended:
+            chunks = [compress_chunk(items)] if items else []
+            self._write_results(keys=[key, _results_key(job.job_id)],
+                                args=["", "list", len(items), self.ttl_seconds, *chunks])
+        with self._lock:
+            self._results_written[job.job_id] = items
+
+    def _write(self, job: JobStatus, fields: Set[str]) -> None:
+        key = _job_key(job.job_id)
+        try:
+            if fields & CHUNKED_FIELDS:
+                self._store_results(job)
+            data = job.model_dump(mode="json", include=fields - CHUNKED_FIELDS)
+            pipe = self.redis.pipeline(transaction=True)
+            if data:
+                pipe.hset(key, mapping={name: json.dumps(value) for name, value in data.items()})
+            pipe.hincrby(key, "_v", 1)
+            pipe.expire(key, self.ttl_seconds)
+            pipe.expire(_results_key(job.job_id), self.ttl_seconds)
+            version = pipe.execute()[1 if data else 0]
+            if fields & INDEXED_FIELDS:
+                self._reindex(keys=[f"{key}:idx"],
+                              args=[job.job_id, _score(job.started_at), self.ttl_seconds, *index_keys_for(job)])
+            with self._lock:
+                self._versions[job.job_id] = int(version)
+                self._checked[job.job_id] = time.monotonic()
+        except Exception as e:
+            logger.warning(f"Failed to write job {job.job_id} to the job store: {e}")
+            with self._lock:
+                self._dirty.setdefault(job.job_id, set()).update(fields)
+            return
+        if fields & EVENT_FIELDS:
+            try:
+                self.redis.publish(event_channel(job.job_id), json.dumps(job_event(job, int(version)), default=str))
+            except Exception as e:
+                logger.debug(f"Failed to publish event for job {job.job_id}: {e}")
+
+    def _parse(self, raw: Dict[Any, Any], chunks: Optional[List[bytes]] = None) -> Tuple[Optional[JobStatus], int]:
+        data = {}
+        version = 0
+        results_type = None
+        for name, value in raw.items():
+            name = _decode(name)
+            if name == "_v":
+                version = int(value)
+            elif name == "_results":
+                results_type = _decode(value)
+            elif name != "_results_n":
+                data[name] = json.loads(value)
+        if results_type == "list":
+            data["results"] = [item for chunk in chunks or [] for item in decompress_chunk(chunk)]
+        elif results_type == "dict":
+            data["results"] = decompress_chunk(chunks[0]) if chunks else None
+        elif results_type == "none":
+            data["results"] = None
+        if "job_id" not in data:
+            return None, version
+        return JobStatus.model_validate(data), version
+
+    def _fetch(self, pipe: Any, job_id: str) -> None:
+        """Queue the reads of one job (hash, then results chunks) on a pipeline"""
+        pipe.hgetall(_job_key(job_id))
+        pipe.lrange(_results_key(job_id), 0, -1)
+
+    def _remember(self, job: JobStatus, version: int) -> JobStatus:
+        """Cache a job loaded from Redis, updating an existing local object in place"""
+        with self._lock:
+            local = self._local.get(job.job_id)
+            if local is not None:
+                for name in JobStatus.model_fields:
+                    local.__dict__[name] = job.__dict__[name]  # bypass change tracking
+                job = local
+            else:
+                self._bind(job)
+                self._local[job.job_id] = job
+                self._evict()
+            self._versions[job.job_id] = version
+            self._checked[job.job_id] = time.monotonic()
+            if isinstance(job.results, list):
+                self._results_written[job.job_id] = list(job.results)
+            else:
+                self._results_written.pop(job.job_id, None)
+        return job
+
+    def _evict(self) -> None:
+        while len(self._local) > self.max_local_jobs:
+            for job_id in self._local:
+                if job_id not in self._dirty:
+                    self._forget(job_id)
+                    break
+            else:
+                return
+
+    def _forget(self, job_id: str) -> None:
+        job = self._local.pop(job_id, None)
+        if job is not None:
+            job._on_change = None
+        self._versions.pop(job_id, None)
+        self._checked.pop(job_id, None)
+        self._results_written.pop(job_id, None)
+
+    def _load(self, job_id: str) -> Optional[JobStatus]:
+        """Latest state of a job: local copy when fresh or dirty, otherwise from Redis"""
+        with self._lock:
+            local = self._local.get(job_id)
+            if local is not None:
+                self._local.move_to_end(job_id)
+            if self.redis is None:
+                return local
+            if local is not None and (job_id in self._dirty or
+                                      time.monotonic() - self._checked.get(job_id, 0) < self.refresh_interval):
+                return local
+            known_version = self._versions.get(job_id)
+        key = _job_key(job_id)
+        try:
+            remote_version = self.redis.hget(key, "_v")
+            if remote_version is None:
+                return local
+            if local is not None and known_version == int(remote_version):
+                with self._lock:
+                    self._checked[job_id] = time.monotonic()
+                return local
+            pipe = self.redis.pipeline(transaction=True)
+            self._fetch(pipe, job_id)
+            job, version = self._parse(*pipe.execute())
+        except Exception as e:
+            logger.warning(f"Failed to read job {job_id} from the job store: {e}")
+            return local
+        return self._remember(job, version) if job is not None else local
+
+    # ----- mapping interface -----
+
+    def __getitem__(self, job_id: str) -> JobStatus:
+        job = self._load(job_id)
+        if job is None:
+            raise KeyError(job_id)
+        return job
+
+    def __contains__(self, job_id: object) -> bool:
+        return isinstance(job_id, str) and self._load(job_id) is not None
+
+    def __setitem__(self, job_id: str, job: JobStatus) -> None:
+        with self._lock:
+            previous = self._local.get(job_id)
+            if previous is not None and previous is not job:
+                previous._on_change = None
+            self._local[job_id] = job
+            self._local.move_to_end(job_id)
+            self._bind(job)
+            if self.redis is not None:
+                self._dirty.pop(job_id, None)
+        if self.redis is not None:
+            self._write(job, set(JobStatus.model_fields))
+            with self._lock:
+                self._evict()
+        else:
+            self._publish_local(job_id)
+
+    def __delitem__(self, job_id: str) -> None:
+        with self._lock:
+            found = job_id in self._local
+            self._dirty.pop(job_id, None)
+            self._forget(job_id)
+        if self.redis is not None:
+            key = _job_key(job_id)
+            try:
+                found = bool(self.redis.delete(key)) or found
+                self.redis.delete(_results_key(job_id))
+                self._reindex(keys=[f"{key}:idx"], args=[job_id, 0, self.ttl_seconds])
+            except Exception as e:
+                logger.warning(f"Failed to delete job {job_id} from the job store: {e}")
+        if not found:
+            raise KeyError(job_id)
+
+    def _all_ids(self) -> List[str]:
+        with self._lock:
+            ids = list(self._local)
+        if self.redis is None:
+            return ids
+        try:
+            remote = [_decode(job_id) for job_id in self.redis.zrevrange(ALL_JOBS_INDEX, 0, -1)]
+        except Exception as e:
+            logger.warning(f"Failed to list jobs from the job store: {e}")
+            return ids
+        seen = set(remote)
+        return remote + [job_id for job_id in ids if job_id not in seen]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._all_ids())
+
+    def __len__(self) -> int:
+        return len(self._all_ids())
+
+    def clear(self) -> None:
+        for job_id in self._all_ids():
+            try:
+                del self[job_id]
+            except KeyError:
+                pass
+
+    # ----- indexed queries -----
+
+    def _get_many(self, job_ids: List[str]) -> Dict[str, JobStatus]:
+        """Jobs by id in one pipelined round-trip (ids whose hash has expired are omitted)"""
+        found: Dict[str, JobStatus] = {}
+        to_fetch = []
+        with self._lock:
+            for job_id in job_ids:
+                local = self._local.get(job_id)
+                if local is not None and (job_id in self._dirty or
+                                          time.monotonic() - self._checked.get(job_id, 0) < self.refresh_interval):
+                    found[job_id] = local
+                else:
+                    to_fetch.append(job_id)
+        if to_fetch:
+            pipe = self.redis.pipeline(transaction=False)
+            for job_id in to_fetch:
+                self._fetch(pipe, job_id)
+            replies = pipe.execute()
+            for job_id, raw, chunks in zip(to_fetch, replies[0::2], replies[1::2]):
+                if not raw:
+                    continue
+                try:
+                    job, version = self._parse(raw, chunks)
+                except Exception as e:
+                    logger.warning(f"Skipping unreadable job {job_id} in the job store: {e}")
+                    continue
+                if job is not None:
+                    found[job_id] = self._remember(job, version)
+        return found
+
+    def _prune(self, index_keys: List[str], job_ids: List[str]) -> None:
+        """Drop index entries whose job hash has expired"""
+        if not job_ids:
+            return
+        try:
+            pipe = self.redis.pipeline(transaction=False)
+            for key in {ALL_JOBS_INDEX, *index_keys}:
+                pipe.zrem(key, *job_ids)
+            pipe.execute()
+        except Exception as e:
+            logger.debug(f"Job index pruning failed: {e}")
+
+    def query(self, status: Optional[str] = None, job_type: Optional[str] = None,
+              ticket_key: Optional[str] = None, story_key: Optional[str] = None,
+              offset: int = 0, limit: Optional[int] = 50, descending: bool = True,
+              started_after: Optional[datetime] = None,
+              started_before: Optional[datetime] = None) -> Tuple[List[JobStatus], int]:
+        """
+        Jobs matching every given filter, ordered by started_at (newest first by default).
+
+        started_after/started_before bound started_at (inclusive) through the index scores,
+        so a date range only loads the jobs inside it.
+
+        Returns:
+            (page of jobs, total matching jobs)
+        """
+        low = _score(started_after) if started_after else float("-inf")
+        high = _score(started_before) if started_before else float("inf")
+        if self.redis is None:
+            return self._query_local(status, job_type, ticket_key, story_key, offset, limit, descending, low, high)
+        try:
+            return self._query_redis(status, job_type, ticket_key, story_key, offset, limit, descending, low, high)
+        except Exception as e:
+            logger.warning(f"Job store query failed, using locally cached jobs: {e}")
+            return self._query_local(status, job_type, ticket_key, story_key, offset, limit, descending, low, high)
+
+    def _query_local(self, status, job_type, ticket_key, story_key, offset, limit, descending, low, high):
+        matching = [job for job in list(self._local.values())
+                    if _matches(job, status, job_type, ticket_key, story_key) and low <= _score(job.started_at) <= high]
+        matching.sort(key=lambda job: _score(job.started_at), reverse=descending)
+        end = None if limit is None else offset + limit
+        return matching[offset:end], len(matching)
+
+    @staticmethod
+    def _filter_keys(status, job_type, ticket_key, story_key) -> List[str]:
+        keys = []
+        if status:
+            keys.append(_index_key("status", status))
+        if job_type:
+            keys.append(_index_key("type", job_type))
+        if ticket_key:
+            keys.append(_index_key("ticket", ticket_key))
+        if story_key:
+            keys.append(_index_key("story", story_key))
+        return keys or [ALL_JOBS_INDEX]
+
+    def _query_redis(self, status, job_type, ticket_key, story_key, offset, limit, descending, low, high):
+        self.flush()  # listings include this process's pending changes
+        keys = self._filter_keys(status, job_type, ticket_key, story_key)
+        low_arg = "-inf" if low == float("-inf") else low
+        high_arg = "+inf" if high == float("inf") else high
+
+        def rng(key, start, num):
+            """`num` ids of an index from position `start` within the started_at window (-1: all)"""
+            if descending:
+                return self.redis.zrevrangebyscore(key, high_arg, low_arg, start=start, num=num)
+            return self.redis.zrangebyscore(key, low_arg, high_arg, start=start, num=num)
+
+        if len(keys) == 1:
+            total = self.redis.zcount(keys[0], low_arg, high_arg)
+            ids = [_decode(job_id) for job_id in rng(keys[0], offset, -1 if limit is None else limit)]
+            jobs = self._get_many(ids)
+            self._prune(keys, [job_id for job_id in ids if job_id not in jobs])
+            return [jobs[job_id] for job_id in ids if job_id in jobs], total
+
+        # Several filters: walk the smallest index window, checking membership in the others
+        pipe = self.redis.pipeline(transaction=False)
+        for key in keys:
+            pipe.zcount(key, low_arg, high_arg)
+        sizes = pipe.execute()
+        driver = keys[sizes.index(min(sizes))]
+        others = [key for key in keys if key != driver]
+        matched: List[str] = []
+        start = 0
+        while True:
+            chunk = [_decode(job_id) for job_id in rng(driver, start, SCAN_CHUNK)]
+            if not chunk:
+                break
+            pipe = self.redis.pipeline(transaction=False)
+            for key in others:
+                pipe.zmscore(key, chunk)
+            scores = pipe.execute()
+            for i, job_id in enumerate(chunk):
+                if all(column[i] is not None for column in scores):
+                    matched.append(job_id)
+            start += SCAN_CHUNK
+        end = None if limit is None else offset + limit
+        ids = matched[offset:end]
+        jobs = self._get_many(ids)
+        self._prune(keys, [job_id for job_id in ids if job_id not in jobs])
+        return [jobs[job_id] for job_id in ids if job_id in jobs], len(matched)
+
+    def page(self, status: Optional[str] = None, job_type: Optional[str] = None,
+             ticket_key: Optional[str] = None, story_key: Optional[str] = None,
+             cursor: Optional[str] = None, limit: int = 50, descending: bool = True,
+             include_total: bool = True) -> JobPage:
+        """
+        One page of jobs matching every given filter, ordered by (started_at, job_id).
+
+        Pass the previous page's next_cursor to continue; next_cursor is None on the last page.
+        The cost of a page does not depend on how many jobs are retained. With several filters
+        the total is estimated from the selectivity seen while paging (total_is_estimate=True).
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        after = decode_cursor(cursor) if cursor else None
+        if self.redis is None:
+            return self._page_local(status, job_type, ticket_key, story_key, after, limit, descending)
+        try:
+            return self._page_redis(status, job_type, ticket_key, story_key, after, limit, descending, include_total)
+        except Exception as e:
+            logger.warning(f"Job store page query failed, using locally cached jobs: {e}")
+            return self._page_local(status, job_type, ticket_key, story_key, after, limit, descending)
+
+    def _page_local(self, status, job_type, ticket_key, story_key, after, limit, descending) -> JobPage:
+        matching = sorted(((_score(job.started_at), job.job_id, job) for job in list(self._local.values())
+                           if _matches(job, status, job_type, ticket_key, story_key)),
+                          key=lambda item: item[:2], reverse=descending)
+        remaining = matching
+        if after is not None:
+            remaining = [item for item in matching if (item[:2] < after if descending else item[:2] > after)]
+        page = remaining[:limit]
+        next_cursor = cursor_for(page[-1][2]) if len(remaining) > limit else None
+        return JobPage([item[2] for item in page], next_cursor, len(matching))
+
+    def _walk_index(self, key: str, after: Optional[Tuple[float, str]], descending: bool,
+                    chunk: int) -> Iterator[Tuple[str, float]]:
+        """(job_id, score) entries of an index in page order, starting just past `after`"""
+        position = 0
+        while True:
+            if descending:
+                rows = self.redis.zrevrangebyscore(key, after[0] if after else "+inf", "-inf",
+                                                   start=position, num=chunk, withscores=True)
+            else:
+                rows = self.redis.zrangebyscore(key, after[0] if after else "-inf", "+inf",
+                                                start=position, num=chunk, withscores=True)
+            for member, score in rows:
+                job_id = _decode(member)
+                # Entries sharing the cursor's started_at are ordered by job_id
+                if after and score == after[0] and (job_id >= after[1] if descending else job_id <= after[1]):
+                    continue
+                yield job_id, score
+            if len(rows) < chunk:
+                return
+            position += chunk
+
+    def _page_redis(self, status, job_type, ticket_key, story_key, after, limit, descending,
+                    include_total) -> JobPage:
+        self.flush()  # listings include this process's pending changes
+        keys = self._filter_keys(status, job_type, ticket_key, story_key)
+        pipe = self.redis.pipeline(transaction=False)
+        for key in keys:
+            pipe.zcard(key)
+        sizes = pipe.execute()
+        driver = keys[sizes.index(min(sizes))]
+        others = [key for key in keys if key != driver]
+
+        # Walk the smallest index from the cursor, checking membership in the others, until
+        # one entry past the page is found (that entry only proves there is a next page)
+        candidates: List[Tuple[str, float]] = []
+        scanned = 0
+        capped = False
+        last_scanned = None
+        walk = self._walk_index(driver, after, descending, limit + 1 if not others else SCAN_CHUNK)
+        while len(candidates) <= limit:
+            batch = [item for _, item in zip(range(SCAN_CHUNK if others else limit + 1 - len(candidates)), walk)]
+            if not batch:
+                break
+            scanned += len(batch)
+            last_scanned = batch[-1]
+            if others:
+                pipe = self.redis.pipeline(transaction=False)
+                for key in others:
+                    pipe.zmscore(key, [job_id for job_id, _ in batch])
+                scores = pipe.execute()
+                batch = [item for i, item in enumerate(batch) if all(column[i] is not None for column in scores)]
+            candidates.extend(batch)
+            if scanned >= MAX_PAGE_SCAN and len(candidates) <= limit:
+                capped = True
+                break
+
+        page = candidates[:limit]
+        if len(candidates) > limit:
+            next_cursor = encode_cursor(page[-1][1], page[-1][0])
+        elif capped:
+            next_cursor = encode_cursor(last_scanned[1], last_scanned[0])
+        else:
+            next_cursor = None
+        ids = [job_id for job_id, _ in page]
+        found = self._get_many(ids)
+        self._prune(keys, [job_id for job_id in ids if job_id not in found])
+        jobs = [found[job_id] for job_id in ids if job_id in found]
+
+        if not include_total:
+            return JobPage(jobs, next_cursor)
+        if not others:
+            return JobPage(jobs, next_cursor, sizes[keys.index(driver)])
+        exhausted = next_cursor is None
+        if after is None and exhausted:
+            return JobPage(jobs, next_cursor, len(candidates))
+        # Scale the driver index's size by the match rate observed in this page's walk
+        matched = len(candidates)
+        estimate = round(min(sizes) * matched / scanned) if scanned else 0
+        return JobPage(jobs, next_cursor, max(estimate, len(jobs)), total_is_estimate=True)
+
+
+def configure_job_store(store: JobStore, store_config: Dict[str, Any],
+                        redis_config: Optional[Dict[str, Any]] = None) -> JobStore:
+    """
+    Point the process-wide store at the backend from the `job_store:` config section
+    (see Config.get_job_store_config). Falls back to in-process storage if Redis is unavailable.
+    """
+    redis_client = None
+    if store_config.get('backend') == 'redis':
+        try:
+            import redis
+            redis_config = redis_config or {}
+            redis_client = redis.Redis(
+                host=redis_config.get('host', 'localhost'),
+                port=int(redis_config.get('port', 6379)),
+                password=redis_config.get('password') or None,
+                db=int(redis_config.get('database', 0)),
+                socket_timeout=2,
+                socket_connect_timeout=2,
+            )
+            redis_client.ping()
+        except Exception as e:
+            logger.warning(f"Job store Redis backend unavailable, keeping jobs in process memory: {e}")
+            redis_client = None
+    store.configure(
+        redis_client,
+        ttl_seconds=store_config.get('ttl_seconds', DEFAULT_TTL_SECONDS),
+        flush_interval=store_config.get('flush_interval_ms', DEFAULT_FLUSH_INTERVAL * 1000) / 1000.0,
+        refresh_interval=store_config.get('refresh_interval_ms', DEFAULT_REFRESH_INTERVAL * 1000) / 1000.0,
+        max_local_jobs=store_config.get('max_local_jobs', DEFAULT_MAX_LOCAL_JOBS),
+    )
+    logger.info(f"Job store backend: {'redis' if redis_client is not None else 'memory'}")
+    return store
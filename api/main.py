@@ -147,7 +147,7 @@ def custom_openapi():
         # Apply security to all paths
         for path, methods in openapi_schema.get("paths", {}).items():
             # Skip health check endpoints
-            if path in ["/", "/health"]:
+            if path in ["/", "/health", "/metrics"]:
                 continue
             
             # Add security requirement to all methods in this path
@@ -199,6 +199,13 @@ async def startup_event():
         await initialize_redis()
     except Exception as e:
         logger.warning(f"Failed to initialize Redis (background jobs may not work): {e}")
+    # Fan out job progress events to SSE/WebSocket subscribers
+    try:
+        from .dependencies import jobs, get_config
+        from .job_events import get_job_event_hub
+        await get_job_event_hub().start(jobs, get_config()._config.get('redis', {}))
+    except Exception as e:
+        logger.warning(f"Failed to start job event streaming (streams will poll the job store): {e}")
 
 
 # Shutdown event (if needed)
@@ -206,6 +213,17 @@ async def startup_event():
 async def shutdown_event():
     """Cleanup on shutdown"""
     logger.info("Application shutting down")
+    try:
+        from .job_events import get_job_event_hub
+        await get_job_event_hub().stop()
+    except Exception as e:
+        logger.warning(f"Error stopping job event streaming: {e}")
+    # Write pending job status changes
+    try:
+        from .dependencies import jobs
+        jobs.close()
+    except Exception as e:
+        logger.warning(f"Error flushing job store: {e}")
     # Close Redis connection pool
     try:
         from .job_queue import close_redis
@@ -252,6 +252,10 @@ class AnalyticsStats(BaseModel):
     avg_verifying_duration: Optional[float] = Field(None, description="Average verifying stage duration")
     common_failure_reasons: List[Dict[str, Any]] = Field(default_factory=list, description="Most common failure reasons")
     jobs_by_stage: Dict[str, int] = Field(default_factory=dict, description="Job count by stage")
+    stage_durations: Dict[str, Dict[str, Any]] = Field(
+        default_factory=dict,
+        description="Per stage and sub-step (e.g. APPLYING.opencode_run): count, failed, avg, p50 and p95 seconds"
+    )
 
 
 class JobAnalyticsRequest(BaseModel):
@@ -2,8 +2,8 @@
 Generation Models
 Request and response models for ticket generation endpoints
 """
-from pydantic import BaseModel, Field, validator
-from typing import Optional, List, Union, Dict, Any
+from pydantic import BaseModel, Field, PrivateAttr, validator
+from typing import Optional, List, Union, Dict, Any, Callable
 from datetime import datetime
 from enum import Enum
 
@@ -181,7 +181,7 @@ class JobStatus(BaseModel):
     job_type: str = Field(default="batch", description="Type of job (batch, single, story_generation, task_generation, test_generation, etc.)")
     status: str = Field(..., description="Current job status")
     progress: dict = Field(..., description="Progress information")
-    results: Optional[dict] = Field(None, description="Processing results (if completed) - format depends on job_type")
+    results: Optional[Union[dict, list]] = Field(None, description="Processing results (if completed) - format depends on job_type (a list of ticket results for batch jobs)")
     started_at: datetime = Field(..., description="Job start timestamp")
     completed_at: Optional[datetime] = Field(None, description="Job completion timestamp")
     total_tickets: Optional[int] = Field(None, description="Total number of tickets to process (for batch jobs)")
@@ -206,4 +206,13 @@ class JobStatus(BaseModel):
     mode: Optional[str] = Field(None, description="Pipeline mode: 'normal' or 'yolo' (for draft_pr jobs)")
     sandbox_id: Optional[str] = Field(None, description="OpenSandbox id when job is running in sandbox (from Redis)")
     sandbox_status: Optional[Dict[str, Any]] = Field(None, description="OpenSandbox status when sandbox_id is set")
+    
+    # Set by the job store; told about every field assignment so changes reach other processes
+    _on_change: Optional[Callable[[str, str], None]] = PrivateAttr(default=None)
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        on_change = (self.__pydantic_private__ or {}).get('_on_change')
+        if on_change is not None and name in type(self).model_fields:
+            on_change(self.job_id, name)
 
@@ -34,6 +34,10 @@ class PromptResubmitRequest(BaseModel):
         None,
         description="LLM model override"
     )
+    refresh_cache: bool = Field(
+        False,
+        description="Bypass the LLM response cache and regenerate (identical resubmits are served from cache otherwise)"
+    )
 
 
 class PromptResubmitResponse(BaseModel):
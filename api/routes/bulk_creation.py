@@ -15,8 +15,8 @@ from ..models.bulk_creation import (
     TaskCreationRequest
 )
 from ..models.generation import BatchResponse, JobStatus
-from ..dependencies import get_generator, get_active_job_for_ticket, register_ticket_job, jobs
-from ..job_queue import get_redis_pool
+from ..dependencies import get_generator, get_active_job_for_ticket, register_ticket_job, claim_ticket_jobs, release_ticket_jobs, jobs
+from ..job_scheduler import submit_job
 from ..auth import get_current_user
 
 router = APIRouter()
@@ -70,17 +70,24 @@ async def execute_planning_with_creation(
                 ticket_key=request.epic_key
             )
             
-            # Register epic key for duplicate prevention
-            register_ticket_job(request.epic_key, job_id)
+            # Register epic key for duplicate prevention; a job that claimed it since the check above wins
+            holder = register_ticket_job(request.epic_key, job_id)
+            if holder:
+                del jobs[job_id]
+                raise HTTPException(
+                    status_code=409,
+                    detail=f"Epic {request.epic_key} is already being processed in job {holder}",
+                    headers={"X-Active-Job-Id": holder, "X-Active-Job-Status-Url": f"/jobs/{holder}"}
+                )
             
-            redis_pool = await get_redis_pool()
-            await redis_pool.enqueue_job(
+            await submit_job(
                 'process_epic_creation_worker',
                 job_id=job_id,
                 epic_key=request.epic_key,
                 operation_mode=request.operation_mode,
                 create_tickets=request.create_tickets,
-                _job_id=job_id
+                _job_id=job_id,
+                _user=current_user
             )
             
             logger.info(f"Enqueued epic creation job {job_id} for epic {request.epic_key}")
@@ -191,17 +198,24 @@ async def create_stories_for_epic(
                 ticket_key=request.epic_key
             )
             
-            # Register epic key for duplicate prevention
-            register_ticket_job(request.epic_key, job_id)
+            # Register epic key for duplicate prevention; a job that claimed it since the check above wins
+            holder = register_ticket_job(request.epic_key, job_id)
+            if holder:
+                del jobs[job_id]
+                raise HTTPException(
+                    status_code=409,
+                    detail=f"Epic {request.epic_key} is already being processed in job {holder}",
+                    headers={"X-Active-Job-Id": holder, "X-Active-Job-Status-Url": f"/jobs/{holder}"}
+                )
             
-            redis_pool = await get_redis_pool()
-            await redis_pool.enqueue_job(
+            await submit_job(
                 'process_story_creation_worker',
                 job_id=job_id,
                 epic_key=request.epic_key,
                 story_count=request.story_count,
                 create_tickets=request.create_tickets,
-                _job_id=job_id
+                _job_id=job_id,
+                _user=current_user
             )
             
             logger.info(f"Enqueued story creation job {job_id} for epic {request.epic_key}")
@@ -309,18 +323,26 @@ async def create_tasks_for_stories(
                 story_keys=request.story_keys.copy()
             )
             
-            # Register all story keys for duplicate prevention
-            for story_key in request.story_keys:
-                register_ticket_job(story_key, job_id)
+            # Claim all story keys for duplicate prevention (atomically, in one round trip);
+            # a job that claimed one since the check above wins
+            active_duplicates = claim_ticket_jobs(request.story_keys, job_id)
+            if active_duplicates:
+                release_ticket_jobs(job_id)
+                del jobs[job_id]
+                raise HTTPException(
+                    status_code=409,
+                    detail=f"Some stories are already being processed: {', '.join(active_duplicates)}",
+                    headers={"X-Duplicate-Stories": ",".join(active_duplicates)}
+                )
             
-            redis_pool = await get_redis_pool()
-            await redis_pool.enqueue_job(
+            await submit_job(
                 'process_task_creation_worker',
                 job_id=job_id,
                 story_keys=request.story_keys,
                 tasks_per_story=request.tasks_per_story,
                 create_tickets=request.create_tickets,
-                _job_id=job_id
+                _job_id=job_id,
+                _user=current_user
             )
             
             logger.info(f"Enqueued task creation job {job_id} for {len(request.story_keys)} stories")
@@ -384,7 +406,7 @@ async def create_tasks_for_stories(
         logger.info(f"[TASK_BREAKDOWN] Attempting to fetch PRD/RFC content for epic: {epic_key}")
         try:
             # Get epic details to retrieve PRD/RFC URLs
-            epic_issue = jira_client.get_ticket(epic_key)
+            epic_issue = jira_client.get_ticket(epic_key, profile='planning')
             if epic_issue:
                 logger.info(f"[TASK_BREAKDOWN] Successfully fetched epic issue {epic_key}")
                 # Get PRD content using planning service method
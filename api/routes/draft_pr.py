@@ -3,9 +3,8 @@ Draft PR Routes
 API endpoints for draft PR orchestrator
 """
 from fastapi import APIRouter, HTTPException, Depends, Query
-from typing import Optional, List
+from typing import Any, Dict, List, Optional
 from datetime import datetime
-from collections import Counter
 import logging
 import uuid
 import json
@@ -37,7 +36,9 @@ from ..models.draft_pr import (
 from ..models.generation import JobStatus, PipelineStage
 from ..dependencies import get_config, get_jira_client, get_sandbox_client, jobs
 from ..auth import get_current_user
+from ..blocking_executor import run_blocking
 from ..job_queue import get_redis_pool, get_sandbox_id
+from ..job_scheduler import submit_job
 from src.draft_pr_models import PlanFeedback, FeedbackType, Approval
 from src.draft_pr_pipeline import DraftPRPipeline, PipelineStage as PipelineStageEnum
 from src.plan_generator import PlanGenerator
@@ -48,6 +49,7 @@ from src.llm_client import LLMClient
 from src.bitbucket_client import BitbucketClient
 from src.template_store import get_template_store
 from src.analytics import AnalyticsService
+from src.stage_timings import get_stage_timings
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -254,16 +256,19 @@ async def create_draft_pr(
     )
     jobs[job_id] = job
     
-    # Register story key for duplicate prevention
-    register_ticket_job(request.story_key, job_id)
+    # Register story key for duplicate prevention; a job that claimed it since the check above wins
+    holder = register_ticket_job(request.story_key, job_id)
+    if holder:
+        del jobs[job_id]
+        raise HTTPException(
+            status_code=409,
+            detail=f"Story {request.story_key} is already being processed in job {holder}",
+            headers={"X-Active-Job-Id": holder, "X-Active-Job-Status-Url": f"/jobs/{holder}"}
+        )
     
     # Queue job for processing
     try:
-        from ..job_queue import get_redis_pool
-        from arq import ArqRedis
-        
-        redis_pool = await get_redis_pool()
-        await redis_pool.enqueue_job(
+        await submit_job(
             'process_draft_pr_worker',
             job_id=job_id,
             story_key=request.story_key,
@@ -272,7 +277,9 @@ async def create_draft_pr(
             repos=request.repos,
             scope=request.scope,
             additional_context=request.additional_context,
-            mode=request.mode
+            mode=request.mode,
+            _job_id=job_id,
+            _user=current_user
         )
         
         job.stage = PipelineStageEnum.PLANNING.value
@@ -574,9 +581,8 @@ async def revise_plan(
         artifact_store.store_artifact(job_id, f"plan_v{new_version.version}", new_version.dict())
         
         # Update job
-        if not job.plan_versions:
-            job.plan_versions = []
-        job.plan_versions.append(new_version.dict())
+        # Reassign (not append in place) so the job store sees the change
+        job.plan_versions = [*(job.plan_versions or []), new_version.dict()]
         job.stage = PipelineStageEnum.WAITING_FOR_APPROVAL.value
         
         # Safety: Invalidate any previous approval if plan was revised
@@ -1137,8 +1143,6 @@ async def retry_job(
     
     # Re-enqueue worker job
     try:
-        redis_pool = await get_redis_pool()
-        
         # Determine retry stage - if not specified, retry from the failed stage
         retry_stage = request.stage or job.stage
         
@@ -1151,7 +1155,7 @@ async def retry_job(
         job.completed_at = None
         
         # Re-enqueue with original parameters
-        await redis_pool.enqueue_job(
+        await submit_job(
             'process_draft_pr_worker',
             job_id=job_id,
             story_key=input_spec.get('story_key', job.ticket_key),
@@ -1161,7 +1165,8 @@ async def retry_job(
             scope=input_spec.get('scope'),
             additional_context=input_spec.get('additional_context'),
             mode=input_spec.get('mode', 'normal'),
-            _job_id=job_id
+            _job_id=job_id,
+            _user=current_user
         )
         
         logger.info(f"Retried job {job_id} from stage {retry_stage}")
@@ -1681,10 +1686,17 @@ async def bulk_create_jobs(
                     mode=job_request.mode
                 )
                 jobs[job_id] = job
-                register_ticket_job(job_request.story_key, job_id)
+                holder = register_ticket_job(job_request.story_key, job_id)
+                if holder:
+                    del jobs[job_id]
+                    return {
+                        "index": index,
+                        "story_key": job_request.story_key,
+                        "success": False,
+                        "error": f"Story {job_request.story_key} is already being processed in job {holder}"
+                    }
                 
-                redis_pool = await get_redis_pool()
-                await redis_pool.enqueue_job(
+                await submit_job(
                     'process_draft_pr_worker',
                     job_id=job_id,
                     story_key=job_request.story_key,
@@ -1694,7 +1706,8 @@ async def bulk_create_jobs(
                     scope=job_request.scope,
                     additional_context=job_request.additional_context,
                     mode=job_request.mode,
-                    _job_id=job_id
+                    _job_id=job_id,
+                    _user=current_user
                 )
                 
                 job.stage = PipelineStageEnum.PLANNING.value
@@ -1905,11 +1918,41 @@ async def bulk_cancel_jobs(
 
 # Analytics Endpoints
 
+async def _load_draft_pr_jobs(start_date: Optional[datetime] = None,
+                              end_date: Optional[datetime] = None) -> List[Dict[str, Any]]:
+    """Draft PR jobs started in the date range as dicts, from the job store and (per-process store) ARQ results"""
+    from ..job_queue import get_redis_pool
+    from ..routes.jobs import _reconstruct_job_from_redis
+    
+    all_jobs = []
+    
+    # Get jobs from the job store (type index, bounded by the started_at window)
+    draft_pr_jobs, _ = await run_blocking(jobs.query, job_type="draft_pr", started_after=start_date,
+                                          started_before=end_date, limit=None)
+    all_jobs.extend(job.dict() for job in draft_pr_jobs)
+    
+    # A per-process job store misses jobs other processes ran: reconstruct them from ARQ results
+    if not jobs.shared:
+        try:
+            redis_pool = await get_redis_pool()
+            all_results = await redis_pool.all_job_results()
+            for job_result in all_results:
+                if job_result.job_id not in jobs:
+                    reconstructed = await _reconstruct_job_from_redis(job_result.job_id)
+                    if reconstructed and reconstructed.job_type == "draft_pr":
+                        all_jobs.append(reconstructed.dict())
+        except Exception as e:
+            logger.warning(f"Error loading jobs from Redis for analytics: {e}")
+    
+    return all_jobs
+
+
 @router.get("/draft-pr/analytics/stats",
           tags=["Draft PR"],
           response_model=AnalyticsStats,
           summary="Get analytics statistics",
-          description="Get overall statistics for draft PR jobs including success rates, durations, and failure reasons.")
+          description="Get overall statistics for draft PR jobs including success rates, durations, "
+                      "per-stage p50/p95 durations and failure reasons.")
 async def get_analytics_stats(
     start_date: Optional[datetime] = Query(None, description="Start date filter"),
     end_date: Optional[datetime] = Query(None, description="End date filter"),
@@ -1917,89 +1960,9 @@ async def get_analytics_stats(
     current_user: str = Depends(get_current_user)
 ):
     """Get analytics statistics"""
-    # Get all draft PR jobs from in-memory store and Redis
-    from ..job_queue import get_redis_pool
-    from ..routes.jobs import _reconstruct_job_from_redis
-    
-    all_jobs = []
-    
-    # Get jobs from in-memory store
-    for job_id, job in jobs.items():
-        if job.job_type == "draft_pr":
-            all_jobs.append(job.dict())
-    
-    # Get jobs from Redis
-    try:
-        redis_pool = await get_redis_pool()
-        all_results = await redis_pool.all_job_results()
-        for job_result in all_results:
-            if job_result.job_id not in jobs:
-                # Try to reconstruct
-                reconstructed = await _reconstruct_job_from_redis(job_result.job_id)
-                if reconstructed and reconstructed.job_type == "draft_pr":
-                    all_jobs.append(reconstructed.dict())
-    except Exception as e:
-        logger.warning(f"Error loading jobs from Redis for analytics: {e}")
-    
-    # Filter by date range
-    if start_date:
-        all_jobs = [j for j in all_jobs if j.get("started_at") and j["started_at"] >= start_date]
-    if end_date:
-        all_jobs = [j for j in all_jobs if j.get("started_at") and j["started_at"] <= end_date]
-    
-    # Filter by status
-    if status:
-        all_jobs = [j for j in all_jobs if j.get("status") == status]
-    
-    # Calculate stats
-    total_jobs = len(all_jobs)
-    successful_jobs = sum(1 for j in all_jobs if j.get("status") == "completed")
-    failed_jobs = sum(1 for j in all_jobs if j.get("status") == "failed")
-    success_rate = (successful_jobs / total_jobs * 100) if total_jobs > 0 else 0.0
-    
-    # Calculate durations
-    durations = []
-    for job in all_jobs:
-        if job.get("started_at") and job.get("completed_at"):
-            if isinstance(job["started_at"], str):
-                from datetime import datetime
-                started = datetime.fromisoformat(job["started_at"].replace('Z', '+00:00'))
-                completed = datetime.fromisoformat(job["completed_at"].replace('Z', '+00:00'))
-            else:
-                started = job["started_at"]
-                completed = job["completed_at"]
-            duration = (completed - started).total_seconds()
-            durations.append(duration)
-    
-    avg_duration = sum(durations) / len(durations) if durations else 0.0
-    
-    # Count jobs by stage
-    jobs_by_stage = Counter(j.get("stage", "UNKNOWN") for j in all_jobs)
-    
-    # Common failure reasons
-    failure_reasons = []
-    for job in all_jobs:
-        if job.get("status") == "failed" and job.get("error"):
-            failure_reasons.append(job["error"])
-    
-    failure_counter = Counter(failure_reasons)
-    common_failures = [
-        {"reason": reason, "count": count}
-        for reason, count in failure_counter.most_common(10)
-    ]
-    
-    return AnalyticsStats(
-        total_jobs=total_jobs,
-        successful_jobs=successful_jobs,
-        failed_jobs=failed_jobs,
-        success_rate=round(success_rate, 2),
-        avg_duration_seconds=round(avg_duration, 2),
-        avg_planning_duration=None,  # Would need stage timing tracking
-        avg_applying_duration=None,  # Would need stage timing tracking
-        avg_verifying_duration=None,  # Would need stage timing tracking
-        common_failure_reasons=common_failures,
-        jobs_by_stage=dict(jobs_by_stage)
-    )
+    analytics = AnalyticsService(lambda: _load_draft_pr_jobs(start_date, end_date), get_stage_timings())
+    stats = await analytics.get_stats(start_date=start_date, end_date=end_date, status=status)
+    return AnalyticsStats(**stats)
 
 
 @router.get("/draft-pr/analytics/jobs",
@@ -2013,59 +1976,5 @@ async def get_job_analytics(
     current_user: str = Depends(get_current_user)
 ):
     """Get job-level analytics"""
-    # Similar to stats endpoint but return individual job data
-    from ..job_queue import get_redis_pool
-    from ..routes.jobs import _reconstruct_job_from_redis
-    
-    all_jobs = []
-    
-    # Get jobs from in-memory store
-    for job_id, job in jobs.items():
-        if job.job_type == "draft_pr":
-            all_jobs.append(job.dict())
-    
-    # Get jobs from Redis
-    try:
-        redis_pool = await get_redis_pool()
-        all_results = await redis_pool.all_job_results()
-        for job_result in all_results:
-            if job_result.job_id not in jobs:
-                reconstructed = await _reconstruct_job_from_redis(job_result.job_id)
-                if reconstructed and reconstructed.job_type == "draft_pr":
-                    all_jobs.append(reconstructed.dict())
-    except Exception as e:
-        logger.warning(f"Error loading jobs from Redis for analytics: {e}")
-    
-    # Filter
-    if start_date:
-        all_jobs = [j for j in all_jobs if j.get("started_at") and j["started_at"] >= start_date]
-    if end_date:
-        all_jobs = [j for j in all_jobs if j.get("started_at") and j["started_at"] <= end_date]
-    if status:
-        all_jobs = [j for j in all_jobs if j.get("status") == status]
-    
-    # Format analytics
-    analytics = []
-    for job in all_jobs:
-        duration = None
-        if job.get("started_at") and job.get("completed_at"):
-            if isinstance(job["started_at"], str):
-                started = datetime.fromisoformat(job["started_at"].replace('Z', '+00:00'))
-                completed = datetime.fromisoformat(job["completed_at"].replace('Z', '+00:00'))
-            else:
-                started = job["started_at"]
-                completed = job["completed_at"]
-            duration = (completed - started).total_seconds()
-        
-        analytics.append({
-            "job_id": job.get("job_id"),
-            "story_key": job.get("ticket_key"),
-            "status": job.get("status"),
-            "stage": job.get("stage"),
-            "duration_seconds": duration,
-            "started_at": job.get("started_at"),
-            "completed_at": job.get("completed_at"),
-            "error": job.get("error")
-        })
-    
-    return analytics
+    analytics = AnalyticsService(lambda: _load_draft_pr_jobs(start_date, end_date))
+    return await analytics.get_job_analytics(start_date=start_date, end_date=end_date, status=status)
@@ -13,7 +13,7 @@ from ..models.opencode import validate_repos_list
 from ..dependencies import get_jira_client, get_generator, get_config
 from ..dependencies import jobs, get_active_job_for_ticket, register_ticket_job
 from ..auth import get_current_user
-from ..job_queue import get_redis_pool
+from ..job_scheduler import submit_job
 from ..utils import normalize_ticket_key
 
 router = APIRouter()
@@ -79,7 +79,7 @@ async def generate_single_description(
                     # Job ID returned but job doesn't exist - clean up stale mapping
                     logger.warning(f"Stale ticket_jobs mapping found: {ticket_key} -> {active_job_id} (job not in jobs dict)")
                     from ..dependencies import unregister_ticket_job
-                    unregister_ticket_job(ticket_key)
+                    unregister_ticket_job(ticket_key, active_job_id)
                     # Continue to create new job
             
             job_id = str(uuid.uuid4())
@@ -97,16 +97,22 @@ async def generate_single_description(
                 repos=repos_urls
             )
             
-            # Register ticket key for duplicate prevention
-            register_ticket_job(ticket_key, job_id)
+            # Register ticket key for duplicate prevention; a job that claimed it since the check above wins
+            holder = register_ticket_job(ticket_key, job_id)
+            if holder:
+                del jobs[job_id]
+                raise HTTPException(
+                    status_code=409,
+                    detail=f"Ticket {ticket_key} is already being processed in job {holder}",
+                    headers={"X-Active-Job-Id": holder, "X-Active-Job-Status-Url": f"/jobs/{holder}"}
+                )
             
             # Convert repos to serializable format for worker
             repos_for_worker = None
             if repos_normalized:
                 repos_for_worker = [{"url": r.url, "branch": r.branch} for r in repos_normalized]
             
-            redis_pool = await get_redis_pool()
-            await redis_pool.enqueue_job(
+            await submit_job(
                 'process_single_ticket_worker',
                 job_id=job_id,
                 ticket_key=ticket_key,
@@ -115,7 +121,8 @@ async def generate_single_description(
                 llm_provider=request.llm_provider,
                 additional_context=request.additional_context,
                 repos=repos_for_worker,
-                _job_id=job_id
+                _job_id=job_id,
+                _user=current_user
             )
             
             logger.info(f"Enqueued single ticket job {job_id} for ticket {ticket_key}" + (" (with OpenCode)" if repos_urls else ""))
@@ -262,8 +269,7 @@ async def start_batch_processing(
             logger.info(f"Using custom LLM settings - provider: {request.llm_provider or 'default'}, model: {request.llm_model or 'default'}")
         
         # Get Redis pool and enqueue job
-        redis_pool = await get_redis_pool()
-        await redis_pool.enqueue_job(
+        await submit_job(
             'process_batch_tickets_worker',
             job_id=job_id,
             jql=request.jql,
@@ -271,7 +277,8 @@ async def start_batch_processing(
             update_jira=request.update_jira,
             llm_model=request.llm_model,
             llm_provider=request.llm_provider,
-            _job_id=job_id  # Use job_id as Arq job ID for tracking
+            _job_id=job_id,  # Use job_id as Arq job ID for tracking
+            _user=current_user
         )
         
         logger.info(f"Enqueued batch job {job_id} for JQL: {request.jql}")
@@ -3,10 +3,19 @@ Health Routes
 Health check and configuration endpoints
 """
 from fastapi import APIRouter, Depends, HTTPException, Query
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse
 from datetime import datetime
+import logging
 from ..auth import get_current_user
 from ..dependencies import get_config, auth_config
+from src.llm_cache import get_llm_cache
+from src.jira_issue_cache import get_jira_issue_cache
+from src.llm_rate_limiter import get_llm_rate_limiter
+from src.prompt_cache import get_prompt_cache_stats
+from src.metrics import CONTENT_TYPE, render as render_metrics
+from ..job_scheduler import update_queue_metrics
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
@@ -24,6 +33,20 @@ async def root():
     }
 
 
+@router.get("/metrics", tags=["Health"], response_class=PlainTextResponse)
+async def metrics():
+    """
+    Prometheus metrics of this API process (outbound call latency and errors, LLM calls)
+    plus job queue depth per class - publicly accessible. Workers export their own metrics
+    (job durations, outbound calls made by jobs) on WORKER_METRICS_PORT.
+    """
+    try:
+        await update_queue_metrics()
+    except Exception as e:
+        logger.warning(f"Could not refresh job queue metrics: {e}")
+    return PlainTextResponse(render_metrics(), media_type=CONTENT_TYPE)
+
+
 @router.get("/health", tags=["Health"])
 async def health_check():
     """Comprehensive health check for all services - publicly accessible"""
@@ -61,6 +84,14 @@ async def health_check():
         health_status["services"]["confluence"] = "connected" 
         health_status["services"]["llm"] = "connected"
         
+        llm_cache = get_llm_cache()
+        health_status["llm_cache"] = llm_cache.stats() if llm_cache is not None else {"enabled": False}
+        llm_rate_limiter = get_llm_rate_limiter()
+        health_status["llm_rate_limit"] = llm_rate_limiter.stats() if llm_rate_limiter is not None else {"enabled": False}
+        health_status["llm_prompt_cache"] = get_prompt_cache_stats().stats()
+        jira_cache = get_jira_issue_cache()
+        health_status["jira_cache"] = jira_cache.stats() if jira_cache is not None else {"enabled": False}
+        
         return health_status
     except Exception as e:
         return JSONResponse(
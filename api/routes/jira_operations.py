@@ -26,7 +26,7 @@ from ..models.jira_operations import (
     BulkCreateStoryItem
 )
 from ..models.generation import BatchResponse, JobStatus
-from ..dependencies import get_jira_client, get_active_job_for_ticket, register_ticket_job, jobs
+from ..dependencies import get_jira_client, get_active_job_for_ticket, claim_ticket_jobs, release_ticket_jobs, jobs
 from ..models.generation import BatchResponse, JobStatus
 from ..auth import get_current_user
 from datetime import datetime
@@ -1197,7 +1197,7 @@ async def bulk_update_stories(
 
         # If async mode, enqueue job
         if request.async_mode:
-            from ..job_queue import get_redis_pool
+            from ..job_scheduler import submit_job
             from ..dependencies import jobs
 
             job_id = str(uuid.uuid4())
@@ -1214,13 +1214,13 @@ async def bulk_update_stories(
                 story_keys=[item.story_key for item in request.stories]
             )
 
-            redis_pool = await get_redis_pool()
-            await redis_pool.enqueue_job(
+            await submit_job(
                 'process_bulk_story_update_worker',
                 job_id=job_id,
                 stories_data=[item.dict() for item in request.stories],
                 dry_run=request.dry_run,
-                _job_id=job_id
+                _job_id=job_id,
+                _user=current_user
             )
 
             logger.info(f"Enqueued bulk story update job {job_id} for {len(request.stories)} stories")
@@ -1280,6 +1280,27 @@ async def bulk_update_stories(
         raise HTTPException(status_code=500, detail=f"Failed to bulk update stories: {str(e)}")
 
 
+def _derive_epics_from_stories(jira_client, tasks) -> Dict[str, Any]:
+    """Epic key per story_key of tasks without a parent_key, resolved with one bulk JIRA fetch"""
+    from ..utils import normalize_ticket_key
+    story_keys = []
+    for task_item in tasks:
+        if (not task_item.parent_key or not str(task_item.parent_key).strip()) and task_item.story_key:
+            sk = normalize_ticket_key(task_item.story_key) or task_item.story_key.strip()
+            if sk and sk not in story_keys:
+                story_keys.append(sk)
+    if not story_keys:
+        return {}
+    raw_epics = jira_client.get_epic_keys_from_stories(story_keys)
+    story_key_to_epic = {}
+    for sk in story_keys:
+        raw_epic = raw_epics.get(sk)
+        story_key_to_epic[sk] = normalize_ticket_key(raw_epic) if raw_epic else None
+        if story_key_to_epic[sk]:
+            logger.info(f"Derived epic {story_key_to_epic[sk]} from story {sk}")
+    return story_key_to_epic
+
+
 @router.post("/jira/bulk-create-tasks",
          tags=["JIRA Operations"],
          response_model=Union[BulkCreateTasksResponse, BatchResponse],
@@ -1292,7 +1313,7 @@ async def bulk_create_tasks(
     """Bulk create multiple task tickets"""
     jira_client = get_jira_client()
     from ..dependencies import get_confluence_client
-    from ..job_queue import get_redis_pool
+    from ..job_scheduler import submit_job
 
     try:
         logger.info(f"User {current_user} bulk creating {len(request.tasks)} task tickets (create_tickets={request.create_tickets}, async_mode={request.async_mode})")
@@ -1329,15 +1350,7 @@ async def bulk_create_tasks(
             from ..utils import normalize_ticket_key
             tasks_data = [task.dict() for task in request.tasks]
             if request.create_tickets:
-                _story_key_to_epic = {}
-                for task_item in request.tasks:
-                    if (not task_item.parent_key or not str(task_item.parent_key).strip()) and task_item.story_key:
-                        sk = normalize_ticket_key(task_item.story_key) or task_item.story_key.strip()
-                        if sk and sk not in _story_key_to_epic:
-                            raw_epic = jira_client.get_epic_key_from_story(sk)
-                            _story_key_to_epic[sk] = normalize_ticket_key(raw_epic) if raw_epic else None
-                            if _story_key_to_epic[sk]:
-                                logger.info(f"Derived epic {_story_key_to_epic[sk]} from story {sk}")
+                _story_key_to_epic = _derive_epics_from_stories(jira_client, request.tasks)
                 for i, task_item in enumerate(request.tasks):
                     if task_item.parent_key and str(task_item.parent_key).strip():
                         resolved_epic = normalize_ticket_key(task_item.parent_key)
@@ -1362,17 +1375,25 @@ async def bulk_create_tasks(
                 story_keys=story_keys
             )
             
-            # Register all story keys for duplicate prevention
-            for story_key in story_keys:
-                register_ticket_job(story_key, job_id)
+            # Claim all story keys for duplicate prevention (atomically, in one round trip);
+            # a job that claimed one since the check above wins
+            active_duplicates = claim_ticket_jobs(story_keys, job_id)
+            if active_duplicates:
+                release_ticket_jobs(job_id)
+                del jobs[job_id]
+                raise HTTPException(
+                    status_code=409,
+                    detail=f"Some stories are already being processed: {', '.join(active_duplicates)}",
+                    headers={"X-Duplicate-Stories": ",".join(active_duplicates)}
+                )
             
-            redis_pool = await get_redis_pool()
-            await redis_pool.enqueue_job(
+            await submit_job(
                 'process_bulk_task_creation_worker',
                 job_id=job_id,
                 tasks_data=tasks_data,
                 create_tickets=request.create_tickets,
-                _job_id=job_id
+                _job_id=job_id,
+                _user=current_user
             )
             
             logger.info(f"Enqueued bulk task creation job {job_id} for {len(request.tasks)} tasks")
@@ -1419,15 +1440,7 @@ async def bulk_create_tasks(
         # Resolve missing parent_key (epic) from story_key via JIRA
         from ..utils import normalize_ticket_key
         from ..constants import MSG_COULD_NOT_DERIVE_EPIC
-        _story_key_to_epic = {}
-        for task_item in request.tasks:
-            if (not task_item.parent_key or not str(task_item.parent_key).strip()) and task_item.story_key:
-                sk = normalize_ticket_key(task_item.story_key) or task_item.story_key.strip()
-                if sk and sk not in _story_key_to_epic:
-                    raw_epic = jira_client.get_epic_key_from_story(sk)
-                    _story_key_to_epic[sk] = normalize_ticket_key(raw_epic) if raw_epic else None
-                    if _story_key_to_epic[sk]:
-                        logger.info(f"Derived epic {_story_key_to_epic[sk]} from story {sk}")
+        _story_key_to_epic = _derive_epics_from_stories(jira_client, request.tasks)
         resolved_parent_keys = []
         for task_item in request.tasks:
             if task_item.parent_key and str(task_item.parent_key).strip():
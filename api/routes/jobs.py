@@ -2,14 +2,20 @@
 Jobs Routes
 Endpoints for job tracking and status
 """
-from fastapi import APIRouter, HTTPException, Query, Depends
+from fastapi import APIRouter, HTTPException, Query, Depends, Header, Request, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
 from datetime import datetime, timezone
-from typing import Optional, Literal
+from typing import Any, Dict, Optional, Literal
+import json
 import logging
+import uuid
 
 from ..models.generation import JobStatus
 from ..dependencies import jobs, get_job_by_ticket_key
+from ..job_store import cursor_for
+from ..job_events import get_job_event_hub
 from ..auth import get_current_user
+from ..blocking_executor import run_blocking
 from ..job_queue import get_redis_pool
 from ..utils import normalize_ticket_key
 
@@ -31,6 +37,18 @@ def _normalize_datetime(dt: Optional[datetime]) -> Optional[datetime]:
     return dt.astimezone(timezone.utc)
 
 
+def _normalize_job_keys(job: JobStatus) -> None:
+    """Normalize ticket keys (extract from URLs), assigning only when they change so stored jobs aren't rewritten"""
+    if job.ticket_key:
+        normalized = normalize_ticket_key(job.ticket_key)
+        if normalized != job.ticket_key:
+            job.ticket_key = normalized
+    if job.ticket_keys:
+        normalized_keys = [normalize_ticket_key(k) for k in job.ticket_keys if normalize_ticket_key(k)]
+        if normalized_keys != job.ticket_keys:
+            job.ticket_keys = normalized_keys
+
+
 async def _reconstruct_job_from_redis(job_id: str) -> Optional[JobStatus]:
     """Reconstruct a job from Redis if it exists there but not in memory"""
     try:
@@ -38,14 +56,14 @@ async def _reconstruct_job_from_redis(job_id: str) -> Optional[JobStatus]:
         
         # Try to get job using Job class (for running jobs) or all_job_results (for completed jobs)
         # First, try to create a Job object to check if it exists
-        from arq.jobs import Job
+        from arq.jobs import Job, JobStatus as ArqJobStatus
         try:
             arq_job = Job(job_id, redis_pool)
-            # Check if job exists by trying to get its info
+            # One info() read: the JobResult once finished, otherwise the queued JobDef
             job_info = await arq_job.info()
-            if job_info:
-                # Extract job info from ARQ job
-                kwargs = job_info.get('kwargs', {}) or {}
+            if job_info is None:
+                raise LookupError(f"ARQ has no job {job_id}")
+            kwargs = job_info.kwargs or {}
             job_type = kwargs.get('job_type', 'single')
             # Check for story_coverage first (has story_key but not ticket_key in kwargs)
             if 'story_key' in kwargs and 'ticket_key' not in kwargs:
@@ -63,65 +81,24 @@ async def _reconstruct_job_from_redis(job_id: str) -> Optional[JobStatus]:
             elif 'test_type' in kwargs:
                 job_type = 'test_generation'
             
-            # Determine status by trying to get the result
-            # If we can get result immediately, job is completed/failed
-            # If we can't, job is still running (started/processing)
+            # Finished jobs carry success/result; otherwise ask ARQ whether it is running yet
             arq_results = None
             error = None
-            status = "started"  # Default
-            
-            try:
-                # Try to get result with very short timeout (don't wait)
-                arq_results = await arq_job.result(timeout=0.01)
-                # If we got a result, job is done - check if it's success or failure
-                # Check job info to see if it was successful
-                try:
-                    job_info = await arq_job.info()
-                    if job_info and job_info.get('success') is False:
-                        status = "failed"
-                        error = str(arq_results) if arq_results else "Job failed"
-                    else:
-                        status = "completed"
-                except:
-                    # Can't get info, assume completed if we got a result
-                    status = "completed"
-            except Exception as e:
-                # Result not available - job is still running
-                # Try to get job info to determine if it's processing or just queued
-                try:
-                    job_info = await arq_job.info()
-                    if job_info:
-                        arq_status = job_info.get('status', '')
-                        if arq_status == 'in_progress':
-                            status = "processing"
-                        elif arq_status in ['queued', 'deferred']:
-                            status = "started"
-                        else:
-                            # Check if job failed but result not available yet
-                            if job_info.get('success') is False:
-                                status = "failed"
-                                error = "Job failed"
-                            else:
-                                status = "started"  # Default to started
-                except:
-                    # Can't get info, assume started
-                    status = "started"
+            success = getattr(job_info, 'success', None)
+            if success is None:
+                arq_status = await arq_job.status()
+                status = "processing" if arq_status == ArqJobStatus.in_progress else "started"
+            elif success:
+                status = "completed"
+                arq_results = job_info.result
+            else:
+                status = "failed"
+                error = str(job_info.result) if job_info.result else "Job failed"
             
             # Get timestamps from job info
-            enqueue_time = None
-            start_time = None
-            finish_time = None
-            try:
-                job_info = await arq_job.info()
-                if job_info:
-                    enqueue_time = job_info.get('enqueue_time')
-                    start_time = job_info.get('start_time')
-                    finish_time = job_info.get('finish_time')
-            except:
-                # Fallback to direct attributes if available
-                enqueue_time = getattr(arq_job, 'enqueue_time', None)
-                start_time = getattr(arq_job, 'start_time', None)
-                finish_time = getattr(arq_job, 'finish_time', None)
+            enqueue_time = job_info.enqueue_time
+            start_time = getattr(job_info, 'start_time', None)
+            finish_time = getattr(job_info, 'finish_time', None)
             
             # Determine progress message
             if status == "started":
@@ -172,7 +149,7 @@ async def _reconstruct_job_from_redis(job_id: str) -> Optional[JobStatus]:
             )
             
             # Store in memory for future requests
-            jobs[job_id] = reconstructed_job
+            await run_blocking(jobs.__setitem__, job_id, reconstructed_job)
             logger.info(f"Job {job_id} reconstructed from Redis with status {status}, type={job_type}")
             return reconstructed_job
         except Exception as job_error:
@@ -251,7 +228,7 @@ async def _reconstruct_job_from_redis(job_id: str) -> Optional[JobStatus]:
                 )
                 
                 # Store in memory for future requests
-                jobs[job_id] = reconstructed_job
+                await run_blocking(jobs.__setitem__, job_id, reconstructed_job)
                 logger.info(f"Job {job_id} reconstructed from Redis results with status {status}")
                 return reconstructed_job
                 
@@ -260,6 +237,22 @@ async def _reconstruct_job_from_redis(job_id: str) -> Optional[JobStatus]:
     return None
 
 
+@router.get("/jobs/queues",
+         tags=["Jobs"],
+         summary="Queue depth and wait time per job class",
+         description="For each scheduling class (interactive, bulk, sandbox): jobs waiting for dispatch, dispatched (ready + running), running, per-user counts, the oldest waiting job's age and recent wait times (submit to start). Use these to size each class's worker pool.")
+async def get_queue_stats(current_user: str = Depends(get_current_user)):
+    """Scheduler queue statistics"""
+    from ..job_scheduler import get_queue_stats as scheduler_queue_stats, get_scheduling_config
+    if not get_scheduling_config()['enabled']:
+        raise HTTPException(status_code=400, detail="Job scheduling is disabled (scheduling.enabled=false)")
+    try:
+        return {"classes": await scheduler_queue_stats()}
+    except Exception as e:
+        logger.error(f"Error reading queue statistics: {e}")
+        raise HTTPException(status_code=503, detail=f"Queue statistics unavailable: {e}")
+
+
 @router.get("/jobs/{job_id}",
          response_model=JobStatus,
          tags=["Jobs"],
@@ -267,12 +260,12 @@ async def _reconstruct_job_from_redis(job_id: str) -> Optional[JobStatus]:
          description="Get the status and results of a background job. Works with batch, single, story_coverage, story_generation, task_generation, test_generation, prd_story_sync, and draft_pr jobs.")
 async def get_job_status(job_id: str, current_user: str = Depends(get_current_user)):
     """Get the status of a batch processing job"""
-    # Check in-memory first
-    if job_id in jobs:
-        job = jobs[job_id]
-        # If job is in started/processing status, always check Redis for actual status
-        # (worker may have completed it in separate process)
-        if job.status in ["started", "processing"]:
+    # Check the job store first (a shared store reads Redis, so off the event loop)
+    job = await run_blocking(jobs.get, job_id)
+    if job is not None:
+        # With a per-process store, a started/processing job may have been finished by a worker
+        # in another process, so check ARQ for the actual status (a shared store is already current)
+        if not jobs.shared and job.status in ["started", "processing"]:
             redis_job = await _reconstruct_job_from_redis(job_id)
             if redis_job:
                 # Redis has the actual status - use it
@@ -282,28 +275,72 @@ async def get_job_status(job_id: str, current_user: str = Depends(get_current_us
             redis_job = await _reconstruct_job_from_redis(job_id)
             if redis_job and redis_job.results is not None:
                 # Redis has the results - use it and update in-memory
-                jobs[job_id] = redis_job
+                await run_blocking(jobs.__setitem__, job_id, redis_job)
                 return redis_job
         # Job is completed/failed/cancelled in memory, normalize ticket_key before returning
-        if job.ticket_key:
-            job.ticket_key = normalize_ticket_key(job.ticket_key)
-        if job.ticket_keys:
-            job.ticket_keys = [normalize_ticket_key(k) for k in job.ticket_keys if normalize_ticket_key(k)]
+        _normalize_job_keys(job)
         return job
     
     # If not in memory, try to reconstruct from Redis
     reconstructed = await _reconstruct_job_from_redis(job_id)
     if reconstructed:
         # Normalize ticket_key if needed (should already be normalized in _reconstruct_job_from_redis, but double-check)
-        if reconstructed.ticket_key:
-            reconstructed.ticket_key = normalize_ticket_key(reconstructed.ticket_key)
-        if reconstructed.ticket_keys:
-            reconstructed.ticket_keys = [normalize_ticket_key(k) for k in reconstructed.ticket_keys if normalize_ticket_key(k)]
+        _normalize_job_keys(reconstructed)
         return reconstructed
     
     raise HTTPException(status_code=404, detail="Job not found")
 
 
+def _format_sse(event: Optional[Dict[str, Any]]) -> str:
+    """Server-sent event frame for a job event (None is a keep-alive comment)"""
+    if event is None:
+        return ": keep-alive\n\n"
+    return f"id: {event['id']}\nevent: progress\ndata: {json.dumps(event, default=str)}\n\n"
+
+
+@router.get("/jobs/{job_id}/events",
+         tags=["Jobs"],
+         summary="Stream job progress (SSE)",
+         description="Server-sent events with the job's status and progress: the current state first, then every update until the job completes, fails or is cancelled. Reconnect with the Last-Event-ID header (or last_event_id) to resume.")
+async def stream_job_events(
+    job_id: str,
+    request: Request,
+    last_event_id: Optional[int] = Query(None, description="Resume after this event id (alternative to the Last-Event-ID header)"),
+    last_event_id_header: Optional[str] = Header(None, alias="Last-Event-ID"),
+    current_user: str = Depends(get_current_user)
+):
+    """Stream progress events for a job"""
+    if await run_blocking(jobs.get, job_id) is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    if last_event_id is None and last_event_id_header and last_event_id_header.isdigit():
+        last_event_id = int(last_event_id_header)
+    
+    async def event_stream():
+        async for event in get_job_event_hub().events(jobs, job_id, last_event_id):
+            if await request.is_disconnected():
+                break
+            yield _format_sse(event)
+    
+    return StreamingResponse(event_stream(), media_type="text/event-stream",
+                             headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+
+@router.websocket("/jobs/{job_id}/ws")
+async def job_events_websocket(websocket: WebSocket, job_id: str, last_event_id: Optional[int] = None,
+                               current_user: str = Depends(get_current_user)):
+    """Same progress events as /jobs/{job_id}/events, as JSON WebSocket messages"""
+    if await run_blocking(jobs.get, job_id) is None:
+        await websocket.close(code=4404, reason="Job not found")
+        return
+    await websocket.accept()
+    try:
+        async for event in get_job_event_hub().events(jobs, job_id, last_event_id):
+            await websocket.send_text(json.dumps(event if event is not None else {"heartbeat": True}, default=str))
+    except WebSocketDisconnect:
+        return
+    await websocket.close()
+
+
 @router.get("/jobs",
          tags=["Jobs"],
          summary="List all jobs",
@@ -316,94 +353,129 @@ async def list_jobs(
     story_key: Optional[str] = Query(None, description="Filter by story key (matches story_key field or story_keys list)"),
     sort_by: Optional[Literal["started_at", "completed_at", "status", "job_type", "job_id", "processed_tickets", "successful_tickets", "failed_tickets"]] = Query("started_at", description="Field to sort by (started_at, completed_at, status, job_type, job_id, processed_tickets, successful_tickets, failed_tickets)"),
     sort_order: Optional[Literal["asc", "desc"]] = Query("desc", description="Sort order (asc for ascending, desc for descending)"),
-    offset: Optional[int] = Query(0, ge=0, description="Number of jobs to skip for pagination"),
+    offset: Optional[int] = Query(0, ge=0, description="Number of jobs to skip for pagination (prefer cursor; offset paging cost grows with offset)"),
     limit: int = Query(50, ge=1, le=200, description="Maximum number of jobs to return"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous response's next_cursor (started_at ordering only)"),
+    include_total: bool = Query(True, description="Include the total number of matching jobs (approximate when several filters are combined)"),
     current_user: str = Depends(get_current_user)
 ):
     """List all background processing jobs"""
-    job_list = list(jobs.values())
-    
-    # Also check Redis for jobs that aren't in memory
-    # Check if we have few jobs in memory (likely after restart) or if filtering for specific statuses
-    # Always check Redis for active jobs (started/processing) to ensure we show all current jobs
-    should_check_redis = (
-        len(job_list) < 10 or 
-        status in ["completed", "failed", "started", "processing"] or
-        status is None  # No filter means show all jobs, so check Redis
-    )
-    
-    if should_check_redis:
+    next_cursor = None
+    total_is_estimate = False
+    if cursor and (sort_by != "started_at" or job_id):
+        raise HTTPException(status_code=400, detail="cursor pagination requires sort_by=started_at and no job_id filter")
+    if sort_by == "started_at" and not job_id and (cursor or (jobs.shared and not offset)):
+        # Filtering, ordering and cursor paging run against the job store's started_at indexes
         try:
-            redis_pool = await get_redis_pool()
-            all_results = await redis_pool.all_job_results()
-            # Get job IDs we already have
-            existing_job_ids = {job.job_id for job in job_list}
-            # Reconstruct missing jobs from Redis (limit to recent 50 to avoid performance issues)
-            for job_result in list(all_results)[:50]:
-                if job_result.job_id not in existing_job_ids:
-                    reconstructed = await _reconstruct_job_from_redis(job_result.job_id)
-                    if reconstructed:
-                        job_list.append(reconstructed)
-        except Exception as e:
-            logger.debug(f"Error loading jobs from Redis: {e}")
+            page = await run_blocking(
+                jobs.page, status=status, job_type=job_type, ticket_key=ticket_key, story_key=story_key,
+                cursor=cursor, limit=limit, descending=sort_order == "desc", include_total=include_total
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        job_list, total_count = page.jobs, page.total
+        next_cursor, total_is_estimate = page.next_cursor, page.total_is_estimate
+    elif jobs.shared and sort_by == "started_at" and not job_id:
+        # Offset paging over the started_at indexes, kept for existing clients
+        job_list, total_count = await run_blocking(
+            jobs.query, status=status, job_type=job_type, ticket_key=ticket_key, story_key=story_key,
+            offset=offset, limit=limit, descending=sort_order == "desc"
+        )
+    else:
+        if jobs.shared:
+            if job_id:
+                job = await run_blocking(jobs.get, job_id)
+                job_list = [job] if job is not None else []
+            else:
+                job_list, _ = await run_blocking(jobs.query, status=status, job_type=job_type, ticket_key=ticket_key,
+                                                 story_key=story_key, limit=None)
+        else:
+            job_list = list(jobs.values())
+            
+            # Jobs are per process: also check ARQ results for jobs that aren't in memory
+            # Check if we have few jobs in memory (likely after restart) or if filtering for specific statuses
+            # Always check Redis for active jobs (started/processing) to ensure we show all current jobs
+            should_check_redis = (
+                len(job_list) < 10 or 
+                status in ["completed", "failed", "started", "processing"] or
+                status is None  # No filter means show all jobs, so check Redis
+            )
+
+            if should_check_redis:
+                try:
+                    redis_pool = await get_redis_pool()
+                    all_results = await redis_pool.all_job_results()
+                    # Get job IDs we already have
+                    existing_job_ids = {job.job_id for job in job_list}
+                    # Reconstruct missing jobs from Redis (limit to recent 50 to avoid performance issues)
+                    for job_result in list(all_results)[:50]:
+                        if job_result.job_id not in existing_job_ids:
+                            reconstructed = await _reconstruct_job_from_redis(job_result.job_id)
+                            if reconstructed:
+                                job_list.append(reconstructed)
+                except Exception as e:
+                    logger.debug(f"Error loading jobs from Redis: {e}")
     
-    # Filter by status if provided
-    if status:
-        job_list = [job for job in job_list if job.status == status]
+        # Filter by status if provided
+        if status:
+            job_list = [job for job in job_list if job.status == status]
     
-    # Filter by job_type if provided
-    if job_type:
-        job_list = [job for job in job_list if job.job_type == job_type]
+        # Filter by job_type if provided
+        if job_type:
+            job_list = [job for job in job_list if job.job_type == job_type]
     
-    # Filter by job_id if provided
-    if job_id:
-        job_list = [job for job in job_list if job.job_id == job_id]
+        # Filter by job_id if provided
+        if job_id:
+            job_list = [job for job in job_list if job.job_id == job_id]
     
-    # Filter by ticket_key if provided
-    if ticket_key:
-        job_list = [job for job in job_list if 
-                   job.ticket_key == ticket_key or 
-                   (job.ticket_keys and ticket_key in job.ticket_keys)]
+        # Filter by ticket_key if provided
+        if ticket_key:
+            job_list = [job for job in job_list if 
+                       job.ticket_key == ticket_key or 
+                       (job.ticket_keys and ticket_key in job.ticket_keys)]
     
-    # Filter by story_key if provided
-    if story_key:
-        job_list = [job for job in job_list if 
-                   job.story_key == story_key or 
-                   (job.story_keys and story_key in job.story_keys)]
+        # Filter by story_key if provided
+        if story_key:
+            job_list = [job for job in job_list if 
+                       job.story_key == story_key or 
+                       (job.story_keys and story_key in job.story_keys)]
     
-    # Sort by specified field
-    reverse = sort_order == "desc"
+        # Sort by specified field
+        reverse = sort_order == "desc"
     
-    if sort_by == "started_at":
-        # Normalize datetimes to UTC-aware for comparison
-        job_list.sort(key=lambda x: _normalize_datetime(x.started_at) or datetime.min.replace(tzinfo=timezone.utc), reverse=reverse)
-    elif sort_by == "completed_at":
-        # For completed_at, None values should go to the end (or beginning depending on sort order)
-        job_list.sort(key=lambda x: _normalize_datetime(x.completed_at) or (datetime.max.replace(tzinfo=timezone.utc) if reverse else datetime.min.replace(tzinfo=timezone.utc)), reverse=reverse)
-    elif sort_by in ["status", "job_type", "job_id"]:
-        # String fields - handle None values
-        job_list.sort(key=lambda x: getattr(x, sort_by, "") or "", reverse=reverse)
-    elif sort_by in ["processed_tickets", "successful_tickets", "failed_tickets"]:
-        # Integer fields
-        job_list.sort(key=lambda x: getattr(x, sort_by, 0), reverse=reverse)
-    else:
-        # Fallback to started_at if invalid sort_by (shouldn't happen due to Literal type, but just in case)
-        job_list.sort(key=lambda x: _normalize_datetime(x.started_at) or datetime.min.replace(tzinfo=timezone.utc), reverse=reverse)
+        if sort_by == "started_at":
+            # Normalize datetimes to UTC-aware for comparison; ties break on job_id, as in JobStore.page
+            job_list.sort(key=lambda x: (_normalize_datetime(x.started_at) or datetime.min.replace(tzinfo=timezone.utc), x.job_id), reverse=reverse)
+        elif sort_by == "completed_at":
+            # For completed_at, None values should go to the end (or beginning depending on sort order)
+            job_list.sort(key=lambda x: _normalize_datetime(x.completed_at) or (datetime.max.replace(tzinfo=timezone.utc) if reverse else datetime.min.replace(tzinfo=timezone.utc)), reverse=reverse)
+        elif sort_by in ["status", "job_type", "job_id"]:
+            # String fields - handle None values
+            job_list.sort(key=lambda x: getattr(x, sort_by, "") or "", reverse=reverse)
+        elif sort_by in ["processed_tickets", "successful_tickets", "failed_tickets"]:
+            # Integer fields
+            job_list.sort(key=lambda x: getattr(x, sort_by, 0), reverse=reverse)
+        else:
+            # Fallback to started_at if invalid sort_by (shouldn't happen due to Literal type, but just in case)
+            job_list.sort(key=lambda x: (_normalize_datetime(x.started_at) or datetime.min.replace(tzinfo=timezone.utc), x.job_id), reverse=reverse)
     
-    # Apply offset and limit for pagination
-    total_count = len(job_list)
-    job_list = job_list[offset:offset + limit]
+        # Apply offset and limit for pagination
+        total_count = len(job_list)
+        has_more = offset + limit < total_count
+        job_list = job_list[offset:offset + limit]
+        # Cursors cannot be combined with a job_id filter, so don't hand one out for it
+        if sort_by == "started_at" and job_id is None and has_more and job_list:
+            next_cursor = cursor_for(job_list[-1])
     
     # Normalize ticket_key for all jobs before returning
     for job in job_list:
-        if job.ticket_key:
-            job.ticket_key = normalize_ticket_key(job.ticket_key)
-        if job.ticket_keys:
-            job.ticket_keys = [normalize_ticket_key(k) for k in job.ticket_keys if normalize_ticket_key(k)]
+        _normalize_job_keys(job)
     
     return {
         "jobs": job_list,
         "total": total_count,
+        "total_is_estimate": total_is_estimate,
+        "next_cursor": next_cursor,
         "offset": offset,
         "limit": limit,
         "filtered_by_status": status,
@@ -431,7 +503,7 @@ async def get_job_status_by_ticket(ticket_key: str, current_user: str = Depends(
             detail=f"Invalid ticket key format: {ticket_key}"
         )
     
-    job_data = get_job_by_ticket_key(normalized_ticket_key)
+    job_data = await run_blocking(get_job_by_ticket_key, normalized_ticket_key)
     
     if not job_data:
         raise HTTPException(
@@ -455,16 +527,51 @@ async def get_job_status_by_ticket(ticket_key: str, current_user: str = Depends(
     return job_data
 
 
+@router.post("/jobs/{job_id}/resume",
+         tags=["Jobs"],
+         summary="Resume a batch job from its checkpoint",
+         description="Re-run a failed or cancelled batch or bulk task creation job. Tickets, JIRA keys and links recorded in the job's checkpoint are reused, so finished work (and LLM spend) is not repeated.")
+async def resume_job(job_id: str, current_user: str = Depends(get_current_user)):
+    """Resume a job from its last checkpoint"""
+    job = await run_blocking(jobs.get, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    
+    if job.status not in ["failed", "cancelled"]:
+        raise HTTPException(status_code=400, detail=f"Cannot resume job with status: {job.status}")
+    
+    from ..job_queue import load_job_checkpoint, clear_cancellation_flag, RESUME_CHECKPOINT_FIELD
+    checkpoint = await load_job_checkpoint(job_id)
+    resume = checkpoint.get(RESUME_CHECKPOINT_FIELD)
+    if not resume:
+        raise HTTPException(status_code=400, detail="Job has no checkpoint to resume from")
+    finished_items = len(checkpoint) - 1
+    
+    await clear_cancellation_flag(job_id)
+    job.error = None
+    job.completed_at = None
+    job.progress = {"message": f"Resuming from checkpoint ({finished_items} items already done)..."}
+    job.status = "started"
+    
+    # A new ARQ job id: the original one may still hold its result
+    from ..job_scheduler import submit_job
+    await submit_job(resume["function"], **resume["kwargs"],
+                     _job_id=f"{job_id}:resume:{uuid.uuid4().hex[:8]}", _user=current_user)
+    logger.info(f"Resuming job {job_id} ({resume['function']}) with {finished_items} checkpointed items")
+    
+    return {"job_id": job_id, "status": "started", "checkpointed_items": finished_items}
+
+
 @router.delete("/jobs/{job_id}",
          tags=["Jobs"],
          summary="Cancel a running job",
          description="Cancel a running or queued job. Only jobs with status 'started' or 'processing' can be cancelled.")
 async def cancel_job(job_id: str, current_user: str = Depends(get_current_user)):
     """Cancel a running job"""
-    if job_id not in jobs:
+    job = await run_blocking(jobs.get, job_id)
+    if job is None:
         raise HTTPException(status_code=404, detail="Job not found")
     
-    job = jobs[job_id]
     if job.status not in ["started", "processing"]:
         raise HTTPException(status_code=400, detail=f"Cannot cancel job with status: {job.status}")
     
@@ -473,6 +580,15 @@ async def cancel_job(job_id: str, current_user: str = Depends(get_current_user))
         from ..job_queue import request_job_cancellation
         await request_job_cancellation(job_id)
         logger.info(f"Set cancellation flag in Redis for job {job_id}")
+        # Children of a fanned-out batch see the flag and record themselves as cancelled
+        
+        # A job still waiting for its class's scheduler never reaches ARQ
+        try:
+            from ..job_scheduler import cancel_pending_job
+            if await cancel_pending_job(job_id):
+                logger.info(f"Removed job {job_id} from the scheduler queue")
+        except Exception as scheduler_error:
+            logger.warning(f"Could not remove job {job_id} from the scheduler queue: {scheduler_error}")
         
         # Also try to abort the ARQ job (for queued jobs that haven't started yet)
         redis_pool = await get_redis_pool()
@@ -492,17 +608,9 @@ async def cancel_job(job_id: str, current_user: str = Depends(get_current_user))
         job.progress = {"message": "Job was cancelled by user"}
         
         # Unregister ticket keys and story keys when job is cancelled
-        from ..dependencies import unregister_ticket_job
-        if job.ticket_key:
-            unregister_ticket_job(job.ticket_key)
-        if job.ticket_keys:
-            for ticket_key in job.ticket_keys:
-                unregister_ticket_job(ticket_key)
-        if job.story_key:
-            unregister_ticket_job(job.story_key)
-        if job.story_keys:
-            for story_key in job.story_keys:
-                unregister_ticket_job(story_key)
+        from ..dependencies import release_ticket_jobs
+        await run_blocking(release_ticket_jobs, job_id)
+        await run_blocking(release_ticket_jobs, job_id, [key for key in [job.ticket_key, job.story_key] if key])
         
         return {"message": f"Job {job_id} cancelled successfully", "status": "cancelled"}
     except Exception as e:
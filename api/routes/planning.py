@@ -18,7 +18,7 @@ from ..models.planning import (
 )
 from ..models.generation import BatchResponse
 from ..models.opencode import validate_repos_list
-from ..dependencies import get_generator, get_jira_client, get_config, get_active_job_for_ticket, register_ticket_job, unregister_ticket_job
+from ..dependencies import get_generator, get_jira_client, get_config, get_active_job_for_ticket, register_ticket_job, unregister_ticket_job, claim_ticket_jobs, release_ticket_jobs
 from ..utils import create_custom_llm_client, extract_story_details_with_tests, extract_task_details_with_tests, parse_story_keys_from_input, normalize_ticket_key
 from ..auth import get_current_user
 
@@ -119,7 +119,7 @@ async def plan_epic_complete(request: EpicPlanRequest, current_user: str = Depen
           description="Generate missing stories from PRD/RFC requirements with acceptance criteria and test cases. Preview mode by default. Set dry_run=false to create tickets.")
 async def generate_stories_for_epic(request: StoryGenerationRequest, current_user: str = Depends(get_current_user)):
     """Generate stories for an epic based on requirements"""
-    from ..job_queue import get_redis_pool
+    from ..job_scheduler import submit_job
     from ..models.generation import BatchResponse, JobStatus
     from datetime import datetime
     import uuid
@@ -163,11 +163,17 @@ async def generate_stories_for_epic(request: StoryGenerationRequest, current_use
                 ticket_key=request.epic_key
             )
             
-            # Register epic key for duplicate prevention
-            register_ticket_job(request.epic_key, job_id)
+            # Register epic key for duplicate prevention; a job that claimed it since the check above wins
+            holder = register_ticket_job(request.epic_key, job_id)
+            if holder:
+                del jobs[job_id]
+                raise HTTPException(
+                    status_code=409,
+                    detail=f"Epic {request.epic_key} is already being processed in job {holder}",
+                    headers={"X-Active-Job-Id": holder, "X-Active-Job-Status-Url": f"/jobs/{holder}"}
+                )
             
-            redis_pool = await get_redis_pool()
-            await redis_pool.enqueue_job(
+            await submit_job(
                 'process_story_generation_worker',
                 job_id=job_id,
                 epic_key=request.epic_key,
@@ -175,7 +181,8 @@ async def generate_stories_for_epic(request: StoryGenerationRequest, current_use
                 llm_model=request.llm_model,
                 llm_provider=request.llm_provider,
                 generate_test_cases=request.generate_test_cases,
-                _job_id=job_id
+                _job_id=job_id,
+                _user=current_user
             )
             
             logger.info(f"Enqueued story generation job {job_id} for epic {request.epic_key}")
@@ -222,6 +229,8 @@ async def generate_stories_for_epic(request: StoryGenerationRequest, current_use
         logger.info(f"Story generation completed for {request.epic_key}: {response.success}")
         return response
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error generating stories for {request.epic_key}: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Failed to generate stories: {str(e)}")
@@ -234,7 +243,7 @@ async def generate_stories_for_epic(request: StoryGenerationRequest, current_use
           description="Generate tasks for stories with breakdown and custom LLM configuration. Supports both story keys and full JIRA URLs. Epic key is optional - if not provided, it will be derived from the story tickets' parent epic. Preview mode by default. Set dry_run=false to create tickets.")
 async def generate_tasks_for_stories(request: TaskGenerationRequest, current_user: str = Depends(get_current_user)):
     """Generate tasks for specific stories"""
-    from ..job_queue import get_redis_pool
+    from ..job_scheduler import submit_job
     from ..models.generation import BatchResponse, JobStatus
     from ..dependencies import jobs
     from datetime import datetime
@@ -278,7 +287,7 @@ async def generate_tasks_for_stories(request: TaskGenerationRequest, current_use
             first_story_key = story_keys[0]
             raw_epic = jira_client.get_epic_key_from_story(first_story_key)
             if not raw_epic:
-                if not jira_client.get_ticket(first_story_key):
+                if not jira_client.get_ticket(first_story_key, profile='minimal'):
                     raise HTTPException(
                         status_code=404,
                         detail=f"Story ticket {first_story_key} not found in JIRA"
@@ -344,17 +353,24 @@ async def generate_tasks_for_stories(request: TaskGenerationRequest, current_use
                 repos=repos_urls
             )
             
-            # Register all story keys for duplicate prevention
-            for story_key in story_keys:
-                register_ticket_job(story_key, job_id)
+            # Claim all story keys for duplicate prevention (atomically, in one round trip);
+            # a job that claimed one since the check above wins
+            active_duplicates = claim_ticket_jobs(story_keys, job_id)
+            if active_duplicates:
+                release_ticket_jobs(job_id)
+                del jobs[job_id]
+                raise HTTPException(
+                    status_code=409,
+                    detail=f"Some stories are already being processed: {', '.join(active_duplicates)}",
+                    headers={"X-Duplicate-Stories": ",".join(active_duplicates)}
+                )
             
             # Convert repos to serializable format for worker
             repos_for_worker = None
             if repos_normalized:
                 repos_for_worker = [{"url": r.url, "branch": r.branch} for r in repos_normalized]
             
-            redis_pool = await get_redis_pool()
-            await redis_pool.enqueue_job(
+            await submit_job(
                 'process_task_generation_worker',
                 job_id=job_id,
                 story_keys=story_keys,
@@ -367,7 +383,8 @@ async def generate_tasks_for_stories(request: TaskGenerationRequest, current_use
                 additional_context=request.additional_context,
                 generate_test_cases=request.generate_test_cases,
                 repos=repos_for_worker,
-                _job_id=job_id
+                _job_id=job_id,
+                _user=current_user
             )
             
             logger.info(f"Enqueued task generation job {job_id} for {len(story_keys)} stories" + (" (with OpenCode)" if repos_urls else ""))
@@ -584,7 +601,7 @@ async def generate_team_based_tasks(
           description="Sync story tickets from PRD table to JIRA. Supports both synchronous and asynchronous processing.")
 async def sync_stories_from_prd(request: PRDStorySyncRequest, current_user: str = Depends(get_current_user)):
     """Sync story tickets from PRD table to JIRA"""
-    from ..job_queue import get_redis_pool
+    from ..job_scheduler import submit_job
     from ..models.generation import BatchResponse, JobStatus
     from datetime import datetime
     import uuid
@@ -623,7 +640,7 @@ async def sync_stories_from_prd(request: PRDStorySyncRequest, current_user: str
         # If epic_key provided, get PRD URL from epic
         if epic_key and not prd_url:
             try:
-                epic_issue = generator.jira_client.get_ticket(epic_key)
+                epic_issue = generator.jira_client.get_ticket(epic_key, profile='planning')
                 if epic_issue:
                     prd_url = generator.planning_service._get_custom_field_value(epic_issue, 'PRD')
                     if not prd_url:
@@ -681,11 +698,17 @@ async def sync_stories_from_prd(request: PRDStorySyncRequest, current_user: str
                 prd_url=prd_url
             )
             
-            # Register epic key for duplicate prevention
-            register_ticket_job(epic_key, job_id)
+            # Register epic key for duplicate prevention; a job that claimed it since the check above wins
+            holder = register_ticket_job(epic_key, job_id)
+            if holder:
+                del jobs[job_id]
+                raise HTTPException(
+                    status_code=409,
+                    detail=f"Epic {epic_key} is already being processed in job {holder}",
+                    headers={"X-Active-Job-Id": holder, "X-Active-Job-Status-Url": f"/jobs/{holder}"}
+                )
             
-            redis_pool = await get_redis_pool()
-            await redis_pool.enqueue_job(
+            await submit_job(
                 'process_prd_story_sync_worker',
                 job_id=job_id,
                 epic_key=epic_key,
@@ -694,7 +717,8 @@ async def sync_stories_from_prd(request: PRDStorySyncRequest, current_user: str
                 existing_ticket_action=request.existing_ticket_action,
                 llm_model=request.llm_model,
                 llm_provider=request.llm_provider,
-                _job_id=job_id
+                _job_id=job_id,
+                _user=current_user
             )
             
             logger.info(f"Enqueued PRD story sync job {job_id} for epic {epic_key}")
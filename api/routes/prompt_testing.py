@@ -70,7 +70,8 @@ async def resubmit_prompt(
             modified_user_prompt=request.modified_user_prompt,
             llm_provider=request.llm_provider,
             llm_model=request.llm_model,
-            original_result=None  # We don't need original result for generation
+            original_result=None,  # We don't need original result for generation
+            refresh_cache=request.refresh_cache
         )
         
         # Build prompts comparison
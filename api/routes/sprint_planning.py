@@ -278,7 +278,7 @@ async def plan_epic_to_sprints(
     current_user: str = Depends(get_current_user)
 ):
     """Plan epic tasks to sprints"""
-    from ..job_queue import get_redis_pool
+    from ..job_scheduler import submit_job
     from ..dependencies import jobs
     from datetime import datetime
     import uuid
@@ -314,11 +314,17 @@ async def plan_epic_to_sprints(
                 ticket_key=request.epic_key
             )
             
-            # Register epic key for duplicate prevention
-            register_ticket_job(request.epic_key, job_id)
+            # Register epic key for duplicate prevention; a job that claimed it since the check above wins
+            holder = register_ticket_job(request.epic_key, job_id)
+            if holder:
+                del jobs[job_id]
+                raise HTTPException(
+                    status_code=409,
+                    detail=f"Epic {request.epic_key} is already being processed in job {holder}",
+                    headers={"X-Active-Job-Id": holder, "X-Active-Job-Status-Url": f"/jobs/{holder}"}
+                )
             
-            redis_pool = await get_redis_pool()
-            await redis_pool.enqueue_job(
+            await submit_job(
                 'process_sprint_planning_worker',
                 job_id=job_id,
                 epic_key=request.epic_key,
@@ -329,7 +335,8 @@ async def plan_epic_to_sprints(
                 team_id=request.team_id,
                 auto_create_sprints=request.auto_create_sprints,
                 dry_run=request.dry_run,
-                _job_id=job_id
+                _job_id=job_id,
+                _user=current_user
             )
             
             logger.info(f"Enqueued sprint planning job {job_id} for epic {request.epic_key}")
@@ -391,7 +398,7 @@ async def create_timeline(
     current_user: str = Depends(get_current_user)
 ):
     """Create timeline schedule"""
-    from ..job_queue import get_redis_pool
+    from ..job_scheduler import submit_job
     from ..dependencies import jobs
     from datetime import datetime
     import uuid
@@ -427,11 +434,17 @@ async def create_timeline(
                 ticket_key=request.epic_key
             )
             
-            # Register epic key for duplicate prevention
-            register_ticket_job(request.epic_key, job_id)
+            # Register epic key for duplicate prevention; a job that claimed it since the check above wins
+            holder = register_ticket_job(request.epic_key, job_id)
+            if holder:
+                del jobs[job_id]
+                raise HTTPException(
+                    status_code=409,
+                    detail=f"Epic {request.epic_key} is already being processed in job {holder}",
+                    headers={"X-Active-Job-Id": holder, "X-Active-Job-Status-Url": f"/jobs/{holder}"}
+                )
             
-            redis_pool = await get_redis_pool()
-            await redis_pool.enqueue_job(
+            await submit_job(
                 'process_timeline_planning_worker',
                 job_id=job_id,
                 epic_key=request.epic_key,
@@ -441,7 +454,8 @@ async def create_timeline(
                 team_capacity_days=request.team_capacity_days,
                 team_id=request.team_id,
                 dry_run=request.dry_run,
-                _job_id=job_id
+                _job_id=job_id,
+                _user=current_user
             )
             
             logger.info(f"Enqueued timeline planning job {job_id} for epic {request.epic_key}")
@@ -22,7 +22,7 @@ from ..dependencies import get_jira_client, get_llm_client, get_config
 from ..dependencies import jobs, get_active_job_for_ticket, register_ticket_job
 from ..utils import create_custom_llm_client, normalize_ticket_key
 from ..auth import get_current_user
-from ..job_queue import get_redis_pool
+from ..job_scheduler import submit_job
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -93,7 +93,7 @@ async def analyze_story_coverage(
                     # Job ID returned but job doesn't exist - clean up stale mapping
                     logger.warning(f"Stale ticket_jobs mapping found: {story_key} -> {active_job_id} (job not in jobs dict)")
                     from ..dependencies import unregister_ticket_job
-                    unregister_ticket_job(story_key)
+                    unregister_ticket_job(story_key, active_job_id)
                     # Continue to create new job
             
             job_id = str(uuid.uuid4())
@@ -111,16 +111,22 @@ async def analyze_story_coverage(
                 repos=repos_urls
             )
             
-            # Register story key for duplicate prevention
-            register_ticket_job(story_key, job_id)
+            # Register story key for duplicate prevention; a job that claimed it since the check above wins
+            holder = register_ticket_job(story_key, job_id)
+            if holder:
+                del jobs[job_id]
+                raise HTTPException(
+                    status_code=409,
+                    detail=f"Story {story_key} is already being processed in job {holder}",
+                    headers={"X-Active-Job-Id": holder, "X-Active-Job-Status-Url": f"/jobs/{holder}"}
+                )
             
             # Convert repos to serializable format for worker
             repos_for_worker = None
             if repos_normalized:
                 repos_for_worker = [{"url": r.url, "branch": r.branch} for r in repos_normalized]
             
-            redis_pool = await get_redis_pool()
-            await redis_pool.enqueue_job(
+            await submit_job(
                 'process_story_coverage_worker',
                 job_id=job_id,
                 story_key=story_key,
@@ -129,7 +135,8 @@ async def analyze_story_coverage(
                 llm_model=request.llm_model,
                 llm_provider=request.llm_provider,
                 repos=repos_for_worker,
-                _job_id=job_id
+                _job_id=job_id,
+                _user=current_user
             )
             
             logger.info(f"Enqueued story coverage analysis job {job_id} for story {story_key}" + (" (with OpenCode)" if repos_urls else ""))
@@ -29,7 +29,7 @@ async def generate_comprehensive_test_suite(
     current_user: str = Depends(get_current_user)
 ):
     """Generate comprehensive test suite for an epic"""
-    from ..job_queue import get_redis_pool
+    from ..job_scheduler import submit_job
     from ..models.generation import BatchResponse, JobStatus
     from ..dependencies import jobs
     from datetime import datetime
@@ -56,7 +56,7 @@ async def generate_comprehensive_test_suite(
             raw_epic = jira_client.get_epic_key_from_story(normalized_story_key)
             if not raw_epic:
                 # Story not found or has no parent
-                story_data = jira_client.get_ticket(normalized_story_key)
+                story_data = jira_client.get_ticket(normalized_story_key, profile='minimal')
                 if not story_data:
                     raise HTTPException(status_code=404, detail=f"Story {normalized_story_key} not found")
                 raise HTTPException(status_code=400, detail=MSG_STORY_HAS_NO_PARENT_EPIC)
@@ -88,8 +88,7 @@ async def generate_comprehensive_test_suite(
                 failed_tickets=0
             )
             
-            redis_pool = await get_redis_pool()
-            await redis_pool.enqueue_job(
+            await submit_job(
                 'process_test_generation_worker',
                 job_id=job_id,
                 test_type="comprehensive",
@@ -100,7 +99,8 @@ async def generate_comprehensive_test_suite(
                 include_documents=request.include_documents,
                 llm_model=request.llm_model,
                 llm_provider=request.llm_provider,
-                _job_id=job_id
+                _job_id=job_id,
+                _user=current_user
             )
             
             logger.info(f"Enqueued comprehensive test generation job {job_id} for epic {epic_key}")
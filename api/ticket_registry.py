@@ -0,0 +1,348 @@
+"""
+Ticket Registry
+Which job is actively working on a ticket, shared by API processes and ARQ workers.
+
+`api.dependencies.ticket_jobs` is a TicketRegistry: a mapping of ticket_key -> job_id. With
+the Redis backend each claim is a key set only if the ticket is free (or already held by the
+same job), with a lease TTL. A claim made when a job is queued gets the long queued lease;
+once a worker runs the job, a background thread renews the job's claims with the short
+running lease, so the claims of a crashed worker expire within minutes. Every claim is
+also recorded in a per-job set, so a job's claims can be renewed or released together.
+claim_many/release_many handle thousands of tickets in one script call. Without Redis it
+behaves like the old process-local dict.
+"""
+import logging
+import threading
+from collections.abc import MutableMapping
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+CLAIM_KEY_PREFIX = "ticket:claim:"
+HELD_KEY_PREFIX = "ticket:held:"
+DEFAULT_LEASE_SECONDS = 300  # Running jobs renew their claims every third of this
+DEFAULT_QUEUED_LEASE_SECONDS = 21600  # Claims of jobs still waiting for a worker
+
+# ARGV = job_id, lease ms, held set key, claim key prefix, then (ticket, expected holder) pairs;
+# an empty expected holder claims only a free ticket (or one the job already holds)
+_CLAIM_SCRIPT = """
+local claimed = {}
+local conflicts = {}
+for i = 5, #ARGV, 2 do
+  local key = ARGV[4] .. ARGV[i]
+  local holder = redis.call('GET', key)
+  if (not holder) or holder == ARGV[1] or (ARGV[i + 1] ~= '' and holder == ARGV[i + 1]) then
+    redis.call('SET', key, ARGV[1], 'PX', ARGV[2])
+    table.insert(claimed, ARGV[i])
+  else
+    table.insert(conflicts, ARGV[i])
+    table.insert(conflicts, holder)
+  end
+end
+-- unpack() is limited by the Lua C stack, so add in chunks
+for i = 1, #claimed, 1000 do
+  redis.call('SADD', ARGV[3], unpack(claimed, i, math.min(i + 999, #claimed)))
+end
+if #claimed > 0 and redis.call('PTTL', ARGV[3]) < tonumber(ARGV[2]) then
+  redis.call('PEXPIRE', ARGV[3], ARGV[2])
+end
+return conflicts
+"""
+
+# ARGV = job_id ('' = whoever holds them), held set key, claim key prefix, tickets...;
+# with a job_id and no tickets, releases everything the job holds
+_RELEASE_SCRIPT = """
+local tickets = {}
+for i = 4, #ARGV do table.insert(tickets, ARGV[i]) end
+if #tickets == 0 and ARGV[1] ~= '' then tickets = redis.call('SMEMBERS', ARGV[2]) end
+local released = 0
+for _, ticket in ipairs(tickets) do
+  local key = ARGV[3] .. ticket
+  if ARGV[1] == '' or redis.call('GET', key) == ARGV[1] then
+    released = released + redis.call('DEL', key)
+  end
+end
+if ARGV[1] ~= '' then
+  for i = 1, #tickets, 1000 do
+    redis.call('SREM', ARGV[2], unpack(tickets, i, math.min(i + 999, #tickets)))
+  end
+end
+return released
+"""
+
+# ARGV = lease ms, claim key prefix, held set key prefix, job_ids...
+_RENEW_SCRIPT = """
+local renewed = 0
+for i = 4, #ARGV do
+  local held = ARGV[3] .. ARGV[i]
+  local job_renewed = 0
+  for _, ticket in ipairs(redis.call('SMEMBERS', held)) do
+    local key = ARGV[2] .. ticket
+    if redis.call('GET', key) == ARGV[i] then
+      redis.call('PEXPIRE', key, ARGV[1])
+      job_renewed = job_renewed + 1
+    else
+      redis.call('SREM', held, ticket)
+    end
+  end
+  if job_renewed > 0 then redis.call('PEXPIRE', held, ARGV[1]) end
+  renewed = renewed + job_renewed
+end
+return renewed
+"""
+
+
+def _claim_key(ticket_key: str) -> str:
+    return f"{CLAIM_KEY_PREFIX}{ticket_key}"
+
+
+def _held_key(job_id: str) -> str:
+    return f"{HELD_KEY_PREFIX}{job_id}"
+
+
+def _decode(value: Any) -> Any:
+    return value.decode("utf-8") if isinstance(value, bytes) else value
+
+
+class TicketRegistry(MutableMapping):
+    """ticket_key -> job_id of the job working on it, in-process or shared through Redis"""
+
+    def __init__(self, redis_client: Any = None, lease_seconds: int = DEFAULT_LEASE_SECONDS,
+                 queued_lease_seconds: int = DEFAULT_QUEUED_LEASE_SECONDS):
+        self._lock = threading.RLock()
+        self._local: Dict[str, str] = {}
+        self._running: Dict[str, int] = {}
+        self._renewer: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self.redis = None
+        self.configure(redis_client, lease_seconds, queued_lease_seconds)
+
+    def configure(self, redis_client: Any = None, lease_seconds: int = DEFAULT_LEASE_SECONDS,
+                  queued_lease_seconds: int = DEFAULT_QUEUED_LEASE_SECONDS) -> None:
+        """(Re)point the registry at a backend; claims already held locally are copied to Redis"""
+        self.lease_seconds = lease_seconds
+        self.queued_lease_seconds = queued_lease_seconds
+        self.redis = redis_client
+        self._claim = redis_client.register_script(_CLAIM_SCRIPT) if redis_client is not None else None
+        self._release = redis_client.register_script(_RELEASE_SCRIPT) if redis_client is not None else None
+        self._renew = redis_client.register_script(_RENEW_SCRIPT) if redis_client is not None else None
+        if redis_client is not None:
+            with self._lock:
+                local, self._local = self._local, {}
+            by_job: Dict[str, List[str]] = {}
+            for ticket_key, job_id in local.items():
+                by_job.setdefault(job_id, []).append(ticket_key)
+            for job_id, ticket_keys in by_job.items():
+                self.claim_many(ticket_keys, job_id)
+
+    @property
+    def shared(self) -> bool:
+        """True when claims are shared with other processes through Redis"""
+        return self.redis is not None
+
+    # ----- claims -----
+
+    def claim_many(self, ticket_keys: Iterable[str], job_id: str,
+                   is_active: Optional[Callable[[str], bool]] = None) -> Dict[str, str]:
+        """
+        Claim tickets for a job, in one round trip.
+
+        Args:
+            ticket_keys: Tickets to claim
+            job_id: The claiming job
+            is_active: Whether a holding job is still active; tickets held by inactive jobs are
+                taken over (with a second round trip only when there are such conflicts)
+
+        Returns:
+            ticket_key -> job_id of the other active job holding it (tickets not claimed)
+        """
+        ticket_keys = list(dict.fromkeys(key for key in ticket_keys if key))
+        if not ticket_keys:
+            return {}
+        if self.redis is None:
+            conflicts = {}
+            with self._lock:
+                for ticket_key in ticket_keys:
+                    holder = self._local.get(ticket_key)
+                    if holder and holder != job_id and (is_active is None or is_active(holder)):
+                        conflicts[ticket_key] = holder
+                    else:
+                        self._local[ticket_key] = job_id
+            return conflicts
+        conflicts = self._run_claim(job_id, [(ticket_key, "") for ticket_key in ticket_keys])
+        if conflicts and is_active is not None:
+            stale = {ticket_key: holder for ticket_key, holder in conflicts.items() if not is_active(holder)}
+            if stale:
+                conflicts = {ticket_key: holder for ticket_key, holder in conflicts.items() if ticket_key not in stale}
+                # Taken over only if the stale job still holds it; a new holder is a real conflict
+                conflicts.update(self._run_claim(job_id, list(stale.items())))
+        return conflicts
+
+    def claim(self, ticket_key: str, job_id: str,
+              is_active: Optional[Callable[[str], bool]] = None) -> Optional[str]:
+        """Claim one ticket; returns the other active job holding it, or None if claimed"""
+        return self.claim_many([ticket_key], job_id, is_active).get(ticket_key)
+
+    def _run_claim(self, job_id: str, pairs: List[tuple]) -> Dict[str, str]:
+        args = [job_id, self._lease_ms(job_id), _held_key(job_id), CLAIM_KEY_PREFIX]
+        for ticket_key, expected in pairs:
+            args.extend((ticket_key, expected))
+        raw = self._claim(args=args)
+        return {_decode(raw[i]): _decode(raw[i + 1]) for i in range(0, len(raw), 2)}
+
+    def release_many(self, ticket_keys: Optional[Iterable[str]] = None, job_id: Optional[str] = None) -> int:
+        """
+        Release claims in one round trip.
+
+        Args:
+            ticket_keys: Tickets to release (default: every ticket `job_id` holds)
+            job_id: Only release tickets this job holds (default: whoever holds them)
+
+        Returns:
+            Number of claims released
+        """
+        ticket_keys = [key for key in (ticket_keys or []) if key]
+        if not ticket_keys and job_id is None:
+            return 0
+        if self.redis is None:
+            released = 0
+            with self._lock:
+                if not ticket_keys:
+                    ticket_keys = [key for key, holder in self._local.items() if holder == job_id]
+                for ticket_key in ticket_keys:
+                    if ticket_key in self._local and (job_id is None or self._local[ticket_key] == job_id):
+                        del self._local[ticket_key]
+                        released += 1
+            return released
+        try:
+            return int(self._release(args=[job_id or "", _held_key(job_id or ""), CLAIM_KEY_PREFIX, *ticket_keys]))
+        except Exception as e:
+            logger.warning(f"Failed to release ticket claims of job {job_id}: {e}")
+            return 0
+
+    def get_many(self, ticket_keys: List[str]) -> Dict[str, Optional[str]]:
+        """ticket_key -> holding job_id (None if free), in one round trip"""
+        if self.redis is None:
+            with self._lock:
+                return {ticket_key: self._local.get(ticket_key) for ticket_key in ticket_keys}
+        if not ticket_keys:
+            return {}
+        values = self.redis.mget([_claim_key(ticket_key) for ticket_key in ticket_keys])
+        return {ticket_key: _decode(value) for ticket_key, value in zip(ticket_keys, values)}
+
+    # ----- leases of running jobs -----
+
+    def _lease_ms(self, job_id: str) -> int:
+        with self._lock:
+            running = job_id in self._running
+        return (self.lease_seconds if running else self.queued_lease_seconds) * 1000
+
+    def track(self, job_id: str) -> None:
+        """A job started running in this process; keep renewing its claims until untrack()"""
+        with self._lock:
+            self._running[job_id] = self._running.get(job_id, 0) + 1
+        if self.redis is not None:
+            self.renew([job_id])
+            self._ensure_renewer()
+
+    def untrack(self, job_id: str) -> None:
+        with self._lock:
+            count = self._running.get(job_id, 0) - 1
+            if count > 0:
+                self._running[job_id] = count
+            else:
+                self._running.pop(job_id, None)
+
+    def renew(self, job_ids: Optional[List[str]] = None, lease_seconds: Optional[int] = None) -> int:
+        """Extend the claims of running jobs to the running lease (or lease_seconds)"""
+        if self.redis is None:
+            return 0
+        with self._lock:
+            job_ids = list(self._running) if job_ids is None else job_ids
+        if not job_ids:
+            return 0
+        try:
+            lease_ms = (lease_seconds if lease_seconds is not None else self.lease_seconds) * 1000
+            return int(self._renew(args=[lease_ms, CLAIM_KEY_PREFIX, HELD_KEY_PREFIX, *job_ids]))
+        except Exception as e:
+            logger.warning(f"Failed to renew ticket claims: {e}")
+            return 0
+
+    def _ensure_renewer(self) -> None:
+        with self._lock:
+            if self._renewer is not None and self._renewer.is_alive():
+                return
+            self._stop.clear()
+            self._renewer = threading.Thread(target=self._renew_loop, name="ticket-lease-renewer", daemon=True)
+            self._renewer.start()
+
+    def _renew_loop(self) -> None:
+        while not self._stop.wait(max(self.lease_seconds / 3.0, 1.0)):
+            self.renew()
+
+    def close(self) -> None:
+        """Stop renewing leases"""
+        self._stop.set()
+        if self._renewer is not None:
+            self._renewer.join(timeout=5)
+
+    # ----- mapping interface -----
+
+    def __getitem__(self, ticket_key: str) -> str:
+        holder = self.get_many([ticket_key]).get(ticket_key)
+        if holder is None:
+            raise KeyError(ticket_key)
+        return holder
+
+    def __setitem__(self, ticket_key: str, job_id: str) -> None:
+        """Unconditional claim (overwrites another job's claim)"""
+        if self.redis is None:
+            with self._lock:
+                self._local[ticket_key] = job_id
+            return
+        holder = self.get_many([ticket_key]).get(ticket_key)
+        self._run_claim(job_id, [(ticket_key, holder or "")])
+
+    def __delitem__(self, ticket_key: str) -> None:
+        if not self.release_many([ticket_key]):
+            raise KeyError(ticket_key)
+
+    def __contains__(self, ticket_key: object) -> bool:
+        return isinstance(ticket_key, str) and self.get_many([ticket_key]).get(ticket_key) is not None
+
+    def _all_keys(self) -> Set[str]:
+        if self.redis is None:
+            with self._lock:
+                return set(self._local)
+        return {_decode(key)[len(CLAIM_KEY_PREFIX):] for key in self.redis.scan_iter(match=f"{CLAIM_KEY_PREFIX}*")}
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._all_keys())
+
+    def __len__(self) -> int:
+        return len(self._all_keys())
+
+    def clear(self) -> None:
+        if self.redis is None:
+            with self._lock:
+                self._local.clear()
+            return
+        keys = list(self.redis.scan_iter(match=f"{CLAIM_KEY_PREFIX}*"))
+        keys += list(self.redis.scan_iter(match=f"{HELD_KEY_PREFIX}*"))
+        if keys:
+            self.redis.delete(*keys)
+
+
+def configure_ticket_registry(registry: TicketRegistry, registry_config: Dict[str, Any],
+                              redis_client: Any = None) -> TicketRegistry:
+    """
+    Point the process-wide registry at Redis (the job store's client, see configure_job_store)
+    or keep it in process memory when the job store has no Redis.
+    """
+    registry.configure(
+        redis_client,
+        lease_seconds=registry_config.get('lease_seconds', DEFAULT_LEASE_SECONDS),
+        queued_lease_seconds=registry_config.get('queued_lease_seconds', DEFAULT_QUEUED_LEASE_SECONDS),
+    )
+    logger.info(f"Ticket registry backend: {'redis' if redis_client is not None else 'memory'}")
+    return registry
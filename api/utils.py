@@ -5,6 +5,7 @@ Helper functions for LLM client creation and data extraction
 from typing import Optional, Dict, Any, List
 import re
 from src.llm_client import LLMClient
+from src.llm_registry import get_llm_registry
 from .dependencies import get_config, get_generator
 from .models.test_generation import TestCaseModel
 from .models.planning import TaskDetail, StoryDetail
@@ -94,18 +95,18 @@ def normalize_ticket_key(ticket_key: Optional[str]) -> Optional[str]:
 
 
 def create_custom_llm_client(provider: Optional[str] = None, model: Optional[str] = None) -> LLMClient:
-    """Create a custom LLM client with specified provider and model"""
+    """Create a custom LLM client with specified provider and model (SDK client reused from the pool)"""
     config = get_config()
     try:
         # Use the config method that properly handles provider/model selection
         llm_config = config.get_llm_config(provider, model)
         logger.info(f"Using custom LLM configuration: provider={llm_config.get('provider')}, model={llm_config.get('model')}")
         
-        return LLMClient(llm_config)
+        return get_llm_registry().get_client(llm_config)
     except Exception as e:
         logger.error(f"Failed to create custom LLM client: {e}")
         # Fallback to default client
-        return LLMClient(config.get_llm_config())
+        return get_llm_registry().get_client(config.get_llm_config())
 
 
 def create_custom_llm_client_with_prompts(
@@ -115,7 +116,9 @@ def create_custom_llm_client_with_prompts(
     temperature: float = 0.7
 ) -> LLMClient:
     """
-    Create a custom LLM client with specified provider, model, and system prompt
+    Create a custom LLM client with specified provider, model, and system prompt.
+    The provider SDK client is reused from the process-wide pool; system prompt and
+    temperature only apply to the returned client.
     
     Args:
         provider: LLM provider (e.g., 'openai', 'claude', 'gemini')
@@ -141,7 +144,7 @@ def create_custom_llm_client_with_prompts(
         
         logger.info(f"Creating custom LLM client: provider={llm_config.get('provider')}, model={llm_config.get('model')}")
         
-        return LLMClient(llm_config)
+        return get_llm_registry().get_client(llm_config)
     except Exception as e:
         logger.error(f"Failed to create custom LLM client with prompts: {e}")
         raise
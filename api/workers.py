@@ -2,13 +2,23 @@
 ARQ Workers
 Background job processing functions for ARQ worker process
 """
+import asyncio
+import time
 from arq import cron
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 import logging
-from .dependencies import get_jira_client, get_llm_client, get_generator, jobs, get_config, unregister_ticket_job, get_active_job_for_ticket, register_ticket_job, get_bitbucket_client
+from .dependencies import get_jira_client, get_llm_client, get_generator, jobs, get_config, unregister_ticket_job, get_bitbucket_client
+from .dependencies import ticket_jobs, claim_ticket_jobs, release_ticket_jobs
 from .models.generation import TicketResponse, JobStatus
 from .utils import create_custom_llm_client, extract_story_details_with_tests, extract_task_details_with_tests
+from .blocking_executor import run_blocking, JobCancelledError
+from .job_fanout import (start_fanout, enqueue_children, record_child_result, get_child_results,
+                         get_fanout_plan, is_parent_cancelled, is_child_job_id)
+from .job_queue import (clear_cancellation_flag, save_job_checkpoint, load_job_checkpoint, clear_job_checkpoint,
+                        RESUME_CHECKPOINT_FIELD)
+from src.progress import progress_reporter
+from src.metrics import JOB_DURATION
 
 logger = logging.getLogger(__name__)
 
@@ -40,6 +50,8 @@ class WorkerSettings:
     max_jobs = 10  # Default, will be overridden by config
     job_timeout = 3600  # Default 1 hour, will be overridden by config
     keep_result = 3600  # Default 1 hour, will be overridden by config
+    allow_abort_jobs = True  # Honour Job.abort() from the cancel endpoint (queued and running jobs)
+    blocking_threads = 0  # Thread pool size for blocking client calls (0 = 2x max_jobs)
 
 
 def _initialize_services_if_needed():
@@ -140,6 +152,74 @@ async def check_cancellation(job_id: str, job: JobStatus) -> bool:
     return False
 
 
+def _claiming_job_id(arq_job_id: str) -> str:
+    """Job whose ticket claims an ARQ job works under (fan-out children and resumed runs use the original job's)"""
+    return arq_job_id.split(":", 1)[0]
+
+
+def _scheduling_enabled() -> bool:
+    try:
+        return get_config().get_scheduling_config()['enabled']
+    except RuntimeError:
+        return False
+
+
+async def on_job_start(ctx):
+    """ARQ on_job_start hook: renew the job's ticket claims while it runs; record its queue wait"""
+    ctx['job_started'] = time.perf_counter()
+    # Fan-out children leave the parent's claims on the queued lease (see _hold_claims_for_children)
+    if not is_child_job_id(ctx['job_id']):
+        await run_blocking(ticket_jobs.track, _claiming_job_id(ctx['job_id']))
+    if _scheduling_enabled():
+        from .job_scheduler import on_job_start as scheduler_job_start
+        await scheduler_job_start(ctx)
+
+
+async def after_job_end(ctx):
+    """ARQ after_job_end hook: stop renewing the job's ticket claims; record its run time; dispatch the next queued job"""
+    job_id = _claiming_job_id(ctx['job_id'])
+    if not is_child_job_id(ctx['job_id']):
+        await run_blocking(ticket_jobs.untrack, job_id)
+    if 'job_started' in ctx:
+        job = await run_blocking(jobs.get, job_id)
+        JOB_DURATION.observe(time.perf_counter() - ctx['job_started'],
+                             job_type=job.job_type if job else "unknown", status=job.status if job else "unknown")
+    if _scheduling_enabled():
+        from .job_scheduler import after_job_end as scheduler_job_end
+        await scheduler_job_end(ctx)
+
+
+def _hold_claims_for_children(job_id: str) -> None:
+    """
+    A fanned-out job returns before its children run, and they may wait in their queue for
+    longer than the running lease: stop renewing the job's claims and hold them with the
+    queued lease until the children release them
+    """
+    ticket_jobs.untrack(job_id)
+    ticket_jobs.renew([job_id], lease_seconds=ticket_jobs.queued_lease_seconds)
+
+
+def _get_batch_concurrency() -> int:
+    """Tickets processed at once by batch jobs (processing.batch_concurrency, default 1)"""
+    try:
+        processing_config = get_config().processing
+    except RuntimeError:
+        processing_config = {}
+    return max(1, int(processing_config.get('batch_concurrency', 1)))
+
+
+def _cancel_check(job_id: str, job: JobStatus):
+    """Build a cancellation probe for run_blocking(cancel_check=...) so long calls stay cancellable"""
+    return lambda: check_cancellation(job_id, job)
+
+
+def _job_progress_updater(job: JobStatus):
+    """Progress callback for progress_reporter(): merges streamed updates into job.progress"""
+    def update(fields: Dict[str, Any]) -> None:
+        job.progress = {**(job.progress or {}), **fields}
+    return update
+
+
 async def process_single_ticket_worker(ctx, job_id: str, ticket_key: str, update_jira: bool,
                                      llm_model: Optional[str] = None, llm_provider: Optional[str] = None,
                                      additional_context: Optional[str] = None,
@@ -159,16 +239,16 @@ async def process_single_ticket_worker(ctx, job_id: str, ticket_key: str, update
     ticket_response = None
     
     try:
-        job = _get_or_create_job(job_id, "single", f"Processing ticket {ticket_key}..." + (" (with OpenCode)" if repos else ""))
+        job = await run_blocking(_get_or_create_job, job_id, "single", f"Processing ticket {ticket_key}..." + (" (with OpenCode)" if repos else ""))
         job.ticket_key = ticket_key
         
         # Check if cancelled via Redis flag
         if await check_cancellation(job_id, job):
-            unregister_ticket_job(ticket_key)
+            unregister_ticket_job(ticket_key, job_id)
             return
         
         # Get ticket info
-        ticket_data = jira_client.get_ticket(ticket_key)
+        ticket_data = await run_blocking(jira_client.get_ticket, ticket_key)
         if not ticket_data:
             job.status = "failed"
             job.completed_at = datetime.now()
@@ -198,7 +278,7 @@ async def process_single_ticket_worker(ctx, job_id: str, ticket_key: str, update
                 job.error = "OpenSandbox is required when repos are provided. Enable OPENSANDBOX_ENABLED and ensure the worker has sandbox configured."
                 job.progress = {"message": job.error}
                 job.failed_tickets = 1
-                unregister_ticket_job(ticket_key)
+                unregister_ticket_job(ticket_key, job_id)
                 return
 
             repo_url = repos[0].get("url", repos[0]) if isinstance(repos[0], dict) else repos[0]
@@ -207,7 +287,7 @@ async def process_single_ticket_worker(ctx, job_id: str, ticket_key: str, update
 
             try:
                 if await check_cancellation(job_id, job):
-                    unregister_ticket_job(ticket_key)
+                    unregister_ticket_job(ticket_key, job_id)
                     return
 
                 pull_requests = []
@@ -216,8 +296,8 @@ async def process_single_ticket_worker(ctx, job_id: str, ticket_key: str, update
                 if bitbucket_client:
                     try:
                         job.progress = {"message": f"Fetching pull requests and commits for {ticket_key}..."}
-                        pull_requests = bitbucket_client.find_pull_requests_for_ticket(ticket_key, include_diff=True)
-                        commits = bitbucket_client.find_commits_for_ticket(ticket_key, include_diff=True)
+                        pull_requests = await run_blocking(bitbucket_client.find_pull_requests_for_ticket, ticket_key, include_diff=True)
+                        commits = await run_blocking(bitbucket_client.find_commits_for_ticket, ticket_key, include_diff=True)
                         logger.info(f"[SINGLE_TICKET] Found {len(pull_requests)} PRs and {len(commits)} commits for {ticket_key}")
                     except Exception as e:
                         logger.warning(f"[SINGLE_TICKET] Failed to fetch PR/commit data for {ticket_key}: {e}")
@@ -229,7 +309,7 @@ async def process_single_ticket_worker(ctx, job_id: str, ticket_key: str, update
                         parent = ticket_data.get('fields', {}).get('parent')
                         epic_key = parent.get('key') if parent else None
                         if epic_key:
-                            epic_issue = jira_client.get_ticket(epic_key)
+                            epic_issue = await run_blocking(jira_client.get_ticket, epic_key, profile='planning')
                             if epic_issue:
                                 prd_url = generator.planning_service._get_custom_field_value(epic_issue, 'PRD')
                                 rfc_url = generator.planning_service._get_custom_field_value(epic_issue, 'RFC')
@@ -287,7 +367,8 @@ async def process_single_ticket_worker(ctx, job_id: str, ticket_key: str, update
 
                 if update_jira and generated_description:
                     try:
-                        jira_client.update_ticket_description(
+                        await run_blocking(
+                            jira_client.update_ticket_description,
                             ticket_key=ticket_key,
                             description=generated_description,
                             dry_run=False
@@ -340,12 +421,15 @@ async def process_single_ticket_worker(ctx, job_id: str, ticket_key: str, update
 
         else:
             # Direct LLM path (original behavior)
-            result = generator.process_ticket(
+            # Preview runs are read-only, so they can be abandoned mid-call on cancellation
+            result = await run_blocking(
+                generator.process_ticket,
                 ticket_key=ticket_key,
                 dry_run=not update_jira,
                 llm_model=llm_model,
                 llm_provider=llm_provider,
-                additional_context=additional_context
+                additional_context=additional_context,
+                cancel_check=None if update_jira else _cancel_check(job_id, job)
             )
             
             # Extract results
@@ -383,7 +467,7 @@ async def process_single_ticket_worker(ctx, job_id: str, ticket_key: str, update
             job.failed_tickets = 0 if result.success else 1
         
         # Unregister ticket key when job completes
-        unregister_ticket_job(ticket_key)
+        unregister_ticket_job(ticket_key, job_id)
         
         logger.info(f"Job {job_id} completed: ticket {ticket_key} processed" + (" (with OpenCode)" if repos else ""))
         
@@ -393,6 +477,10 @@ async def process_single_ticket_worker(ctx, job_id: str, ticket_key: str, update
             raise RuntimeError("ticket_response was not set - this should not happen")
         return ticket_response.dict()
         
+    except JobCancelledError:
+        logger.info(f"Job {job_id} cancelled during processing of ticket {ticket_key}")
+        unregister_ticket_job(ticket_key, job_id)
+        return
     except Exception as e:
         logger.error(f"Job {job_id} failed: {e}")
         if job_id in jobs:
@@ -403,7 +491,7 @@ async def process_single_ticket_worker(ctx, job_id: str, ticket_key: str, update
             job.progress = {"message": f"Job failed: {str(e)}"}
             # Unregister ticket key on failure
             if job.ticket_key:
-                unregister_ticket_job(job.ticket_key)
+                unregister_ticket_job(job.ticket_key, job_id)
         raise
 
 
@@ -416,51 +504,49 @@ async def process_batch_tickets_worker(ctx, job_id: str, jql: str, max_results:
     jira_client = get_jira_client()
     
     try:
-        job = _get_or_create_job(job_id, "batch", "Fetching tickets from JIRA...")
+        job = await run_blocking(_get_or_create_job, job_id, "batch", "Fetching tickets from JIRA...")
+        
+        # Tickets finished by an earlier (crashed, timed out or cancelled) run of this job
+        checkpoint = await load_job_checkpoint(job_id)
+        await save_job_checkpoint(job_id, {RESUME_CHECKPOINT_FIELD: {
+            "function": "process_batch_tickets_worker",
+            "kwargs": {"job_id": job_id, "jql": jql, "max_results": max_results, "update_jira": update_jira,
+                       "llm_model": llm_model, "llm_provider": llm_provider}
+        }})
+        job.processed_tickets = job.successful_tickets = job.failed_tickets = 0
         
         # Get tickets from JQL
-        tickets = jira_client.search_issues(jql, max_results=max_results)
+        tickets = await run_blocking(jira_client.search_issues, jql, max_results=max_results)
         job.total_tickets = len(tickets)
         
         # Track all ticket keys for this batch job
         ticket_keys_list = [ticket.key for ticket in tickets]
         job.ticket_keys = ticket_keys_list
         
-        # Check for duplicate active jobs per ticket
-        skipped_tickets = []
-        active_duplicates = {}
-        for ticket in tickets:
-            active_job_id = get_active_job_for_ticket(ticket.key)
-            if active_job_id and active_job_id != job_id:
-                skipped_tickets.append(ticket.key)
-                active_duplicates[ticket.key] = active_job_id
-                logger.warning(f"Job {job_id}: Skipping ticket {ticket.key} - already being processed in job {active_job_id}")
+        # Claim every ticket in one round trip; tickets held by another active job are skipped
+        active_duplicates = claim_ticket_jobs(ticket_keys_list, job_id)
+        skipped_tickets = [ticket.key for ticket in tickets if ticket.key in active_duplicates]
+        for ticket_key in skipped_tickets:
+            logger.warning(f"Job {job_id}: Skipping ticket {ticket_key} - already being processed in job {active_duplicates[ticket_key]}")
         
         if skipped_tickets:
             job.progress = {"message": f"Found {len(tickets)} tickets, {len(skipped_tickets)} skipped (duplicates), processing {len(tickets) - len(skipped_tickets)}..."}
         else:
             job.progress = {"message": f"Found {len(tickets)} tickets, processing..."}
         
-        # Register all ticket keys for this job (even skipped ones, to prevent duplicates)
-        for ticket_key in ticket_keys_list:
-            register_ticket_job(ticket_key, job_id)
-        
-        results = []
-        for i, ticket in enumerate(tickets):
-            try:
-                # Check if job was cancelled via Redis flag
-                if await check_cancellation(job_id, job):
-                    # Unregister all ticket keys
-                    for ticket_key in ticket_keys_list:
-                        unregister_ticket_job(ticket_key)
-                    logger.info(f"Job {job_id} was cancelled")
-                    return
-                
-                # Skip if this ticket is being processed by another job
-                if ticket.key in skipped_tickets:
-                    results.append(TicketResponse(
+        if _use_fanout(len(tickets)):
+            # Spread the tickets over all workers; the last child to finish completes this job
+            await run_blocking(_hold_claims_for_children, job_id)
+            await start_fanout(job_id, len(tickets))
+            children = []
+            for index, ticket in enumerate(tickets):
+                summary, assignee_name, parent_name = _ticket_display_fields(ticket)
+                if checkpoint.get(f"ticket:{ticket.key}"):
+                    await _record_batch_ticket(job_id, index, TicketResponse(**checkpoint[f"ticket:{ticket.key}"]))
+                elif ticket.key in skipped_tickets:
+                    await _record_batch_ticket(job_id, index, TicketResponse(
                         ticket_key=ticket.key,
-                        summary=ticket.fields.summary if hasattr(ticket.fields, 'summary') else '',
+                        summary=summary,
                         assignee_name=None,
                         parent_name=None,
                         generated_description=None,
@@ -471,78 +557,136 @@ async def process_batch_tickets_worker(ctx, job_id: str, jql: str, max_results:
                         llm_provider=llm_provider,
                         llm_model=llm_model
                     ))
-                    job.failed_tickets += 1
-                    job.processed_tickets += 1
-                    continue
-                
-                # Extract basic ticket information
-                summary = ticket.fields.summary if hasattr(ticket.fields, 'summary') else ''
-                assignee = ticket.fields.assignee if hasattr(ticket.fields, 'assignee') else None
-                assignee_name = assignee.displayName if assignee else None
-                
-                parent = ticket.fields.parent if hasattr(ticket.fields, 'parent') else None
-                parent_name = parent.fields.summary if parent and hasattr(parent.fields, 'summary') else None
-                
-                # Process each ticket
-                result = generator.process_ticket(
-                    ticket_key=ticket.key,
-                    dry_run=not update_jira,
-                    llm_model=llm_model,
-                    llm_provider=llm_provider
-                )
-                
-                # Extract generated description
-                generated_description = None
-                if result.description:
-                    generated_description = result.description.description
-                
-                # Convert to response format
-                ticket_response = TicketResponse(
-                    ticket_key=ticket.key,
-                    summary=summary,
-                    assignee_name=assignee_name,
-                    parent_name=parent_name,
-                    generated_description=generated_description,
-                    success=result.success,
-                    error=result.error,
-                    skipped_reason=result.skipped_reason,
-                    updated_in_jira=update_jira and result.success,
-                    llm_provider=result.llm_provider,
-                    llm_model=result.llm_model
-                )
-                
-                results.append(ticket_response)
-                
-                if result.success:
-                    job.successful_tickets += 1
                 else:
-                    job.failed_tickets += 1
-                    
-                job.processed_tickets += 1
-                job.progress = {
-                    "message": f"Processed {job.processed_tickets}/{job.total_tickets} tickets",
-                    "percentage": (job.processed_tickets / job.total_tickets) * 100
-                }
-                
-                logger.info(f"Job {job_id}: Processed ticket {ticket.key} ({i+1}/{len(tickets)})")
-                
-            except Exception as e:
-                logger.error(f"Job {job_id}: Error processing ticket {ticket.key}: {e}")
-                results.append(TicketResponse(
+                    children.append((index, (ticket.key, summary, assignee_name, parent_name,
+                                             update_jira, llm_model, llm_provider)))
+            await enqueue_children(job_id, "process_batch_ticket_child_worker", children)
+            if children:
+                job.progress = {"message": f"Dispatched {len(children)} tickets to workers", "percentage": 0}
+            return
+        
+        # Results keep JQL order; slots fill in as tickets finish. Partial results are listed in
+        # finishing order so each progress write only appends the new ticket to the job store
+        results: List[Optional[TicketResponse]] = [None] * len(tickets)
+        finished: List[TicketResponse] = []
+        cancelled = asyncio.Event()
+        ticket_slots = asyncio.Semaphore(_get_batch_concurrency())
+        
+        def record_result(index: int, ticket_response: TicketResponse):
+            """Stream a finished ticket into the job's progress and partial results"""
+            results[index] = ticket_response
+            if ticket_response.success:
+                job.successful_tickets += 1
+            else:
+                job.failed_tickets += 1
+            job.processed_tickets += 1
+            finished.append(ticket_response)
+            job.results = list(finished)
+            job.progress = {
+                "message": f"Processed {job.processed_tickets}/{job.total_tickets} tickets",
+                "percentage": (job.processed_tickets / job.total_tickets) * 100,
+                "last_ticket": ticket_response.ticket_key,
+                "last_ticket_success": ticket_response.success
+            }
+        
+        async def process_one(index: int, ticket):
+            # Skip if this ticket is being processed by another job
+            if ticket.key in skipped_tickets:
+                record_result(index, TicketResponse(
                     ticket_key=ticket.key,
-                    summary="",
+                    summary=ticket.fields.summary if hasattr(ticket.fields, 'summary') else '',
                     assignee_name=None,
                     parent_name=None,
                     generated_description=None,
                     success=False,
-                    error=str(e),
-                    skipped_reason=None,
+                    error=f"Ticket is already being processed in job {active_duplicates[ticket.key]}",
+                    skipped_reason="duplicate_active_job",
                     updated_in_jira=False,
                     llm_provider=llm_provider,
                     llm_model=llm_model
                 ))
-                job.failed_tickets += 1
-                job.processed_tickets += 1
+                return
+            
+            saved = checkpoint.get(f"ticket:{ticket.key}")
+            if saved:
+                record_result(index, TicketResponse(**saved))
+                return
+            
+            async with ticket_slots:
+                if cancelled.is_set():
+                    return
+                try:
+                    # Check if job was cancelled via Redis flag
+                    if await check_cancellation(job_id, job):
+                        cancelled.set()
+                        return
+                    
+                    # Extract basic ticket information
+                    summary, assignee_name, parent_name = _ticket_display_fields(ticket)
+                    
+                    # Process each ticket
+                    result = await run_blocking(
+                        generator.process_ticket,
+                        ticket_key=ticket.key,
+                        dry_run=not update_jira,
+                        llm_model=llm_model,
+                        llm_provider=llm_provider,
+                        cancel_check=None if update_jira else _cancel_check(job_id, job)
+                    )
+                    
+                    # Extract generated description
+                    generated_description = None
+                    if result.description:
+                        generated_description = result.description.description
+                    
+                    # Convert to response format
+                    ticket_response = TicketResponse(
+                        ticket_key=ticket.key,
+                        summary=summary,
+                        assignee_name=assignee_name,
+                        parent_name=parent_name,
+                        generated_description=generated_description,
+                        success=result.success,
+                        error=result.error,
+                        skipped_reason=result.skipped_reason,
+                        updated_in_jira=update_jira and result.success,
+                        llm_provider=result.llm_provider,
+                        llm_model=result.llm_model
+                    )
+                    record_result(index, ticket_response)
+                    if ticket_response.success or ticket_response.skipped_reason:
+                        # Failed tickets are left out so a resumed run retries them
+                        await save_job_checkpoint(job_id, {f"ticket:{ticket.key}": ticket_response.model_dump(mode="json")})
+                    
+                    logger.info(f"Job {job_id}: Processed ticket {ticket.key} ({job.processed_tickets}/{len(tickets)})")
+                    
+                except JobCancelledError:
+                    cancelled.set()
+                except Exception as e:
+                    logger.error(f"Job {job_id}: Error processing ticket {ticket.key}: {e}")
+                    record_result(index, TicketResponse(
+                        ticket_key=ticket.key,
+                        summary="",
+                        assignee_name=None,
+                        parent_name=None,
+                        generated_description=None,
+                        success=False,
+                        error=str(e),
+                        skipped_reason=None,
+                        updated_in_jira=False,
+                        llm_provider=llm_provider,
+                        llm_model=llm_model
+                    ))
+        
+        await asyncio.gather(*(process_one(i, ticket) for i, ticket in enumerate(tickets)))
+        
+        if cancelled.is_set():
+            # Unregister all ticket keys
+            release_ticket_jobs(job_id)
+            logger.info(f"Job {job_id} was cancelled")
+            return
+        
+        results = [r for r in results if r is not None]
         
         # Mark job as completed
         job.status = "completed"
@@ -554,8 +698,8 @@ async def process_batch_tickets_worker(ctx, job_id: str, jql: str, max_results:
         }
         
         # Unregister all ticket keys when job completes
-        for ticket_key in ticket_keys_list:
-            unregister_ticket_job(ticket_key)
+        release_ticket_jobs(job_id)
+        await clear_job_checkpoint(job_id)
         
         logger.info(f"Job {job_id} completed: {job.successful_tickets} successful, {job.failed_tickets} failed")
         
@@ -568,12 +712,119 @@ async def process_batch_tickets_worker(ctx, job_id: str, jql: str, max_results:
             job.error = str(e)
             job.progress = {"message": f"Job failed: {str(e)}"}
             # Unregister all ticket keys on failure
-            if job.ticket_keys:
-                for ticket_key in job.ticket_keys:
-                    unregister_ticket_job(ticket_key)
+            release_ticket_jobs(job_id)
         raise
 
 
+def _use_fanout(item_count: int) -> bool:
+    """Whether a batch should be split into child jobs (processing.batch_fanout; needs the shared job store)"""
+    try:
+        processing_config = get_config().processing
+    except RuntimeError:
+        processing_config = {}
+    if not processing_config.get('batch_fanout') or not jobs.shared:
+        return False
+    return item_count >= int(processing_config.get('batch_fanout_min_items', 10))
+
+
+def _ticket_display_fields(ticket) -> tuple:
+    """(summary, assignee name, parent name) of a JIRA search result"""
+    summary = ticket.fields.summary if hasattr(ticket.fields, 'summary') else ''
+    assignee = ticket.fields.assignee if hasattr(ticket.fields, 'assignee') else None
+    parent = ticket.fields.parent if hasattr(ticket.fields, 'parent') else None
+    parent_name = parent.fields.summary if parent and hasattr(parent.fields, 'summary') else None
+    return summary, assignee.displayName if assignee else None, parent_name
+
+
+async def _record_batch_ticket(parent_job_id: str, index: int, ticket_response: TicketResponse):
+    """Record a fanned-out ticket under its batch job; the last one completes the batch"""
+    progress = await record_child_result(parent_job_id, index, ticket_response.model_dump(mode="json"),
+                                         ticket_response.success)
+    job = jobs.get(parent_job_id)
+    if job is None:
+        return
+    if job.status != "cancelled" and progress.done > job.processed_tickets:
+        job.processed_tickets = progress.done
+        job.successful_tickets = progress.succeeded
+        job.failed_tickets = progress.failed
+        job.progress = {
+            "message": f"Processed {progress.done}/{progress.total} tickets",
+            "percentage": (progress.done / progress.total) * 100,
+            "last_ticket": ticket_response.ticket_key,
+            "last_ticket_success": ticket_response.success
+        }
+    if not progress.finished:
+        return
+    
+    results = await get_child_results(parent_job_id)
+    job.results = [results[i] for i in sorted(results)]
+    job.processed_tickets = progress.done
+    job.successful_tickets = progress.succeeded
+    job.failed_tickets = progress.failed
+    if job.status == "cancelled":
+        await clear_cancellation_flag(parent_job_id)
+    else:
+        job.completed_at = datetime.now()
+        job.progress = {
+            "message": f"Completed: {job.successful_tickets} successful, {job.failed_tickets} failed",
+            "percentage": 100
+        }
+        job.status = "completed"
+        await clear_job_checkpoint(parent_job_id)
+    release_ticket_jobs(parent_job_id)
+    logger.info(f"Job {parent_job_id} completed across workers: {job.successful_tickets} successful, {job.failed_tickets} failed")
+
+
+async def process_batch_ticket_child_worker(ctx, parent_job_id: str, index: int, ticket_key: str,
+                                            summary: str, assignee_name: Optional[str], parent_name: Optional[str],
+                                            update_jira: bool, llm_model: Optional[str] = None,
+                                            llm_provider: Optional[str] = None):
+    """ARQ worker function for one ticket of a fanned-out batch job"""
+    _initialize_services_if_needed()
+    generator = get_generator()
+    
+    def ticket_response(**fields) -> TicketResponse:
+        return TicketResponse(ticket_key=ticket_key, summary=summary, assignee_name=assignee_name,
+                              parent_name=parent_name, **fields)
+    
+    cancelled = ticket_response(generated_description=None, success=False, error="Job was cancelled",
+                                skipped_reason="cancelled", updated_in_jira=False,
+                                llm_provider=llm_provider, llm_model=llm_model)
+    if await is_parent_cancelled(parent_job_id):
+        response = cancelled
+    else:
+        try:
+            result = await run_blocking(
+                generator.process_ticket,
+                ticket_key=ticket_key,
+                dry_run=not update_jira,
+                llm_model=llm_model,
+                llm_provider=llm_provider,
+                cancel_check=None if update_jira else (lambda: is_parent_cancelled(parent_job_id))
+            )
+            response = ticket_response(
+                generated_description=result.description.description if result.description else None,
+                success=result.success,
+                error=result.error,
+                skipped_reason=result.skipped_reason,
+                updated_in_jira=update_jira and result.success,
+                llm_provider=result.llm_provider,
+                llm_model=result.llm_model
+            )
+            if response.success or response.skipped_reason:
+                await save_job_checkpoint(parent_job_id, {f"ticket:{ticket_key}": response.model_dump(mode="json")})
+        except JobCancelledError:
+            response = cancelled
+        except Exception as e:
+            logger.error(f"Job {parent_job_id}: Error processing ticket {ticket_key}: {e}")
+            response = ticket_response(generated_description=None, success=False, error=str(e),
+                                       skipped_reason=None, updated_in_jira=False,
+                                       llm_provider=llm_provider, llm_model=llm_model)
+    await _record_batch_ticket(parent_job_id, index, response)
+    unregister_ticket_job(ticket_key, parent_job_id)
+    return response.success
+
+
 async def process_story_generation_worker(ctx, job_id: str, epic_key: str, dry_run: bool,
                                          llm_model: Optional[str] = None, llm_provider: Optional[str] = None,
                                          generate_test_cases: bool = False):
@@ -582,13 +833,13 @@ async def process_story_generation_worker(ctx, job_id: str, epic_key: str, dry_r
     generator = get_generator()
     
     try:
-        job = _get_or_create_job(job_id, "story_generation", f"Generating stories for epic {epic_key}...")
+        job = await run_blocking(_get_or_create_job, job_id, "story_generation", f"Generating stories for epic {epic_key}...")
         # Epic key is tracked as ticket_key for story generation
         job.ticket_key = epic_key
         
         # Check if cancelled via Redis flag
         if await check_cancellation(job_id, job):
-            unregister_ticket_job(epic_key)
+            unregister_ticket_job(epic_key, job_id)
             return
         
         if not generator.planning_service:
@@ -598,10 +849,12 @@ async def process_story_generation_worker(ctx, job_id: str, epic_key: str, dry_r
         if llm_provider or llm_model:
             custom_llm_client = create_custom_llm_client(llm_provider, llm_model)
         
-        planning_result = generator.generate_stories_for_epic(
+        planning_result = await run_blocking(
+            generator.generate_stories_for_epic,
             epic_key=epic_key,
             dry_run=dry_run,
-            generate_test_cases=generate_test_cases
+            generate_test_cases=generate_test_cases,
+            cancel_check=_cancel_check(job_id, job) if dry_run else None
         )
         
         # Convert to dict for storage
@@ -628,13 +881,17 @@ async def process_story_generation_worker(ctx, job_id: str, epic_key: str, dry_r
         job.successful_tickets = len(planning_result.created_tickets)
         
         # Unregister epic key when job completes
-        unregister_ticket_job(epic_key)
+        unregister_ticket_job(epic_key, job_id)
         
         logger.info(f"Job {job_id} completed: generated stories for epic {epic_key}")
         
         # Return results so ARQ stores them in Redis for persistence
         return job.results
         
+    except JobCancelledError:
+        logger.info(f"Job {job_id} cancelled during story generation for epic {epic_key}")
+        unregister_ticket_job(epic_key, job_id)
+        return
     except Exception as e:
         logger.error(f"Job {job_id} failed: {e}")
         if job_id in jobs:
@@ -645,7 +902,7 @@ async def process_story_generation_worker(ctx, job_id: str, epic_key: str, dry_r
             job.progress = {"message": f"Job failed: {str(e)}"}
             # Unregister epic key on failure
             if job.ticket_key:
-                unregister_ticket_job(job.ticket_key)
+                unregister_ticket_job(job.ticket_key, job_id)
         raise
 
 
@@ -668,7 +925,7 @@ async def process_task_generation_worker(ctx, job_id: str, story_keys: List[str]
     jira_client = get_jira_client()
     
     try:
-        job = _get_or_create_job(job_id, "task_generation", f"Generating tasks for {len(story_keys)} stories..." + (" (with OpenCode)" if repos else ""))
+        job = await run_blocking(_get_or_create_job, job_id, "task_generation", f"Generating tasks for {len(story_keys)} stories..." + (" (with OpenCode)" if repos else ""))
         # Track all story keys for this job
         job.ticket_key = epic_key  # May be None initially
         job.story_keys = story_keys.copy()
@@ -677,7 +934,7 @@ async def process_task_generation_worker(ctx, job_id: str, story_keys: List[str]
         if await check_cancellation(job_id, job):
             # Unregister all story keys
             for story_key in story_keys:
-                unregister_ticket_job(story_key)
+                unregister_ticket_job(story_key, job_id)
             return
         
         # Branch: Sandbox (OpenCode in sandbox) when repos provided vs Direct LLM path
@@ -693,7 +950,7 @@ async def process_task_generation_worker(ctx, job_id: str, story_keys: List[str]
                 job.error = "OpenSandbox is required when repos are provided. Enable OPENSANDBOX_ENABLED and ensure the worker has sandbox configured."
                 job.progress = {"message": job.error}
                 for story_key in story_keys:
-                    unregister_ticket_job(story_key)
+                    unregister_ticket_job(story_key, job_id)
                 return
 
             repo_url = repos[0].get("url", repos[0]) if isinstance(repos[0], dict) else repos[0]
@@ -703,7 +960,7 @@ async def process_task_generation_worker(ctx, job_id: str, story_keys: List[str]
             try:
                 if await check_cancellation(job_id, job):
                     for story_key in story_keys:
-                        unregister_ticket_job(story_key)
+                        unregister_ticket_job(story_key, job_id)
                     return
 
                 all_tasks = []
@@ -712,7 +969,7 @@ async def process_task_generation_worker(ctx, job_id: str, story_keys: List[str]
                 rfc_url = None
                 if epic_key and generator.planning_service:
                     try:
-                        epic_issue = jira_client.get_ticket(epic_key)
+                        epic_issue = await run_blocking(jira_client.get_ticket, epic_key, profile='planning')
                         if epic_issue:
                             prd_url = generator.planning_service._get_custom_field_value(epic_issue, 'PRD')
                             rfc_url = generator.planning_service._get_custom_field_value(epic_issue, 'RFC')
@@ -724,8 +981,9 @@ async def process_task_generation_worker(ctx, job_id: str, story_keys: List[str]
                         logger.warning(f"[TASK_BREAKDOWN] Failed to fetch PRD/RFC URLs from epic {epic_key}: {e}")
 
                 stories_data = []
+                fetched_stories = await run_blocking(jira_client.get_tickets, story_keys)
                 for story_key in story_keys:
-                    story_data = jira_client.get_ticket(story_key)
+                    story_data = fetched_stories[story_key]["issue"]
                     if not story_data:
                         logger.warning(f"Story {story_key} not found, skipping")
                         continue
@@ -741,7 +999,7 @@ async def process_task_generation_worker(ctx, job_id: str, story_keys: List[str]
                     story_key = story_info['key']
                     if await check_cancellation(job_id, job):
                         for sk in story_keys:
-                            unregister_ticket_job(sk)
+                            unregister_ticket_job(sk, job_id)
                         return
 
                     prompt = task_breakdown_prompt(
@@ -856,17 +1114,20 @@ async def process_task_generation_worker(ctx, job_id: str, story_keys: List[str]
             if llm_provider or llm_model:
                 custom_llm_client = create_custom_llm_client(llm_provider, llm_model)
             
-            planning_result = generator.generate_tasks_for_stories(
-                story_keys=story_keys,
-                epic_key=epic_key,
-                dry_run=dry_run,
-                split_oversized_tasks=split_oversized_tasks,
-                max_task_cycle_days=max_task_cycle_days,
-                max_tasks_per_story=config.get_max_tasks_per_story(),
-                custom_llm_client=custom_llm_client,
-                additional_context=additional_context,
-                generate_test_cases=generate_test_cases
-            )
+            with progress_reporter(_job_progress_updater(job)):
+                planning_result = await run_blocking(
+                    generator.generate_tasks_for_stories,
+                    story_keys=story_keys,
+                    epic_key=epic_key,
+                    dry_run=dry_run,
+                    split_oversized_tasks=split_oversized_tasks,
+                    max_task_cycle_days=max_task_cycle_days,
+                    max_tasks_per_story=config.get_max_tasks_per_story(),
+                    custom_llm_client=custom_llm_client,
+                    additional_context=additional_context,
+                    generate_test_cases=generate_test_cases,
+                    cancel_check=_cancel_check(job_id, job) if dry_run else None
+                )
             
             story_details = extract_story_details_with_tests(planning_result, generate_test_cases=generate_test_cases)
             task_details = extract_task_details_with_tests(planning_result, generate_test_cases=generate_test_cases)
@@ -894,13 +1155,18 @@ async def process_task_generation_worker(ctx, job_id: str, story_keys: List[str]
         
         # Unregister all story keys when job completes
         for story_key in story_keys:
-            unregister_ticket_job(story_key)
+            unregister_ticket_job(story_key, job_id)
         
         logger.info(f"Job {job_id} completed: generated tasks for {len(story_keys)} stories" + (" (with OpenCode)" if repos else ""))
         
         # Return results so ARQ stores them in Redis for persistence
         return job.results
         
+    except JobCancelledError:
+        logger.info(f"Job {job_id} cancelled during task generation for {len(story_keys)} stories")
+        for story_key in story_keys:
+            unregister_ticket_job(story_key, job_id)
+        return
     except Exception as e:
         logger.error(f"Job {job_id} failed: {e}")
         if job_id in jobs:
@@ -912,10 +1178,10 @@ async def process_task_generation_worker(ctx, job_id: str, story_keys: List[str]
             # Unregister all story keys on failure
             if job.story_keys:
                 for story_key in job.story_keys:
-                    unregister_ticket_job(story_key)
+                    unregister_ticket_job(story_key, job_id)
             elif job.ticket_keys:
                 for ticket_key in job.ticket_keys:
-                    unregister_ticket_job(ticket_key)
+                    unregister_ticket_job(ticket_key, job_id)
         raise
 
 
@@ -929,7 +1195,7 @@ async def process_test_generation_worker(ctx, job_id: str, test_type: str, epic_
     generator = get_generator()
     
     try:
-        job = _get_or_create_job(job_id, "test_generation", f"Generating {test_type} tests...")
+        job = await run_blocking(_get_or_create_job, job_id, "test_generation", f"Generating {test_type} tests...")
         # Track the relevant ticket key and story key based on test type
         if task_key:
             job.ticket_key = task_key
@@ -941,7 +1207,7 @@ async def process_test_generation_worker(ctx, job_id: str, test_type: str, epic_
         # Check if cancelled via Redis flag
         if await check_cancellation(job_id, job):
             if job.ticket_key:
-                unregister_ticket_job(job.ticket_key)
+                unregister_ticket_job(job.ticket_key, job_id)
             return
         
         if not generator.planning_service:
@@ -955,25 +1221,31 @@ async def process_test_generation_worker(ctx, job_id: str, test_type: str, epic_
         coverage_level_enum = TestCoverageLevel(coverage_level)
         
         if test_type == "comprehensive" and epic_key:
-            test_results = generator.planning_service.generate_comprehensive_test_suite(
+            test_results = await run_blocking(
+                generator.planning_service.generate_comprehensive_test_suite,
                 epic_key=epic_key,
-                coverage_level=coverage_level_enum
+                coverage_level=coverage_level_enum,
+                cancel_check=_cancel_check(job_id, job)
             )
         elif test_type == "story" and story_key:
-            test_results = generator.planning_service.generate_story_tests(
+            test_results = await run_blocking(
+                generator.planning_service.generate_story_tests,
                 story_key=story_key,
                 coverage_level=coverage_level_enum,
                 domain_context=domain_context,
                 technical_context=technical_context,
-                include_documents=include_documents
+                include_documents=include_documents,
+                cancel_check=_cancel_check(job_id, job)
             )
         elif test_type == "task" and task_key:
-            test_results = generator.planning_service.generate_task_tests(
+            test_results = await run_blocking(
+                generator.planning_service.generate_task_tests,
                 task_key=task_key,
                 coverage_level=coverage_level_enum,
                 domain_context=domain_context,
                 technical_context=technical_context,
-                include_documents=include_documents
+                include_documents=include_documents,
+                cancel_check=_cancel_check(job_id, job)
             )
         else:
             raise ValueError(f"Invalid test_type or missing required key: test_type={test_type}, epic_key={epic_key}, story_key={story_key}, task_key={task_key}")
@@ -986,10 +1258,15 @@ async def process_test_generation_worker(ctx, job_id: str, test_type: str, epic_
         
         # Unregister ticket key when job completes
         if job.ticket_key:
-            unregister_ticket_job(job.ticket_key)
+            unregister_ticket_job(job.ticket_key, job_id)
         
         logger.info(f"Job {job_id} completed: generated {test_type} tests")
         
+    except JobCancelledError:
+        logger.info(f"Job {job_id} cancelled during {test_type} test generation")
+        if job.ticket_key:
+            unregister_ticket_job(job.ticket_key, job_id)
+        return
     except Exception as e:
         logger.error(f"Job {job_id} failed: {e}")
         if job_id in jobs:
@@ -1000,7 +1277,7 @@ async def process_test_generation_worker(ctx, job_id: str, test_type: str, epic_
             job.progress = {"message": f"Job failed: {str(e)}"}
             # Unregister ticket key on failure
             if job.ticket_key:
-                unregister_ticket_job(job.ticket_key)
+                unregister_ticket_job(job.ticket_key, job_id)
         raise
 
 
@@ -1012,7 +1289,7 @@ async def process_prd_story_sync_worker(ctx, job_id: str, epic_key: str, prd_url
     generator = get_generator()
     
     try:
-        job = _get_or_create_job(job_id, "prd_story_sync", f"Syncing stories from PRD for epic {epic_key}...")
+        job = await run_blocking(_get_or_create_job, job_id, "prd_story_sync", f"Syncing stories from PRD for epic {epic_key}...")
         job.ticket_key = epic_key
         # Preserve PRD URL if not already set
         if not job.prd_url:
@@ -1020,7 +1297,7 @@ async def process_prd_story_sync_worker(ctx, job_id: str, epic_key: str, prd_url
         
         # Check if cancelled via Redis flag
         if await check_cancellation(job_id, job):
-            unregister_ticket_job(epic_key)
+            unregister_ticket_job(epic_key, job_id)
             return
         
         if not generator.planning_service:
@@ -1028,7 +1305,8 @@ async def process_prd_story_sync_worker(ctx, job_id: str, epic_key: str, prd_url
         
         job.progress = {"message": "Parsing PRD content..."}
         
-        planning_result = generator.sync_stories_from_prd(
+        planning_result = await run_blocking(
+            generator.sync_stories_from_prd,
             epic_key=epic_key,
             prd_url=prd_url,
             dry_run=dry_run,
@@ -1078,7 +1356,7 @@ async def process_prd_story_sync_worker(ctx, job_id: str, epic_key: str, prd_url
         job.successful_tickets = len(planning_result.created_tickets.get('stories', []))
         
         # Unregister epic key when job completes
-        unregister_ticket_job(epic_key)
+        unregister_ticket_job(epic_key, job_id)
         
         logger.info(f"Job {job_id} completed: synced stories from PRD for epic {epic_key}")
         
@@ -1095,7 +1373,7 @@ async def process_prd_story_sync_worker(ctx, job_id: str, epic_key: str, prd_url
             job.progress = {"message": f"Job failed: {str(e)}"}
             # Unregister epic key on failure
             if job.ticket_key:
-                unregister_ticket_job(job.ticket_key)
+                unregister_ticket_job(job.ticket_key, job_id)
         raise
 
 
@@ -1105,7 +1383,7 @@ async def process_bulk_story_update_worker(ctx, job_id: str, stories_data: List[
     jira_client = get_jira_client()
     
     try:
-        job = _get_or_create_job(job_id, "bulk_story_update", f"Bulk updating {len(stories_data)} stories...")
+        job = await run_blocking(_get_or_create_job, job_id, "bulk_story_update", f"Bulk updating {len(stories_data)} stories...")
         job.total_tickets = len(stories_data)
         
         # Check if cancelled via Redis flag
@@ -1134,7 +1412,8 @@ async def process_bulk_story_update_worker(ctx, job_id: str, stories_data: List[
             
             logger.info(f"Processing story {i}/{len(stories_data)}: {story_item.story_key}")
             
-            result = _process_single_story_update(
+            result = await run_blocking(
+                _process_single_story_update,
                 jira_client=jira_client,
                 story_item=story_item,
                 dry_run=dry_run
@@ -1179,6 +1458,378 @@ async def process_bulk_story_update_worker(ctx, job_id: str, stories_data: List[
         raise
 
 
+async def _prepare_bulk_task_issues(jira_client, tasks_data: List[Dict[str, Any]]) -> tuple:
+    """
+    Resolve epics/project and build JIRA issue payloads for bulk task creation.
+    
+    Returns:
+        (issue data per task, links to create once the tickets exist)
+    """
+    # Resolve missing parent_key (epic) from story_key via JIRA
+    from .utils import normalize_ticket_key
+    from .constants import MSG_COULD_NOT_DERIVE_EPIC
+    stories_to_resolve = []
+    for task_dict in tasks_data:
+        parent_key = task_dict.get("parent_key")
+        if (not parent_key or not str(parent_key).strip()) and task_dict.get("story_key"):
+            sk = normalize_ticket_key(task_dict["story_key"]) or task_dict["story_key"].strip()
+            if sk and sk not in stories_to_resolve:
+                stories_to_resolve.append(sk)
+    story_key_to_epic = {}
+    if stories_to_resolve:
+        raw_epics = await run_blocking(jira_client.get_epic_keys_from_stories, stories_to_resolve)
+        for sk in stories_to_resolve:
+            raw_epic = raw_epics.get(sk)
+            story_key_to_epic[sk] = normalize_ticket_key(raw_epic) if raw_epic else None
+            if story_key_to_epic[sk]:
+                logger.info(f"Derived epic {story_key_to_epic[sk]} from story {sk}")
+    for task_dict in tasks_data:
+        if not task_dict.get("parent_key") and task_dict.get("story_key"):
+            sk = normalize_ticket_key(task_dict["story_key"]) or task_dict["story_key"].strip()
+            task_dict["parent_key"] = story_key_to_epic.get(sk)
+    
+    epic_for_project = next(
+        (t.get("parent_key") for t in tasks_data if t.get("parent_key")),
+        None
+    )
+    if not epic_for_project:
+        raise RuntimeError(MSG_COULD_NOT_DERIVE_EPIC)
+    project_key = jira_client.get_project_key_from_epic(epic_for_project)
+    if not project_key:
+        raise RuntimeError(f"Could not determine project key from epic {epic_for_project}")
+    
+    # Build issue data for all tasks
+    from src.planning_models import TaskPlan, CycleTimeEstimate, TaskScope
+    
+    tickets_data = []
+    pending_links = []  # Collect all links to create after tickets are created
+    
+    for i, task_dict in enumerate(tasks_data):
+        resolved_epic = task_dict.get("parent_key")
+        
+        # Create cycle time estimate if mandays provided
+        cycle_time_estimate = None
+        if task_dict.get("mandays") is not None:
+            mandays = task_dict["mandays"]
+            cycle_time_estimate = CycleTimeEstimate(
+                development_days=mandays * 0.6,
+                testing_days=mandays * 0.2,
+                review_days=mandays * 0.15,
+                deployment_days=mandays * 0.05,
+                total_days=mandays,
+                confidence_level=0.7
+            )
+        
+        # Create TaskPlan
+        task_plan = TaskPlan(
+            summary=task_dict["summary"],
+            purpose=task_dict["description"],
+            scopes=[TaskScope(
+                description=task_dict["description"],
+                deliverable="Task completion"
+            )],
+            expected_outcomes=["Task completed successfully"],
+            test_cases=[],
+            cycle_time_estimate=cycle_time_estimate,
+            epic_key=resolved_epic
+        )
+        
+        # Build issue data
+        description_adf = jira_client._convert_markdown_to_adf(task_dict["description"])
+        
+        issue_data = {
+            "fields": {
+                "project": {"key": project_key},
+                "summary": task_dict["summary"],
+                "description": description_adf,
+                "issuetype": {"name": "Task"}
+            }
+        }
+        
+        # Add parent epic
+        if resolved_epic:
+            epic_type = await run_blocking(jira_client.get_ticket_type, resolved_epic)
+            if epic_type and 'epic' in epic_type.lower():
+                issue_data["fields"]["parent"] = {"key": resolved_epic}
+        
+        # Add mandays if available
+        if cycle_time_estimate and jira_client.mandays_custom_field:
+            issue_data["fields"][jira_client.mandays_custom_field] = cycle_time_estimate.total_days
+        
+        # Add test cases if available
+        if task_dict.get("test_cases") and jira_client.test_case_custom_field:
+            test_cases_adf = jira_client._convert_markdown_to_adf(task_dict["test_cases"])
+            issue_data["fields"][jira_client.test_case_custom_field] = test_cases_adf
+        
+        tickets_data.append(issue_data)
+        
+        # Collect link information for later
+        if task_dict.get("story_key"):
+            pending_links.append({
+                "index": i,
+                "from": None,  # Will be set after ticket creation
+                "to": task_dict["story_key"],
+                "type": "Work item split",
+                "direction": "outward"
+            })
+        
+        if task_dict.get("blocks"):
+            for blocked_key in task_dict["blocks"]:
+                pending_links.append({
+                    "index": i,
+                    "from": None,  # Will be set after ticket creation
+                    "to": blocked_key,
+                    "type": "Blocks",
+                    "direction": "outward"
+                })
+    
+    return tickets_data, pending_links
+
+
+def _bulk_task_results(indexes: List[int], bulk_results: Dict[str, Any]) -> tuple:
+    """
+    Per-task results of one bulk_create_tickets call over the tasks at `indexes`.
+    
+    Returns:
+        (results, index -> created ticket key)
+    """
+    created_ticket_keys = bulk_results.get("created_tickets", [])
+    failed_tickets = bulk_results.get("failed_tickets", [])
+    results = []
+    index_to_ticket_key = {}
+    for position, index in enumerate(indexes):
+        if position < len(created_ticket_keys):
+            ticket_key = created_ticket_keys[position]
+            index_to_ticket_key[index] = ticket_key
+            results.append({
+                "index": index,
+                "success": True,
+                "ticket_key": ticket_key,
+                "error": None,
+                "links_created": []
+            })
+        else:
+            error_msg = "Failed to create ticket"
+            if position < len(failed_tickets):
+                error_msg = str(failed_tickets[position])
+            results.append({
+                "index": index,
+                "success": False,
+                "ticket_key": None,
+                "error": error_msg,
+                "links_created": []
+            })
+    return results, index_to_ticket_key
+
+
+BULK_CREATE_CHUNK = 50  # Tickets per bulk create call, and per checkpoint
+
+
+async def _create_bulk_task_tickets(job_id: str, job: JobStatus, jira_client, indexes: List[int],
+                                    issues: List[Dict[str, Any]], checkpoint: Dict[str, Any],
+                                    is_cancelled) -> List[Dict[str, Any]]:
+    """
+    Create the tickets for the tasks at `indexes` (issues aligned with indexes) in checkpointed chunks.
+    
+    Tasks the checkpoint already has a ticket for are not created again; each created chunk is
+    checkpointed before the next one starts. Creation stops early once `is_cancelled()` is true.
+    """
+    results_by_index = {}
+    pending = []
+    for index, issue in zip(indexes, issues):
+        saved = checkpoint.get(f"task:{index}")
+        if saved:
+            results_by_index[index] = {**saved, "links_created": []}
+        else:
+            pending.append((index, issue))
+    if results_by_index:
+        logger.info(f"Job {job_id}: {len(results_by_index)} task tickets already created by an earlier run")
+    
+    for start in range(0, len(pending), BULK_CREATE_CHUNK):
+        if await is_cancelled():
+            break
+        chunk = pending[start:start + BULK_CREATE_CHUNK]
+        bulk_results = await run_blocking(jira_client.bulk_create_tickets, [issue for _, issue in chunk])
+        chunk_results, _ = _bulk_task_results([index for index, _ in chunk], bulk_results)
+        await save_job_checkpoint(job_id, {f"task:{result['index']}": result for result in chunk_results if result["success"]})
+        for result in chunk_results:
+            results_by_index[result["index"]] = result
+        job.progress = {"message": f"Created {len(results_by_index)}/{len(indexes)} task tickets..."}
+    
+    return [results_by_index.get(index) or {"index": index, "success": False, "ticket_key": None,
+                                            "error": "Job was cancelled", "links_created": []}
+            for index in indexes]
+
+
+async def _create_bulk_task_links(job_id: str, job: JobStatus, jira_client, tasks_data: List[Dict[str, Any]],
+                                  pending_links: List[Dict[str, Any]], index_to_ticket_key: Dict[int, str],
+                                  results: List[Dict[str, Any]], checkpoint: Optional[Dict[str, Any]] = None) -> None:
+    """
+    Create the collected links once all tickets exist, resolving task_ids and summaries to keys.
+    Links recorded in the checkpoint by an earlier run are reused rather than created again.
+    """
+    checkpoint = checkpoint or {}
+    task_id_to_ticket_key = {}  # Map task_id (UUID) to created ticket key for dependency resolution
+    summary_to_ticket_key = {}  # Map summary to created ticket key for summary-based resolution
+    for i, task_dict in enumerate(tasks_data):
+        if i not in index_to_ticket_key:
+            continue
+        task_id = task_dict.get("task_id")
+        if task_id:
+            task_id_to_ticket_key[task_id] = index_to_ticket_key[i]
+            logger.debug(f"Mapped task_id {task_id} -> {index_to_ticket_key[i]}")
+        summary = task_dict.get("summary")
+        if summary:
+            summary_to_ticket_key[summary] = index_to_ticket_key[i]
+    logger.info(f"Built task_id mapping with {len(task_id_to_ticket_key)} entries for dependency resolution")
+    logger.info(f"Built summary mapping with {len(summary_to_ticket_key)} entries for dependency resolution")
+    
+    # Now create all links after all tickets are created
+    job.progress = {"message": f"All tickets created. Creating {len(pending_links)} pending links..."}
+    logger.info(f"All tickets created. Creating {len(pending_links)} pending links...")
+    
+    # Helper function to check if a string is a UUID
+    def is_uuid(value: str) -> bool:
+        import uuid as uuid_module
+        try:
+            uuid_module.UUID(value)
+            return True
+        except (ValueError, AttributeError):
+            return False
+    
+    for link_number, link_info in enumerate(pending_links):
+        # Check if cancelled via Redis flag
+        if await check_cancellation(job_id, job):
+            break
+        
+        index = link_info["index"]
+        if index not in index_to_ticket_key:
+            continue  # Skip if ticket creation failed
+        
+        saved_link = checkpoint.get(f"link:{link_number}")
+        if saved_link:
+            results[index]["links_created"].append(saved_link)
+            continue
+        
+        source_key = index_to_ticket_key[index]
+        target_key = link_info["to"]
+        link_type = link_info["type"]
+        direction = link_info.get("direction", "outward")
+        
+        # Resolve target_key if it's a task_id (UUID) or task summary
+        original_target = target_key
+        resolved = False
+        
+        # First, try to resolve as UUID (task_id)
+        if is_uuid(target_key):
+            resolved_key = task_id_to_ticket_key.get(target_key)
+            if resolved_key:
+                target_key = resolved_key
+                resolved = True
+                logger.info(f"Resolved task_id {original_target} -> {target_key} for {link_type} link")
+        
+        # If not a UUID or not resolved, try to resolve as task summary
+        if not resolved and target_key in summary_to_ticket_key:
+            resolved_key = summary_to_ticket_key[target_key]
+            target_key = resolved_key
+            resolved = True
+            logger.info(f"Resolved task summary '{original_target}' -> {target_key} for {link_type} link")
+        
+        # If it's a UUID that couldn't be resolved, skip this link
+        if not resolved and is_uuid(original_target):
+            logger.warning(f"Could not resolve task_id {original_target} to JIRA key - task may not exist in this batch or was not created")
+            results[index]["links_created"].append({
+                "link_type": link_type,
+                "source_key": source_key,
+                "target_key": original_target,
+                "status": "failed",
+                "error": f"Could not resolve task_id {original_target} to JIRA key"
+            })
+            continue
+        
+        # If still not resolved, assume it's already a JIRA key (e.g., "BIF-1234")
+        
+        # For "Work item split", we need to swap source and target to get correct relationship
+        # With direction="outward": inwardIssue=source, outwardIssue=target
+        # So: source=story, target=task, direction="outward"
+        # This creates: inwardIssue=story, outwardIssue=task
+        # This makes Task show "split from" Story correctly
+        if link_type == "Work item split":
+            # Swap: Story as source, Task as target, direction="outward"
+            # This creates: inwardIssue=story, outwardIssue=task
+            link_success = await run_blocking(
+                jira_client.create_issue_link_generic,
+                source_key=target_key,  # Story as source
+                target_key=source_key,  # Task as target
+                link_type=link_type,
+                direction="outward"  # This makes: inwardIssue=source (story), outwardIssue=target (task)
+            )
+        else:
+            # For other link types, use original parameters
+            link_success = await run_blocking(
+                jira_client.create_issue_link_generic,
+                source_key=source_key,
+                target_key=target_key,
+                link_type=link_type,
+                direction=direction
+            )
+        
+        if link_success:
+            created_link = {
+                "link_type": link_type,
+                "source_key": source_key,
+                "target_key": target_key,
+                "status": "created"
+            }
+            results[index]["links_created"].append(created_link)
+            await save_job_checkpoint(job_id, {f"link:{link_number}": created_link})
+        else:
+            results[index]["links_created"].append({
+                "link_type": link_type,
+                "source_key": source_key,
+                "target_key": target_key,
+                "status": "failed"
+            })
+
+
+def _finish_bulk_task_creation(job_id: str, job: JobStatus, tasks_data: List[Dict[str, Any]],
+                               results: List[Dict[str, Any]], created_ticket_keys: List[str]) -> Optional[Dict[str, Any]]:
+    """Complete (or close out a cancelled) bulk task creation job and release its story keys"""
+    successful = sum(1 for result in results if result["success"])
+    failed = len(results) - successful
+    
+    # Check if job was cancelled before marking as completed
+    if job.status != "cancelled":
+        message = f"Bulk creation completed: {successful} successful, {failed} failed"
+        logger.info(message)
+        
+        job.status = "completed"
+        job.completed_at = datetime.now()
+        job.results = {
+            "total_tasks": len(tasks_data),
+            "successful": successful,
+            "failed": failed,
+            "results": results,
+            "created_tickets": created_ticket_keys,
+            "message": message
+        }
+        job.progress = {"message": message}
+        job.processed_tickets = len(tasks_data)
+        job.successful_tickets = successful
+        job.failed_tickets = failed
+    else:
+        # Job was cancelled - update progress but keep cancelled status
+        job.progress = {"message": f"Job was cancelled after creating {len(created_ticket_keys)} tickets"}
+        job.processed_tickets = len(created_ticket_keys)
+    
+    # Unregister all story keys when job completes or is cancelled
+    release_ticket_jobs(job_id)
+    
+    logger.info(f"Job {job_id} completed: bulk created {len(tasks_data)} tasks ({successful} successful, {failed} failed)")
+    
+    return job.results
+
+
 async def process_bulk_task_creation_worker(ctx, job_id: str, tasks_data: List[Dict[str, Any]], create_tickets: bool):
     """ARQ worker function for bulk creating task tickets"""
     _initialize_services_if_needed()
@@ -1186,15 +1837,13 @@ async def process_bulk_task_creation_worker(ctx, job_id: str, tasks_data: List[D
     from .dependencies import get_confluence_client
     
     try:
-        job = _get_or_create_job(job_id, "bulk_task_creation", f"Creating {len(tasks_data)} task tickets...")
+        job = await run_blocking(_get_or_create_job, job_id, "bulk_task_creation", f"Creating {len(tasks_data)} task tickets...")
         job.total_tickets = len(tasks_data)
         
         # Check if cancelled via Redis flag
         if await check_cancellation(job_id, job):
             # Unregister story keys
-            story_keys = list(set([task.get("story_key") for task in tasks_data]))
-            for story_key in story_keys:
-                unregister_ticket_job(story_key)
+            release_ticket_jobs(job_id)
             return
         
         if not jira_client:
@@ -1225,9 +1874,7 @@ async def process_bulk_task_creation_worker(ctx, job_id: str, tasks_data: List[D
             job.progress = {"message": f"Preview completed: {len(tasks_data)} tasks"}
             job.successful_tickets = len(tasks_data)
             
-            story_keys = list(set([task.get("story_key") for task in tasks_data]))
-            for story_key in story_keys:
-                unregister_ticket_job(story_key)
+            release_ticket_jobs(job_id)
             
             return job.results
         
@@ -1237,312 +1884,43 @@ async def process_bulk_task_creation_worker(ctx, job_id: str, tasks_data: List[D
         if confluence_client:
             confluence_server_url = confluence_client.server_url
         
-        # Resolve missing parent_key (epic) from story_key via JIRA
-        from .utils import normalize_ticket_key
-        from .constants import MSG_COULD_NOT_DERIVE_EPIC
-        story_key_to_epic = {}
-        for task_dict in tasks_data:
-            parent_key = task_dict.get("parent_key")
-            if (not parent_key or not str(parent_key).strip()) and task_dict.get("story_key"):
-                sk = normalize_ticket_key(task_dict["story_key"]) or task_dict["story_key"].strip()
-                if sk and sk not in story_key_to_epic:
-                    raw_epic = jira_client.get_epic_key_from_story(sk)
-                    story_key_to_epic[sk] = normalize_ticket_key(raw_epic) if raw_epic else None
-                    if story_key_to_epic[sk]:
-                        logger.info(f"Derived epic {story_key_to_epic[sk]} from story {sk}")
-        for task_dict in tasks_data:
-            if not task_dict.get("parent_key") and task_dict.get("story_key"):
-                sk = normalize_ticket_key(task_dict["story_key"]) or task_dict["story_key"].strip()
-                task_dict["parent_key"] = story_key_to_epic.get(sk)
-        
-        epic_for_project = next(
-            (t.get("parent_key") for t in tasks_data if t.get("parent_key")),
-            None
-        )
-        if not epic_for_project:
-            raise RuntimeError(MSG_COULD_NOT_DERIVE_EPIC)
-        project_key = jira_client.get_project_key_from_epic(epic_for_project)
-        if not project_key:
-            raise RuntimeError(f"Could not determine project key from epic {epic_for_project}")
-        
-        # Build issue data for all tasks
-        from src.planning_models import TaskPlan, CycleTimeEstimate, TaskScope
-        
-        tickets_data = []
-        task_index_to_item = {}  # Map index to task item for link creation later
-        pending_links = []  # Collect all links to create after tickets are created
+        # Tickets and links created by an earlier (crashed, timed out or cancelled) run of this job
+        checkpoint = await load_job_checkpoint(job_id)
+        await save_job_checkpoint(job_id, {RESUME_CHECKPOINT_FIELD: {
+            "function": "process_bulk_task_creation_worker",
+            "kwargs": {"job_id": job_id, "tasks_data": tasks_data, "create_tickets": create_tickets}
+        }})
         
         job.progress = {"message": "Preparing task data..."}
+        tickets_data, pending_links = await _prepare_bulk_task_issues(jira_client, tasks_data)
         
-        for i, task_dict in enumerate(tasks_data):
-            task_item = type('TaskItem', (), task_dict)()  # Simple object from dict
-            resolved_epic = task_dict.get("parent_key")
-            
-            # Create cycle time estimate if mandays provided
-            cycle_time_estimate = None
-            if task_dict.get("mandays") is not None:
-                mandays = task_dict["mandays"]
-                cycle_time_estimate = CycleTimeEstimate(
-                    development_days=mandays * 0.6,
-                    testing_days=mandays * 0.2,
-                    review_days=mandays * 0.15,
-                    deployment_days=mandays * 0.05,
-                    total_days=mandays,
-                    confidence_level=0.7
-                )
-            
-            # Create TaskPlan
-            task_plan = TaskPlan(
-                summary=task_dict["summary"],
-                purpose=task_dict["description"],
-                scopes=[TaskScope(
-                    description=task_dict["description"],
-                    deliverable="Task completion"
-                )],
-                expected_outcomes=["Task completed successfully"],
-                test_cases=[],
-                cycle_time_estimate=cycle_time_estimate,
-                epic_key=resolved_epic
-            )
-            
-            # Build issue data
-            description_adf = jira_client._convert_markdown_to_adf(task_dict["description"])
-            
-            issue_data = {
-                "fields": {
-                    "project": {"key": project_key},
-                    "summary": task_dict["summary"],
-                    "description": description_adf,
-                    "issuetype": {"name": "Task"}
-                }
-            }
-            
-            # Add parent epic
-            if resolved_epic:
-                epic_type = jira_client.get_ticket_type(resolved_epic)
-                if epic_type and 'epic' in epic_type.lower():
-                    issue_data["fields"]["parent"] = {"key": resolved_epic}
-            
-            # Add mandays if available
-            if cycle_time_estimate and jira_client.mandays_custom_field:
-                issue_data["fields"][jira_client.mandays_custom_field] = cycle_time_estimate.total_days
-            
-            # Add test cases if available
-            if task_dict.get("test_cases") and jira_client.test_case_custom_field:
-                test_cases_adf = jira_client._convert_markdown_to_adf(task_dict["test_cases"])
-                issue_data["fields"][jira_client.test_case_custom_field] = test_cases_adf
-            
-            tickets_data.append(issue_data)
-            task_index_to_item[i] = task_dict
-            
-            # Collect link information for later
-            if task_dict.get("story_key"):
-                pending_links.append({
-                    "index": i,
-                    "from": None,  # Will be set after ticket creation
-                    "to": task_dict["story_key"],
-                    "type": "Work item split",
-                    "direction": "outward"
-                })
-            
-            if task_dict.get("blocks"):
-                for blocked_key in task_dict["blocks"]:
-                    pending_links.append({
-                        "index": i,
-                        "from": None,  # Will be set after ticket creation
-                        "to": blocked_key,
-                        "type": "Blocks",
-                        "direction": "outward"
-                    })
+        if _use_fanout(len(tasks_data)):
+            # One child job per story creates that story's tasks; the last child creates the links
+            groups: Dict[Any, List[int]] = {}
+            for i, task_dict in enumerate(tasks_data):
+                groups.setdefault(task_dict.get("story_key") or f"task-{i}", []).append(i)
+            await run_blocking(_hold_claims_for_children, job_id)
+            await start_fanout(job_id, len(groups), plan={"tasks_data": tasks_data, "pending_links": pending_links})
+            await enqueue_children(job_id, "process_bulk_task_creation_child_worker", [
+                (group, (indexes, [tickets_data[i] for i in indexes]))
+                for group, indexes in enumerate(groups.values())
+            ])
+            job.progress = {"message": f"Dispatched {len(tasks_data)} tasks for {len(groups)} stories to workers"}
+            return None
         
         # Create all tickets first
         job.progress = {"message": f"Creating {len(tickets_data)} task tickets in bulk..."}
         logger.info(f"Creating {len(tickets_data)} task tickets in bulk...")
-        bulk_results = jira_client.bulk_create_tickets(tickets_data)
-        
-        created_ticket_keys = bulk_results.get("created_tickets", [])
-        failed_tickets = bulk_results.get("failed_tickets", [])
-        
-        # Build results and mappings for dependency resolution
-        results = []
-        successful = 0
-        failed = 0
-        index_to_ticket_key = {}  # Map index to created ticket key
-        task_id_to_ticket_key = {}  # Map task_id (UUID) to created ticket key for dependency resolution
+        results = await _create_bulk_task_tickets(job_id, job, jira_client, list(range(len(tasks_data))), tickets_data,
+                                                  checkpoint, lambda: check_cancellation(job_id, job))
+        index_to_ticket_key = {result["index"]: result["ticket_key"] for result in results if result["success"]}
         
-        for i in range(len(tasks_data)):
-            if i < len(created_ticket_keys):
-                ticket_key = created_ticket_keys[i]
-                index_to_ticket_key[i] = ticket_key
-                
-                # Build task_id -> ticket_key mapping for UUID-based dependency resolution
-                task_id = tasks_data[i].get("task_id")
-                if task_id:
-                    task_id_to_ticket_key[task_id] = ticket_key
-                    logger.debug(f"Mapped task_id {task_id} -> {ticket_key}")
-                
-                results.append({
-                    "index": i,
-                    "success": True,
-                    "ticket_key": ticket_key,
-                    "error": None,
-                    "links_created": []
-                })
-                successful += 1
-            else:
-                error_msg = "Failed to create ticket"
-                if i < len(failed_tickets):
-                    error_msg = str(failed_tickets[i])
-                results.append({
-                    "index": i,
-                    "success": False,
-                    "ticket_key": None,
-                    "error": error_msg,
-                    "links_created": []
-                })
-                failed += 1
-        
-        logger.info(f"Built task_id mapping with {len(task_id_to_ticket_key)} entries for dependency resolution")
-        
-        # Also build summary -> ticket_key mapping for summary-based dependency resolution
-        summary_to_ticket_key = {}
-        for i, task_dict in enumerate(tasks_data):
-            if i in index_to_ticket_key:
-                summary = task_dict.get("summary")
-                if summary:
-                    summary_to_ticket_key[summary] = index_to_ticket_key[i]
-        logger.info(f"Built summary mapping with {len(summary_to_ticket_key)} entries for dependency resolution")
-        
-        # Now create all links after all tickets are created
-        job.progress = {"message": f"All tickets created. Creating {len(pending_links)} pending links..."}
-        logger.info(f"All tickets created. Creating {len(pending_links)} pending links...")
-        
-        # Helper function to check if a string is a UUID
-        def is_uuid(value: str) -> bool:
-            import uuid as uuid_module
-            try:
-                uuid_module.UUID(value)
-                return True
-            except (ValueError, AttributeError):
-                return False
-        
-        for link_info in pending_links:
-            # Check if cancelled via Redis flag
-            if await check_cancellation(job_id, job):
-                break
-            
-            index = link_info["index"]
-            if index not in index_to_ticket_key:
-                continue  # Skip if ticket creation failed
-            
-            source_key = index_to_ticket_key[index]
-            target_key = link_info["to"]
-            link_type = link_info["type"]
-            direction = link_info.get("direction", "outward")
-            
-            # Resolve target_key if it's a task_id (UUID) or task summary
-            original_target = target_key
-            resolved = False
-            
-            # First, try to resolve as UUID (task_id)
-            if is_uuid(target_key):
-                resolved_key = task_id_to_ticket_key.get(target_key)
-                if resolved_key:
-                    target_key = resolved_key
-                    resolved = True
-                    logger.info(f"Resolved task_id {original_target} -> {target_key} for {link_type} link")
-            
-            # If not a UUID or not resolved, try to resolve as task summary
-            if not resolved and target_key in summary_to_ticket_key:
-                resolved_key = summary_to_ticket_key[target_key]
-                target_key = resolved_key
-                resolved = True
-                logger.info(f"Resolved task summary '{original_target}' -> {target_key} for {link_type} link")
-            
-            # If it's a UUID that couldn't be resolved, skip this link
-            if not resolved and is_uuid(original_target):
-                logger.warning(f"Could not resolve task_id {original_target} to JIRA key - task may not exist in this batch or was not created")
-                results[index]["links_created"].append({
-                    "link_type": link_type,
-                    "source_key": source_key,
-                    "target_key": original_target,
-                    "status": "failed",
-                    "error": f"Could not resolve task_id {original_target} to JIRA key"
-                })
-                continue
-            
-            # If still not resolved, assume it's already a JIRA key (e.g., "BIF-1234")
-            
-            # For "Work item split", we need to swap source and target to get correct relationship
-            # With direction="outward": inwardIssue=source, outwardIssue=target
-            # So: source=story, target=task, direction="outward"
-            # This creates: inwardIssue=story, outwardIssue=task
-            # This makes Task show "split from" Story correctly
-            if link_type == "Work item split":
-                # Swap: Story as source, Task as target, direction="outward"
-                # This creates: inwardIssue=story, outwardIssue=task
-                link_success = jira_client.create_issue_link_generic(
-                    source_key=target_key,  # Story as source
-                    target_key=source_key,  # Task as target
-                    link_type=link_type,
-                    direction="outward"  # This makes: inwardIssue=source (story), outwardIssue=target (task)
-                )
-            else:
-                # For other link types, use original parameters
-                link_success = jira_client.create_issue_link_generic(
-                    source_key=source_key,
-                    target_key=target_key,
-                    link_type=link_type,
-                    direction=direction
-                )
-            
-            if link_success:
-                results[index]["links_created"].append({
-                    "link_type": link_type,
-                    "source_key": source_key,
-                    "target_key": target_key,
-                    "status": "created"
-                })
-            else:
-                results[index]["links_created"].append({
-                    "link_type": link_type,
-                    "source_key": source_key,
-                    "target_key": target_key,
-                    "status": "failed"
-                })
-        
-        # Check if job was cancelled before marking as completed
+        await _create_bulk_task_links(job_id, job, jira_client, tasks_data, pending_links, index_to_ticket_key,
+                                      results, checkpoint)
         if job.status != "cancelled":
-            message = f"Bulk creation completed: {successful} successful, {failed} failed"
-            logger.info(message)
-            
-            job.status = "completed"
-            job.completed_at = datetime.now()
-            job.results = {
-                "total_tasks": len(tasks_data),
-                "successful": successful,
-                "failed": failed,
-                "results": results,
-                "created_tickets": created_ticket_keys,
-                "message": message
-            }
-            job.progress = {"message": message}
-            job.processed_tickets = len(tasks_data)
-            job.successful_tickets = successful
-            job.failed_tickets = failed
-        else:
-            # Job was cancelled - update progress but keep cancelled status
-            job.progress = {"message": f"Job was cancelled after creating {len(created_ticket_keys)} tickets"}
-            job.processed_tickets = len(created_ticket_keys)
-        
-        # Unregister all story keys when job completes or is cancelled
-        story_keys = list(set([task.get("story_key") for task in tasks_data]))
-        for story_key in story_keys:
-            unregister_ticket_job(story_key)
-        
-        logger.info(f"Job {job_id} completed: bulk created {len(tasks_data)} tasks ({successful} successful, {failed} failed)")
-        
-        return job.results
+            await clear_job_checkpoint(job_id)
+        return _finish_bulk_task_creation(job_id, job, tasks_data, results,
+                                          [index_to_ticket_key[i] for i in sorted(index_to_ticket_key)])
         
     except Exception as e:
         logger.error(f"Job {job_id} failed: {e}")
@@ -1553,9 +1931,67 @@ async def process_bulk_task_creation_worker(ctx, job_id: str, tasks_data: List[D
             job.error = str(e)
             job.progress = {"message": f"Job failed: {str(e)}"}
             # Unregister story keys on failure
-            story_keys = list(set([task.get("story_key") for task in tasks_data]))
-            for story_key in story_keys:
-                unregister_ticket_job(story_key)
+            release_ticket_jobs(job_id)
+        raise
+
+
+async def process_bulk_task_creation_child_worker(ctx, parent_job_id: str, group: int, indexes: List[int],
+                                                  tickets_data: List[Dict[str, Any]]):
+    """ARQ worker function creating one story's tasks for a fanned-out bulk task creation job"""
+    _initialize_services_if_needed()
+    jira_client = get_jira_client()
+    
+    job = jobs.get(parent_job_id)
+    if job is None or await is_parent_cancelled(parent_job_id):
+        results = [{"index": i, "success": False, "ticket_key": None, "error": "Job was cancelled",
+                    "links_created": []} for i in indexes]
+    else:
+        try:
+            checkpoint = await load_job_checkpoint(parent_job_id, [f"task:{i}" for i in indexes])
+            results = await _create_bulk_task_tickets(parent_job_id, job, jira_client, indexes, tickets_data,
+                                                      checkpoint, lambda: is_parent_cancelled(parent_job_id))
+        except Exception as e:
+            logger.error(f"Job {parent_job_id}: Error creating tasks {indexes}: {e}")
+            results = [{"index": i, "success": False, "ticket_key": None, "error": str(e),
+                        "links_created": []} for i in indexes]
+    
+    progress = await record_child_result(parent_job_id, group, {"results": results},
+                                         all(result["success"] for result in results))
+    job = jobs.get(parent_job_id)
+    if job is None:
+        return
+    if job.status != "cancelled":
+        job.progress = {"message": f"Created tasks for {progress.done}/{progress.total} stories"}
+    if not progress.finished:
+        return
+    
+    # Last child: gather every task's result, then create the links across stories
+    plan = {}
+    try:
+        plan = await get_fanout_plan(parent_job_id) or {}
+        tasks_data = plan.get("tasks_data", [])
+        child_results = await get_child_results(parent_job_id)
+        all_results = sorted((result for child in child_results.values() for result in child["results"]),
+                             key=lambda result: result["index"])
+        index_to_ticket_key = {result["index"]: result["ticket_key"] for result in all_results if result["success"]}
+        if job.status != "cancelled":
+            pending_links = plan.get("pending_links", [])
+            checkpoint = await load_job_checkpoint(parent_job_id, [f"link:{n}" for n in range(len(pending_links))])
+            await _create_bulk_task_links(parent_job_id, job, jira_client, tasks_data, pending_links,
+                                          index_to_ticket_key, all_results, checkpoint)
+        else:
+            await clear_cancellation_flag(parent_job_id)
+        if job.status != "cancelled":
+            await clear_job_checkpoint(parent_job_id)
+        _finish_bulk_task_creation(parent_job_id, job, tasks_data, all_results,
+                                   [index_to_ticket_key[i] for i in sorted(index_to_ticket_key)])
+    except Exception as e:
+        logger.error(f"Job {parent_job_id} failed: {e}")
+        job.completed_at = datetime.now()
+        job.error = str(e)
+        job.progress = {"message": f"Job failed: {str(e)}"}
+        job.status = "failed"
+        release_ticket_jobs(parent_job_id)
         raise
 
 
@@ -1585,12 +2021,12 @@ async def process_story_coverage_worker(ctx, job_id: str, story_key: str, includ
     coverage_response = None
     
     try:
-        job = _get_or_create_job(job_id, "story_coverage", f"Analyzing coverage for story {story_key}..." + (" (with OpenCode)" if repos else ""))
+        job = await run_blocking(_get_or_create_job, job_id, "story_coverage", f"Analyzing coverage for story {story_key}..." + (" (with OpenCode)" if repos else ""))
         job.story_key = story_key
         
         # Check if cancelled via Redis flag
         if await check_cancellation(job_id, job):
-            unregister_ticket_job(story_key)
+            unregister_ticket_job(story_key, job_id)
             return
         
         if not jira_client:
@@ -1612,7 +2048,7 @@ async def process_story_coverage_worker(ctx, job_id: str, story_key: str, includ
                 job.completed_at = datetime.now()
                 job.error = "OpenSandbox is required when repos are provided. Enable OPENSANDBOX_ENABLED and ensure the worker has sandbox configured."
                 job.progress = {"message": job.error}
-                unregister_ticket_job(story_key)
+                unregister_ticket_job(story_key, job_id)
                 return
 
             repo_url = repos[0].get("url", repos[0]) if isinstance(repos[0], dict) else repos[0]
@@ -1621,10 +2057,10 @@ async def process_story_coverage_worker(ctx, job_id: str, story_key: str, includ
 
             try:
                 if await check_cancellation(job_id, job):
-                    unregister_ticket_job(story_key)
+                    unregister_ticket_job(story_key, job_id)
                     return
 
-                story_data = jira_client.get_ticket(story_key)
+                story_data = await run_blocking(jira_client.get_ticket, story_key)
                 if not story_data:
                     raise RuntimeError(f"Story {story_key} not found")
                 story_fields = story_data.get('fields', {})
@@ -1637,7 +2073,7 @@ async def process_story_coverage_worker(ctx, job_id: str, story_key: str, includ
                     try:
                         epic_key = parent.get('key') if parent else None
                         if epic_key:
-                            epic_issue = jira_client.get_ticket(epic_key)
+                            epic_issue = await run_blocking(jira_client.get_ticket, epic_key, profile='planning')
                             if epic_issue:
                                 prd_url = generator.planning_service._get_custom_field_value(epic_issue, 'PRD')
                                 rfc_url = generator.planning_service._get_custom_field_value(epic_issue, 'RFC')
@@ -1654,7 +2090,7 @@ async def process_story_coverage_worker(ctx, job_id: str, story_key: str, includ
                     for subtask in story_fields['subtasks']:
                         task_key = subtask.get('key')
                         if task_key and task_key not in seen_task_keys:
-                            task_data = jira_client.get_ticket(task_key)
+                            task_data = await run_blocking(jira_client.get_ticket, task_key)
                             if task_data:
                                 task_fields = task_data.get('fields', {})
                                 description_text = _extract_description_text(task_fields.get('description', ''), jira_client)
@@ -1670,7 +2106,7 @@ async def process_story_coverage_worker(ctx, job_id: str, story_key: str, includ
                             linked_key = linked_issue.get('key')
                             linked_type = linked_issue.get('fields', {}).get('issuetype', {}).get('name', '')
                             if linked_key and linked_key not in seen_task_keys and linked_type in ['Task', 'Sub-task', 'Technical Task']:
-                                task_data = jira_client.get_ticket(linked_key)
+                                task_data = await run_blocking(jira_client.get_ticket, linked_key)
                                 if task_data:
                                     task_fields = task_data.get('fields', {})
                                     description_text = _extract_description_text(task_fields.get('description', ''), jira_client)
@@ -1773,10 +2209,12 @@ async def process_story_coverage_worker(ctx, job_id: str, story_key: str, includ
             job.progress = {"message": "Fetching story and tasks..."}
             
             # Perform analysis
-            result = analyzer.analyze_coverage(
+            result = await run_blocking(
+                analyzer.analyze_coverage,
                 story_key=story_key,
                 include_test_cases=include_test_cases,
-                additional_context=additional_context
+                additional_context=additional_context,
+                cancel_check=_cancel_check(job_id, job)
             )
             
             if not result.get('success', False):
@@ -1784,7 +2222,7 @@ async def process_story_coverage_worker(ctx, job_id: str, story_key: str, includ
                 job.completed_at = datetime.now()
                 job.error = result.get('error', 'Analysis failed')
                 job.progress = {"message": f"Analysis failed: {result.get('error', 'Unknown error')}"}
-                unregister_ticket_job(story_key)
+                unregister_ticket_job(story_key, job_id)
                 return
             
             # Convert result to response format
@@ -1806,7 +2244,7 @@ async def process_story_coverage_worker(ctx, job_id: str, story_key: str, includ
             job.successful_tickets = 1
         
         # Unregister story key when job completes
-        unregister_ticket_job(story_key)
+        unregister_ticket_job(story_key, job_id)
         
         logger.info(f"Job {job_id} completed: analyzed coverage for story {story_key}" + (" (with OpenCode)" if repos else ""))
         
@@ -1816,6 +2254,10 @@ async def process_story_coverage_worker(ctx, job_id: str, story_key: str, includ
             raise RuntimeError("coverage_response was not set - this should not happen")
         return coverage_response.dict()
         
+    except JobCancelledError:
+        logger.info(f"Job {job_id} cancelled during coverage analysis for story {story_key}")
+        unregister_ticket_job(story_key, job_id)
+        return
     except Exception as e:
         logger.error(f"Job {job_id} failed: {e}")
         if job_id in jobs:
@@ -1826,7 +2268,7 @@ async def process_story_coverage_worker(ctx, job_id: str, story_key: str, includ
             job.progress = {"message": f"Job failed: {str(e)}"}
             # Unregister story key on failure
             if job.ticket_key:
-                unregister_ticket_job(job.ticket_key)
+                unregister_ticket_job(job.ticket_key, job_id)
         raise
 
 
@@ -1836,12 +2278,12 @@ async def process_epic_creation_worker(ctx, job_id: str, epic_key: str, operatio
     generator = get_generator()
     
     try:
-        job = _get_or_create_job(job_id, "epic_creation", f"Planning and creating tickets for epic {epic_key}...")
+        job = await run_blocking(_get_or_create_job, job_id, "epic_creation", f"Planning and creating tickets for epic {epic_key}...")
         job.ticket_key = epic_key
         
         # Check if cancelled via Redis flag
         if await check_cancellation(job_id, job):
-            unregister_ticket_job(epic_key)
+            unregister_ticket_job(epic_key, job_id)
             return
         
         if not generator.planning_service:
@@ -1869,7 +2311,8 @@ async def process_epic_creation_worker(ctx, job_id: str, epic_key: str, operatio
         job.progress = {"message": "Executing planning and creation..."}
         
         # Execute planning with creation
-        results = generator.planning_service.execute_planning_with_creation(
+        results = await run_blocking(
+            generator.planning_service.execute_planning_with_creation,
             context, 
             create_tickets=create_tickets
         )
@@ -1886,7 +2329,7 @@ async def process_epic_creation_worker(ctx, job_id: str, epic_key: str, operatio
             job.successful_tickets = total_created
         
         # Unregister epic key when job completes
-        unregister_ticket_job(epic_key)
+        unregister_ticket_job(epic_key, job_id)
         
         logger.info(f"Job {job_id} completed: epic planning and creation for {epic_key}")
         
@@ -1903,7 +2346,7 @@ async def process_epic_creation_worker(ctx, job_id: str, epic_key: str, operatio
             job.progress = {"message": f"Job failed: {str(e)}"}
             # Unregister epic key on failure
             if job.ticket_key:
-                unregister_ticket_job(job.ticket_key)
+                unregister_ticket_job(job.ticket_key, job_id)
         raise
 
 
@@ -1913,12 +2356,12 @@ async def process_story_creation_worker(ctx, job_id: str, epic_key: str, story_c
     generator = get_generator()
     
     try:
-        job = _get_or_create_job(job_id, "story_creation", f"Creating stories for epic {epic_key}...")
+        job = await run_blocking(_get_or_create_job, job_id, "story_creation", f"Creating stories for epic {epic_key}...")
         job.ticket_key = epic_key
         
         # Check if cancelled via Redis flag
         if await check_cancellation(job_id, job):
-            unregister_ticket_job(epic_key)
+            unregister_ticket_job(epic_key, job_id)
             return
         
         if not generator.planning_service:
@@ -1935,7 +2378,7 @@ async def process_story_creation_worker(ctx, job_id: str, epic_key: str, story_c
             max_stories_per_epic=story_count or 5
         )
         
-        planning_result = generator.planning_service.generate_stories_for_epic(context)
+        planning_result = await run_blocking(generator.planning_service.generate_stories_for_epic, context)
         
         if not planning_result.success or not planning_result.epic_plan:
             job.status = "failed"
@@ -1947,13 +2390,14 @@ async def process_story_creation_worker(ctx, job_id: str, epic_key: str, story_c
                 "errors": planning_result.errors,
                 "epic_key": epic_key
             }
-            unregister_ticket_job(epic_key)
+            unregister_ticket_job(epic_key, job_id)
             return job.results
         
         # Create stories if requested
         job.progress = {"message": "Creating story tickets..."}
         
-        creation_results = generator.planning_service.create_stories_for_epic(
+        creation_results = await run_blocking(
+            generator.planning_service.create_stories_for_epic,
             epic_key,
             planning_result.epic_plan.stories,
             dry_run=not create_tickets
@@ -1976,7 +2420,7 @@ async def process_story_creation_worker(ctx, job_id: str, epic_key: str, story_c
         job.progress = {"message": f"Story creation completed: {job.successful_tickets} stories created"}
         
         # Unregister epic key when job completes
-        unregister_ticket_job(epic_key)
+        unregister_ticket_job(epic_key, job_id)
         
         logger.info(f"Job {job_id} completed: created stories for epic {epic_key}")
         
@@ -1993,7 +2437,7 @@ async def process_story_creation_worker(ctx, job_id: str, epic_key: str, story_c
             job.progress = {"message": f"Job failed: {str(e)}"}
             # Unregister epic key on failure
             if job.ticket_key:
-                unregister_ticket_job(job.ticket_key)
+                unregister_ticket_job(job.ticket_key, job_id)
         raise
 
 
@@ -2003,14 +2447,14 @@ async def process_task_creation_worker(ctx, job_id: str, story_keys: List[str],
     generator = get_generator()
     
     try:
-        job = _get_or_create_job(job_id, "task_creation", f"Creating tasks for {len(story_keys)} stories...")
+        job = await run_blocking(_get_or_create_job, job_id, "task_creation", f"Creating tasks for {len(story_keys)} stories...")
         job.story_keys = story_keys.copy()
         
         # Check if cancelled via Redis flag
         if await check_cancellation(job_id, job):
             # Unregister all story keys
             for story_key in story_keys:
-                unregister_ticket_job(story_key)
+                unregister_ticket_job(story_key, job_id)
             return
         
         if not generator.planning_service:
@@ -2035,7 +2479,7 @@ async def process_task_creation_worker(ctx, job_id: str, story_keys: List[str],
         epic_key = None
         logger.info(f"[TASK_BREAKDOWN] Starting PRD/RFC fetch for {len(normalized_story_keys)} stories")
         try:
-            first_story_data = jira_client.get_ticket(normalized_story_keys[0])
+            first_story_data = await run_blocking(jira_client.get_ticket, normalized_story_keys[0], profile='minimal')
             if first_story_data:
                 parent = first_story_data.get('fields', {}).get('parent')
                 if parent and parent.get('key'):
@@ -2068,13 +2512,13 @@ async def process_task_creation_worker(ctx, job_id: str, story_keys: List[str],
         logger.info(f"[TASK_BREAKDOWN] Attempting to fetch PRD/RFC content for epic: {epic_key}")
         try:
             # Get epic details to retrieve PRD/RFC URLs
-            epic_issue = jira_client.get_ticket(epic_key)
+            epic_issue = await run_blocking(jira_client.get_ticket, epic_key, profile='planning')
             if epic_issue:
                 logger.info(f"[TASK_BREAKDOWN] Successfully fetched epic issue {epic_key}")
                 # Get PRD content using planning service method
-                prd_content = generator.planning_service._get_prd_content(epic_issue)
+                prd_content = await run_blocking(generator.planning_service._get_prd_content, epic_issue)
                 # Get RFC content using planning service method
-                rfc_content = generator.planning_service._get_rfc_content(epic_issue)
+                rfc_content = await run_blocking(generator.planning_service._get_rfc_content, epic_issue)
                 
                 if prd_content:
                     logger.info(f"[TASK_BREAKDOWN] ✅ Retrieved PRD content: {prd_content.get('title', 'Unknown')}")
@@ -2100,9 +2544,11 @@ async def process_task_creation_worker(ctx, job_id: str, story_keys: List[str],
             rfc_content=rfc_content
         )
         
-        planning_result = generator.planning_service.generate_tasks_for_stories(
-            normalized_story_keys, context
-        )
+        with progress_reporter(_job_progress_updater(job)):
+            planning_result = await run_blocking(
+                generator.planning_service.generate_tasks_for_stories,
+                normalized_story_keys, context
+            )
         
         if not planning_result.success or not planning_result.epic_plan:
             job.status = "failed"
@@ -2116,7 +2562,7 @@ async def process_task_creation_worker(ctx, job_id: str, story_keys: List[str],
             }
             # Unregister all story keys on failure
             for story_key in story_keys:
-                unregister_ticket_job(story_key)
+                unregister_ticket_job(story_key, job_id)
             return job.results
         
         # Extract all tasks from stories
@@ -2127,7 +2573,8 @@ async def process_task_creation_worker(ctx, job_id: str, story_keys: List[str],
         # Create tasks if requested
         job.progress = {"message": "Creating task tickets..."}
         
-        creation_results = generator.planning_service.create_tasks_for_stories(
+        creation_results = await run_blocking(
+            generator.planning_service.create_tasks_for_stories,
             all_tasks,
             story_keys,
             dry_run=not create_tickets
@@ -2151,7 +2598,7 @@ async def process_task_creation_worker(ctx, job_id: str, story_keys: List[str],
         
         # Unregister all story keys when job completes
         for story_key in story_keys:
-            unregister_ticket_job(story_key)
+            unregister_ticket_job(story_key, job_id)
         
         logger.info(f"Job {job_id} completed: created tasks for {len(story_keys)} stories")
         
@@ -2169,10 +2616,10 @@ async def process_task_creation_worker(ctx, job_id: str, story_keys: List[str],
             # Unregister all story keys on failure
             if job.story_keys:
                 for story_key in job.story_keys:
-                    unregister_ticket_job(story_key)
+                    unregister_ticket_job(story_key, job_id)
             elif job.ticket_keys:
                 for ticket_key in job.ticket_keys:
-                    unregister_ticket_job(ticket_key)
+                    unregister_ticket_job(ticket_key, job_id)
         raise
 
 
@@ -2184,12 +2631,12 @@ async def process_sprint_planning_worker(ctx, job_id: str, epic_key: str, board_
     _initialize_services_if_needed()
     
     try:
-        job = _get_or_create_job(job_id, "sprint_planning", f"Planning sprint for epic {epic_key}...")
+        job = await run_blocking(_get_or_create_job, job_id, "sprint_planning", f"Planning sprint for epic {epic_key}...")
         job.ticket_key = epic_key
         
         # Check if cancelled via Redis flag
         if await check_cancellation(job_id, job):
-            unregister_ticket_job(epic_key)
+            unregister_ticket_job(epic_key, job_id)
             return
         
         # Get sprint planning service
@@ -2201,7 +2648,8 @@ async def process_sprint_planning_worker(ctx, job_id: str, epic_key: str, board_
         
         job.progress = {"message": "Planning epic tasks to sprints..."}
         
-        result = sprint_service.plan_epic_to_sprints(
+        result = await run_blocking(
+            sprint_service.plan_epic_to_sprints,
             epic_key=epic_key,
             board_id=board_id,
             sprint_capacity_days=sprint_capacity_days,
@@ -2219,7 +2667,7 @@ async def process_sprint_planning_worker(ctx, job_id: str, epic_key: str, board_
         job.successful_tickets = result.get('total_tasks', 0) if result.get('success') else 0
         
         # Unregister epic key when job completes
-        unregister_ticket_job(epic_key)
+        unregister_ticket_job(epic_key, job_id)
         
         logger.info(f"Job {job_id} completed: sprint planning for epic {epic_key}")
         
@@ -2234,7 +2682,7 @@ async def process_sprint_planning_worker(ctx, job_id: str, epic_key: str, board_
             job.error = str(e)
             job.progress = {"message": f"Job failed: {str(e)}"}
             if job.ticket_key:
-                unregister_ticket_job(job.ticket_key)
+                unregister_ticket_job(job.ticket_key, job_id)
         raise
 
 
@@ -2246,12 +2694,12 @@ async def process_timeline_planning_worker(ctx, job_id: str, epic_key: str, boar
     _initialize_services_if_needed()
     
     try:
-        job = _get_or_create_job(job_id, "timeline_planning", f"Creating timeline for epic {epic_key}...")
+        job = await run_blocking(_get_or_create_job, job_id, "timeline_planning", f"Creating timeline for epic {epic_key}...")
         job.ticket_key = epic_key
         
         # Check if cancelled via Redis flag
         if await check_cancellation(job_id, job):
-            unregister_ticket_job(epic_key)
+            unregister_ticket_job(epic_key, job_id)
             return
         
         # Get sprint planning service
@@ -2263,7 +2711,8 @@ async def process_timeline_planning_worker(ctx, job_id: str, epic_key: str, boar
         
         job.progress = {"message": "Creating timeline schedule..."}
         
-        result = sprint_service.schedule_timeline(
+        result = await run_blocking(
+            sprint_service.schedule_timeline,
             epic_key=epic_key,
             board_id=board_id,
             start_date=start_date,
@@ -2280,7 +2729,7 @@ async def process_timeline_planning_worker(ctx, job_id: str, epic_key: str, boar
         job.successful_tickets = len(result.get('sprints', [])) if result.get('success') else 0
         
         # Unregister epic key when job completes
-        unregister_ticket_job(epic_key)
+        unregister_ticket_job(epic_key, job_id)
         
         logger.info(f"Job {job_id} completed: timeline planning for epic {epic_key}")
         
@@ -2295,7 +2744,7 @@ async def process_timeline_planning_worker(ctx, job_id: str, epic_key: str, boar
             job.error = str(e)
             job.progress = {"message": f"Job failed: {str(e)}"}
             if job.ticket_key:
-                unregister_ticket_job(job.ticket_key)
+                unregister_ticket_job(job.ticket_key, job_id)
         raise
 
 
@@ -2320,7 +2769,7 @@ async def process_draft_pr_worker(
     config = get_config()
 
     try:
-        job = _get_or_create_job(job_id, "draft_pr", f"Processing draft PR for {story_key}...")
+        job = await run_blocking(_get_or_create_job, job_id, "draft_pr", f"Processing draft PR for {story_key}...")
         job.ticket_key = story_key
         job.stage = "PLANNING"
         
@@ -2328,7 +2777,7 @@ async def process_draft_pr_worker(
         jira_client = get_jira_client()
         if not story_summary and story_key:
             try:
-                issue = jira_client.get_issue(story_key)
+                issue = await run_blocking(jira_client.get_issue, story_key)
                 story_summary = issue.fields.summary
                 story_description = issue.fields.description or story_description
             except Exception as e:
@@ -2446,7 +2895,7 @@ async def process_draft_pr_worker(
             if workspace_path.exists():
                 await workspace_manager.cleanup_workspace(job_id)
             from ..dependencies import unregister_ticket_job
-            unregister_ticket_job(story_key)
+            unregister_ticket_job(story_key, job_id)
             return
         
         # Create cancellation event and monitor for cancellation
@@ -2507,7 +2956,7 @@ async def process_draft_pr_worker(
                 if workspace_path.exists():
                     await workspace_manager.cleanup_workspace(job_id)
                 from ..dependencies import unregister_ticket_job
-                unregister_ticket_job(story_key)
+                unregister_ticket_job(story_key, job_id)
         
         # Update job with results
         job.stage = results.get('stage', 'FAILED')
@@ -2583,4 +3032,4 @@ async def process_draft_pr_worker(
 
     finally:
         # Always unregister so the same story can be retried or re-run
-        unregister_ticket_job(story_key)
+        unregister_ticket_job(story_key, job_id)
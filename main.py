@@ -19,6 +19,9 @@ from src.bitbucket_client import BitbucketClient
 from src.confluence_client import ConfluenceClient
 from src.llm_client import LLMClient
 from src.generator import DescriptionGenerator
+from src.backend_limiter import BackendLimiter
+from src.llm_cache import configure_llm_cache
+from src.llm_rate_limiter import configure_llm_rate_limiter
 from src.models import ProcessingResult
 
 
@@ -88,6 +91,8 @@ def create_clients(config: Config):
         )
     
     # LLM client (required)
+    configure_llm_cache(config.get_llm_cache_config(), config._config.get('redis', {}))
+    configure_llm_rate_limiter(config.get_llm_rate_limit_config(), config._config.get('redis', {}))
     llm_config = config.get_llm_config()
     llm_client = LLMClient(llm_config)
     
@@ -240,8 +245,9 @@ def single(ctx, ticket_key, dry_run, update):
 @click.option('--dry-run', is_flag=True, help='Preview changes without updating (default mode)')
 @click.option('--update', is_flag=True, help='Actually update tickets')
 @click.option('--max-results', default=100, help='Maximum number of tickets to process')
+@click.option('--concurrency', default=None, type=int, help='Tickets processed at once (default: processing.batch_concurrency)')
 @click.pass_context
-def batch(ctx, jql, dry_run, update, max_results):
+def batch(ctx, jql, dry_run, update, max_results, concurrency):
     """Process multiple tickets using JQL query"""
     config = ctx.obj
     logger = logging.getLogger(__name__)
@@ -276,11 +282,14 @@ def batch(ctx, jql, dry_run, update, max_results):
         confluence_client=confluence_client,
         llm_client=llm_client,
         prompt_template=config.prompts['description_template'],
-        include_code_analysis=config.processing.get('include_code_analysis', True)
+        include_code_analysis=config.processing.get('include_code_analysis', True),
+        backend_limiter=BackendLimiter.from_config(config.processing)
     )
     
     # Process tickets
-    results = generator.process_batch(jql, dry_run_mode, max_results)
+    if concurrency is None:
+        concurrency = int(config.processing.get('batch_concurrency', 1))
+    results = generator.process_batch(jql, dry_run_mode, max_results, concurrency=concurrency)
     
     # Print summary
     print_results_summary(results)
@@ -9,10 +9,17 @@ import os
 import sys
 from arq import create_pool
 from arq.connections import RedisSettings
+from arq.constants import default_queue_name
 from arq.worker import Worker
+from api.blocking_executor import configure_executor, shutdown_executor
+from api.job_scheduler import JOB_CLASSES, queue_name_for, run_dispatch_loop
 from api.workers import (
     WorkerSettings,
+    _initialize_services_if_needed,
+    on_job_start,
+    after_job_end,
     process_batch_tickets_worker,
+    process_batch_ticket_child_worker,
     process_single_ticket_worker,
     process_story_generation_worker,
     process_task_generation_worker,
@@ -21,6 +28,7 @@ from api.workers import (
     process_prd_story_sync_worker,
     process_bulk_story_update_worker,
     process_bulk_task_creation_worker,
+    process_bulk_task_creation_child_worker,
     process_epic_creation_worker,
     process_story_creation_worker,
     process_task_creation_worker,
@@ -29,6 +37,7 @@ from api.workers import (
     process_draft_pr_worker
 )
 from src.config import Config
+from src.metrics import start_metrics_server
 import logging
 
 logging.basicConfig(
@@ -67,9 +76,26 @@ async def main():
         WorkerSettings.keep_result = int(
             os.getenv('WORKER_KEEP_RESULT', worker_config.get('keep_result', WorkerSettings.keep_result))
         )
+        metrics_port = int(os.getenv('WORKER_METRICS_PORT', worker_config.get('metrics_port', 9101)) or 0)
+        WorkerSettings.blocking_threads = int(
+            os.getenv('WORKER_BLOCKING_THREADS', worker_config.get('blocking_threads', WorkerSettings.blocking_threads)) or 0
+        )
+        
+        # Job classes served by this process (each class has its own queue and max_jobs)
+        scheduling_config = config.get_scheduling_config()
+        queues_setting = os.getenv('WORKER_QUEUES', worker_config.get('queues')) or ','.join(JOB_CLASSES)
+        worker_queues = [q.strip() for q in str(queues_setting).split(',') if q.strip() in JOB_CLASSES]
+        if not worker_queues:
+            raise ValueError(f"WORKER_QUEUES must name at least one of {', '.join(JOB_CLASSES)}: {queues_setting}")
+        total_max_jobs = WorkerSettings.max_jobs
+        if scheduling_config['enabled']:
+            total_max_jobs = sum(scheduling_config['classes'][q]['max_jobs'] or WorkerSettings.max_jobs for q in worker_queues)
+        
+        # Blocking JIRA/LLM calls run on a thread pool so max_jobs jobs actually overlap
+        configure_executor(WorkerSettings.blocking_threads or total_max_jobs * 2)
         
         logger.info(f"Starting ARQ worker with Redis: {WorkerSettings.redis_settings.host}:{WorkerSettings.redis_settings.port}")
-        logger.info(f"Worker configuration: max_jobs={WorkerSettings.max_jobs}, job_timeout={WorkerSettings.job_timeout}s, keep_result={WorkerSettings.keep_result}s")
+        logger.info(f"Worker configuration: max_jobs={WorkerSettings.max_jobs}, job_timeout={WorkerSettings.job_timeout}s, keep_result={WorkerSettings.keep_result}s, blocking_threads={WorkerSettings.blocking_threads or total_max_jobs * 2}")
         
         # Cleanup orphaned OpenCode containers and workspaces on startup
         if config.is_opencode_enabled():
@@ -149,39 +175,80 @@ async def main():
             except Exception as e:
                 logger.warning("OpenSandbox startup check failed: %s", e)
 
-        # Create worker with all worker functions
-        worker = Worker(
-            functions=[
-                process_batch_tickets_worker,
-                process_single_ticket_worker,
-                process_story_generation_worker,
-                process_task_generation_worker,
-                process_test_generation_worker,
-                process_story_coverage_worker,
-                process_prd_story_sync_worker,
-                process_bulk_story_update_worker,
-                process_bulk_task_creation_worker,
-                process_epic_creation_worker,
-                process_story_creation_worker,
-                process_task_creation_worker,
-                process_sprint_planning_worker,
-                process_timeline_planning_worker,
-                process_draft_pr_worker
-            ],
-            redis_settings=WorkerSettings.redis_settings,
-            max_jobs=WorkerSettings.max_jobs,
-            job_timeout=WorkerSettings.job_timeout,
-            keep_result=WorkerSettings.keep_result
-        )
+        # One ARQ worker per job class this process serves, each on its class's queue
+        worker_functions = [
+            process_batch_tickets_worker,
+            process_batch_ticket_child_worker,
+            process_single_ticket_worker,
+            process_story_generation_worker,
+            process_task_generation_worker,
+            process_test_generation_worker,
+            process_story_coverage_worker,
+            process_prd_story_sync_worker,
+            process_bulk_story_update_worker,
+            process_bulk_task_creation_worker,
+            process_bulk_task_creation_child_worker,
+            process_epic_creation_worker,
+            process_story_creation_worker,
+            process_task_creation_worker,
+            process_sprint_planning_worker,
+            process_timeline_planning_worker,
+            process_draft_pr_worker
+        ]
+        if scheduling_config['enabled']:
+            worker_classes = [(job_class, queue_name_for(job_class),
+                               scheduling_config['classes'][job_class]['max_jobs'] or WorkerSettings.max_jobs)
+                              for job_class in worker_queues]
+        else:
+            worker_classes = [("default", default_queue_name, WorkerSettings.max_jobs)]
+        workers = [
+            Worker(
+                functions=worker_functions,
+                queue_name=queue_name,
+                redis_settings=WorkerSettings.redis_settings,
+                max_jobs=max_jobs,
+                job_timeout=WorkerSettings.job_timeout,
+                keep_result=WorkerSettings.keep_result,
+                allow_abort_jobs=WorkerSettings.allow_abort_jobs,
+                on_job_start=on_job_start,
+                after_job_end=after_job_end
+            )
+            for _, queue_name, max_jobs in worker_classes
+        ]
+        for job_class, queue_name, max_jobs in worker_classes:
+            logger.info(f"Serving {job_class} jobs from {queue_name} with max_jobs={max_jobs}")
+        
+        # Job durations and the outbound calls jobs make, for Prometheus to scrape
+        if metrics_port:
+            try:
+                start_metrics_server(metrics_port)
+            except OSError as e:
+                logger.warning(f"Metrics exporter could not listen on port {metrics_port}: {e}")
+        
+        # The job hooks read the shared config, ticket registry and Redis pool from api.dependencies
+        _initialize_services_if_needed()
+        dispatch_task = None
+        if scheduling_config['enabled']:
+            dispatch_task = asyncio.create_task(
+                run_dispatch_loop(worker_queues, scheduling_config['dispatch_interval_seconds'])
+            )
         
         logger.info("ARQ worker started. Waiting for jobs...")
-        await worker.async_run()
+        try:
+            await asyncio.gather(*(worker.async_run() for worker in workers))
+        finally:
+            if dispatch_task:
+                dispatch_task.cancel()
         
     except KeyboardInterrupt:
         logger.info("Worker stopped by user")
     except Exception as e:
         logger.error(f"Worker error: {e}")
         sys.exit(1)
+    finally:
+        shutdown_executor()
+        from api.dependencies import ticket_jobs
+        ticket_jobs.close()
 
 
 if __name__ == '__main__':
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Benchmark ARQ worker throughput with blocking JIRA/LLM calls.
+
+Runs process_single_ticket_worker concurrently (as ARQ does with max_jobs > 1)
+against fake JIRA and LLM clients that sleep for a configurable latency, so the
+numbers show whether jobs actually overlap. No JIRA, LLM or Redis is needed.
+
+Usage:
+  # From repo root, with venv activated:
+  python scripts/benchmark_worker_throughput.py
+
+  # Custom job counts and simulated latencies, write results to a file:
+  python scripts/benchmark_worker_throughput.py --jobs 1 5 10 20 --jira-latency 0.2 --llm-latency 1.0 --output results.json
+
+  # Compare against the old behaviour (blocking calls made inline on the event loop):
+  python scripts/benchmark_worker_throughput.py --inline
+
+Interpretation:
+  - jobs_per_second should grow roughly linearly with the job count until the
+    blocking-call thread pool (--threads) is saturated.
+  - With --inline, jobs_per_second stays flat: every job serializes on the event loop.
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+# Add project root to path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+
+class FakeJiraClient:
+    """JIRA client stand-in whose calls block for a fixed latency."""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+
+    def get_ticket(self, ticket_key: str) -> dict:
+        time.sleep(self.latency)
+        return {"key": ticket_key, "fields": {"summary": f"Benchmark {ticket_key}", "description": ""}}
+
+
+class FakeGenerator:
+    """Description generator stand-in whose process_ticket blocks like an LLM call."""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.planning_service = None
+
+    def process_ticket(self, ticket_key: str, **kwargs):
+        time.sleep(self.latency)
+        description = SimpleNamespace(description=f"Generated for {ticket_key}", system_prompt="", user_prompt="")
+        return SimpleNamespace(
+            success=True, error=None, skipped_reason=None, description=description,
+            llm_provider="benchmark", llm_model="benchmark"
+        )
+
+
+async def _never_cancelled(job_id, job) -> bool:
+    return False
+
+
+async def _run_inline(func, *args, cancel_check=None, **kwargs):
+    """Pre-thread-pool behaviour: call the blocking function directly on the event loop."""
+    return func(*args, **kwargs)
+
+
+async def run_batch(job_count: int, inline: bool) -> float:
+    """Run job_count single-ticket jobs concurrently; return elapsed seconds."""
+    from api import workers
+
+    jobs = [
+        workers.process_single_ticket_worker({}, f"bench-{job_count}-{i}", f"BENCH-{i}", False)
+        for i in range(job_count)
+    ]
+    t0 = time.perf_counter()
+    if inline:
+        with patch.object(workers, "run_blocking", _run_inline):
+            await asyncio.gather(*jobs)
+    else:
+        await asyncio.gather(*jobs)
+    return time.perf_counter() - t0
+
+
+async def main() -> dict:
+    parser = argparse.ArgumentParser(description="Benchmark ARQ worker throughput with blocking client calls")
+    parser.add_argument("--jobs", type=int, nargs="+", default=[1, 2, 5, 10], help="Concurrent job counts to measure")
+    parser.add_argument("--jira-latency", type=float, default=0.1, help="Simulated JIRA call latency in seconds")
+    parser.add_argument("--llm-latency", type=float, default=0.5, help="Simulated LLM call latency in seconds")
+    parser.add_argument("--threads", type=int, default=20, help="Blocking-call thread pool size")
+    parser.add_argument("--inline", action="store_true", help="Run blocking calls on the event loop (old behaviour)")
+    parser.add_argument("--output", "-o", type=str, help="Write JSON results to this file")
+    args = parser.parse_args()
+
+    from api import workers
+    from api.blocking_executor import configure_executor, shutdown_executor
+
+    configure_executor(args.threads)
+    jira_client = FakeJiraClient(args.jira_latency)
+    generator = FakeGenerator(args.llm_latency)
+
+    results = []
+    with patch.object(workers, "_initialize_services_if_needed", lambda: None), \
+         patch.object(workers, "get_jira_client", lambda: jira_client), \
+         patch.object(workers, "get_generator", lambda: generator), \
+         patch.object(workers, "get_config", lambda: None), \
+         patch.object(workers, "check_cancellation", _never_cancelled):
+        for job_count in args.jobs:
+            elapsed = await run_batch(job_count, args.inline)
+            r = {
+                "jobs": job_count,
+                "elapsed_seconds": round(elapsed, 3),
+                "jobs_per_second": round(job_count / elapsed, 3),
+            }
+            results.append(r)
+            print(f"jobs={job_count}: elapsed={r['elapsed_seconds']}s throughput={r['jobs_per_second']} jobs/s")
+
+    shutdown_executor()
+
+    out = {
+        "mode": "inline" if args.inline else "thread_pool",
+        "threads": args.threads,
+        "jira_latency_seconds": args.jira_latency,
+        "llm_latency_seconds": args.llm_latency,
+        "results": results,
+    }
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(out, f, indent=2)
+        print(f"Wrote {args.output}")
+
+    return out
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -2,11 +2,14 @@
 Analytics Service
 Calculates analytics and metrics for draft PR jobs
 """
+import inspect
 import logging
 from typing import Dict, Any, List, Optional
 from datetime import datetime, timedelta
 from collections import defaultdict, Counter
 
+from .stage_timings import StageTimingStore
+
 logger = logging.getLogger(__name__)
 
 
@@ -15,14 +18,16 @@ class AnalyticsService:
     Service for calculating analytics and metrics for draft PR jobs.
     """
     
-    def __init__(self, job_status_retriever):
+    def __init__(self, job_status_retriever, stage_timings: Optional[StageTimingStore] = None):
         """
         Initialize analytics service.
         
         Args:
-            job_status_retriever: Function to retrieve job statuses (from Redis/memory)
+            job_status_retriever: Function (sync or async) returning draft PR job dicts (from Redis/memory)
+            stage_timings: Optional stage timing store for per-stage durations
         """
         self.job_status_retriever = job_status_retriever
+        self.stage_timings = stage_timings
     
     async def get_stats(
         self,
@@ -55,7 +60,8 @@ class AnalyticsService:
                 "avg_applying_duration": None,
                 "avg_verifying_duration": None,
                 "common_failure_reasons": [],
-                "jobs_by_stage": {}
+                "jobs_by_stage": {},
+                "stage_durations": {}
             }
         
         # Calculate basic stats
@@ -66,17 +72,20 @@ class AnalyticsService:
         
         # Calculate duration stats
         durations = []
-        planning_durations = []
-        applying_durations = []
-        verifying_durations = []
-        
         for job in jobs:
-            if job.get("started_at") and job.get("completed_at"):
-                duration = (job["completed_at"] - job["started_at"]).total_seconds()
-                durations.append(duration)
-            
-            # Extract stage durations from progress/artifacts if available
-            # This would require additional tracking in the pipeline
+            started, completed = _as_datetime(job.get("started_at")), _as_datetime(job.get("completed_at"))
+            if started and completed:
+                durations.append((completed - started).total_seconds())
+        
+        # Stage durations come from the timing spans the pipeline recorded for these jobs
+        # (no upper bound: stages of a job started before end_date may run past it)
+        stage_durations = {}
+        if self.stage_timings is not None:
+            job_ids = {j.get("job_id") for j in jobs}
+            try:
+                stage_durations = self.stage_timings.summary(start_date, None, job_ids=job_ids)
+            except Exception as e:
+                logger.warning(f"Failed to load stage timings: {e}")
         
         avg_duration = sum(durations) / len(durations) if durations else 0.0
         
@@ -101,11 +110,12 @@ class AnalyticsService:
             "failed_jobs": failed_jobs,
             "success_rate": round(success_rate, 2),
             "avg_duration_seconds": round(avg_duration, 2),
-            "avg_planning_duration": None,  # Would need stage timing tracking
-            "avg_applying_duration": None,  # Would need stage timing tracking
-            "avg_verifying_duration": None,  # Would need stage timing tracking
+            "avg_planning_duration": stage_durations.get("PLANNING", {}).get("avg"),
+            "avg_applying_duration": stage_durations.get("APPLYING", {}).get("avg"),
+            "avg_verifying_duration": stage_durations.get("VERIFYING", {}).get("avg"),
             "common_failure_reasons": common_failures,
-            "jobs_by_stage": dict(jobs_by_stage)
+            "jobs_by_stage": dict(jobs_by_stage),
+            "stage_durations": stage_durations
         }
     
     async def get_job_analytics(
@@ -130,8 +140,9 @@ class AnalyticsService:
         analytics = []
         for job in jobs:
             duration = None
-            if job.get("started_at") and job.get("completed_at"):
-                duration = (job["completed_at"] - job["started_at"]).total_seconds()
+            started, completed = _as_datetime(job.get("started_at")), _as_datetime(job.get("completed_at"))
+            if started and completed:
+                duration = (completed - started).total_seconds()
             
             analytics.append({
                 "job_id": job.get("job_id"),
@@ -163,7 +174,33 @@ class AnalyticsService:
         Returns:
             List of job dictionaries
         """
-        # This would query Redis or in-memory job store
-        # For now, return empty list - implementation depends on job storage
-        # In production, this would query Redis for all draft_pr jobs
-        return []
+        jobs = self.job_status_retriever()
+        if inspect.isawaitable(jobs):
+            jobs = await jobs
+        
+        start_date, end_date = _as_datetime(start_date), _as_datetime(end_date)
+        filtered = []
+        for job in jobs or []:
+            started = _as_datetime(job.get("started_at"))
+            if start_date and (not started or started < start_date):
+                continue
+            if end_date and (not started or started > end_date):
+                continue
+            if status and job.get("status") != status:
+                continue
+            filtered.append(job)
+        return filtered
+
+
+def _as_datetime(value: Any) -> Optional[datetime]:
+    """
+    Job timestamps are datetimes, or ISO strings when reconstructed from Redis.
+    Jobs store naive local times, so aware values are converted to naive local time to compare with them.
+    """
+    if not value:
+        return None
+    if not isinstance(value, datetime):
+        value = datetime.fromisoformat(str(value).replace('Z', '+00:00'))
+    if value.tzinfo is not None:
+        value = value.astimezone().replace(tzinfo=None)
+    return value
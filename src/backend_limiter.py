@@ -0,0 +1,59 @@
+"""
+Per-backend concurrency limits for blocking client calls.
+
+Batch description generation runs several tickets at once on worker threads; these
+limits cap how many calls are in flight against each backend (LLM, JIRA, Confluence,
+Bitbucket) across all of them, so raising ticket concurrency cannot overrun a rate
+limit on the slowest or most expensive service.
+"""
+import logging
+import threading
+from contextlib import contextmanager, nullcontext
+from typing import Any, Dict, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+# Config keys under `processing:` and their defaults
+DEFAULT_BACKEND_LIMITS: Dict[str, int] = {
+    'llm': 4,
+    'jira': 8,
+    'confluence': 4,
+    'bitbucket': 4,
+}
+
+
+class BackendLimiter:
+    """Named bounded semaphores, one per backend. Unknown backends are unlimited."""
+
+    def __init__(self, limits: Optional[Dict[str, int]] = None):
+        self.limits = dict(DEFAULT_BACKEND_LIMITS)
+        if limits:
+            self.limits.update({k: int(v) for k, v in limits.items() if v is not None})
+        self._semaphores = {
+            backend: threading.BoundedSemaphore(max(1, limit))
+            for backend, limit in self.limits.items()
+        }
+        logger.info(f"Backend concurrency limits: {self.limits}")
+
+    @classmethod
+    def from_config(cls, processing_config: Dict[str, Any]) -> "BackendLimiter":
+        """Build from the `processing:` config section (llm_concurrency, jira_concurrency, ...)"""
+        return cls({
+            backend: processing_config.get(f'{backend}_concurrency', default)
+            for backend, default in DEFAULT_BACKEND_LIMITS.items()
+        })
+
+    @contextmanager
+    def limit(self, backend: str) -> Iterator[None]:
+        """Hold one slot for `backend` while the block runs"""
+        semaphore = self._semaphores.get(backend)
+        if semaphore is None:
+            yield
+            return
+        with semaphore:
+            yield
+
+
+def limit_backend(limiter: Optional[BackendLimiter], backend: str):
+    """Context manager for `backend` on an optional limiter (no-op when limiter is None)"""
+    return limiter.limit(backend) if limiter is not None else nullcontext()
@@ -4,6 +4,8 @@ import logging
 from urllib.parse import urljoin
 from datetime import datetime
 
+from .metrics import instrument_session
+
 logger = logging.getLogger(__name__)
 
 
@@ -52,7 +54,7 @@ class BitbucketClient:
         self.base_url = "https://api.bitbucket.org/2.0"
         
         # Setup session for Bitbucket API
-        self.session = requests.Session()
+        self.session = instrument_session(requests.Session(), "bitbucket")
         self.session.auth = (email, api_token)
         self.session.headers.update({
             'Accept': 'application/json',
@@ -238,7 +240,7 @@ class BitbucketClient:
                 logger.debug("Jira credentials not available for Development Panel API")
                 return None
             
-            jira_session = requests.Session()
+            jira_session = instrument_session(requests.Session(), "jira")
             credentials = base64.b64encode(f"{jira_username}:{jira_api_token}".encode()).decode()
             jira_session.headers.update({
                 'Authorization': f'Basic {credentials}',
@@ -61,12 +61,12 @@ class BulkTicketCreator:
                 results["errors"].append(f"Could not extract project key from epic {epic_plan.epic_key}")
                 return results
             
-            # Create stories first
+            # Create stories first (bulk, in chunks)
             story_mapping = {}  # original_story_plan -> created_key
             
-            for story_plan in epic_plan.stories:
-                story_key = self._create_story_with_retry(story_plan, project_key)
-                
+            story_results = self._create_stories(epic_plan.stories, project_key)
+            for story_plan, created in zip(epic_plan.stories, story_results):
+                story_key = created["key"]
                 if story_key:
                     results["created_tickets"]["stories"].append(story_key)
                     story_mapping[id(story_plan)] = story_key
@@ -75,63 +75,52 @@ class BulkTicketCreator:
                     results["failed_creations"].append({
                         "type": "story",
                         "summary": story_plan.summary,
-                        "error": "Failed to create story ticket"
+                        "error": created["error"] or "Failed to create story ticket"
                     })
                     results["success"] = False
             
-            # Create tasks for each story
+            # Create the tasks of every created story in one bulk pass
             task_mapping = {}  # task_plan_id -> created_key
             pending_links = []  # Collect links to create after all tickets are created
             
+            task_plans, task_story_keys = [], []
             for story_plan in epic_plan.stories:
                 story_id = id(story_plan)
                 if story_id not in story_mapping:
                     continue  # Skip if story creation failed
-                
-                story_key = story_mapping[story_id]
-                
                 for task_plan in story_plan.tasks:
-                    task_key = self._create_task_with_retry(task_plan, project_key, story_key)
-                    
-                    if task_key:
-                        results["created_tickets"]["tasks"].append(task_key)
-                        task_mapping[id(task_plan)] = task_key
-                        logger.info(f"Created task {task_key}: {task_plan.summary}")
-                        
-                        # Collect "Split From" relationship for later creation
-                        if hasattr(task_plan, 'split_from_story') and task_plan.split_from_story:
-                            pending_links.append({
-                                "from": task_key,
-                                "to": story_key,
-                                "type": "Split From"
-                            })
-                    else:
-                        results["failed_creations"].append({
-                            "type": "task",
-                            "summary": task_plan.summary,
-                            "parent_story": story_key,
-                            "error": "Failed to create task ticket"
-                        })
-                        results["success"] = False
+                    task_plans.append(task_plan)
+                    task_story_keys.append(story_mapping[story_id])
             
-            # Now that all tickets are created, create all links
-            logger.info(f"All tickets created. Creating {len(pending_links)} pending links...")
-            
-            # Create "Split From" relationships
-            for link_info in pending_links:
-                # Swap: Story as inward, Task as outward to get correct relationship
-                # link_info["from"] is task_key, link_info["to"] is story_key
-                # We need to swap them for correct relationship
-                link_success = self.jira_client.create_issue_link(
-                    link_info["to"], link_info["from"], link_info["type"]  # Swapped: story as inward, task as outward
-                )
-                if link_success:
-                    results["relationships_created"].append(link_info)
+            task_results = self._create_tasks(task_plans, project_key, task_story_keys)
+            for task_plan, story_key, created in zip(task_plans, task_story_keys, task_results):
+                task_key = created["key"]
+                if task_key:
+                    results["created_tickets"]["tasks"].append(task_key)
+                    task_mapping[id(task_plan)] = task_key
+                    logger.info(f"Created task {task_key}: {task_plan.summary}")
+                    
+                    # Collect "Split From" relationship for later creation
+                    # Story as inward, task as outward to get the correct relationship
+                    if hasattr(task_plan, 'split_from_story') and task_plan.split_from_story:
+                        pending_links.append(self._pending_link(
+                            story_key, task_key, "Split From",
+                            {"from": task_key, "to": story_key, "type": "Split From"}
+                        ))
                 else:
-                    results["relationships_failed"].append(link_info)
+                    results["failed_creations"].append({
+                        "type": "task",
+                        "summary": task_plan.summary,
+                        "parent_story": story_key,
+                        "error": created["error"] or "Failed to create task ticket"
+                    })
+                    results["success"] = False
             
-            # Create dependency relationships between tasks
-            self._create_task_dependencies(epic_plan.stories, task_mapping, results)
+            # Now that all tickets are created, create all links (split and dependency) concurrently
+            pending_links.extend(self._task_dependency_links(
+                [task for story in epic_plan.stories for task in story.tasks], task_mapping))
+            logger.info(f"All tickets created. Creating {len(pending_links)} pending links...")
+            self._create_links(pending_links, results)
             
             # Validate the created structure
             validation_results = self.jira_client.validate_ticket_relationships(epic_plan.epic_key)
@@ -188,9 +177,8 @@ class BulkTicketCreator:
                 results["errors"].append(f"Could not extract project key from epic {epic_key}")
                 return results
             
-            for story_plan in stories:
-                story_key = self._create_story_with_retry(story_plan, project_key)
-                
+            for story_plan, created in zip(stories, self._create_stories(stories, project_key)):
+                story_key = created["key"]
                 if story_key:
                     results["created_tickets"]["stories"].append(story_key)
                     logger.info(f"Created story {story_key}")
@@ -198,7 +186,7 @@ class BulkTicketCreator:
                     results["failed_creations"].append({
                         "type": "story",
                         "summary": story_plan.summary,
-                        "error": "Failed to create story ticket"
+                        "error": created["error"] or "Failed to create story ticket"
                     })
                     results["success"] = False
         
@@ -256,60 +244,36 @@ class BulkTicketCreator:
                 results["errors"].append("Could not determine project key from story keys")
                 return results
             
-            # Create tasks with story relationships
+            # Create tasks with story relationships, assigned to stories in round-robin fashion
             task_mapping = {}  # task_plan_id -> created_key
-            story_task_mapping = {}  # task_key -> story_key
-            story_index = 0
+            pending_links = []
+            task_story_keys = [story_keys[i % len(story_keys)] for i in range(len(tasks))]
             
-            for task_plan in tasks:
-                # Assign to story in round-robin fashion
-                story_key = story_keys[story_index % len(story_keys)]
-                story_index += 1
-                
-                task_key = self._create_task_with_retry(task_plan, project_key, story_key)
-                
+            task_results = self._create_tasks(tasks, project_key, task_story_keys)
+            for task_plan, story_key, created in zip(tasks, task_story_keys, task_results):
+                task_key = created["key"]
                 if task_key:
                     results["created_tickets"]["tasks"].append(task_key)
                     task_mapping[id(task_plan)] = task_key
-                    story_task_mapping[task_key] = story_key
                     logger.info(f"Created task {task_key} under story {story_key}")
+                    
+                    # Story as inward, task as outward: makes the task show "split from" the story
+                    pending_links.append(self._pending_link(
+                        story_key, task_key, "Work item split",
+                        {"from": task_key, "to": story_key, "type": "Work item split"}
+                    ))
                 else:
                     results["failed_creations"].append({
                         "type": "task",
                         "summary": task_plan.summary,
                         "parent_story": story_key,
-                        "error": "Failed to create task ticket"
+                        "error": created["error"] or "Failed to create task ticket"
                     })
                     results["success"] = False
             
-            # Create story-task links for all created tasks
-            for task_key, story_key in story_task_mapping.items():
-                # Swap: Story as inward, Task as outward to get correct relationship
-                # This makes Task show "split from" Story correctly
-                link_success = self.jira_client.create_issue_link(
-                    inward_key=story_key,    # Story is inward
-                    outward_key=task_key,    # Task is outward (shows "split from" Story)
-                    link_type="Work item split"
-                )
-                if link_success:
-                    results["relationships_created"].append({
-                        "from": task_key,
-                        "to": story_key,
-                        "type": "Work item split"
-                    })
-                    logger.info(f"Created story-task link: {task_key} split from {story_key}")
-                else:
-                    results["relationships_failed"].append({
-                        "from": task_key,
-                        "to": story_key,
-                        "type": "Work item split",
-                        "error": "Failed to create link"
-                    })
-                    logger.warning(f"Failed to create story-task link: {task_key} -> {story_key}")
-            
-            # Create dependency relationships if any tasks have dependencies
-            if any(task.depends_on_tasks for task in tasks):
-                self._create_standalone_task_dependencies(tasks, task_mapping, results)
+            # Story-task links and dependency relationships, created concurrently
+            pending_links.extend(self._task_dependency_links(tasks, task_mapping))
+            self._create_links(pending_links, results)
         
         except Exception as e:
             results["success"] = False
@@ -363,55 +327,43 @@ class BulkTicketCreator:
         
         return results
     
-    def _create_story_with_retry(self, story_plan: StoryPlan, project_key: str, max_retries: int = 3) -> Optional[str]:
-        """Create story ticket with retry logic"""
-        # Get Confluence server URL if available
-        confluence_server_url = None
-        if self.confluence_client:
-            confluence_server_url = self.confluence_client.server_url
-        
-        for attempt in range(max_retries):
-            try:
-                story_key = self.jira_client.create_story_ticket(
-                    story_plan, 
-                    project_key,
-                    confluence_server_url=confluence_server_url
-                )
-                if story_key:
-                    return story_key
-                
-                if attempt < max_retries - 1:
-                    time.sleep(2 ** attempt)  # Exponential backoff
-                    
-            except Exception as e:
-                logger.warning(f"Story creation attempt {attempt + 1} failed: {str(e)}")
-                if attempt < max_retries - 1:
-                    time.sleep(2 ** attempt)
-        
-        return None
+    def _confluence_server_url(self) -> Optional[str]:
+        """Confluence server URL for downloading image attachments, if available"""
+        return self.confluence_client.server_url if self.confluence_client else None
     
-    def _create_task_with_retry(self, task_plan: TaskPlan, project_key: str, story_key: str, max_retries: int = 3) -> Optional[str]:
-        """Create task ticket with retry logic"""
-        # Get Confluence server URL if available
-        confluence_server_url = None
-        if self.confluence_client:
-            confluence_server_url = self.confluence_client.server_url
-        
-        for attempt in range(max_retries):
-            try:
-                task_key = self.jira_client.create_task_ticket(task_plan, project_key, story_key, confluence_server_url=confluence_server_url)
-                if task_key:
-                    return task_key
-                
-                if attempt < max_retries - 1:
-                    time.sleep(2 ** attempt)  # Exponential backoff
-                    
-            except Exception as e:
-                logger.warning(f"Task creation attempt {attempt + 1} failed: {str(e)}")
-                if attempt < max_retries - 1:
-                    time.sleep(2 ** attempt)
-        
-        return None
+    def _create_stories(self, story_plans: List[StoryPlan], project_key: str) -> List[Dict[str, Any]]:
+        """Create story tickets with JIRA bulk create; one {"key", "error"} per plan"""
+        if not story_plans:
+            return []
+        return self.jira_client.create_story_tickets(story_plans, project_key,
+                                                     confluence_server_url=self._confluence_server_url())
+    
+    def _create_tasks(self, task_plans: List[TaskPlan], project_key: str, story_keys: List[str]) -> List[Dict[str, Any]]:
+        """Create task tickets with JIRA bulk create; one {"key", "error"} per plan"""
+        if not task_plans:
+            return []
+        return self.jira_client.create_task_tickets(task_plans, project_key, story_keys,
+                                                    confluence_server_url=self._confluence_server_url())
+    
+    @staticmethod
+    def _pending_link(inward_key: str, outward_key: str, link_type: str, record: Dict[str, Any],
+                      error: str = "Failed to create link") -> Dict[str, Any]:
+        """A link to create once all tickets exist, with the entry to report for it"""
+        return {"inward_key": inward_key, "outward_key": outward_key, "link_type": link_type,
+                "record": record, "error": error}
+    
+    def _create_links(self, pending_links: List[Dict[str, Any]], results: Dict[str, Any]) -> None:
+        """Create the pending links concurrently and record each outcome in results"""
+        outcomes = self.jira_client.create_issue_links(
+            [{key: link[key] for key in ("inward_key", "outward_key", "link_type")} for link in pending_links]
+        )
+        for link, success in zip(pending_links, outcomes):
+            if success:
+                results["relationships_created"].append(link["record"])
+                logger.info(f"Created {link['link_type']} link: {link['inward_key']} -> {link['outward_key']}")
+            else:
+                results["relationships_failed"].append({**link["record"], "error": link["error"]})
+                logger.warning(f"Failed to create {link['link_type']} link: {link['inward_key']} -> {link['outward_key']}")
     
     def rollback_creation(self, created_tickets: Dict[str, List[str]]) -> Dict[str, Any]:
         """
@@ -447,101 +399,17 @@ class BulkTicketCreator:
         
         return rollback_results
     
-    def _create_task_dependencies(self, stories: List[StoryPlan], task_mapping: Dict[int, str], results: Dict[str, Any]) -> None:
+    def _task_dependency_links(self, tasks: List[TaskPlan], task_mapping: Dict[int, str]) -> List[Dict[str, Any]]:
         """
-        Create dependency relationships between tasks based on their depends_on_tasks field
+        Collect "Blocks" links between created tasks based on their depends_on_tasks field
         
         Args:
-            stories: List of story plans containing tasks
-            task_mapping: Mapping from task plan ID to created JIRA key  
-            results: Results dictionary to update with relationship info
-        """
-        logger.info("Creating task dependency relationships")
-        
-        # Build a mapping from task summary to task plan for dependency lookup
-        all_tasks = []
-        for story in stories:
-            all_tasks.extend(story.tasks)
-        
-        # Create summary to task plan mapping for AI-generated dependencies
-        summary_to_task = {}
-        for task in all_tasks:
-            summary_to_task[task.summary] = task
-        
-        # Create task ID to plan mapping for legacy dependencies
-        task_id_to_plan = {}
-        for i, task in enumerate(all_tasks):
-            task_id_to_plan[f"task_{i+1}"] = task
-        
-        dependency_count = 0
-        
-        for task_plan in all_tasks:
-            task_id = id(task_plan)
-            
-            if task_id not in task_mapping:
-                continue  # Skip if task wasn't created
-                
-            dependent_task_key = task_mapping[task_id]
-            
-            # Create "is blocked by" relationships for each dependency
-            for dep_identifier in task_plan.depends_on_tasks:
-                dependency_task_plan = None
-                
-                # Try to find dependency by task summary (AI-generated dependencies)
-                if dep_identifier in summary_to_task:
-                    dependency_task_plan = summary_to_task[dep_identifier]
-                    logger.info(f"Found AI dependency: '{task_plan.summary}' depends on '{dep_identifier}'")
-                # Fallback to legacy task ID format (pattern-generated dependencies)
-                elif dep_identifier in task_id_to_plan:
-                    dependency_task_plan = task_id_to_plan[dep_identifier]
-                    logger.info(f"Found legacy dependency: '{task_plan.summary}' depends on task ID '{dep_identifier}'")
-                else:
-                    logger.warning(f"Dependency not found for '{task_plan.summary}': '{dep_identifier}'")
-                    continue
-                
-                # Create the JIRA link if we found the dependency task
-                if dependency_task_plan:
-                    dependency_task_id = id(dependency_task_plan)
-                    
-                    if dependency_task_id in task_mapping:
-                        blocking_task_key = task_mapping[dependency_task_id]
-                        
-                        # Create "Blocks" relationship (blocking_task blocks dependent_task)
-                        link_success = self.jira_client.create_issue_link(
-                            blocking_task_key, dependent_task_key, "Blocks"
-                        )
-                        
-                        if link_success:
-                            results["relationships_created"].append({
-                                "from": blocking_task_key,
-                                "to": dependent_task_key,
-                                "type": "Blocks",
-                                "blocking_team": dependency_task_plan.team.value,
-                                "dependent_team": task_plan.team.value
-                            })
-                            dependency_count += 1
-                            logger.info(f"Created blocking relationship: {blocking_task_key} ({dependency_task_plan.team.value}) blocks {dependent_task_key} ({task_plan.team.value})")
-                        else:
-                            results["relationships_failed"].append({
-                                "from": blocking_task_key,
-                                "to": dependent_task_key,
-                                "type": "Blocks",
-                                "error": "Failed to create blocking relationship"
-                            })
-        
-        logger.info(f"Created {dependency_count} task dependency relationships")
-    
-    def _create_standalone_task_dependencies(self, tasks: List[TaskPlan], task_mapping: Dict[int, str], results: Dict[str, Any]) -> None:
-        """
-        Create dependency relationships for standalone task creation
-        
-        Args:
-            tasks: List of task plans
+            tasks: Task plans (all tasks of the epic, or the standalone tasks)
             task_mapping: Mapping from task plan ID to created JIRA key
-            results: Results dictionary to update with relationship info
+            
+        Returns:
+            Pending links for _create_links
         """
-        logger.info("Creating standalone task dependency relationships")
-        
         # Create summary to task plan mapping for AI-generated dependencies
         summary_to_task = {}
         for task in tasks:
@@ -552,7 +420,7 @@ class BulkTicketCreator:
         for i, task in enumerate(tasks):
             task_id_to_plan[f"task_{i+1}"] = task
         
-        dependency_count = 0
+        pending_links = []
         
         for task_plan in tasks:
             task_id = id(task_plan)
@@ -564,8 +432,6 @@ class BulkTicketCreator:
             
             # Create "is blocked by" relationships for each dependency
             for dep_identifier in task_plan.depends_on_tasks:
-                dependency_task_plan = None
-                
                 # Try to find dependency by task summary (AI-generated dependencies)
                 if dep_identifier in summary_to_task:
                     dependency_task_plan = summary_to_task[dep_identifier]
@@ -578,34 +444,22 @@ class BulkTicketCreator:
                     logger.warning(f"Dependency not found for '{task_plan.summary}': '{dep_identifier}'")
                     continue
                 
-                # Create the JIRA link if we found the dependency task
-                if dependency_task_plan:
-                    dependency_task_id = id(dependency_task_plan)
+                dependency_task_id = id(dependency_task_plan)
+                if dependency_task_id in task_mapping:
+                    blocking_task_key = task_mapping[dependency_task_id]
                     
-                    if dependency_task_id in task_mapping:
-                        blocking_task_key = task_mapping[dependency_task_id]
-                        
-                        # Create "Blocks" relationship (blocking_task blocks dependent_task)
-                        link_success = self.jira_client.create_issue_link(
-                            blocking_task_key, dependent_task_key, "Blocks"
-                        )
-                        
-                        if link_success:
-                            results["relationships_created"].append({
-                                "from": blocking_task_key,
-                                "to": dependent_task_key,
-                                "type": "Blocks",
-                                "blocking_team": dependency_task_plan.team.value,
-                                "dependent_team": task_plan.team.value
-                            })
-                            dependency_count += 1
-                            logger.info(f"Created blocking relationship: {blocking_task_key} ({dependency_task_plan.team.value}) blocks {dependent_task_key} ({task_plan.team.value})")
-                        else:
-                            results["relationships_failed"].append({
-                                "from": blocking_task_key,
-                                "to": dependent_task_key,
-                                "type": "Blocks",
-                                "error": "Failed to create blocking relationship"
-                            })
-        
-        logger.info(f"Created {dependency_count} standalone task dependency relationships")
+                    # "Blocks" relationship (blocking_task blocks dependent_task)
+                    pending_links.append(self._pending_link(
+                        blocking_task_key, dependent_task_key, "Blocks",
+                        {
+                            "from": blocking_task_key,
+                            "to": dependent_task_key,
+                            "type": "Blocks",
+                            "blocking_team": dependency_task_plan.team.value,
+                            "dependent_team": task_plan.team.value
+                        },
+                        error="Failed to create blocking relationship"
+                    ))
+        
+        logger.info(f"Collected {len(pending_links)} task dependency relationships")
+        return pending_links
@@ -394,6 +394,113 @@ class Config:
             'sandbox_runtime': str(features.get('sandbox_runtime', 'docker')).strip().lower() or 'docker',
         }
 
+    def get_llm_cache_config(self) -> Dict[str, Any]:
+        """Get LLM response cache configuration with defaults (backend: memory, redis or disk)"""
+        cache = self._config.get('llm_cache', {}) or {}
+        enabled = cache.get('enabled', True)
+        if isinstance(enabled, str):
+            enabled = enabled.strip().lower() in ('true', '1', 'yes')
+        return {
+            'enabled': bool(enabled),
+            'backend': str(cache.get('backend') or 'memory').strip().lower(),
+            'max_entries': int(cache.get('max_entries') or 1000),
+            'ttl_seconds': int(cache.get('ttl_seconds') or 86400),
+            'disk_path': cache.get('disk_path') or 'data/llm_cache',
+        }
+
+    def get_jira_cache_config(self) -> Dict[str, Any]:
+        """Get JIRA issue cache configuration with defaults (backend: memory or redis)"""
+        cache = self._config.get('jira_cache', {}) or {}
+        enabled = cache.get('enabled', True)
+        if isinstance(enabled, str):
+            enabled = enabled.strip().lower() in ('true', '1', 'yes')
+        revalidate = cache.get('revalidate_after_seconds')
+        return {
+            'enabled': bool(enabled),
+            'backend': str(cache.get('backend') or 'memory').strip().lower(),
+            'max_entries': int(cache.get('max_entries') or 2000),
+            'ttl_seconds': int(cache.get('ttl_seconds') or 3600),
+            'revalidate_after_seconds': int(revalidate) if revalidate not in (None, '') else 30,
+        }
+
+    def get_job_store_config(self) -> Dict[str, Any]:
+        """Get job store configuration with defaults (backend: redis or memory)"""
+        store = self._config.get('job_store', {}) or {}
+        return {
+            'backend': str(store.get('backend') or 'redis').strip().lower(),
+            'ttl_seconds': int(store.get('ttl_seconds') or 604800),
+            'flush_interval_ms': int(store.get('flush_interval_ms') or 200),
+            'refresh_interval_ms': int(store.get('refresh_interval_ms') or 250),
+            'max_local_jobs': int(store.get('max_local_jobs') or 5000),
+        }
+
+    def get_ticket_registry_config(self) -> Dict[str, Any]:
+        """Get ticket registry configuration with defaults (shares the job store's Redis backend)"""
+        registry = self._config.get('ticket_registry', {}) or {}
+        return {
+            'lease_seconds': int(registry.get('lease_seconds') or 300),
+            'queued_lease_seconds': int(registry.get('queued_lease_seconds') or 21600),
+        }
+
+    def get_stage_timing_config(self) -> Dict[str, Any]:
+        """Get Draft PR stage timing configuration with defaults (shares the job store's Redis backend)"""
+        timings = self._config.get('stage_timings', {}) or {}
+        return {
+            'retention_days': int(timings.get('retention_days') or 30),
+        }
+
+    def get_scheduling_config(self) -> Dict[str, Any]:
+        """Get job scheduling configuration with defaults (classes: interactive, bulk, sandbox; per_user_max 0 = no cap)"""
+        scheduling = self._config.get('scheduling', {}) or {}
+        enabled = scheduling.get('enabled', True)
+        if isinstance(enabled, str):
+            enabled = enabled.strip().lower() in ('true', '1', 'yes')
+        defaults = {
+            'interactive': {'dispatch_limit': 20, 'per_user_max': 0},
+            'bulk': {'dispatch_limit': 10, 'per_user_max': 4},
+            'sandbox': {'dispatch_limit': 4, 'per_user_max': 1},
+        }
+        configured = scheduling.get('classes') or {}
+        classes = {}
+        for name, class_defaults in defaults.items():
+            settings = configured.get(name) or {}
+            per_user_max = settings.get('per_user_max')
+            classes[name] = {
+                'dispatch_limit': int(settings.get('dispatch_limit') or class_defaults['dispatch_limit']),
+                'per_user_max': int(class_defaults['per_user_max'] if per_user_max in (None, '') else per_user_max),
+                'max_jobs': int(settings.get('max_jobs') or 0),
+            }
+        job_type_weights = scheduling.get('job_type_weights')
+        user_weights = scheduling.get('user_weights')
+        job_classes = scheduling.get('job_classes')
+        return {
+            'enabled': bool(enabled),
+            'classes': classes,
+            'job_type_weights': job_type_weights if isinstance(job_type_weights, dict) else {},
+            'user_weights': user_weights if isinstance(user_weights, dict) else {},
+            'job_classes': job_classes if isinstance(job_classes, dict) else {},
+            'dispatch_interval_seconds': float(scheduling.get('dispatch_interval_seconds') or 5),
+            'stale_after_seconds': int(scheduling.get('stale_after_seconds') or 7200),
+        }
+
+    def get_llm_rate_limit_config(self) -> Dict[str, Any]:
+        """Get LLM rate limiter configuration with defaults (rpm/tpm 0 = unlimited; backend: memory or redis)"""
+        limits = self._config.get('llm_rate_limit', {}) or {}
+        enabled = limits.get('enabled', True)
+        if isinstance(enabled, str):
+            enabled = enabled.strip().lower() in ('true', '1', 'yes')
+        models = limits.get('models')
+        return {
+            'enabled': bool(enabled),
+            'backend': str(limits.get('backend') or 'memory').strip().lower(),
+            'rpm': int(limits.get('rpm') or 0),
+            'tpm': int(limits.get('tpm') or 0),
+            'max_concurrency': int(limits.get('max_concurrency') or 8),
+            'min_concurrency': int(limits.get('min_concurrency') or 1),
+            'max_retries': int(limits.get('max_retries') or 4),
+            'models': models if isinstance(models, dict) else {},
+        }
+
     def get_mcp_config(self) -> Dict[str, Any]:
         """Get MCP server configuration"""
         return self._config.get('mcp', {})
@@ -5,6 +5,8 @@ from urllib.parse import urljoin
 import re
 from bs4 import BeautifulSoup
 
+from .metrics import instrument_session
+
 logger = logging.getLogger(__name__)
 
 
@@ -14,7 +16,7 @@ class ConfluenceClient:
     def __init__(self, server_url: str, username: str, api_token: str):
         self.server_url = server_url.rstrip('/')
         self.auth = (username, api_token)
-        self.session = requests.Session()
+        self.session = instrument_session(requests.Session(), "confluence")
         self.session.auth = self.auth
         self.session.headers.update({
             'Accept': 'application/json'
@@ -15,6 +15,7 @@ from .workspace_manager import WorkspaceManager
 from .artifact_store import ArtifactStore
 from .bitbucket_client import BitbucketClient
 from .llm_client import LLMClient
+from .stage_timings import stage_timer
 
 logger = logging.getLogger(__name__)
 
@@ -192,17 +193,19 @@ class DraftPRPipeline:
         branch = repos[0].get("branch") if repos else None
         input_spec = self.artifact_store.retrieve_artifact(job_id, "input_spec") or {}
         story_key = input_spec.get("story_key")
-        return await self.sandbox_pipeline.execute_apply_to_pr(
-            job_id=job_id,
-            approved_plan=approved_plan,
-            repo_url=repo_url,
-            branch=branch,
-            story_key=story_key,
-            destination_branch="main",
-            cancellation_event=cancellation_event,
-            on_sandbox_created=on_sandbox_created,
-            on_sandbox_released=on_sandbox_released,
-        )
+        # Whole APPLY→PR run; the sandbox pipeline times its stages and sub-steps itself
+        with stage_timer(job_id, "APPLY_TO_PR"):
+            return await self.sandbox_pipeline.execute_apply_to_pr(
+                job_id=job_id,
+                approved_plan=approved_plan,
+                repo_url=repo_url,
+                branch=branch,
+                story_key=story_key,
+                destination_branch="main",
+                cancellation_event=cancellation_event,
+                on_sandbox_created=on_sandbox_created,
+                on_sandbox_released=on_sandbox_released,
+            )
 
     async def execute_pipeline(
         self,
@@ -274,48 +277,49 @@ class DraftPRPipeline:
                 )
             
             workspace_path = None
-            if self.sandbox_runner and repos:
-                # Sandbox planning: run plan generation inside OpenSandbox.
-                prompt = self.plan_generator.build_plan_prompt(
-                    story_key=story_key,
-                    story_summary=story_summary,
-                    story_description=story_description,
-                    scope=scope,
-                    repos=repos,
-                    additional_context=additional_context,
-                )
-                repo_url = repos[0].get("url", repos[0]) if isinstance(repos[0], dict) else repos[0]
-                branch = repos[0].get("branch") if isinstance(repos[0], dict) else None
-                result = await self.sandbox_runner.execute_plan_generation(
-                    job_id=job_id,
-                    repo_url=repo_url,
-                    branch=branch,
-                    prompt=prompt,
-                    cancellation_event=cancellation_event,
-                )
-                if isinstance(result, dict) and "plan" in result and isinstance(result["plan"], dict):
-                    plan_dict = result["plan"]
-                elif isinstance(result, dict) and result.get("summary") and result.get("scope"):
-                    plan_dict = result
+            with stage_timer(job_id, PipelineStage.PLANNING):
+                if self.sandbox_runner and repos:
+                    # Sandbox planning: run plan generation inside OpenSandbox.
+                    prompt = self.plan_generator.build_plan_prompt(
+                        story_key=story_key,
+                        story_summary=story_summary,
+                        story_description=story_description,
+                        scope=scope,
+                        repos=repos,
+                        additional_context=additional_context,
+                    )
+                    repo_url = repos[0].get("url", repos[0]) if isinstance(repos[0], dict) else repos[0]
+                    branch = repos[0].get("branch") if isinstance(repos[0], dict) else None
+                    result = await self.sandbox_runner.execute_plan_generation(
+                        job_id=job_id,
+                        repo_url=repo_url,
+                        branch=branch,
+                        prompt=prompt,
+                        cancellation_event=cancellation_event,
+                    )
+                    if isinstance(result, dict) and "plan" in result and isinstance(result["plan"], dict):
+                        plan_dict = result["plan"]
+                    elif isinstance(result, dict) and result.get("summary") and result.get("scope"):
+                        plan_dict = result
+                    else:
+                        raise PlanGeneratorError(
+                            f"Sandbox plan generation returned unexpected structure: keys={list(result.keys()) if isinstance(result, dict) else type(result)}"
+                        )
+                    plan_v1 = self.plan_generator.post_process_plan(plan_dict, repos, generated_by="opencode")
                 else:
-                    raise PlanGeneratorError(
-                        f"Sandbox plan generation returned unexpected structure: keys={list(result.keys()) if isinstance(result, dict) else type(result)}"
+                    # LLM-only planning (no repos or sandbox not used).
+                    plan_v1 = await self.plan_generator.generate_plan(
+                        job_id=job_id,
+                        story_key=story_key,
+                        story_summary=story_summary,
+                        story_description=story_description,
+                        scope=scope,
+                        repos=repos,
+                        additional_context=additional_context,
+                        use_opencode=False,
+                        workspace_path=None,
+                        cancellation_event=cancellation_event,
                     )
-                plan_v1 = self.plan_generator.post_process_plan(plan_dict, repos, generated_by="opencode")
-            else:
-                # LLM-only planning (no repos or sandbox not used).
-                plan_v1 = await self.plan_generator.generate_plan(
-                    job_id=job_id,
-                    story_key=story_key,
-                    story_summary=story_summary,
-                    story_description=story_description,
-                    scope=scope,
-                    repos=repos,
-                    additional_context=additional_context,
-                    use_opencode=False,
-                    workspace_path=None,
-                    cancellation_event=cancellation_event,
-                )
             
             if cancellation_event and cancellation_event.is_set():
                 if workspace_path is not None:
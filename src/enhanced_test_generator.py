@@ -1098,7 +1098,7 @@ class EnhancedTestGenerator:
             if epic_key:
                 try:
                     # Get epic issue to access PRD/RFC custom fields
-                    epic_issue = self.jira_client.get_ticket(epic_key)
+                    epic_issue = self.jira_client.get_ticket(epic_key, profile='planning')
                     if not epic_issue:
                         logger.warning(f"Epic {epic_key} not found")
                         return None
@@ -1176,8 +1176,10 @@ class EnhancedTestGenerator:
     def _generate_task_tests_with_full_context(self, task, story_context, doc_context, coverage_level, technical_context):
         """Generate task tests with complete context"""
         try:
-            # Create comprehensive prompt with all context
-            prompt = self._create_comprehensive_task_prompt(
+            # Create comprehensive prompt with all context; the epic document context leads
+            # and is shared by every task, so it goes out as a cacheable prefix
+            shared_prefix = self._create_document_context_prefix(doc_context)
+            prompt = self._create_full_context_task_prompt(
                 task, story_context, doc_context, coverage_level, technical_context
             )
             
@@ -1186,7 +1188,8 @@ class EnhancedTestGenerator:
             response = self.llm_client.generate_content_json(
                 prompt=prompt,
                 system_prompt=Prompts.get_full_context_test_system_prompt(),
-                max_tokens=None
+                max_tokens=None,
+                cacheable_prefix=shared_prefix or None
             )
             
             # Parse response into test cases
@@ -1219,50 +1222,65 @@ class EnhancedTestGenerator:
         return prompt
     
     def _create_comprehensive_task_prompt(self, task, story_context, doc_context, coverage_level, technical_context):
-        """Create comprehensive prompt with enhanced document context"""
-        # Start with enhanced prompt
-        prompt = self._create_enhanced_task_prompt(task, story_context, coverage_level, technical_context)
+        """Create comprehensive prompt with enhanced document context (document context first)"""
+        return self._create_document_context_prefix(doc_context) + self._create_full_context_task_prompt(
+            task, story_context, doc_context, coverage_level, technical_context
+        )
+    
+    def _create_document_context_prefix(self, doc_context):
+        """
+        Epic PRD/RFC context leading the full-context test prompt.
         
-        # Add enhanced document context if available
-        if doc_context:
-            prompt += f"\n\n**ENHANCED DOCUMENT CONTEXT:**"
-            
-            if doc_context.get('prd'):
-                prd_data = doc_context['prd']
-                prd_title = prd_data.get('title', 'Product Requirements')
-                prompt += f"\n\n**PRD Context - {prd_title}:**"
-                
-                # Add specific PRD sections relevant to testing
-                sections = prd_data.get('sections', {})
-                prd_sections = []
-                if sections.get('user_stories'):
-                    prd_sections.append(f"- User Stories: {sections['user_stories'][:300]}...")
-                if sections.get('acceptance_criteria'):
-                    prd_sections.append(f"- Acceptance Criteria: {sections['acceptance_criteria'][:300]}...")
-                if sections.get('constraints_limitation'):
-                    prd_sections.append(f"- Constraints & Limitations: {sections['constraints_limitation'][:300]}...")
-                if sections.get('description_flow'):
-                    prd_sections.append(f"- Process Flow: {sections['description_flow'][:300]}...")
-                if sections.get('strategic_impact'):
-                    prd_sections.append(f"- Strategic Impact: {sections['strategic_impact'][:200]}...")
-                
-                if prd_sections:
-                    prompt += "\n" + "\n".join(prd_sections)
-                
-                prompt += f"\n{Prompts.get_prd_usage_guidance()}"
+        Every task under one epic gets the same text, so it is sent as a cacheable prefix
+        ahead of the task-specific prompt. Empty when there is no document context.
+        """
+        if not doc_context:
+            return ""
+        
+        prefix = "**ENHANCED DOCUMENT CONTEXT:**"
+        
+        if doc_context.get('prd'):
+            prd_data = doc_context['prd']
+            prd_title = prd_data.get('title', 'Product Requirements')
+            prefix += f"\n\n**PRD Context - {prd_title}:**"
+            
+            # Add specific PRD sections relevant to testing
+            sections = prd_data.get('sections', {})
+            prd_sections = []
+            if sections.get('user_stories'):
+                prd_sections.append(f"- User Stories: {sections['user_stories'][:300]}...")
+            if sections.get('acceptance_criteria'):
+                prd_sections.append(f"- Acceptance Criteria: {sections['acceptance_criteria'][:300]}...")
+            if sections.get('constraints_limitation'):
+                prd_sections.append(f"- Constraints & Limitations: {sections['constraints_limitation'][:300]}...")
+            if sections.get('description_flow'):
+                prd_sections.append(f"- Process Flow: {sections['description_flow'][:300]}...")
+            if sections.get('strategic_impact'):
+                prd_sections.append(f"- Strategic Impact: {sections['strategic_impact'][:200]}...")
+            
+            if prd_sections:
+                prefix += "\n" + "\n".join(prd_sections)
+            
+            prefix += f"\n{Prompts.get_prd_usage_guidance()}"
+        
+        if doc_context.get('rfc'):
+            rfc_data = doc_context['rfc']
+            rfc_title = rfc_data.get('title', 'Technical Specification')
+            prefix += f"\n\n**RFC Context - {rfc_title}:**"
             
-            if doc_context.get('rfc'):
-                rfc_data = doc_context['rfc']
-                rfc_title = rfc_data.get('title', 'Technical Specification')
-                prompt += f"\n\n**RFC Context - {rfc_title}:**"
-                
-                # Add RFC sections relevant to testing
-                sections = rfc_data.get('sections', {})
-                rfc_summary = rfc_data.get('content_summary', '')
-                if rfc_summary:
-                    prompt += f"\n- Technical Overview: {rfc_summary[:400]}..."
-                
-                prompt += f"\n{Prompts.get_rfc_usage_guidance()}"
+            # Add RFC sections relevant to testing
+            rfc_summary = rfc_data.get('content_summary', '')
+            if rfc_summary:
+                prefix += f"\n- Technical Overview: {rfc_summary[:400]}..."
+            
+            prefix += f"\n{Prompts.get_rfc_usage_guidance()}"
+        
+        return prefix + "\n\n---\n\n"
+    
+    def _create_full_context_task_prompt(self, task, story_context, doc_context, coverage_level, technical_context):
+        """Task-specific part of the full-context prompt (follows the document context prefix)"""
+        # Start with enhanced prompt
+        prompt = self._create_enhanced_task_prompt(task, story_context, coverage_level, technical_context)
         
         # Add context prioritization guidance based on available context
         focus_messages = Prompts.get_testing_focus_messages()
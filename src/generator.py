@@ -1,5 +1,6 @@
 import logging
-from typing import Optional, List, Dict, Any, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Dict, Any, Tuple, Callable
 from datetime import datetime
 
 from .models import (
@@ -14,10 +15,29 @@ from .jira_client import JiraClient
 from .bitbucket_client import BitbucketClient
 from .confluence_client import ConfluenceClient
 from .llm_client import LLMClient
+from .llm_registry import get_llm_registry
 from .prompts import Prompts
+from .backend_limiter import BackendLimiter, limit_backend
+from .token_counter import ContextBudget, count_tokens
 
 logger = logging.getLogger(__name__)
 
+# Prompt template variables sized by the context budget (plus additional_context)
+BUDGETED_PROMPT_SECTIONS = (
+    'ticket_description', 'story_information', 'prd_summary', 'prd_goals',
+    'rfc_technical_summary', 'rfc_implementation_summary', 'rfc_security_performance_summary',
+    'pull_request_details', 'commit_messages', 'changed_files', 'code_changes_summary',
+)
+# Relative shares when sections must be truncated (unlisted = 1.0)
+PROMPT_SECTION_WEIGHTS = {
+    'ticket_description': 2.0,
+    'prd_summary': 1.5,
+    'rfc_technical_summary': 1.5,
+    'rfc_implementation_summary': 1.5,
+    'pull_request_details': 1.5,
+    'additional_context': 1.0,
+}
+
 
 class DescriptionGenerator:
     """Main class for generating ticket descriptions and planning epics"""
@@ -31,7 +51,8 @@ class DescriptionGenerator:
         prompt_template: Optional[str] = None,
         include_code_analysis: bool = True,
         story_description_max_length: int = 300,
-        story_description_summary_threshold: int = 500
+        story_description_summary_threshold: int = 500,
+        backend_limiter: Optional[BackendLimiter] = None
     ):
         self.jira_client = jira_client
         self.bitbucket_client = bitbucket_client
@@ -47,6 +68,9 @@ class DescriptionGenerator:
         
         logger.info(f"Story description config initialized: max_length={story_description_max_length}, summary_threshold={story_description_summary_threshold}")
         
+        # Caps in-flight calls per backend when tickets are processed concurrently (None = unlimited)
+        self.backend_limiter = backend_limiter
+        
         # Initialize planning service for dual-mode support
         self.planning_service = PlanningService(
             jira_client, confluence_client, llm_client
@@ -78,7 +102,8 @@ class DescriptionGenerator:
             logger.info(f"Processing ticket: {ticket_key}")
             
             # Get ticket information
-            ticket_data = self.jira_client.get_ticket(ticket_key)
+            with self._limit('jira'):
+                ticket_data = self.jira_client.get_ticket(ticket_key)
             if not ticket_data:
                 return ProcessingResult(
                     ticket_key=ticket_key,
@@ -108,9 +133,10 @@ class DescriptionGenerator:
                 )
             
             # Update ticket
-            success = self.jira_client.update_ticket_description(
-                ticket_key, description.description, dry_run
-            )
+            with self._limit('jira'):
+                success = self.jira_client.update_ticket_description(
+                    ticket_key, description.description, dry_run
+                )
             
             # Handle image attachments if description contains images (only if not dry run)
             if success and not dry_run:
@@ -118,11 +144,12 @@ class DescriptionGenerator:
                 if self.confluence_client:
                     confluence_server_url = self.confluence_client.server_url
                 
-                self.jira_client._attach_images_from_description(
-                    ticket_key, 
-                    description.description, 
-                    confluence_server_url
-                )
+                with self._limit('jira'):
+                    self.jira_client._attach_images_from_description(
+                        ticket_key, 
+                        description.description, 
+                        confluence_server_url
+                    )
             
             # Add model and provider to the result
             llm_provider = None
@@ -148,21 +175,30 @@ class DescriptionGenerator:
                 error=str(e)
             )
     
-    def process_batch(self, jql: str, dry_run: bool = True, max_results: int = 100) -> List[ProcessingResult]:
-        """Process multiple tickets based on JQL query"""
+    def process_batch(self, jql: str, dry_run: bool = True, max_results: int = 100,
+                      concurrency: int = 1,
+                      on_result: Optional[Callable[[ProcessingResult], None]] = None) -> List[ProcessingResult]:
+        """Process multiple tickets based on JQL query
+        
+        Args:
+            jql: JQL query selecting the tickets
+            dry_run: If True, don't actually update JIRA
+            max_results: Maximum number of tickets to process
+            concurrency: Number of tickets processed at once (per-backend calls are still
+                         capped by backend_limiter)
+            on_result: Optional callback invoked with each result as soon as it finishes
+        
+        Returns:
+            Results in the same order as the search results
+        """
         logger.info(f"Processing batch with JQL: {jql}")
         
         try:
-            tickets = self.jira_client.search_tickets(jql, max_results)
-            logger.info(f"Found {len(tickets)} tickets to process")
+            # Tickets stream in page by page, so processing starts before the whole search finishes
+            tickets = self.jira_client.iter_search_tickets(jql, max_results)
             
-            results = []
-            for i, ticket_data in enumerate(tickets, 1):
-                ticket_key = ticket_data['key']
-                logger.info(f"Processing {i}/{len(tickets)}: {ticket_key}")
-                
+            def process_one(ticket_key: str) -> ProcessingResult:
                 result = self.process_ticket(ticket_key, dry_run)
-                results.append(result)
                 
                 # Log progress
                 if result.success:
@@ -171,19 +207,42 @@ class DescriptionGenerator:
                     logger.info(f"⊝ Skipped {ticket_key}: {result.skipped_reason}")
                 else:
                     logger.error(f"✗ Failed {ticket_key}: {result.error}")
-            
-            return results
+                
+                if on_result:
+                    on_result(result)
+                return result
+            
+            if concurrency <= 1:
+                results = []
+                for i, ticket_data in enumerate(tickets, 1):
+                    logger.info(f"Processing {i}: {ticket_data['key']}")
+                    results.append(process_one(ticket_data['key']))
+                logger.info(f"Processed {len(results)} tickets")
+                return results
+            
+            logger.info(f"Processing tickets with concurrency {concurrency}")
+            with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="batch-ticket") as executor:
+                # Tickets are submitted as their page arrives; futures keep search order while
+                # tickets finish in any order
+                futures = [executor.submit(process_one, ticket_data['key']) for ticket_data in tickets]
+                logger.info(f"Found {len(futures)} tickets to process")
+                return [future.result() for future in futures]
             
         except Exception as e:
             logger.error(f"Error processing batch: {e}")
             return []
     
+    def _limit(self, backend: str):
+        """Hold a concurrency slot for `backend` ('llm', 'jira', 'confluence', 'bitbucket')"""
+        return limit_backend(self.backend_limiter, backend)
+    
     def _build_context(self, ticket_data: Dict[str, Any], additional_context: Optional[str] = None) -> GenerationContext:
         """Build context for description generation"""
         fields = ticket_data.get('fields', {})
         
         # Get ALL story information via split relationships
-        story_tickets_data = self.jira_client.find_story_tickets(ticket_data['key'])
+        with self._limit('jira'):
+            story_tickets_data = self.jira_client.find_story_tickets(ticket_data['key'])
         stories = []
         
         for story_data in story_tickets_data:
@@ -255,7 +314,8 @@ class DescriptionGenerator:
     def _fetch_prd_content(self, prd_url: str) -> Optional[PRDContent]:
         """Fetch PRD/RFC content from Confluence with enhanced section extraction"""
         try:
-            page_data = self.confluence_client.get_page_content(prd_url)
+            with self._limit('confluence'):
+                page_data = self.confluence_client.get_page_content(prd_url)
             if not page_data:
                 return None
             
@@ -457,7 +517,8 @@ class DescriptionGenerator:
     def _fetch_rfc_content(self, rfc_url: str) -> Optional[RFCContent]:
         """Fetch RFC content from Confluence with comprehensive section extraction"""
         try:
-            page_data = self.confluence_client.get_page_content(rfc_url)
+            with self._limit('confluence'):
+                page_data = self.confluence_client.get_page_content(rfc_url)
             if not page_data:
                 return None
             
@@ -517,7 +578,8 @@ class DescriptionGenerator:
     def _fetch_pull_requests(self, ticket_key: str, include_code_analysis: bool = False) -> List[PullRequest]:
         """Fetch pull requests related to the ticket"""
         try:
-            pr_data = self.bitbucket_client.find_pull_requests_for_ticket(ticket_key, include_diff=include_code_analysis)
+            with self._limit('bitbucket'):
+                pr_data = self.bitbucket_client.find_pull_requests_for_ticket(ticket_key, include_diff=include_code_analysis)
             
             pull_requests = []
             for pr in pr_data:
@@ -542,7 +604,8 @@ class DescriptionGenerator:
     def _fetch_commits(self, ticket_key: str, include_code_analysis: bool = False) -> List[Commit]:
         """Fetch commits related to the ticket"""
         try:
-            commit_data = self.bitbucket_client.find_commits_for_ticket(ticket_key, include_diff=include_code_analysis)
+            with self._limit('bitbucket'):
+                commit_data = self.bitbucket_client.find_commits_for_ticket(ticket_key, include_diff=include_code_analysis)
             
             commits = []
             for commit in commit_data:
@@ -592,11 +655,12 @@ class DescriptionGenerator:
                 
                 logger.info(f"Using custom LLM configuration: provider={current_config['provider']}, model={current_config['model']}")
                 
-                # Create temporary client with these settings
-                temp_client = LLMClient(current_config)
+                # Client for these settings (provider SDK client reused from the pool)
+                temp_client = get_llm_registry().get_client(current_config)
                 system_prompt = temp_client.get_system_prompt()
                 # max_tokens=None uses config default (from LLM_MAX_TOKENS env var)
-                description_text = temp_client.generate_description(user_prompt)
+                with self._limit('llm'):
+                    description_text = temp_client.generate_description(user_prompt)
                 
                 used_provider = current_config['provider']
                 used_model = current_config['model']
@@ -604,7 +668,8 @@ class DescriptionGenerator:
                 # Use the default client
                 system_prompt = self.llm_client.get_system_prompt()
                 # max_tokens=None uses config default (from LLM_MAX_TOKENS env var)
-                description_text = self.llm_client.provider.generate_description(user_prompt, max_tokens=None)
+                with self._limit('llm'):
+                    description_text = self.llm_client.provider.generate_description(user_prompt, max_tokens=None)
                 used_provider = self.llm_client.provider_name
                 used_model = self.llm_client.provider.model
             
@@ -650,7 +715,7 @@ class DescriptionGenerator:
             llm_model: Optional LLM model to override default (used to get max_tokens)
             llm_provider: Optional LLM provider to override default (used to get max_tokens)
         """
-        # Get max_tokens for dynamic additional context limit
+        # Get max_tokens (reserved for the response when budgeting the context window)
         max_tokens = self._get_effective_max_tokens(llm_provider, llm_model)
         
         # Format ticket description - when in dry_run mode and description exists, ensure it's included
@@ -676,63 +741,44 @@ class DescriptionGenerator:
             'additional_context': 'N/A'  # Placeholder
         }
         
-        # Build prompt without additional_context to count tokens
-        prompt_without_additional = self.prompt_template
-        for var, value in template_vars_base.items():
-            prompt_without_additional = prompt_without_additional.replace(f'{{{{{var}}}}}', str(value))
-        
         # Get system prompt for token counting
         system_prompt = None
         if llm_model or llm_provider:
             from .config import Config
             config = Config()
             current_config = config.get_llm_config(llm_provider, llm_model)
-            from .llm_client import LLMClient
-            temp_client = LLMClient(current_config)
+            temp_client = get_llm_registry().get_client(current_config)
             system_prompt = temp_client.get_system_prompt()
+            provider_name, model_name = current_config['provider'], current_config['model']
         else:
             system_prompt = self.llm_client.get_system_prompt()
+            provider_name, model_name = self._resolve_provider_model()
         
-        # Count tokens used so far (system prompt + user prompt without additional_context)
-        system_tokens = self._estimate_tokens(system_prompt)
-        prompt_tokens = self._estimate_tokens(prompt_without_additional)
-        total_tokens_used = system_tokens + prompt_tokens
-        
-        logger.debug(f"Token usage: system={system_tokens}, prompt={prompt_tokens}, total={total_tokens_used}")
-        
-        # Calculate remaining budget for additional_context
-        if max_tokens is not None:
-            # Reserve 30% of max_tokens for response generation
-            response_reserve = int(max_tokens * 0.3)
-            available_for_prompt = max_tokens - response_reserve
-            
-            # Calculate remaining tokens for additional_context
-            remaining_tokens = available_for_prompt - total_tokens_used
-            
-            # Ensure we have at least some buffer (don't use 100% of available)
-            remaining_tokens = max(0, remaining_tokens - 100)  # 100 token buffer
-            
-            # Convert tokens to characters (3.5 chars per token, conservative)
-            char_limit = int(remaining_tokens * 3.5)
-            
-            # Ensure non-negative (no cap - trust the dynamic calculation)
-            char_limit = max(0, char_limit)
-            
-            logger.debug(f"Additional context budget: {remaining_tokens} tokens = ~{char_limit} chars (max_tokens={max_tokens}, available_for_prompt={available_for_prompt})")
-        else:
-            # Fallback to default if max_tokens not available
-            char_limit = 1000
-            logger.debug(f"Using default additional context limit: {char_limit} chars (max_tokens not available)")
-        
-        # Format additional_context with calculated limit
-        formatted_additional_context = self._format_additional_context(
-            context.additional_context, 
-            char_limit=char_limit
+        # Variable sections share what is left of the context window after the system prompt,
+        # the fixed template text and the response reservation (max_tokens)
+        sections = {var: str(template_vars_base[var]) for var in BUDGETED_PROMPT_SECTIONS}
+        sections['additional_context'] = context.additional_context or ''
+        prompt_skeleton = self.prompt_template
+        for var, value in template_vars_base.items():
+            prompt_skeleton = prompt_skeleton.replace(f'{{{{{var}}}}}', '' if var in sections else str(value))
+        
+        budget = ContextBudget(provider_name, model_name, max_output_tokens=max_tokens)
+        fitted_sections = budget.fit(
+            sections,
+            fixed_texts=[system_prompt, prompt_skeleton],
+            weights=PROMPT_SECTION_WEIGHTS,
+            truncate=self._smart_truncate
         )
+        logger.debug(f"Context budget ({budget.counter.name}): window={budget.context_window}, reserved_output={budget.max_output_tokens}")
         
-        # Now build final prompt with properly sized additional_context
         template_vars = template_vars_base.copy()
-        template_vars['additional_context'] = formatted_additional_context
+        for var in BUDGETED_PROMPT_SECTIONS:
+            template_vars[var] = fitted_sections[var]
+        fitted_additional_context = fitted_sections['additional_context']
+        template_vars['additional_context'] = self._format_additional_context(
+            fitted_additional_context,
+            char_limit=len(fitted_additional_context)
+        )
         
         # Replace template variables with final values
         prompt = self.prompt_template
@@ -809,22 +855,30 @@ class DescriptionGenerator:
         
         return additional_context
     
-    def _estimate_tokens(self, text: str) -> int:
-        """Estimate token count from text (rough approximation)
-        
-        Uses ~4 characters per token as a conservative estimate.
-        For more accuracy, could use tiktoken library.
+    def _estimate_tokens(self, text: str, llm_provider: Optional[str] = None,
+                         llm_model: Optional[str] = None) -> int:
+        """Count tokens with the tokenizer for the provider/model (default client when not given)
         
         Args:
-            text: Text to estimate tokens for
+            text: Text to count tokens for
+            llm_provider: Optional LLM provider override
+            llm_model: Optional LLM model override
             
         Returns:
-            Estimated token count
+            Token count (heuristic estimate when no tokenizer is available)
         """
         if not text:
             return 0
-        # Conservative estimate: 4 chars per token (accounts for spaces, punctuation)
-        return len(text) // 4
+        provider_name, model_name = self._resolve_provider_model(llm_provider, llm_model)
+        return count_tokens(text, provider_name, model_name)
+    
+    def _resolve_provider_model(self, llm_provider: Optional[str] = None,
+                                llm_model: Optional[str] = None) -> Tuple[Optional[str], Optional[str]]:
+        """Provider and model a request will use (overrides, else the default client's)"""
+        if llm_provider or llm_model:
+            return llm_provider or getattr(self.llm_client, 'provider_name', None), llm_model
+        provider = getattr(self.llm_client, 'provider', None)
+        return getattr(self.llm_client, 'provider_name', None), getattr(provider, 'model', None)
     
     def _get_effective_max_tokens(self, llm_provider: Optional[str] = None,
                                   llm_model: Optional[str] = None) -> Optional[int]:
@@ -1205,7 +1259,8 @@ class DescriptionGenerator:
             
             try:
                 # Get parent ticket data
-                parent_data = self.jira_client.get_ticket(parent_key)
+                with self._limit('jira'):
+                    parent_data = self.jira_client.get_ticket(parent_key, profile='planning')
                 parent_prd_url = self.jira_client.extract_prd_url(parent_data)
                 if parent_prd_url:
                     logger.debug(f"Found PRD URL in parent {parent_key}: {parent_prd_url}")
@@ -1217,7 +1272,8 @@ class DescriptionGenerator:
                     grandparent_key = parent_fields['parent']['key']
                     logger.debug(f"Found grandparent ticket: {grandparent_key}")
                     
-                    grandparent_data = self.jira_client.get_ticket(grandparent_key)
+                    with self._limit('jira'):
+                        grandparent_data = self.jira_client.get_ticket(grandparent_key, profile='planning')
                     grandparent_prd_url = self.jira_client.extract_prd_url(grandparent_data)
                     if grandparent_prd_url:
                         logger.debug(f"Found PRD URL in grandparent {grandparent_key}: {grandparent_prd_url}")
@@ -1246,7 +1302,8 @@ class DescriptionGenerator:
             
             try:
                 # Get parent ticket data
-                parent_data = self.jira_client.get_ticket(parent_key)
+                with self._limit('jira'):
+                    parent_data = self.jira_client.get_ticket(parent_key, profile='planning')
                 parent_rfc_url = self.jira_client.extract_rfc_url(parent_data)
                 if parent_rfc_url:
                     logger.debug(f"Found RFC URL in parent {parent_key}: {parent_rfc_url}")
@@ -1258,7 +1315,8 @@ class DescriptionGenerator:
                     grandparent_key = parent_fields['parent']['key']
                     logger.debug(f"Found grandparent ticket: {grandparent_key}")
                     
-                    grandparent_data = self.jira_client.get_ticket(grandparent_key)
+                    with self._limit('jira'):
+                        grandparent_data = self.jira_client.get_ticket(grandparent_key, profile='planning')
                     grandparent_rfc_url = self.jira_client.extract_rfc_url(grandparent_data)
                     if grandparent_rfc_url:
                         logger.debug(f"Found RFC URL in grandparent {grandparent_key}: {grandparent_rfc_url}")
@@ -1435,7 +1493,7 @@ class DescriptionGenerator:
         if not epic_key:
             logger.info("No epic_key provided, deriving from story tickets...")
             try:
-                first_story_data = self.jira_client.get_ticket(story_keys[0])
+                first_story_data = self.jira_client.get_ticket(story_keys[0], profile='minimal')
                 if first_story_data:
                     parent = first_story_data.get('fields', {}).get('parent')
                     if parent and parent.get('key'):
@@ -1464,7 +1522,7 @@ class DescriptionGenerator:
         
         try:
             # Get epic details to retrieve PRD/RFC URLs
-            epic_issue = self.jira_client.get_ticket(epic_key)
+            epic_issue = self.jira_client.get_ticket(epic_key, profile='planning')
             if epic_issue:
                 # Get PRD content using planning service method
                 prd_content = self.planning_service._get_prd_content(epic_issue)
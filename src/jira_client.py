@@ -1,14 +1,60 @@
 import requests
 import re
-from typing import Dict, List, Optional, Any, Tuple
+import copy
+from typing import Dict, Iterator, List, Optional, Any, Tuple
 import logging
+import time
 from urllib.parse import urljoin
 import tempfile
 import os
 from io import BytesIO
+from concurrent.futures import ThreadPoolExecutor
+
+from .metrics import instrument_session
+from .jira_issue_cache import get_jira_issue_cache
 
 logger = logging.getLogger(__name__)
 
+BULK_FETCH_CHUNK_SIZE = 100  # Keys per `key in (...)` search (the search/jql page size cap)
+BULK_FETCH_WORKERS = 4  # Concurrent chunk requests per get_tickets call
+SEARCH_PAGE_SIZE = 100  # Issues per search page (the enhanced search API's cap)
+SEARCH_PARALLEL_PAGES = 4  # Concurrent page requests when the total is known up front (deprecated search API)
+BULK_CREATE_CHUNK_SIZE = 50  # Issues per /issue/bulk call (JIRA's per-request limit)
+LINK_WORKERS = 8  # Concurrent issueLink requests in create_issue_links
+_TICKET_KEY_RE = re.compile(r'^[A-Z][A-Z0-9_]*-\d+$')
+
+
+# Named field projections for reads (see JiraClient._get_fields_list). Every profile starts from
+# MINIMAL_FIELDS; *_custom_field entries resolve to the client's configured custom field ids.
+MINIMAL_FIELDS = ['key', 'summary', 'status', 'issuetype', 'parent', 'updated']
+FIELD_PROFILES = {
+    'minimal': [],
+    'links': ['issuelinks'],
+    'description': ['description'],
+    'planning': ['prd_custom_field', 'rfc_custom_field', 'mandays_custom_field'],
+    'test_cases': ['description', 'test_case_custom_field'],
+}
+
+
+def _with_updated(fields: str) -> str:
+    """Cached reads always carry `updated` so entries can be revalidated"""
+    return fields if 'updated' in fields.split(',') else fields + ',updated'
+
+
+def _prefetched(pages: Iterator[List[Dict[str, Any]]]) -> Iterator[List[Dict[str, Any]]]:
+    """Iterate pages while the following page is already being fetched in a background thread"""
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="jira-search")
+    try:
+        pending = executor.submit(next, pages, None)
+        while True:
+            page = pending.result()
+            if page is None:
+                return
+            pending = executor.submit(next, pages, None)
+            yield page
+    finally:
+        executor.shutdown(wait=True)
+
 
 class JiraClient:
     """Jira API client for fetching and updating tickets"""
@@ -28,15 +74,33 @@ class JiraClient:
         logger.info(f"🔍   rfc_custom_field: {self.rfc_custom_field}")
         logger.info(f"🔍   test_case_custom_field: {self.test_case_custom_field}")
         logger.info(f"🔍   mandays_custom_field: {self.mandays_custom_field}")
-        self.session = requests.Session()
+        self.session = instrument_session(requests.Session(), "jira")
         self.session.auth = self.auth
         self.session.headers.update({
             'Accept': 'application/json',
             'Content-Type': 'application/json'
         })
     
-    def _get_fields_list(self) -> str:
-        """Get the list of fields to fetch from Jira API"""
+    def _get_fields_list(self, profile: Optional[str] = None) -> str:
+        """
+        Get the list of fields to fetch from Jira API.
+
+        profile selects a lean projection from FIELD_PROFILES ('minimal' for metadata such as
+        parent or issue type, 'links', 'description', 'planning' for PRD/RFC/mandays fields,
+        'test_cases'); None returns the wide default list.
+        """
+        if profile is not None:
+            if profile not in FIELD_PROFILES:
+                raise ValueError(f"Unknown field profile: {profile}")
+            fields = list(MINIMAL_FIELDS)
+            for field in FIELD_PROFILES[profile]:
+                if field.endswith('_custom_field'):
+                    field = getattr(self, field)
+                    if not field:
+                        continue
+                fields.append(str(field))
+            return ','.join(fields)
+
         base_fields = ['key', 'summary', 'description', 'status', 'parent', 'assignee', 'created', 'updated', 'issuetype']
         custom_fields = []
         
@@ -57,155 +121,301 @@ class JiraClient:
     
     def search_tickets(self, jql: str, max_results: int = 100) -> List[Dict[str, Any]]:
         """Search for tickets using JQL with the new enhanced search API"""
-        # Use the new enhanced search endpoint
-        url = urljoin(self.server_url, '/rest/api/3/search/jql')
-        
-        # Check if JQL is too long for GET request (usually around 2048 chars)
-        if len(jql) > 2000:
-            return self._search_tickets_post(url, jql, max_results)
-        else:
-            return self._search_tickets_get(url, jql, max_results)
+        return list(self._iter_search(jql, max_results, prefetch=False))
     
-    def _search_tickets_get(self, url: str, jql: str, max_results: int) -> List[Dict[str, Any]]:
-        """Search using GET request for shorter JQL queries"""
-        params = {
-            'jql': jql,
-            'maxResults': max_results,
-            'fields': self._get_fields_list()
-        }
+    def iter_search_tickets(self, jql: str, max_results: int = 100) -> Iterator[Dict[str, Any]]:
+        """
+        Stream search results: issues are yielded as soon as their page arrives and the
+        next page is requested in the background while the caller works through the
+        current one, so batch processing can start after the first page.
         
-        all_issues = []
-        next_page_token = None
+        Same results and fallback as search_tickets. Abandoning the iterator early waits
+        for at most the page in flight.
+        """
+        return self._iter_search(jql, max_results, prefetch=True)
+    
+    def _iter_search(self, jql: str, max_results: int, prefetch: bool) -> Iterator[Dict[str, Any]]:
+        """Issues from the enhanced search API, falling back to the deprecated API on failure"""
+        url = urljoin(self.server_url, '/rest/api/3/search/jql')
         
+        # Check if JQL is too long for GET request (usually around 2048 chars)
+        pages = self._search_pages(url, jql, max_results, use_post=len(jql) > 2000)
+        seen = set()
         try:
-            while True:
-                if next_page_token:
-                    params['nextPageToken'] = next_page_token
-                
-                response = self.session.get(url, params=params, timeout=30)
-                response.raise_for_status()
-                
-                data = response.json()
-                issues = data.get('issues', [])
-                all_issues.extend(issues)
-                
-                # Check if this is the last page
-                if data.get('isLast', True) or len(all_issues) >= max_results:
-                    break
-                
-                # Get next page token if available
-                next_page_token = data.get('nextPageToken')
-                if not next_page_token:
-                    break
-                
-                # Update max results for next request
-                remaining = max_results - len(all_issues)
-                if remaining > 0:
-                    params['maxResults'] = min(remaining, 100)
-                else:
-                    break
-            
-            return all_issues[:max_results]  # Ensure we don't exceed max_results
-            
+            for page in (_prefetched(pages) if prefetch else pages):
+                for issue in page:
+                    seen.add(issue.get('key'))
+                    yield issue
+            return
         except requests.exceptions.RequestException as e:
             logger.error(f"Failed to search tickets: {e}")
             # Fallback to deprecated API if enhanced search fails
             logger.warning("Falling back to deprecated search API")
-            return self._search_tickets_deprecated(jql, max_results)
+        
+        # A stream that failed part-way continues with the issues it has not yielded yet
+        remaining = max_results - len(seen)
+        try:
+            for page in self._search_pages_deprecated(jql, max_results):
+                for issue in page:
+                    if issue.get('key') in seen:
+                        continue
+                    if remaining <= 0:
+                        return
+                    remaining -= 1
+                    yield issue
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Failed to search tickets with deprecated API: {e}")
+            raise
     
-    def _search_tickets_post(self, url: str, jql: str, max_results: int) -> List[Dict[str, Any]]:
-        """Search using POST request for longer JQL queries"""
-        payload = {
-            'jql': jql,
-            'maxResults': max_results,
-            'fields': [
+    def _search_pages(self, url: str, jql: str, max_results: int, use_post: bool) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Pages of the enhanced search API, following nextPageToken.
+        GET for shorter JQL queries, POST (JSON body) for longer ones.
+        """
+        if use_post:
+            fields: Any = [
                 'key', 'summary', 'description', 'status', 'parent', 'assignee',
                 self.prd_custom_field, 'created', 'updated'
             ]
+        else:
+            fields = self._get_fields_list()
+        request = {
+            'jql': jql,
+            'maxResults': min(max_results, SEARCH_PAGE_SIZE),
+            'fields': fields
         }
         
-        all_issues = []
-        next_page_token = None
+        fetched = 0
+        while True:
+            if use_post:
+                response = self.session.post(url, json=request, timeout=30)
+            else:
+                response = self.session.get(url, params=request, timeout=30)
+            response.raise_for_status()
+            
+            data = response.json()
+            issues = data.get('issues', [])[:max_results - fetched]  # Ensure we don't exceed max_results
+            fetched += len(issues)
+            yield issues
+            
+            # Check if this is the last page
+            next_page_token = data.get('nextPageToken')
+            if data.get('isLast', True) or not next_page_token or not issues or fetched >= max_results:
+                return
+            request['nextPageToken'] = next_page_token
+            request['maxResults'] = min(max_results - fetched, SEARCH_PAGE_SIZE)
+    
+    def _search_pages_deprecated(self, jql: str, max_results: int,
+                                 max_workers: int = SEARCH_PARALLEL_PAGES) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Pages of the deprecated offset-based search API (count first, then parallel pages).
+        
+        The first page reports the total, which fixes every remaining startAt; those pages
+        are then requested concurrently and yielded in order.
+        """
+        url = urljoin(self.server_url, '/rest/api/3/search')
+        fields = self._get_fields_list()
         
+        def fetch(start_at: int, page_size: int) -> Dict[str, Any]:
+            params = {
+                'jql': jql,
+                'startAt': start_at,
+                'maxResults': page_size,
+                'fields': fields
+            }
+            response = self.session.get(url, params=params, timeout=30)
+            response.raise_for_status()
+            return response.json()
+        
+        first = fetch(0, min(max_results, SEARCH_PAGE_SIZE))
+        issues = first.get('issues', [])[:max_results]
+        yield issues
+        
+        # JIRA may cap the page below what was asked for; later pages use the size it returned
+        page_size = len(issues)
+        total = min(int(first.get('total', page_size)), max_results)
+        if not page_size or page_size >= total:
+            return
+        
+        offsets = range(page_size, total, page_size)
+        executor = ThreadPoolExecutor(max_workers=min(max_workers, len(offsets)), thread_name_prefix="jira-search")
+        try:
+            futures = [executor.submit(fetch, start_at, min(page_size, total - start_at)) for start_at in offsets]
+            for future in futures:
+                yield future.result().get('issues', [])
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+    
+    def get_ticket(self, ticket_key: str, profile: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Get detailed information for a specific ticket.
+
+        profile picks a field projection (see _get_fields_list); the default is the wide
+        field list plus issuelinks.
+        """
+        fields = self._get_fields_list(profile) if profile else self._get_fields_list() + ',issuelinks'
+        return self._get_ticket_with_fields(ticket_key, fields)
+    
+    def get_tickets(self, ticket_keys: List[str], fields: Optional[str] = None, profile: Optional[str] = None,
+                    max_workers: int = BULK_FETCH_WORKERS) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch many tickets with `key in (...)` JQL searches instead of one GET per ticket.
+
+        Keys are sent in chunks of BULK_FETCH_CHUNK_SIZE (paginated via nextPageToken),
+        chunks run concurrently. A chunk JIRA rejects (e.g. it names a deleted issue) and keys
+        missing from the results (e.g. moved issues) fall back to single GETs. With the issue
+        cache configured, cached tickets are served from it: stale ones are revalidated with
+        one `updated`-only search and only changed or uncached tickets are fetched.
+
+        Args:
+            ticket_keys: Ticket keys; duplicates are fetched once
+            fields: Comma-separated fields (defaults to get_ticket's fields, with issuelinks)
+            profile: Named field projection, used when fields is not given (see _get_fields_list)
+
+        Returns:
+            {key: {"issue": ticket data or None, "error": message or None}} in input order
+        """
+        if not fields:
+            fields = self._get_fields_list(profile) if profile else self._get_fields_list() + ',issuelinks'
+        keys = list(dict.fromkeys(k.strip().upper() for k in ticket_keys if k and k.strip()))
+        results: Dict[str, Dict[str, Any]] = {}
+        valid = []
+        for key in keys:
+            if _TICKET_KEY_RE.match(key):
+                valid.append(key)
+                results[key] = {"issue": None, "error": None}
+            else:
+                results[key] = {"issue": None, "error": f"Invalid ticket key: {key}"}
+
+        cache = get_jira_issue_cache()
+        to_fetch = valid
+        if cache is not None:
+            fields = _with_updated(fields)
+            to_fetch, stale = [], {}
+            for key in valid:
+                entry = cache.get(key, fields)
+                if entry is None:
+                    to_fetch.append(key)
+                elif cache.is_fresh(entry):
+                    results[key]["issue"] = copy.deepcopy(entry["issue"])
+                    cache.record("hits")
+                else:
+                    stale[key] = entry
+            if stale:
+                current = {(issue.get('key') or '').upper(): (issue.get('fields') or {}).get('updated')
+                           for issue in self._search_by_keys(list(stale), 'updated', max_workers)}
+                for key, entry in stale.items():
+                    if entry["updated"] and current.get(key) == entry["updated"]:
+                        cache.mark_validated(key, fields, entry)
+                        cache.record("revalidated")
+                        results[key]["issue"] = copy.deepcopy(entry["issue"])
+                    else:
+                        to_fetch.append(key)
+            cache.record("misses", len(to_fetch))
+
+        for issue in self._search_by_keys(to_fetch, fields, max_workers):
+            key = (issue.get('key') or '').upper()
+            if key in results:
+                results[key]["issue"] = issue
+                if cache is not None:
+                    cache.put(key, fields, issue)
+
+        missing = [key for key in to_fetch if results[key]["issue"] is None]
+        if missing:
+            logger.debug(f"Bulk fetch: {len(missing)} of {len(to_fetch)} tickets not in search results, fetching individually")
+        for key in missing:
+            issue = self._fetch_ticket(key, fields)
+            if issue:
+                results[key]["issue"] = issue
+                if cache is not None:
+                    cache.put(key, fields, issue)
+            else:
+                results[key]["error"] = f"Ticket {key} not found or not accessible"
+
+        # Map back to the caller's spelling of each key
+        ordered = {}
+        for key in ticket_keys:
+            if key and key.strip() and key not in ordered:
+                ordered[key] = results[key.strip().upper()]
+        return ordered
+
+    def _search_by_keys(self, keys: List[str], fields: str, max_workers: int = BULK_FETCH_WORKERS) -> List[Dict[str, Any]]:
+        """`key in (...)` searches over chunks of keys, run concurrently"""
+        chunks = [keys[i:i + BULK_FETCH_CHUNK_SIZE] for i in range(0, len(keys), BULK_FETCH_CHUNK_SIZE)]
+        if len(chunks) > 1 and max_workers > 1:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks)),
+                                    thread_name_prefix="jira-bulk-get") as executor:
+                fetched = list(executor.map(lambda chunk: self._fetch_ticket_chunk(chunk, fields), chunks))
+        else:
+            fetched = [self._fetch_ticket_chunk(chunk, fields) for chunk in chunks]
+        return [issue for issues in fetched for issue in issues]
+
+    def _fetch_ticket_chunk(self, keys: List[str], fields: str) -> List[Dict[str, Any]]:
+        """One `key in (...)` search (POST, paginated); returns [] when JIRA rejects the chunk"""
+        url = urljoin(self.server_url, '/rest/api/3/search/jql')
+        quoted = ','.join(f'"{key}"' for key in keys)
+        payload = {
+            'jql': f'key in ({quoted})',
+            'maxResults': len(keys),
+            'fields': fields.split(','),
+        }
+        issues = []
         try:
             while True:
-                if next_page_token:
-                    payload['nextPageToken'] = next_page_token
-                
                 response = self.session.post(url, json=payload, timeout=30)
                 response.raise_for_status()
-                
                 data = response.json()
-                issues = data.get('issues', [])
-                all_issues.extend(issues)
-                
-                # Check if this is the last page
-                if data.get('isLast', True) or len(all_issues) >= max_results:
-                    break
-                
-                # Get next page token if available
+                issues.extend(data.get('issues', []))
                 next_page_token = data.get('nextPageToken')
-                if not next_page_token:
+                if data.get('isLast', True) or not next_page_token or len(issues) >= len(keys):
                     break
-                
-                # Update max results for next request
-                remaining = max_results - len(all_issues)
-                if remaining > 0:
-                    payload['maxResults'] = min(remaining, 100)
-                else:
-                    break
-            
-            return all_issues[:max_results]  # Ensure we don't exceed max_results
-            
+                payload['nextPageToken'] = next_page_token
         except requests.exceptions.RequestException as e:
-            logger.error(f"Failed to search tickets with POST: {e}")
-            # Fallback to deprecated API if enhanced search fails
-            logger.warning("Falling back to deprecated search API")
-            return self._search_tickets_deprecated(jql, max_results)
-    
-    def _search_tickets_deprecated(self, jql: str, max_results: int) -> List[Dict[str, Any]]:
-        """Fallback method using deprecated search API"""
-        url = urljoin(self.server_url, '/rest/api/3/search')
-        
-        params = {
-            'jql': jql,
-            'maxResults': max_results,
-            'fields': self._get_fields_list()
-        }
-        
-        try:
-            response = self.session.get(url, params=params, timeout=30)
-            response.raise_for_status()
-            
-            data = response.json()
-            return data.get('issues', [])
-            
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Failed to search tickets with deprecated API: {e}")
-            raise
-    
-    def get_ticket(self, ticket_key: str) -> Optional[Dict[str, Any]]:
-        """Get detailed information for a specific ticket"""
+            logger.warning(f"Bulk fetch of {len(keys)} tickets failed, falling back to single fetches: {e}")
+        return issues
+
+    def _get_ticket_with_fields(self, ticket_key: str, fields: str) -> Optional[Dict[str, Any]]:
+        """Single-ticket read through the issue cache (when configured)"""
+        cache = get_jira_issue_cache()
+        if cache is None:
+            return self._fetch_ticket(ticket_key, fields)
+        fields = _with_updated(fields)
+        entry = cache.get(ticket_key, fields)
+        if entry is not None:
+            if cache.is_fresh(entry):
+                cache.record("hits")
+                return copy.deepcopy(entry["issue"])
+            current = self._fetch_ticket(ticket_key, 'updated')
+            if current is not None and entry["updated"] and (current.get('fields') or {}).get('updated') == entry["updated"]:
+                cache.mark_validated(ticket_key, fields, entry)
+                cache.record("revalidated")
+                return copy.deepcopy(entry["issue"])
+        cache.record("misses")
+        issue = self._fetch_ticket(ticket_key, fields)
+        if issue is not None:
+            cache.put(ticket_key, fields, issue)
+        return issue
+
+    def _fetch_ticket(self, ticket_key: str, fields: str) -> Optional[Dict[str, Any]]:
         url = urljoin(self.server_url, f'/rest/api/3/issue/{ticket_key}')
-        
-        params = {
-            'fields': self._get_fields_list() + ',issuelinks'
-        }
-        
         try:
-            response = self.session.get(url, params=params, timeout=30)
+            response = self.session.get(url, params={'fields': fields}, timeout=30)
             response.raise_for_status()
-            
             return response.json()
-            
         except requests.exceptions.RequestException as e:
             logger.error(f"Failed to get ticket {ticket_key}: {e}")
             return None
-    
+
+    def _invalidate_cached(self, *ticket_keys: str) -> None:
+        """Drop cached copies of issues this client just wrote to"""
+        cache = get_jira_issue_cache()
+        if cache is not None:
+            cache.invalidate(*ticket_keys)
+
     def get_issue_links(self, ticket_key: str) -> List[Dict[str, Any]]:
         """Get issue links for a specific ticket"""
         try:
-            ticket_data = self.get_ticket(ticket_key)
+            ticket_data = self.get_ticket(ticket_key, profile='links')
             if not ticket_data:
                 return []
             
@@ -223,7 +433,7 @@ class JiraClient:
         """Find ALL story tickets linked via 'split from' or 'split to' relationships"""
         try:
             issue_links = self.get_issue_links(ticket_key)
-            story_tickets = []
+            story_keys = []
             
             for link in issue_links:
                 link_type = link.get('type', {})
@@ -244,9 +454,11 @@ class JiraClient:
                         if 'story' in issue_type:
                             story_key = linked_issue['key']
                             logger.debug(f"Found story ticket {story_key} linked to {ticket_key}")
-                            story_data = self.get_ticket(story_key)
-                            if story_data:
-                                story_tickets.append(story_data)
+                            story_keys.append(story_key)
+            
+            # One bulk fetch for all linked stories instead of a GET per story
+            fetched = self.get_tickets(story_keys, profile='description') if story_keys else {}
+            story_tickets = [r["issue"] for r in fetched.values() if r["issue"]]
             
             logger.debug(f"Found {len(story_tickets)} story ticket(s) via split relations for {ticket_key}")
             return story_tickets
@@ -280,6 +492,7 @@ class JiraClient:
         
         try:
             response = self.session.put(url, json=payload, timeout=30)
+            self._invalidate_cached(ticket_key)
             response.raise_for_status()
             
             logger.info(f"Successfully updated ticket {ticket_key}")
@@ -293,7 +506,7 @@ class JiraClient:
         """Append text to existing JIRA ticket description"""
         try:
             # Get current ticket
-            ticket = self.get_ticket(ticket_key)
+            ticket = self.get_ticket(ticket_key, profile='description')
             if not ticket:
                 logger.error(f"Ticket {ticket_key} not found")
                 return False
@@ -337,6 +550,8 @@ class JiraClient:
             }
             
             response = self.session.put(url, json=payload, timeout=30)
+            
+            self._invalidate_cached(ticket_key)
             response.raise_for_status()
             
             logger.info(f"✅ Successfully appended to description for {ticket_key}")
@@ -366,6 +581,8 @@ class JiraClient:
             }
             
             response = self.session.put(url, json=payload, timeout=30)
+            
+            self._invalidate_cached(ticket_key)
             response.raise_for_status()
             
             logger.info(f"Successfully updated mandays custom field for {ticket_key}")
@@ -404,6 +621,8 @@ class JiraClient:
             
             response = self.session.put(url, json=payload, timeout=30)
             
+            self._invalidate_cached(ticket_key)
+            
             logger.info(f"🔍 Response status: {response.status_code}")
             logger.info(f"🔍 Response headers: {dict(response.headers)}")
             logger.info(f"🔍 Response body: {response.text}")
@@ -921,94 +1140,109 @@ class JiraClient:
     # BULK OPERATIONS (Phase 3)
     # =====================================
     
-    def create_story_ticket(self, story_plan, project_key: str, confluence_server_url: Optional[str] = None) -> Optional[str]:
+    def _build_story_issue_data(self, story_plan, project_key: str) -> Dict[str, Any]:
         """
-        Create a story ticket in JIRA
+        Build the issue-create payload for a story
         
         Args:
             story_plan: StoryPlan object with story details
             project_key: JIRA project key
-            confluence_server_url: Optional Confluence server URL for downloading image attachments
             
         Returns:
-            Created ticket key or None if failed
+            Issue data dict for POST /rest/api/3/issue
         """
+        # Prepare story description in ADF format with fallback
         try:
-            # Prepare story description in ADF format with fallback
-            try:
-                description_adf = story_plan.format_description_for_jira_adf()
-                
-                # If format_description_for_jira_adf returns None, it means description already contains
-                # acceptance criteria and we should convert the markdown description to ADF
-                if description_adf is None:
-                    # Description already has acceptance criteria, convert markdown to ADF
+            description_adf = story_plan.format_description_for_jira_adf()
+            
+            # If format_description_for_jira_adf returns None, it means description already contains
+            # acceptance criteria and we should convert the markdown description to ADF
+            if description_adf is None:
+                # Description already has acceptance criteria, convert markdown to ADF
+                description_adf = self._convert_markdown_to_adf(story_plan.description)
+                logger.debug(f"Converted markdown description to ADF for story: {story_plan.summary}")
+            else:
+                # Description doesn't have acceptance criteria, but might still have markdown
+                # Check if description contains markdown formatting
+                if '**' in story_plan.description or '##' in story_plan.description or '```' in story_plan.description:
+                    # Convert the full description (which may include markdown) to ADF
+                    # and merge with acceptance criteria if needed
                     description_adf = self._convert_markdown_to_adf(story_plan.description)
                     logger.debug(f"Converted markdown description to ADF for story: {story_plan.summary}")
                 else:
-                    # Description doesn't have acceptance criteria, but might still have markdown
-                    # Check if description contains markdown formatting
-                    if '**' in story_plan.description or '##' in story_plan.description or '```' in story_plan.description:
-                        # Convert the full description (which may include markdown) to ADF
-                        # and merge with acceptance criteria if needed
-                        description_adf = self._convert_markdown_to_adf(story_plan.description)
-                        logger.debug(f"Converted markdown description to ADF for story: {story_plan.summary}")
-                    else:
-                        logger.debug(f"Using ADF format for story description: {story_plan.summary}")
-            except Exception as e:
-                logger.warning(f"Failed to format ADF description for story, using markdown conversion fallback: {e}")
-                # Try markdown conversion as fallback
-                try:
-                    description_adf = self._convert_markdown_to_adf(story_plan.description)
-                except Exception as e2:
-                    logger.warning(f"Markdown conversion also failed, using plain text fallback: {e2}")
-                    description_text = story_plan.format_description()
-                    description_adf = {
-                        "type": "doc",
-                        "version": 1,
-                        "content": [
-                            {
-                                "type": "paragraph",
-                                "content": [
-                                    {
-                                        "type": "text",
-                                        "text": description_text
-                                    }
-                                ]
-                            }
-                        ]
-                    }
-            
-            # Prepare issue data
-            issue_data = {
-                "fields": {
-                    "project": {"key": project_key},
-                    "summary": story_plan.summary,
-                    "description": description_adf,
-                    "issuetype": {"name": "Story"}
+                    logger.debug(f"Using ADF format for story description: {story_plan.summary}")
+        except Exception as e:
+            logger.warning(f"Failed to format ADF description for story, using markdown conversion fallback: {e}")
+            # Try markdown conversion as fallback
+            try:
+                description_adf = self._convert_markdown_to_adf(story_plan.description)
+            except Exception as e2:
+                logger.warning(f"Markdown conversion also failed, using plain text fallback: {e2}")
+                description_text = story_plan.format_description()
+                description_adf = {
+                    "type": "doc",
+                    "version": 1,
+                    "content": [
+                        {
+                            "type": "paragraph",
+                            "content": [
+                                {
+                                    "type": "text",
+                                    "text": description_text
+                                }
+                            ]
+                        }
+                    ]
                 }
+        
+        # Prepare issue data
+        issue_data = {
+            "fields": {
+                "project": {"key": project_key},
+                "summary": story_plan.summary,
+                "description": description_adf,
+                "issuetype": {"name": "Story"}
             }
+        }
+        
+        # Add epic link if provided
+        if story_plan.epic_key:
+            issue_data["fields"]["parent"] = {"key": story_plan.epic_key}
+        
+        # Calculate mandays from child tasks if available
+        if self.mandays_custom_field and hasattr(story_plan, 'tasks') and story_plan.tasks:
+            total_mandays = 0.0
+            for task in story_plan.tasks:
+                if hasattr(task, 'cycle_time_estimate') and task.cycle_time_estimate:
+                    total_mandays += task.cycle_time_estimate.total_days
+            
+            if total_mandays > 0:
+                issue_data["fields"][self.mandays_custom_field] = total_mandays
+                logger.debug(f"Setting mandays field {self.mandays_custom_field} to {total_mandays} for story (calculated from {len(story_plan.tasks)} tasks)")
+        
+        # Add test cases to custom field if available
+        test_cases_content = story_plan.format_test_cases()
+        if test_cases_content and self.test_case_custom_field:
+            # Convert Markdown to ADF format
+            test_cases_adf = self._convert_markdown_to_adf(test_cases_content)
+            issue_data["fields"][self.test_case_custom_field] = test_cases_adf
+        
+        return issue_data
+    
+    def create_story_ticket(self, story_plan, project_key: str, confluence_server_url: Optional[str] = None) -> Optional[str]:
+        """
+        Create a story ticket in JIRA
+        
+        Args:
+            story_plan: StoryPlan object with story details
+            project_key: JIRA project key
+            confluence_server_url: Optional Confluence server URL for downloading image attachments
             
-            # Add epic link if provided
-            if story_plan.epic_key:
-                issue_data["fields"]["parent"] = {"key": story_plan.epic_key}
-            
-            # Calculate mandays from child tasks if available
-            if self.mandays_custom_field and hasattr(story_plan, 'tasks') and story_plan.tasks:
-                total_mandays = 0.0
-                for task in story_plan.tasks:
-                    if hasattr(task, 'cycle_time_estimate') and task.cycle_time_estimate:
-                        total_mandays += task.cycle_time_estimate.total_days
-                
-                if total_mandays > 0:
-                    issue_data["fields"][self.mandays_custom_field] = total_mandays
-                    logger.debug(f"Setting mandays field {self.mandays_custom_field} to {total_mandays} for story (calculated from {len(story_plan.tasks)} tasks)")
-            
-            # Add test cases to custom field if available
-            test_cases_content = story_plan.format_test_cases()
-            if test_cases_content and self.test_case_custom_field:
-                # Convert Markdown to ADF format
-                test_cases_adf = self._convert_markdown_to_adf(test_cases_content)
-                issue_data["fields"][self.test_case_custom_field] = test_cases_adf
+        Returns:
+            Created ticket key or None if failed
+        """
+        try:
+            issue_data = self._build_story_issue_data(story_plan, project_key)
             
             # Create the ticket
             url = urljoin(self.server_url, '/rest/api/3/issue')
@@ -1031,6 +1265,89 @@ class JiraClient:
             logger.error(f"Error creating story ticket: {str(e)}")
             return None
     
+    def _build_task_issue_data(self, task_plan, project_key: str, story_key: Optional[str] = None,
+                               raw_description: Optional[str] = None, epic_type: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Build the issue-create payload for a task
+        
+        Args:
+            task_plan: TaskPlan object with task details
+            project_key: JIRA project key
+            story_key: Parent story key (optional, only used for logging)
+            raw_description: Optional raw description to use directly (bypasses TaskPlan formatting)
+            epic_type: Issue type of task_plan.epic_key, looked up by the caller
+            
+        Returns:
+            Issue data dict for POST /rest/api/3/issue
+        """
+        # Prepare task description in ADF format
+        if raw_description:
+            # Use raw description directly, convert to ADF
+            logger.debug(f"Using raw description for task: {task_plan.summary}")
+            description_adf = self._convert_markdown_to_adf(raw_description)
+        else:
+            # Use TaskPlan structured formatting
+            try:
+                description_adf = task_plan.format_description_for_jira_adf()
+                logger.debug(f"Using ADF format for task description: {task_plan.summary}")
+            except Exception as e:
+                logger.warning(f"Failed to format ADF description for task, using plain text fallback: {e}")
+                description_text = task_plan.format_description()
+                description_adf = {
+                    "type": "doc",
+                    "version": 1,
+                    "content": [
+                        {
+                            "type": "paragraph",
+                            "content": [
+                                {
+                                    "type": "text",
+                                    "text": description_text
+                                }
+                            ]
+                        }
+                    ]
+                }
+        
+        # Prepare issue data
+        issue_data = {
+            "fields": {
+                "project": {"key": project_key},
+                "summary": task_plan.summary,
+                "description": description_adf,
+                "issuetype": {"name": "Task"}
+            }
+        }
+        
+        # Add parent relationships - use epic as parent (stories cannot parent tasks in this hierarchy)
+        # Verify epic_key is actually an Epic before setting as parent
+        if task_plan.epic_key:
+            if epic_type and 'epic' in epic_type.lower():
+                issue_data["fields"]["parent"] = {"key": task_plan.epic_key}
+                if story_key:
+                    logger.debug(f"Setting task parent to epic: {task_plan.epic_key} (will link to story {story_key} via relationship)")
+                else:
+                    logger.debug(f"Setting task parent to epic: {task_plan.epic_key} (no story parent)")
+            else:
+                logger.warning(f"Epic key {task_plan.epic_key} is not an Epic (type: {epic_type}), skipping parent relationship")
+        else:
+            logger.warning(f"No epic key provided for task: {task_plan.summary}")
+        
+        # Add mandays estimation as custom field if available
+        if task_plan.cycle_time_estimate and self.mandays_custom_field:
+            mandays_value = task_plan.cycle_time_estimate.total_days
+            issue_data["fields"][self.mandays_custom_field] = mandays_value
+            logger.debug(f"Setting mandays field {self.mandays_custom_field} to {mandays_value} for task")
+        
+        # Add test cases to custom field if available
+        test_cases_content = task_plan.format_test_cases()
+        if test_cases_content and self.test_case_custom_field:
+            # Convert Markdown to ADF format
+            test_cases_adf = self._convert_markdown_to_adf(test_cases_content)
+            issue_data["fields"][self.test_case_custom_field] = test_cases_adf
+        
+        return issue_data
+    
     def create_task_ticket(self, task_plan, project_key: str, story_key: Optional[str] = None, raw_description: Optional[str] = None, confluence_server_url: Optional[str] = None) -> Optional[str]:
         """
         Create a task ticket in JIRA
@@ -1046,72 +1363,8 @@ class JiraClient:
             Created ticket key or None if failed
         """
         try:
-            # Prepare task description in ADF format
-            if raw_description:
-                # Use raw description directly, convert to ADF
-                logger.debug(f"Using raw description for task: {task_plan.summary}")
-                description_adf = self._convert_markdown_to_adf(raw_description)
-            else:
-                # Use TaskPlan structured formatting
-                try:
-                    description_adf = task_plan.format_description_for_jira_adf()
-                    logger.debug(f"Using ADF format for task description: {task_plan.summary}")
-                except Exception as e:
-                    logger.warning(f"Failed to format ADF description for task, using plain text fallback: {e}")
-                    description_text = task_plan.format_description()
-                    description_adf = {
-                        "type": "doc",
-                        "version": 1,
-                        "content": [
-                            {
-                                "type": "paragraph",
-                                "content": [
-                                    {
-                                        "type": "text",
-                                        "text": description_text
-                                    }
-                                ]
-                            }
-                        ]
-                    }
-            
-            # Prepare issue data
-            issue_data = {
-                "fields": {
-                    "project": {"key": project_key},
-                    "summary": task_plan.summary,
-                    "description": description_adf,
-                    "issuetype": {"name": "Task"}
-                }
-            }
-            
-            # Add parent relationships - use epic as parent (stories cannot parent tasks in this hierarchy)
-            # Verify epic_key is actually an Epic before setting as parent
-            if task_plan.epic_key:
-                epic_type = self.get_ticket_type(task_plan.epic_key)
-                if epic_type and 'epic' in epic_type.lower():
-                    issue_data["fields"]["parent"] = {"key": task_plan.epic_key}
-                    if story_key:
-                        logger.debug(f"Setting task parent to epic: {task_plan.epic_key} (will link to story {story_key} via relationship)")
-                    else:
-                        logger.debug(f"Setting task parent to epic: {task_plan.epic_key} (no story parent)")
-                else:
-                    logger.warning(f"Epic key {task_plan.epic_key} is not an Epic (type: {epic_type}), skipping parent relationship")
-            else:
-                logger.warning(f"No epic key provided for task: {task_plan.summary}")
-            
-            # Add mandays estimation as custom field if available
-            if task_plan.cycle_time_estimate and self.mandays_custom_field:
-                mandays_value = task_plan.cycle_time_estimate.total_days
-                issue_data["fields"][self.mandays_custom_field] = mandays_value
-                logger.debug(f"Setting mandays field {self.mandays_custom_field} to {mandays_value} for task")
-            
-            # Add test cases to custom field if available
-            test_cases_content = task_plan.format_test_cases()
-            if test_cases_content and self.test_case_custom_field:
-                # Convert Markdown to ADF format
-                test_cases_adf = self._convert_markdown_to_adf(test_cases_content)
-                issue_data["fields"][self.test_case_custom_field] = test_cases_adf
+            epic_type = self.get_ticket_type(task_plan.epic_key) if task_plan.epic_key else None
+            issue_data = self._build_task_issue_data(task_plan, project_key, story_key, raw_description, epic_type)
             
             # Create the ticket
             url = urljoin(self.server_url, '/rest/api/3/issue')
@@ -1159,6 +1412,7 @@ class JiraClient:
             
             url = urljoin(self.server_url, '/rest/api/3/issueLink')
             response = self.session.post(url, json=link_data, timeout=30)
+            self._invalidate_cached(inward_key, outward_key)
             
             if response.status_code == 201:
                 logger.debug(f"✅ Successfully created JIRA link {inward_key} -> {outward_key} ({link_type})")
@@ -1280,6 +1534,149 @@ class JiraClient:
         
         return results
     
+    def create_issues(self, issues: List[Dict[str, Any]], chunk_size: int = BULK_CREATE_CHUNK_SIZE) -> List[Dict[str, Any]]:
+        """
+        Create issues with /rest/api/3/issue/bulk in chunks of chunk_size.
+        
+        JIRA creates the valid elements of a chunk even when others fail; the created issues
+        come back in element order and failures name their failedElementNumber, which maps
+        every result to its input. A throttled chunk (429/503, nothing created) is retried once
+        after Retry-After; other failures are not retried, since the request may have created
+        issues.
+        
+        Args:
+            issues: Issue-create payloads ({"fields": {...}})
+            chunk_size: Issues per bulk request
+            
+        Returns:
+            [{"key": created key or None, "error": message or None}] aligned with issues
+        """
+        url = urljoin(self.server_url, '/rest/api/3/issue/bulk')
+        results: List[Dict[str, Any]] = []
+        
+        for start in range(0, len(issues), chunk_size):
+            chunk = issues[start:start + chunk_size]
+            chunk_results = [{"key": None, "error": None} for _ in chunk]
+            try:
+                response = self.session.post(url, json={"issueUpdates": chunk}, timeout=60)
+                if response.status_code in (429, 503):
+                    delay = min(float(response.headers.get('Retry-After') or 1), 10.0)
+                    logger.warning(f"Bulk create throttled ({response.status_code}), retrying in {delay:.0f}s")
+                    time.sleep(delay)
+                    response = self.session.post(url, json={"issueUpdates": chunk}, timeout=60)
+                
+                try:
+                    data = response.json()
+                except ValueError:
+                    data = {}
+                failed = {}
+                for error in data.get('errors') or []:
+                    element_errors = error.get('elementErrors') or {}
+                    message = '; '.join(element_errors.get('errorMessages') or []) or \
+                        '; '.join(f"{field}: {msg}" for field, msg in (element_errors.get('errors') or {}).items())
+                    failed[error.get('failedElementNumber')] = message or f"HTTP {error.get('status')}"
+                created = iter(data.get('issues') or [])
+                
+                if response.status_code not in (200, 201) and not data.get('issues') and not failed:
+                    raise ValueError(f"{response.status_code} - {response.text[:200]}")
+                for position, item in enumerate(chunk_results):
+                    if position in failed:
+                        item["error"] = failed[position]
+                        continue
+                    issue = next(created, None)
+                    if issue and issue.get('key'):
+                        item["key"] = issue['key']
+                    else:
+                        item["error"] = "Not reported as created by JIRA"
+            except Exception as e:
+                logger.error(f"Bulk create of issues {start + 1}-{start + len(chunk)} failed: {e}")
+                for item in chunk_results:
+                    item["key"], item["error"] = None, f"Bulk creation failed: {e}"
+            
+            created_count = sum(1 for item in chunk_results if item["key"])
+            logger.info(f"Bulk created {created_count}/{len(chunk)} issues (items {start + 1}-{start + len(chunk)})")
+            results.extend(chunk_results)
+        
+        return results
+    
+    def create_story_tickets(self, story_plans: List[Any], project_key: str,
+                             confluence_server_url: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Bulk counterpart of create_story_ticket.
+        
+        Returns:
+            [{"key": created key or None, "error": message or None}] aligned with story_plans
+        """
+        issues = []
+        for story_plan in story_plans:
+            try:
+                issues.append(self._build_story_issue_data(story_plan, project_key))
+            except Exception as e:
+                issues.append(e)
+        return self._create_planned_issues(issues, [plan.description for plan in story_plans], confluence_server_url)
+    
+    def create_task_tickets(self, task_plans: List[Any], project_key: str, story_keys: Optional[List[Optional[str]]] = None,
+                            confluence_server_url: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Bulk counterpart of create_task_ticket; each distinct epic's issue type is looked up once.
+        
+        Args:
+            story_keys: Parent story key per task (optional, aligned with task_plans)
+            
+        Returns:
+            [{"key": created key or None, "error": message or None}] aligned with task_plans
+        """
+        story_keys = story_keys or [None] * len(task_plans)
+        epic_types = {epic_key: self.get_ticket_type(epic_key)
+                      for epic_key in {plan.epic_key for plan in task_plans if plan.epic_key}}
+        issues = []
+        for task_plan, story_key in zip(task_plans, story_keys):
+            try:
+                issues.append(self._build_task_issue_data(task_plan, project_key, story_key,
+                                                          epic_type=epic_types.get(task_plan.epic_key)))
+            except Exception as e:
+                issues.append(e)
+        # TaskPlan has no free-text description of its own; only plans that carry one can have images
+        descriptions = [getattr(plan, 'description', None) for plan in task_plans]
+        return self._create_planned_issues(issues, descriptions, confluence_server_url)
+    
+    def _create_planned_issues(self, issues: List[Any], descriptions: List[Optional[str]],
+                               confluence_server_url: Optional[str]) -> List[Dict[str, Any]]:
+        """Bulk-create the payloads (exceptions mark payloads that could not be built), then attach images"""
+        buildable = [i for i, issue in enumerate(issues) if not isinstance(issue, Exception)]
+        created = dict(zip(buildable, self.create_issues([issues[i] for i in buildable])))
+        
+        results = []
+        for i, issue in enumerate(issues):
+            if isinstance(issue, Exception):
+                results.append({"key": None, "error": f"Could not build issue: {issue}"})
+                continue
+            result = created[i]
+            if result["key"] and descriptions[i]:
+                # Handle image attachments if description contains images
+                self._attach_images_from_description(result["key"], descriptions[i], confluence_server_url)
+            results.append(result)
+        return results
+    
+    def create_issue_links(self, links: List[Dict[str, str]], max_workers: int = LINK_WORKERS) -> List[bool]:
+        """
+        Create many issue links with a bounded pool of concurrent requests (JIRA has no bulk link API).
+        
+        Args:
+            links: [{"inward_key", "outward_key", "link_type"}] as for create_issue_link
+            
+        Returns:
+            Success flag per link, aligned with links
+        """
+        if not links:
+            return []
+        
+        def create(link: Dict[str, str]) -> bool:
+            return self.create_issue_link(link["inward_key"], link["outward_key"], link["link_type"])
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(links)), thread_name_prefix="jira-link") as executor:
+            return list(executor.map(create, links))
+    
     def get_epic_key_from_story(self, story_key: str) -> Optional[str]:
         """
         Get the parent epic key for a story ticket.
@@ -1293,7 +1690,7 @@ class JiraClient:
         """
         if not story_key or not str(story_key).strip():
             return None
-        ticket = self.get_ticket(story_key.strip())
+        ticket = self.get_ticket(story_key.strip(), profile='minimal')
         if not ticket:
             return None
         parent = (ticket.get("fields") or {}).get("parent")
@@ -1301,6 +1698,20 @@ class JiraClient:
             return None
         return parent.get("key")
 
+    def get_epic_keys_from_stories(self, story_keys: List[str]) -> Dict[str, Optional[str]]:
+        """
+        Bulk variant of get_epic_key_from_story: one search for all stories.
+
+        Returns:
+            {story_key: epic key or None} in input order (None when not found or no parent)
+        """
+        fetched = self.get_tickets([k.strip() for k in story_keys if k and str(k).strip()], profile='minimal')
+        epic_keys = {}
+        for story_key, result in fetched.items():
+            parent = ((result["issue"] or {}).get("fields") or {}).get("parent") or {}
+            epic_keys[story_key] = parent.get("key") or None
+        return epic_keys
+
     def get_project_key_from_epic(self, epic_key: str) -> Optional[str]:
         """
         Extract project key from epic key
@@ -1379,16 +1790,17 @@ class JiraClient:
     # STORY COVERAGE ANALYSIS (New Feature)
     # =====================================
     
-    def get_story_tasks(self, story_key: str) -> List[Dict[str, Any]]:
+    def get_story_tasks(self, story_key: str, story_data: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """
         Get all task tickets related to a story ticket
         
         Fetches tasks via:
         1. Parent relationship (parent = story_key)
-        2. "Split from" relationship via issue links
+        2. "Split from" relationship via issue links (one bulk fetch for all linked tasks)
         
         Args:
             story_key: Story ticket key
+            story_data: Story ticket already fetched with issuelinks (saves re-fetching it)
             
         Returns:
             List of task ticket data dictionaries
@@ -1411,7 +1823,11 @@ class JiraClient:
             logger.info(f"Found {len(tasks)} tasks via parent relationship")
             
             # Method 2: Search via "split from" issue links
-            issue_links = self.get_issue_links(story_key)
+            if story_data is not None:
+                issue_links = (story_data.get('fields') or {}).get('issuelinks', [])
+            else:
+                issue_links = self.get_issue_links(story_key)
+            split_task_keys = []
             logger.info(f"Checking {len(issue_links)} issue links for split relationships")
             
             for link in issue_links:
@@ -1431,10 +1847,13 @@ class JiraClient:
                             task_key = outward_issue['key']
                             if task_key not in task_keys_seen:
                                 logger.info(f"Found task {task_key} via split relationship")
-                                task_data = self.get_ticket(task_key)
-                                if task_data:
-                                    tasks.append(task_data)
-                                    task_keys_seen.add(task_key)
+                                split_task_keys.append(task_key)
+                                task_keys_seen.add(task_key)
+            
+            if split_task_keys:
+                for result in self.get_tickets(split_task_keys).values():
+                    if result["issue"]:
+                        tasks.append(result["issue"])
             
             logger.info(f"Total tasks found for story {story_key}: {len(tasks)}")
             return tasks
@@ -1511,6 +1930,8 @@ class JiraClient:
             }
             
             response = self.session.put(url, json=payload, timeout=30)
+            
+            self._invalidate_cached(ticket_key)
             response.raise_for_status()
             
             logger.info(f"✅ Successfully updated summary for ticket {ticket_key}")
@@ -1548,6 +1969,8 @@ class JiraClient:
             }
             
             response = self.session.put(url, json=payload, timeout=30)
+            
+            self._invalidate_cached(ticket_key)
             response.raise_for_status()
             
             logger.info(f"✅ Successfully updated parent for ticket {ticket_key} to {parent_key}")
@@ -1568,7 +1991,7 @@ class JiraClient:
             Issue type name in lowercase (e.g., 'story', 'task') or None if not found
         """
         try:
-            ticket_data = self.get_ticket(ticket_key)
+            ticket_data = self.get_ticket(ticket_key, profile='minimal')
             if not ticket_data:
                 logger.warning(f"Could not get ticket data for {ticket_key}")
                 return None
@@ -1583,6 +2006,23 @@ class JiraClient:
             logger.error(f"Error getting ticket type for {ticket_key}: {e}")
             return None
     
+    def _build_link_data(self, source_key: str, target_key: str, link_type: str, direction: str = "outward") -> Dict[str, Any]:
+        """Build the issueLink payload for create_issue_link_generic"""
+        # Set up link data based on direction
+        if direction.lower() == "outward":
+            # Source is inward, target is outward (normal direction)
+            return {
+                "type": {"name": link_type},
+                "inwardIssue": {"key": source_key},
+                "outwardIssue": {"key": target_key}
+            }
+        # inward: source is outward, target is inward (reverse direction)
+        return {
+            "type": {"name": link_type},
+            "inwardIssue": {"key": target_key},
+            "outwardIssue": {"key": source_key}
+        }
+    
     def create_issue_link_generic(self, source_key: str, target_key: str, link_type: str, direction: str = "outward") -> bool:
         """
         Create a generic link between two JIRA issues with direction control
@@ -1609,24 +2049,11 @@ class JiraClient:
         try:
             logger.debug(f"🔗 Creating generic link: {source_key} -> {target_key} ({link_type}, {direction})")
             
-            # Set up link data based on direction
-            if direction.lower() == "outward":
-                # Source is inward, target is outward (normal direction)
-                link_data = {
-                    "type": {"name": link_type},
-                    "inwardIssue": {"key": source_key},
-                    "outwardIssue": {"key": target_key}
-                }
-            else:  # inward
-                # Source is outward, target is inward (reverse direction)
-                link_data = {
-                    "type": {"name": link_type},
-                    "inwardIssue": {"key": target_key},
-                    "outwardIssue": {"key": source_key}
-                }
+            link_data = self._build_link_data(source_key, target_key, link_type, direction)
             
             url = urljoin(self.server_url, '/rest/api/3/issueLink')
             response = self.session.post(url, json=link_data, timeout=30)
+            self._invalidate_cached(source_key, target_key)
             
             if response.status_code == 201:
                 logger.info(f"✅ Successfully created link: {source_key} -> {target_key} ({link_type}, {direction})")
@@ -1973,6 +2400,46 @@ class JiraClient:
         
         return image_urls
     
+    def _resolve_image_url(self, image_url: str, confluence_server_url: Optional[str] = None) -> str:
+        """Turn a (possibly relative Confluence attachment) image URL into an absolute download URL"""
+        # If it's a relative Confluence URL, make it absolute
+        if image_url.startswith('/wiki/download/attachments/'):
+            if confluence_server_url:
+                # Ensure confluence_server_url has /wiki suffix if not present
+                base_url = confluence_server_url.rstrip('/')
+                if not base_url.endswith('/wiki'):
+                    # Try to add /wiki if it's missing
+                    if '/wiki' not in base_url:
+                        base_url = base_url + '/wiki'
+                full_url = urljoin(base_url, image_url)
+                logger.info(f"Converting relative Confluence URL using server URL: {confluence_server_url} -> {full_url}")
+            else:
+                # Try to infer from JIRA server URL (often same domain)
+                # Replace /rest/api with /wiki
+                base_url = self.server_url.replace('/rest/api', '').replace('/api', '')
+                if not base_url.endswith('/wiki'):
+                    base_url = base_url + '/wiki'
+                full_url = urljoin(base_url, image_url)
+                logger.warning(f"No Confluence server URL provided, inferring from JIRA URL: {base_url} -> {full_url}")
+        elif image_url.startswith('/download/attachments/'):
+            if confluence_server_url:
+                base_url = confluence_server_url.rstrip('/')
+                if not base_url.endswith('/wiki'):
+                    if '/wiki' not in base_url:
+                        base_url = base_url + '/wiki'
+                full_url = urljoin(base_url, image_url)
+                logger.info(f"Converting relative Confluence URL (no /wiki prefix): {full_url}")
+            else:
+                base_url = self.server_url.replace('/rest/api', '').replace('/api', '')
+                if not base_url.endswith('/wiki'):
+                    base_url = base_url + '/wiki'
+                full_url = urljoin(base_url, image_url)
+                logger.warning(f"No Confluence server URL provided, inferring: {full_url}")
+        else:
+            full_url = image_url
+            logger.info(f"Using absolute URL: {full_url}")
+        return full_url
+    
     def _download_image(self, image_url: str, confluence_server_url: Optional[str] = None) -> Optional[BytesIO]:
         """
         Download an image from a URL (supports Confluence attachments and external URLs)
@@ -1987,42 +2454,7 @@ class JiraClient:
         try:
             logger.info(f"Attempting to download image from: {image_url}")
             
-            # If it's a relative Confluence URL, make it absolute
-            if image_url.startswith('/wiki/download/attachments/'):
-                if confluence_server_url:
-                    # Ensure confluence_server_url has /wiki suffix if not present
-                    base_url = confluence_server_url.rstrip('/')
-                    if not base_url.endswith('/wiki'):
-                        # Try to add /wiki if it's missing
-                        if '/wiki' not in base_url:
-                            base_url = base_url + '/wiki'
-                    full_url = urljoin(base_url, image_url)
-                    logger.info(f"Converting relative Confluence URL using server URL: {confluence_server_url} -> {full_url}")
-                else:
-                    # Try to infer from JIRA server URL (often same domain)
-                    # Replace /rest/api with /wiki
-                    base_url = self.server_url.replace('/rest/api', '').replace('/api', '')
-                    if not base_url.endswith('/wiki'):
-                        base_url = base_url + '/wiki'
-                    full_url = urljoin(base_url, image_url)
-                    logger.warning(f"No Confluence server URL provided, inferring from JIRA URL: {base_url} -> {full_url}")
-            elif image_url.startswith('/download/attachments/'):
-                if confluence_server_url:
-                    base_url = confluence_server_url.rstrip('/')
-                    if not base_url.endswith('/wiki'):
-                        if '/wiki' not in base_url:
-                            base_url = base_url + '/wiki'
-                    full_url = urljoin(base_url, image_url)
-                    logger.info(f"Converting relative Confluence URL (no /wiki prefix): {full_url}")
-                else:
-                    base_url = self.server_url.replace('/rest/api', '').replace('/api', '')
-                    if not base_url.endswith('/wiki'):
-                        base_url = base_url + '/wiki'
-                    full_url = urljoin(base_url, image_url)
-                    logger.warning(f"No Confluence server URL provided, inferring: {full_url}")
-            else:
-                full_url = image_url
-                logger.info(f"Using absolute URL: {full_url}")
+            full_url = self._resolve_image_url(image_url, confluence_server_url)
             
             # Download the image
             logger.debug(f"Downloading image from: {full_url}")
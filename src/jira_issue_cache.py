@@ -0,0 +1,229 @@
+"""
+JIRA issue cache: read-through cache of issue payloads keyed by (issue key, field set).
+Lookups go to an in-process LRU first, then an optional shared Redis tier. Entries older than
+revalidate_after_seconds are checked against JIRA with a lightweight `updated`-only query and
+reused when the issue has not changed; JiraClient drops an issue's entries whenever it writes
+to that issue.
+"""
+import copy
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 2000
+DEFAULT_TTL_SECONDS = 3600  # 1 hour
+DEFAULT_REVALIDATE_AFTER_SECONDS = 30
+
+
+def fields_digest(fields: str) -> str:
+    """Short stable id of a comma-separated field list (order-insensitive)"""
+    normalized = ",".join(sorted({f.strip() for f in fields.split(",") if f.strip()}))
+    return hashlib.sha1(normalized.encode("utf-8")).hexdigest()[:12]
+
+
+class RedisIssueCacheBackend:
+    """Shared second tier: one Redis hash per issue (field set digest -> entry JSON)"""
+
+    KEY_PREFIX = "jira:issue:"
+
+    def __init__(self, host: str = "localhost", port: int = 6379, password: Optional[str] = None, db: int = 0):
+        import redis
+        self._redis = redis.Redis(host=host, port=port, password=password or None, db=db,
+                                  socket_timeout=2, socket_connect_timeout=2)
+
+    def get(self, issue_key: str, digest: str) -> Optional[str]:
+        value = self._redis.hget(self.KEY_PREFIX + issue_key, digest)
+        return value.decode("utf-8") if value is not None else None
+
+    def set(self, issue_key: str, digest: str, value: str, ttl_seconds: int) -> None:
+        pipe = self._redis.pipeline(transaction=False)
+        pipe.hset(self.KEY_PREFIX + issue_key, digest, value.encode("utf-8"))
+        pipe.expire(self.KEY_PREFIX + issue_key, ttl_seconds)
+        pipe.execute()
+
+    def delete(self, issue_keys: Iterable[str]) -> None:
+        keys = [self.KEY_PREFIX + k for k in issue_keys]
+        if keys:
+            self._redis.delete(*keys)
+
+    def clear(self) -> None:
+        for key in self._redis.scan_iter(match=self.KEY_PREFIX + "*"):
+            self._redis.delete(key)
+
+    def __repr__(self) -> str:
+        return "redis"
+
+
+class JiraIssueCache:
+    """
+    Two-tier issue cache: bounded in-process LRU with TTL, plus optional shared backend.
+
+    Entries are {"issue": payload, "updated": fields.updated, "checked_at": epoch seconds};
+    an entry is fresh (served without asking JIRA) until revalidate_after_seconds after
+    its last check.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, ttl_seconds: int = DEFAULT_TTL_SECONDS,
+                 revalidate_after_seconds: int = DEFAULT_REVALIDATE_AFTER_SECONDS,
+                 backend: Optional[Any] = None):
+        self.max_entries = max(1, max_entries)
+        self.ttl_seconds = ttl_seconds
+        self.revalidate_after_seconds = revalidate_after_seconds
+        self.backend = backend
+        self._entries: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "revalidated": 0, "misses": 0, "invalidations": 0, "errors": 0}
+
+    def get(self, issue_key: str, fields: str) -> Optional[Dict[str, Any]]:
+        """Cached entry for the issue and field set, or None"""
+        local_key = (issue_key.upper(), fields_digest(fields))
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(local_key)
+            if entry is not None:
+                if entry["stored_at"] + self.ttl_seconds >= now:
+                    self._entries.move_to_end(local_key)
+                    return entry
+                del self._entries[local_key]
+
+        if self.backend is not None:
+            try:
+                value = self.backend.get(local_key[0], local_key[1])
+            except Exception as e:
+                logger.warning(f"JIRA issue cache backend read failed: {e}")
+                value = None
+                self._count("errors")
+            if value is not None:
+                entry = json.loads(value)
+                self._store_local(local_key, entry)
+                return entry
+        return None
+
+    def is_fresh(self, entry: Dict[str, Any]) -> bool:
+        return entry["checked_at"] + self.revalidate_after_seconds >= time.time()
+
+    def put(self, issue_key: str, fields: str, issue: Dict[str, Any]) -> None:
+        """Store a freshly fetched issue in both tiers"""
+        now = time.time()
+        entry = {"issue": copy.deepcopy(issue), "updated": (issue.get("fields") or {}).get("updated"),
+                 "checked_at": now, "stored_at": now}
+        self._write(issue_key, fields, entry)
+
+    def mark_validated(self, issue_key: str, fields: str, entry: Dict[str, Any]) -> None:
+        """Record that JIRA confirmed the entry is current (restarts its freshness window)"""
+        entry = {**entry, "checked_at": time.time()}
+        self._write(issue_key, fields, entry)
+
+    def invalidate(self, *issue_keys: str) -> None:
+        """Drop every cached field set of the given issues (both tiers)"""
+        keys = {k.upper() for k in issue_keys if k}
+        if not keys:
+            return
+        with self._lock:
+            for local_key in [k for k in self._entries if k[0] in keys]:
+                del self._entries[local_key]
+            self._stats["invalidations"] += len(keys)
+        if self.backend is not None:
+            try:
+                self.backend.delete(keys)
+            except Exception as e:
+                logger.warning(f"JIRA issue cache backend delete failed: {e}")
+                self._count("errors")
+
+    def record(self, outcome: str, count: int = 1) -> None:
+        """Count a lookup outcome: hits, revalidated or misses"""
+        self._count(outcome, count)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+        if self.backend is not None:
+            try:
+                self.backend.clear()
+            except Exception as e:
+                logger.warning(f"JIRA issue cache backend clear failed: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/revalidation/miss counters and sizing, for health/metrics endpoints"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["size"] = len(self._entries)
+        lookups = stats["hits"] + stats["revalidated"] + stats["misses"]
+        stats["hit_rate"] = round((stats["hits"] + stats["revalidated"]) / lookups, 4) if lookups else 0.0
+        stats["max_entries"] = self.max_entries
+        stats["ttl_seconds"] = self.ttl_seconds
+        stats["revalidate_after_seconds"] = self.revalidate_after_seconds
+        stats["backend"] = repr(self.backend) if self.backend is not None else "memory"
+        return stats
+
+    def _write(self, issue_key: str, fields: str, entry: Dict[str, Any]) -> None:
+        local_key = (issue_key.upper(), fields_digest(fields))
+        self._store_local(local_key, entry)
+        if self.backend is not None:
+            try:
+                self.backend.set(local_key[0], local_key[1], json.dumps(entry), self.ttl_seconds)
+            except Exception as e:
+                logger.warning(f"JIRA issue cache backend write failed: {e}")
+                self._count("errors")
+
+    def _store_local(self, local_key: tuple, entry: Dict[str, Any]) -> None:
+        with self._lock:
+            self._entries[local_key] = entry
+            self._entries.move_to_end(local_key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _count(self, name: str, count: int = 1) -> None:
+        with self._lock:
+            self._stats[name] += count
+
+
+_jira_issue_cache: Optional[JiraIssueCache] = None
+
+
+def configure_jira_issue_cache(cache_config: Dict[str, Any],
+                               redis_config: Optional[Dict[str, Any]] = None) -> Optional[JiraIssueCache]:
+    """
+    Create the process-wide cache from the `jira_cache:` config section (see Config.get_jira_cache_config).
+    Returns None (caching disabled) when enabled is false.
+    """
+    global _jira_issue_cache
+    if not cache_config.get("enabled"):
+        _jira_issue_cache = None
+        logger.info("JIRA issue cache disabled")
+        return None
+
+    backend = None
+    backend_name = cache_config.get("backend", "memory")
+    if backend_name == "redis":
+        redis_config = redis_config or {}
+        try:
+            backend = RedisIssueCacheBackend(
+                host=redis_config.get("host", "localhost"),
+                port=int(redis_config.get("port", 6379)),
+                password=redis_config.get("password"),
+                db=int(redis_config.get("database", 0)),
+            )
+        except Exception as e:
+            logger.warning(f"JIRA issue cache backend '{backend_name}' unavailable, using in-process cache only: {e}")
+
+    _jira_issue_cache = JiraIssueCache(
+        max_entries=int(cache_config.get("max_entries", DEFAULT_MAX_ENTRIES)),
+        ttl_seconds=int(cache_config.get("ttl_seconds", DEFAULT_TTL_SECONDS)),
+        revalidate_after_seconds=int(cache_config.get("revalidate_after_seconds", DEFAULT_REVALIDATE_AFTER_SECONDS)),
+        backend=backend,
+    )
+    logger.info(f"JIRA issue cache enabled: backend={backend_name}, max_entries={_jira_issue_cache.max_entries}, "
+                f"revalidate_after={_jira_issue_cache.revalidate_after_seconds}s")
+    return _jira_issue_cache
+
+
+def get_jira_issue_cache() -> Optional[JiraIssueCache]:
+    """Process-wide JIRA issue cache, or None when not configured/disabled"""
+    return _jira_issue_cache
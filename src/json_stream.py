@@ -0,0 +1,107 @@
+"""
+Incremental parsing of a streamed JSON array.
+
+LLM task generation returns a JSON array of task objects. Feeding the stream through
+IncrementalJSONArrayParser yields each element as soon as its closing brace arrives, so
+callers can materialise finished items before the completion ends and keep them if the
+response is later truncated.
+"""
+import json
+import logging
+from typing import Any, List
+
+logger = logging.getLogger(__name__)
+
+
+class IncrementalJSONArrayParser:
+    """
+    Feed text chunks; get back the array elements completed by each chunk.
+
+    Leading prose or markdown fences before the first '[' are skipped. Elements are the
+    direct children of that array; an element that fails to decode is logged and skipped.
+    """
+
+    def __init__(self):
+        self._buffer = ""
+        self._pos = 0              # next character to scan
+        self._started = False      # seen the opening '['
+        self._finished = False     # seen the matching ']'
+        self._depth = 0            # nesting depth relative to the array (1 = inside it)
+        self._in_string = False
+        self._escape = False
+        self._element_start = None
+        self.elements: List[Any] = []
+
+    @property
+    def finished(self) -> bool:
+        """True once the closing ']' of the array has been parsed"""
+        return self._finished
+
+    def feed(self, chunk: str) -> List[Any]:
+        """Consume a chunk and return the elements it completed (in order)"""
+        if self._finished or not chunk:
+            return []
+        self._buffer += chunk
+        completed = []
+        buffer = self._buffer
+        i = self._pos
+        while i < len(buffer):
+            ch = buffer[i]
+            if not self._started:
+                if ch == '[':
+                    self._started = True
+                    self._depth = 1
+                i += 1
+                continue
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == '\\':
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                i += 1
+                continue
+
+            if self._depth == 1 and self._element_start is None and ch not in ' \t\r\n,]':
+                self._element_start = i
+
+            if ch == '"':
+                self._in_string = True
+            elif ch in '[{':
+                self._depth += 1
+            elif ch in ']}':
+                self._depth -= 1
+                if self._depth == 1 and self._element_start is not None:
+                    self._emit(buffer[self._element_start:i + 1], completed)
+                elif self._depth == 0:
+                    if self._element_start is not None:  # trailing scalar element
+                        self._emit(buffer[self._element_start:i], completed)
+                    self._finished = True
+                    i += 1
+                    break
+            elif ch == ',' and self._depth == 1 and self._element_start is not None:
+                self._emit(buffer[self._element_start:i], completed)
+            i += 1
+
+        # Drop consumed text so long streams don't rescan from the start
+        keep_from = self._element_start if self._element_start is not None else i
+        self._buffer = buffer[keep_from:]
+        self._pos = i - keep_from
+        if self._element_start is not None:
+            self._element_start = 0
+        return completed
+
+    def _emit(self, text: str, completed: List[Any]) -> None:
+        self._element_start = None
+        text = text.strip()
+        if not text:
+            return
+        try:
+            element = json.loads(text)
+        except json.JSONDecodeError as e:
+            logger.warning(f"Skipping undecodable streamed JSON element: {e}")
+            return
+        self.elements.append(element)
+        completed.append(element)
@@ -0,0 +1,243 @@
+"""
+LLM response cache: content-addressed by (provider, model, temperature, system prompt,
+prompt, max_tokens, response format). Lookups go to an in-process LRU first, then an
+optional shared backend (Redis or on-disk) so retried jobs and resubmitted prompts do
+not pay for an identical provider call twice.
+"""
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 1000
+DEFAULT_TTL_SECONDS = 86400  # 1 day
+
+
+def make_cache_key(provider: str, model: str, temperature: Optional[float], system_prompt: Optional[str],
+                   prompt: str, max_tokens: Optional[int], response_format: str = "text") -> str:
+    """Stable sha256 key over everything that can change the provider's answer"""
+    payload = json.dumps(
+        [provider, model, temperature, system_prompt or "", prompt, max_tokens, response_format],
+        ensure_ascii=False, separators=(",", ":"), default=str
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class RedisCacheBackend:
+    """Shared second tier in Redis (sync client; LLM calls run on worker threads)"""
+
+    KEY_PREFIX = "llm:cache:"
+
+    def __init__(self, host: str = "localhost", port: int = 6379, password: Optional[str] = None, db: int = 0):
+        import redis
+        self._redis = redis.Redis(host=host, port=port, password=password or None, db=db,
+                                  socket_timeout=2, socket_connect_timeout=2)
+
+    def get(self, key: str) -> Optional[str]:
+        value = self._redis.get(self.KEY_PREFIX + key)
+        return value.decode("utf-8") if value is not None else None
+
+    def set(self, key: str, value: str, ttl_seconds: int) -> None:
+        self._redis.set(self.KEY_PREFIX + key, value.encode("utf-8"), ex=ttl_seconds)
+
+    def clear(self) -> None:
+        for key in self._redis.scan_iter(match=self.KEY_PREFIX + "*"):
+            self._redis.delete(key)
+
+    def __repr__(self) -> str:
+        return "redis"
+
+
+class DiskCacheBackend:
+    """Second tier as one JSON file per entry; oldest files are pruned past max_entries"""
+
+    def __init__(self, path: str, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.path = path
+        self.max_entries = max_entries
+        os.makedirs(path, exist_ok=True)
+
+    def _file(self, key: str) -> str:
+        return os.path.join(self.path, f"{key}.json")
+
+    def get(self, key: str) -> Optional[str]:
+        try:
+            with open(self._file(key), "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return None
+        if entry.get("expires_at", 0) < time.time():
+            self._remove(key)
+            return None
+        return entry.get("value")
+
+    def set(self, key: str, value: str, ttl_seconds: int) -> None:
+        tmp = self._file(key) + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"expires_at": time.time() + ttl_seconds, "value": value}, f)
+        os.replace(tmp, self._file(key))
+        self._prune()
+
+    def clear(self) -> None:
+        for name in os.listdir(self.path):
+            if name.endswith(".json"):
+                self._remove(name[:-5])
+
+    def _remove(self, key: str) -> None:
+        try:
+            os.remove(self._file(key))
+        except FileNotFoundError:
+            pass
+
+    def _prune(self) -> None:
+        entries = [os.path.join(self.path, n) for n in os.listdir(self.path) if n.endswith(".json")]
+        if len(entries) <= self.max_entries:
+            return
+        entries.sort(key=os.path.getmtime)
+        for file_path in entries[:len(entries) - self.max_entries]:
+            try:
+                os.remove(file_path)
+            except FileNotFoundError:
+                pass
+
+    def __repr__(self) -> str:
+        return "disk"
+
+
+class LLMResponseCache:
+    """Two-tier response cache: bounded in-process LRU with TTL, plus optional shared backend"""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, ttl_seconds: int = DEFAULT_TTL_SECONDS,
+                 backend: Optional[Any] = None):
+        self.max_entries = max(1, max_entries)
+        self.ttl_seconds = ttl_seconds
+        self.backend = backend
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "memory_hits": 0, "backend_hits": 0, "stores": 0, "errors": 0}
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for key, or None (counts a hit or miss)"""
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at >= now:
+                    self._entries.move_to_end(key)
+                    self._stats["hits"] += 1
+                    self._stats["memory_hits"] += 1
+                    return value
+                del self._entries[key]
+
+        if self.backend is not None:
+            try:
+                value = self.backend.get(key)
+            except Exception as e:
+                logger.warning(f"LLM cache backend read failed: {e}")
+                value = None
+                with self._lock:
+                    self._stats["errors"] += 1
+            if value is not None:
+                self._store_local(key, value)
+                with self._lock:
+                    self._stats["hits"] += 1
+                    self._stats["backend_hits"] += 1
+                return value
+
+        with self._lock:
+            self._stats["misses"] += 1
+        return None
+
+    def set(self, key: str, value: str) -> None:
+        """Store a response in both tiers"""
+        self._store_local(key, value)
+        with self._lock:
+            self._stats["stores"] += 1
+        if self.backend is not None:
+            try:
+                self.backend.set(key, value, self.ttl_seconds)
+            except Exception as e:
+                logger.warning(f"LLM cache backend write failed: {e}")
+                with self._lock:
+                    self._stats["errors"] += 1
+
+    def _store_local(self, key: str, value: str) -> None:
+        with self._lock:
+            self._entries[key] = (time.time() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached responses (both tiers)"""
+        with self._lock:
+            self._entries.clear()
+        if self.backend is not None:
+            try:
+                self.backend.clear()
+            except Exception as e:
+                logger.warning(f"LLM cache backend clear failed: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and sizing, for health/metrics endpoints"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["size"] = len(self._entries)
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = round(stats["hits"] / lookups, 4) if lookups else 0.0
+        stats["max_entries"] = self.max_entries
+        stats["ttl_seconds"] = self.ttl_seconds
+        stats["backend"] = repr(self.backend) if self.backend is not None else "memory"
+        return stats
+
+
+_llm_cache: Optional[LLMResponseCache] = None
+
+
+def configure_llm_cache(cache_config: Dict[str, Any], redis_config: Optional[Dict[str, Any]] = None) -> Optional[LLMResponseCache]:
+    """
+    Create the process-wide cache from the `llm_cache:` config section (see Config.get_llm_cache_config).
+    Returns None (caching disabled) when enabled is false.
+    """
+    global _llm_cache
+    if not cache_config.get("enabled"):
+        _llm_cache = None
+        logger.info("LLM response cache disabled")
+        return None
+
+    max_entries = int(cache_config.get("max_entries", DEFAULT_MAX_ENTRIES))
+    backend = None
+    backend_name = cache_config.get("backend", "memory")
+    try:
+        if backend_name == "redis":
+            redis_config = redis_config or {}
+            backend = RedisCacheBackend(
+                host=redis_config.get("host", "localhost"),
+                port=int(redis_config.get("port", 6379)),
+                password=redis_config.get("password"),
+                db=int(redis_config.get("database", 0)),
+            )
+        elif backend_name == "disk":
+            backend = DiskCacheBackend(cache_config.get("disk_path", "data/llm_cache"), max_entries=max_entries)
+    except Exception as e:
+        logger.warning(f"LLM cache backend '{backend_name}' unavailable, using in-process cache only: {e}")
+        backend = None
+
+    _llm_cache = LLMResponseCache(
+        max_entries=max_entries,
+        ttl_seconds=int(cache_config.get("ttl_seconds", DEFAULT_TTL_SECONDS)),
+        backend=backend,
+    )
+    logger.info(f"LLM response cache enabled: backend={backend_name}, max_entries={max_entries}, ttl={_llm_cache.ttl_seconds}s")
+    return _llm_cache
+
+
+def get_llm_cache() -> Optional[LLMResponseCache]:
+    """Process-wide LLM response cache, or None when not configured/disabled"""
+    return _llm_cache
@@ -1,16 +1,48 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List, Dict, Any
+from contextvars import ContextVar
+from typing import Optional, List, Dict, Any, Iterator
+import copy
 import logging
 import json
 
 from .prompts import Prompts
+from .llm_cache import get_llm_cache, make_cache_key
+from .llm_rate_limiter import get_llm_rate_limiter
+from .token_counter import get_token_counter
+from .prompt_cache import record_prompt_cache_usage
+from .metrics import track_llm
 
 logger = logging.getLogger(__name__)
 
 
+# Finish reasons meaning the completion stopped at the token limit (OpenAI/KIMI, Claude, Gemini)
+TRUNCATED_FINISH_REASONS = {"length", "max_tokens"}
+
+# Set by a provider call in this context whose completion was cut off; LLMClient checks it
+# so truncated completions are not stored in the response cache
+_response_truncated: ContextVar[bool] = ContextVar("llm_response_truncated", default=False)
+
+
+def _note_finish_reason(finish_reason: Any) -> None:
+    """Record a truncated completion (finish_reason may be a string or a Gemini enum)"""
+    name = getattr(finish_reason, "name", finish_reason)
+    if isinstance(name, str) and name.lower() in TRUNCATED_FINISH_REASONS:
+        _response_truncated.set(True)
+
+
+def _gemini_finish_reason(response: Any) -> Any:
+    candidates = getattr(response, "candidates", None)
+    return getattr(candidates[0], "finish_reason", None) if candidates else None
+
+
 class LLMProvider(ABC):
     """Abstract base class for LLM providers"""
     
+    provider_name = "llm"
+    # True when generate_*/stream_description accept cacheable_prefix and mark it for
+    # provider-side caching; otherwise LLMClient sends the prefix first in the prompt
+    supports_cache_control = False
+    
     def __init__(self, api_key: str, model: str, system_prompt: str, temperature: float = 0.7, max_tokens: Optional[int] = None):
         self.api_key = api_key
         self.model = model
@@ -19,27 +51,36 @@ class LLMProvider(ABC):
         self.config_max_tokens = max_tokens  # Global max_tokens from config (None = use provider defaults)
     
     @abstractmethod
-    def generate_description(self, prompt: str, max_tokens: Optional[int] = None) -> str:
-        """Generate description using the LLM provider"""
+    def generate_description(self, prompt: str, max_tokens: Optional[int] = None, system_prompt: Optional[str] = None) -> str:
+        """Generate description using the LLM provider (system_prompt overrides the default for this call only)"""
         pass
     
-    def generate_json(self, prompt: str, max_tokens: Optional[int] = None) -> str:
+    def generate_json(self, prompt: str, max_tokens: Optional[int] = None, system_prompt: Optional[str] = None) -> str:
         """
         Generate JSON response with enforced JSON mode (provider-specific implementation)
         
         Args:
             prompt: The prompt to send to the LLM (should include JSON format instructions)
             max_tokens: Maximum tokens to generate
+            system_prompt: Per-request system prompt (None = provider default)
             
         Returns:
             JSON string (guaranteed valid JSON, not wrapped in markdown)
         """
+        system_prompt = system_prompt or self.system_prompt
         # Default implementation: fallback to regular generation with JSON extraction
         # Subclasses should override this for provider-specific JSON enforcement
-        response = self.generate_description(prompt)
+        response = self.generate_description(prompt, system_prompt=system_prompt)
         # Extract JSON from response if needed
         return self._extract_json_from_response(response)
     
+    def stream_description(self, prompt: str, max_tokens: Optional[int] = None, system_prompt: Optional[str] = None) -> Iterator[str]:
+        """
+        Stream the completion as text chunks. Default implementation yields the blocking
+        result as a single chunk; providers with native streaming override this.
+        """
+        yield self.generate_description(prompt, max_tokens=max_tokens, system_prompt=system_prompt)
+    
     def _extract_json_from_response(self, response: str) -> str:
         """Extract JSON from response, handling markdown code blocks"""
         response = response.strip()
@@ -80,12 +121,32 @@ class LLMProvider(ABC):
         
         return response
     
+    def with_overrides(self, system_prompt: Optional[str] = None, temperature: Optional[float] = None,
+                       max_tokens: Optional[int] = None) -> "LLMProvider":
+        """
+        Shallow copy with different generation settings that shares this provider's SDK client
+        (connection pool, TLS sessions). Used by the provider registry to serve per-request
+        settings without rebuilding the transport.
+        """
+        clone = copy.copy(self)
+        if system_prompt is not None:
+            clone.system_prompt = system_prompt
+        if temperature is not None:
+            clone.temperature = temperature
+        clone.config_max_tokens = max_tokens
+        clone._apply_settings()
+        return clone
+    
+    def _apply_settings(self) -> None:
+        """Recompute values derived from temperature/max_tokens (hook for with_overrides)"""
+        pass
+    
     def get_system_prompt(self) -> str:
         """Get the current system prompt"""
         return self.system_prompt
     
     def set_system_prompt(self, system_prompt: str) -> None:
-        """Set a new system prompt (for temporary overrides)"""
+        """Set the default system prompt (pass system_prompt per call for one-off overrides)"""
         self.system_prompt = system_prompt
     
     def _build_prompt(self, ticket_info: str, prd_content: str = None, 
@@ -128,6 +189,8 @@ class LLMProvider(ABC):
 class OpenAIProvider(LLMProvider):
     """OpenAI GPT provider"""
     
+    provider_name = "openai"
+    
     def __init__(self, api_key: str, model: str, system_prompt: str, temperature: float = 0.7, max_tokens: Optional[int] = None):
         # GPT-5 variants only support temperature=1.0, override if needed
         if OpenAIProvider._is_gpt5_variant(model):
@@ -142,6 +205,10 @@ class OpenAIProvider(LLMProvider):
         except ImportError:
             raise ImportError("openai package is required for OpenAI provider")
     
+    def _apply_settings(self) -> None:
+        if OpenAIProvider._is_gpt5_variant(self.model):
+            self.temperature = 1.0
+    
     @staticmethod
     def _is_gpt5_variant(model: str) -> bool:
         """Check if model is a GPT-5 variant that requires temperature=1.0"""
@@ -154,13 +221,14 @@ class OpenAIProvider(LLMProvider):
             return 1.0
         return self.temperature
     
-    def generate_description(self, prompt: str, max_tokens: Optional[int] = None) -> str:
+    def generate_description(self, prompt: str, max_tokens: Optional[int] = None, system_prompt: Optional[str] = None) -> str:
+        system_prompt = system_prompt or self.system_prompt
         try:
             # Log the prompts being sent to OpenAI
             logger.info("=" * 80)
             logger.info("🤖 OPENAI PROMPT DEBUG")
             logger.info("=" * 80)
-            logger.info(f"📋 SYSTEM PROMPT:\n{self.system_prompt}")
+            logger.info(f"📋 SYSTEM PROMPT:\n{system_prompt}")
             logger.info("-" * 80)
             logger.info(f"👤 USER PROMPT:\n{prompt}")
             logger.info("=" * 80)
@@ -192,15 +260,17 @@ class OpenAIProvider(LLMProvider):
             response = self.client.chat.completions.create(
                 model=self.model,
                 messages=[
-                    {"role": "system", "content": self.system_prompt},
+                    {"role": "system", "content": system_prompt},
                     {"role": "user", "content": prompt}
                 ],
                 max_completion_tokens=max_completion_tokens,
                 temperature=effective_temp
             )
             
+            record_prompt_cache_usage(self.provider_name, self.model, getattr(response, 'usage', None))
             result = response.choices[0].message.content
             finish_reason = response.choices[0].finish_reason
+            _note_finish_reason(finish_reason)
             
             # Check if response was truncated or empty
             if finish_reason == 'length':
@@ -234,13 +304,14 @@ class OpenAIProvider(LLMProvider):
             raise
             raise
     
-    def generate_json(self, prompt: str, max_tokens: Optional[int] = None) -> str:
+    def generate_json(self, prompt: str, max_tokens: Optional[int] = None, system_prompt: Optional[str] = None) -> str:
         """
         Generate JSON response with OpenAI's JSON mode enforcement
         
         Note: OpenAI's JSON mode only supports JSON objects, not arrays.
         If the prompt requests an array, we'll wrap it in an object or use extraction.
         """
+        system_prompt = system_prompt or self.system_prompt
         try:
             # Check if prompt requests an array
             requests_array = "array" in prompt.lower() or "[\n" in prompt or '"[' in prompt
@@ -276,7 +347,7 @@ class OpenAIProvider(LLMProvider):
                 # OpenAI JSON mode requires objects, not arrays
                 # For arrays, we'll use regular generation with extraction
                 logger.info("Prompt requests array - using regular generation with JSON extraction")
-                response_text = self.generate_description(json_prompt)
+                response_text = self.generate_description(json_prompt, system_prompt=system_prompt)
                 return self._extract_json_from_response(response_text)
             
             # GPT-5 variants require temperature=1.0
@@ -286,7 +357,7 @@ class OpenAIProvider(LLMProvider):
             response = self.client.chat.completions.create(
                 model=self.model,
                 messages=[
-                    {"role": "system", "content": self.system_prompt},
+                    {"role": "system", "content": system_prompt},
                     {"role": "user", "content": json_prompt}
                 ],
                 response_format={"type": "json_object"},
@@ -294,8 +365,10 @@ class OpenAIProvider(LLMProvider):
                 temperature=effective_temp
             )
             
+            record_prompt_cache_usage(self.provider_name, self.model, getattr(response, 'usage', None))
             result = response.choices[0].message.content
             finish_reason = response.choices[0].finish_reason
+            _note_finish_reason(finish_reason)
             
             # Check if response was truncated or empty
             if finish_reason == 'length':
@@ -320,12 +393,47 @@ class OpenAIProvider(LLMProvider):
             logger.error(f"OpenAI JSON generation error: {e}")
             # Fallback to regular generation
             logger.warning("Falling back to regular generation mode")
-            return self._extract_json_from_response(self.generate_description(prompt))
+            return self._extract_json_from_response(self.generate_description(prompt, system_prompt=system_prompt))
+
+    def stream_description(self, prompt: str, max_tokens: Optional[int] = None, system_prompt: Optional[str] = None) -> Iterator[str]:
+        """Stream completion text chunks (same token limits as generate_description)"""
+        system_prompt = system_prompt or self.system_prompt
+        if max_tokens is not None:
+            max_completion_tokens = max_tokens
+        elif self.config_max_tokens is not None:
+            max_completion_tokens = self.config_max_tokens
+            if OpenAIProvider._is_gpt5_variant(self.model) and max_completion_tokens < 16000:
+                max_completion_tokens = 16000
+        else:
+            max_completion_tokens = 16000 if OpenAIProvider._is_gpt5_variant(self.model) else 2000
+        
+        stream = self.client.chat.completions.create(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": prompt}
+            ],
+            max_completion_tokens=max_completion_tokens,
+            temperature=self._get_effective_temperature(),
+            stream=True,
+            stream_options={"include_usage": True}
+        )
+        for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+            if chunk.choices and chunk.choices[0].finish_reason == 'length':
+                logger.warning("⚠️ OpenAI stream was truncated (finish_reason=length)")
+                _note_finish_reason('length')
+            if not chunk.choices:
+                record_prompt_cache_usage(self.provider_name, self.model, getattr(chunk, 'usage', None))
 
 
 class ClaudeProvider(LLMProvider):
     """Anthropic Claude provider"""
     
+    provider_name = "claude"
+    supports_cache_control = True
+    
     def __init__(self, api_key: str, model: str, system_prompt: str, temperature: float = 0.7, max_tokens: Optional[int] = None):
         super().__init__(api_key, model, system_prompt, temperature, max_tokens=max_tokens)
         # Default max_tokens for Claude (8000) unless overridden by config
@@ -337,7 +445,30 @@ class ClaudeProvider(LLMProvider):
         except ImportError:
             raise ImportError("anthropic package is required for Claude provider")
     
-    def generate_description(self, prompt: str, max_tokens: Optional[int] = None) -> str:
+    def _apply_settings(self) -> None:
+        self.default_max_tokens = self.config_max_tokens if self.config_max_tokens is not None else 8000
+    
+    @staticmethod
+    def _message_params(prompt: str, system_prompt: str, cacheable_prefix: Optional[str]) -> Dict[str, Any]:
+        """
+        system/messages for the Messages API. With a cacheable_prefix the system prompt and
+        the prefix become separate blocks carrying ephemeral cache_control breakpoints, so
+        later calls sharing them read the prefix from Anthropic's prompt cache.
+        """
+        if not cacheable_prefix:
+            return {"system": system_prompt, "messages": [{"role": "user", "content": prompt}]}
+        cache_control = {"type": "ephemeral"}
+        return {
+            "system": [{"type": "text", "text": system_prompt, "cache_control": cache_control}] if system_prompt else system_prompt,
+            "messages": [{"role": "user", "content": [
+                {"type": "text", "text": cacheable_prefix, "cache_control": cache_control},
+                {"type": "text", "text": prompt},
+            ]}],
+        }
+    
+    def generate_description(self, prompt: str, max_tokens: Optional[int] = None, system_prompt: Optional[str] = None,
+                             cacheable_prefix: Optional[str] = None) -> str:
+        system_prompt = system_prompt or self.system_prompt
         try:
             # Use provided max_tokens, config max_tokens, or default
             tokens_to_use = max_tokens if max_tokens is not None else self.default_max_tokens
@@ -348,17 +479,16 @@ class ClaudeProvider(LLMProvider):
                 model=self.model,
                 max_tokens=tokens_to_use,
                 temperature=self.temperature,
-                system=self.system_prompt,
-                messages=[
-                    {"role": "user", "content": prompt}
-                ]
+                **self._message_params(prompt, system_prompt, cacheable_prefix)
             )
             
             # Check if response was truncated
             stop_reason = response.stop_reason
+            _note_finish_reason(stop_reason)
             if stop_reason == "max_tokens":
                 logger.warning(f"Claude response was truncated due to max_tokens limit ({tokens_to_use})")
             
+            record_prompt_cache_usage(self.provider_name, self.model, getattr(response, 'usage', None))
             result = response.content[0].text
             logger.info(f"Claude response length: {len(result)} characters, stop_reason: {stop_reason}")
             
@@ -367,7 +497,8 @@ class ClaudeProvider(LLMProvider):
             logger.error(f"Claude API error: {e}")
             raise
     
-    def generate_json(self, prompt: str, max_tokens: Optional[int] = None) -> str:
+    def generate_json(self, prompt: str, max_tokens: Optional[int] = None, system_prompt: Optional[str] = None,
+                      cacheable_prefix: Optional[str] = None) -> str:
         """
         Generate JSON response with Claude using prompt-based JSON generation
         
@@ -375,6 +506,7 @@ class ClaudeProvider(LLMProvider):
         Instead, we use prompt-based JSON generation with extraction, which works reliably
         across all Claude models.
         """
+        system_prompt = system_prompt or self.system_prompt
         try:
             # Use provided max_tokens, config max_tokens, or default
             tokens_to_use = max_tokens if max_tokens is not None else self.default_max_tokens
@@ -389,7 +521,8 @@ class ClaudeProvider(LLMProvider):
             
             # Claude uses prompt-based JSON generation with extraction
             logger.info("Using Claude regular generation with JSON extraction")
-            response_text = self.generate_description(json_prompt, max_tokens=tokens_to_use)
+            response_text = self.generate_description(json_prompt, max_tokens=tokens_to_use, system_prompt=system_prompt,
+                                                      cacheable_prefix=cacheable_prefix)
             
             # Extract JSON from response (prefers objects over arrays)
             extracted_json = self._extract_json_from_response(response_text)
@@ -420,10 +553,32 @@ class ClaudeProvider(LLMProvider):
             # Re-raise to let caller handle
             raise
 
+    def stream_description(self, prompt: str, max_tokens: Optional[int] = None, system_prompt: Optional[str] = None,
+                           cacheable_prefix: Optional[str] = None) -> Iterator[str]:
+        """Stream completion text chunks via the Messages streaming API"""
+        system_prompt = system_prompt or self.system_prompt
+        tokens_to_use = max_tokens if max_tokens is not None else self.default_max_tokens
+        with self.client.messages.stream(
+            model=self.model,
+            max_tokens=tokens_to_use,
+            temperature=self.temperature,
+            **self._message_params(prompt, system_prompt, cacheable_prefix)
+        ) as stream:
+            for text in stream.text_stream:
+                yield text
+            try:
+                final_message = stream.get_final_message()
+                _note_finish_reason(final_message.stop_reason)
+                record_prompt_cache_usage(self.provider_name, self.model, final_message.usage)
+            except Exception as e:
+                logger.debug(f"Claude stream usage unavailable: {e}")
+
 
 class GeminiProvider(LLMProvider):
     """Google Gemini provider"""
     
+    provider_name = "gemini"
+    
     def __init__(self, api_key: str, model: str, system_prompt: str, temperature: float = 0.7, max_tokens: Optional[int] = None):
         super().__init__(api_key, model, system_prompt, temperature, max_tokens=max_tokens)
         # Default max_output_tokens for Gemini (8192) unless overridden by config
@@ -442,10 +597,15 @@ class GeminiProvider(LLMProvider):
         except ImportError:
             raise ImportError("google-generativeai package is required for Gemini provider")
     
-    def generate_description(self, prompt: str, max_tokens: Optional[int] = None) -> str:
+    def _apply_settings(self) -> None:
+        # Per-call GenerationConfig carries temperature; client-level config is only the fallback
+        self.default_max_output_tokens = self.config_max_tokens if self.config_max_tokens is not None else 8192
+    
+    def generate_description(self, prompt: str, max_tokens: Optional[int] = None, system_prompt: Optional[str] = None) -> str:
+        system_prompt = system_prompt or self.system_prompt
         try:
             # Combine system prompt with user prompt for Gemini
-            full_prompt = f"{self.system_prompt}\n\n{prompt}"
+            full_prompt = f"{system_prompt}\n\n{prompt}"
             # Use provided max_tokens, config max_tokens, or default
             tokens_to_use = max_tokens if max_tokens is not None else self.default_max_output_tokens
             
@@ -459,17 +619,20 @@ class GeminiProvider(LLMProvider):
             )
             
             response = self.client.generate_content(full_prompt, generation_config=generation_config)
+            _note_finish_reason(_gemini_finish_reason(response))
+            record_prompt_cache_usage(self.provider_name, self.model, getattr(response, 'usage_metadata', None))
             return response.text
         except Exception as e:
             logger.error(f"Gemini API error: {e}")
             raise
     
-    def generate_json(self, prompt: str, max_tokens: Optional[int] = None) -> str:
+    def generate_json(self, prompt: str, max_tokens: Optional[int] = None, system_prompt: Optional[str] = None) -> str:
         """
         Generate JSON response with Gemini's JSON mode enforcement
         
         Gemini supports response_mime_type="application/json" for strict JSON output.
         """
+        system_prompt = system_prompt or self.system_prompt
         try:
             import google.generativeai as genai
             
@@ -477,7 +640,7 @@ class GeminiProvider(LLMProvider):
             
             # Combine system prompt with user prompt
             json_instruction = Prompts.get_json_response_instruction()
-            full_prompt = f"{self.system_prompt}\n\n{prompt}\n\n{json_instruction}"
+            full_prompt = f"{system_prompt}\n\n{prompt}\n\n{json_instruction}"
             
             # Use provided max_tokens, config max_tokens, or default
             tokens_to_use = max_tokens if max_tokens is not None else self.default_max_output_tokens
@@ -496,6 +659,8 @@ class GeminiProvider(LLMProvider):
             json_model = genai.GenerativeModel(self.model, generation_config=json_generation_config)
             
             response = json_model.generate_content(full_prompt)
+            _note_finish_reason(_gemini_finish_reason(response))
+            record_prompt_cache_usage(self.provider_name, self.model, getattr(response, 'usage_metadata', None))
             result = response.text
             
             logger.info(f"Gemini JSON response length: {len(result) if result else 0} characters")
@@ -515,12 +680,29 @@ class GeminiProvider(LLMProvider):
             logger.error(f"Gemini JSON generation error: {e}")
             # Fallback to regular generation
             logger.warning("Falling back to regular generation mode")
-            return self._extract_json_from_response(self.generate_description(prompt))
+            return self._extract_json_from_response(self.generate_description(prompt, system_prompt=system_prompt))
+
+    def stream_description(self, prompt: str, max_tokens: Optional[int] = None, system_prompt: Optional[str] = None) -> Iterator[str]:
+        """Stream completion text chunks (generate_content with stream=True)"""
+        system_prompt = system_prompt or self.system_prompt
+        import google.generativeai as genai
+        generation_config = genai.types.GenerationConfig(
+            temperature=self.temperature,
+            max_output_tokens=max_tokens if max_tokens is not None else self.default_max_output_tokens
+        )
+        response = self.client.generate_content(f"{system_prompt}\n\n{prompt}", generation_config=generation_config, stream=True)
+        for chunk in response:
+            text = getattr(chunk, 'text', None)
+            if text:
+                yield text
+            _note_finish_reason(_gemini_finish_reason(chunk))
 
 
 class KimiProvider(LLMProvider):
     """Moonshot AI KIMI provider (OpenAI-compatible API)"""
     
+    provider_name = "kimi"
+    
     def __init__(self, api_key: str, model: str, system_prompt: str, temperature: float = 0.7, max_tokens: Optional[int] = None):
         super().__init__(api_key, model, system_prompt, temperature, max_tokens=max_tokens)
         try:
@@ -530,13 +712,14 @@ class KimiProvider(LLMProvider):
         except ImportError:
             raise ImportError("openai package is required for KIMI provider")
     
-    def generate_description(self, prompt: str, max_tokens: Optional[int] = None) -> str:
+    def generate_description(self, prompt: str, max_tokens: Optional[int] = None, system_prompt: Optional[str] = None) -> str:
+        system_prompt = system_prompt or self.system_prompt
         try:
             # Log the prompts being sent to KIMI
             logger.info("=" * 80)
             logger.info("🤖 KIMI PROMPT DEBUG")
             logger.info("=" * 80)
-            logger.info(f"📋 SYSTEM PROMPT:\n{self.system_prompt}")
+            logger.info(f"📋 SYSTEM PROMPT:\n{system_prompt}")
             logger.info("-" * 80)
             logger.info(f"👤 USER PROMPT:\n{prompt}")
             logger.info("=" * 80)
@@ -553,15 +736,17 @@ class KimiProvider(LLMProvider):
             response = self.client.chat.completions.create(
                 model=self.model,
                 messages=[
-                    {"role": "system", "content": self.system_prompt},
+                    {"role": "system", "content": system_prompt},
                     {"role": "user", "content": prompt}
                 ],
                 max_completion_tokens=max_completion_tokens,
                 temperature=self.temperature
             )
             
+            record_prompt_cache_usage(self.provider_name, self.model, getattr(response, 'usage', None))
             result = response.choices[0].message.content
             finish_reason = response.choices[0].finish_reason
+            _note_finish_reason(finish_reason)
             
             # Check if response was truncated or empty
             if finish_reason == 'length':
@@ -623,13 +808,14 @@ class KimiProvider(LLMProvider):
                     logger.error(f"💡 Try using one of these models: moonshot-v1-8k, moonshot-v1-32k, moonshot-v1-128k, kimi-latest, kimi-k2-thinking, kimi-k2-thinking-turbo")
             raise
     
-    def generate_json(self, prompt: str, max_tokens: Optional[int] = None) -> str:
+    def generate_json(self, prompt: str, max_tokens: Optional[int] = None, system_prompt: Optional[str] = None) -> str:
         """
         Generate JSON response with KIMI's JSON mode enforcement (OpenAI-compatible)
         
         Note: KIMI's JSON mode only supports JSON objects, not arrays.
         If the prompt requests an array, we'll wrap it in an object or use extraction.
         """
+        system_prompt = system_prompt or self.system_prompt
         try:
             # Check if prompt requests an array
             requests_array = "array" in prompt.lower() or "[\n" in prompt or '"[' in prompt
@@ -655,14 +841,14 @@ class KimiProvider(LLMProvider):
                 # KIMI JSON mode requires objects, not arrays
                 # For arrays, we'll use regular generation with extraction
                 logger.info("Prompt requests array - using regular generation with JSON extraction")
-                response_text = self.generate_description(json_prompt)
+                response_text = self.generate_description(json_prompt, system_prompt=system_prompt)
                 return self._extract_json_from_response(response_text)
             
             # For objects, use strict JSON mode
             response = self.client.chat.completions.create(
                 model=self.model,
                 messages=[
-                    {"role": "system", "content": self.system_prompt},
+                    {"role": "system", "content": system_prompt},
                     {"role": "user", "content": json_prompt}
                 ],
                 response_format={"type": "json_object"},
@@ -670,8 +856,10 @@ class KimiProvider(LLMProvider):
                 temperature=self.temperature
             )
             
+            record_prompt_cache_usage(self.provider_name, self.model, getattr(response, 'usage', None))
             result = response.choices[0].message.content
             finish_reason = response.choices[0].finish_reason
+            _note_finish_reason(finish_reason)
             
             # Check if response was truncated or empty
             if finish_reason == 'length':
@@ -725,46 +913,87 @@ class KimiProvider(LLMProvider):
                     logger.error(f"💡 Try using one of these models: moonshot-v1-8k, moonshot-v1-32k, moonshot-v1-128k, kimi-latest, kimi-k2-thinking, kimi-k2-thinking-turbo")
             # Fallback to regular generation
             logger.warning("Falling back to regular generation mode")
-            return self._extract_json_from_response(self.generate_description(prompt))
+            return self._extract_json_from_response(self.generate_description(prompt, system_prompt=system_prompt))
+
+    def stream_description(self, prompt: str, max_tokens: Optional[int] = None, system_prompt: Optional[str] = None) -> Iterator[str]:
+        """Stream completion text chunks (OpenAI-compatible streaming)"""
+        system_prompt = system_prompt or self.system_prompt
+        if max_tokens is not None:
+            max_completion_tokens = max_tokens
+        elif self.config_max_tokens is not None:
+            max_completion_tokens = self.config_max_tokens
+        else:
+            max_completion_tokens = 2000  # Default for KIMI
+        
+        stream = self.client.chat.completions.create(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": prompt}
+            ],
+            max_completion_tokens=max_completion_tokens,
+            temperature=self.temperature,
+            stream=True
+        )
+        for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+            if chunk.choices and chunk.choices[0].finish_reason == 'length':
+                logger.warning("⚠️ KIMI stream was truncated (finish_reason=length)")
+                _note_finish_reason('length')
+
+
+def create_provider(config: dict) -> LLMProvider:
+    """Create the appropriate LLM provider (new SDK client) from an LLM config dict"""
+    provider = config['provider'].lower()
+    api_key = config['api_key']
+    model = config['model']
+    system_prompt = config['system_prompt']
+    temperature = config.get('temperature', 0.7)
+    max_tokens = config.get('max_tokens')  # Pass max_tokens to providers
+    
+    if provider == "openai":
+        return OpenAIProvider(api_key, model, system_prompt, temperature, max_tokens=max_tokens)
+    elif provider == "claude":
+        return ClaudeProvider(api_key, model, system_prompt, temperature, max_tokens=max_tokens)
+    elif provider == "gemini":
+        return GeminiProvider(api_key, model, system_prompt, temperature, max_tokens=max_tokens)
+    elif provider == "kimi":
+        return KimiProvider(api_key, model, system_prompt, temperature, max_tokens=max_tokens)
+    else:
+        raise ValueError(f"Unsupported LLM provider: {provider}")
 
 
 class LLMClient:
     """Factory class for LLM providers"""
     
-    def __init__(self, config: dict):
+    def __init__(self, config: dict, registry: Optional[Any] = None):
+        """
+        Args:
+            config: LLM config dict (see Config.get_llm_config)
+            registry: Optional LLMProviderRegistry; when given, the provider SDK client is
+                borrowed from the pool instead of created for this instance
+        """
         self.provider_name = config['provider'].lower()
         self.config = config
+        self.registry = registry
         self.default_max_tokens = config.get('max_tokens')  # Global max_tokens from config (None = use provider defaults)
         logger.info(f"LLMClient initialized: provider={self.provider_name}, config_max_tokens={self.default_max_tokens}")
         logger.info(f"LLMClient.__init__: config.get('max_tokens') returned: {repr(config.get('max_tokens'))}, type: {type(config.get('max_tokens'))}")
         self.provider = self._create_provider(config)
     
     def _create_provider(self, config: dict) -> LLMProvider:
-        """Create the appropriate LLM provider"""
-        provider = config['provider'].lower()
-        api_key = config['api_key']
-        model = config['model']
-        system_prompt = config['system_prompt']
-        temperature = config.get('temperature', 0.7)
-        max_tokens = config.get('max_tokens')  # Pass max_tokens to providers
-        
-        if provider == "openai":
-            return OpenAIProvider(api_key, model, system_prompt, temperature, max_tokens=max_tokens)
-        elif provider == "claude":
-            return ClaudeProvider(api_key, model, system_prompt, temperature, max_tokens=max_tokens)
-        elif provider == "gemini":
-            return GeminiProvider(api_key, model, system_prompt, temperature, max_tokens=max_tokens)
-        elif provider == "kimi":
-            return KimiProvider(api_key, model, system_prompt, temperature, max_tokens=max_tokens)
-        else:
-            raise ValueError(f"Unsupported LLM provider: {provider}")
+        """Create the appropriate LLM provider (pooled when a registry is set)"""
+        if self.registry is not None:
+            return self.registry.get_provider(config)
+        return create_provider(config)
     
     def get_system_prompt(self) -> str:
         """Get the current system prompt from the provider"""
         return self.provider.get_system_prompt()
     
     def set_system_prompt(self, system_prompt: str) -> None:
-        """Set a new system prompt on the provider (for temporary overrides)"""
+        """Set the provider's default system prompt (pass system_prompt per call for one-off overrides)"""
         self.provider.set_system_prompt(system_prompt)
     
     def generate_description(self, ticket_info: str, prd_content: str = None, 
@@ -773,9 +1002,54 @@ class LLMClient:
         """Generate description using the configured provider"""
         prompt = self.provider._build_prompt(ticket_info, prd_content, commits, pull_requests, code_changes)
         # max_tokens=None uses config default (from LLM_MAX_TOKENS env var)
-        return self.provider.generate_description(prompt, max_tokens=None)
+        with track_llm(self.provider_name, self.provider.model, "generate"):
+            return self.provider.generate_description(prompt, max_tokens=None)
+    
+    def _cache_key(self, prompt: str, system_prompt: Optional[str], max_tokens: Optional[int], response_format: str) -> str:
+        """Cache key for a request as it will actually be sent (effective system prompt and max_tokens)"""
+        return make_cache_key(
+            provider=self.provider_name,
+            model=self.provider.model,
+            temperature=self.provider.temperature,
+            system_prompt=system_prompt or self.provider.get_system_prompt(),
+            prompt=prompt,
+            max_tokens=max_tokens,
+            response_format=response_format,
+        )
     
-    def generate_content(self, prompt: str, system_prompt: str = None, max_tokens: Optional[int] = None) -> str:
+    def _with_prefix(self, prompt: str, cacheable_prefix: Optional[str]):
+        """
+        (prompt to send, provider kwargs, full prompt) for a request with a stable prefix.
+        Providers with cache_control get the prefix separately to mark it; the others get
+        it prepended, which is what their automatic prefix caching matches on.
+        """
+        if not cacheable_prefix:
+            return prompt, {}, prompt
+        full_prompt = cacheable_prefix + prompt
+        if getattr(self.provider, 'supports_cache_control', False) is True:
+            return prompt, {"cacheable_prefix": cacheable_prefix}, full_prompt
+        return full_prompt, {}, full_prompt
+    
+    def _call_provider(self, call, prompt: str, system_prompt: Optional[str], max_tokens: Optional[int],
+                       operation: str = "generate"):
+        """Run a provider call under the shared rate limiter (when configured), timing each attempt"""
+        untimed_call = call
+
+        def call():
+            with track_llm(self.provider_name, self.provider.model, operation):
+                return untimed_call()
+
+        limiter = get_llm_rate_limiter()
+        if limiter is None:
+            return call()
+        effective_system_prompt = system_prompt or self.provider.get_system_prompt() or ""
+        counter = get_token_counter(self.provider_name, self.provider.model)
+        estimated_tokens = counter.count(prompt) + counter.count(effective_system_prompt) + (max_tokens or 0)
+        return limiter.call(self.provider_name, self.provider.model, call, estimated_tokens=estimated_tokens)
+    
+    def generate_content(self, prompt: str, system_prompt: str = None, max_tokens: Optional[int] = None,
+                         use_cache: bool = True, refresh_cache: bool = False,
+                         cacheable_prefix: Optional[str] = None) -> str:
         """
         Generate content using the configured provider with custom prompts
         
@@ -783,6 +1057,10 @@ class LLMClient:
             prompt: The prompt to send to the LLM
             system_prompt: Optional system prompt override
             max_tokens: Maximum tokens to generate (default: config max_tokens or provider default)
+            use_cache: Serve/store the response through the LLM response cache (when configured)
+            refresh_cache: Skip the cache lookup and overwrite the cached response
+            cacheable_prefix: Stable leading text shared by many calls (e.g. epic PRD/RFC context),
+                sent before prompt and marked for provider-side prompt caching where supported
             
         Returns:
             Generated content as string
@@ -791,22 +1069,33 @@ class LLMClient:
         if max_tokens is None:
             max_tokens = self.default_max_tokens
         
-        # Temporarily override system prompt if provided
-        original_prompt = None
-        if system_prompt:
-            original_prompt = self.provider.get_system_prompt()
-            self.provider.set_system_prompt(system_prompt)
+        send_prompt, prefix_kwargs, full_prompt = self._with_prefix(prompt, cacheable_prefix)
+        cache = get_llm_cache() if use_cache else None
+        cache_key = None
+        if cache is not None:
+            cache_key = self._cache_key(full_prompt, system_prompt, max_tokens, "text")
+            if not refresh_cache:
+                cached = cache.get(cache_key)
+                if cached is not None:
+                    logger.info(f"generate_content: LLM cache hit ({self.provider_name}/{self.provider.model})")
+                    return cached
         
-        try:
-            # Call provider's generate_description with max_tokens (all providers support it now)
-            result = self.provider.generate_description(prompt, max_tokens=max_tokens)
-            return result
-        finally:
-            # Restore original system prompt if it was overridden
-            if original_prompt:
-                self.provider.set_system_prompt(original_prompt)
+        # System prompt is passed per request (no provider mutation), so one client can be shared across threads
+        _response_truncated.set(False)
+        result = self._call_provider(
+            lambda: self.provider.generate_description(send_prompt, max_tokens=max_tokens, system_prompt=system_prompt or None,
+                                                       **prefix_kwargs),
+            full_prompt, system_prompt, max_tokens
+        )
+        
+        # A completion cut off at max_tokens is returned but not cached
+        if cache is not None and isinstance(result, str) and result and not _response_truncated.get():
+            cache.set(cache_key, result)
+        return result
     
-    def generate_content_json(self, prompt: str, system_prompt: str = None, max_tokens: Optional[int] = None) -> str:
+    def generate_content_json(self, prompt: str, system_prompt: str = None, max_tokens: Optional[int] = None,
+                              use_cache: bool = True, refresh_cache: bool = False,
+                              cacheable_prefix: Optional[str] = None) -> str:
         """
         Generate JSON content with enforced JSON mode (unified across all providers)
         
@@ -820,6 +1109,10 @@ class LLMClient:
             prompt: The prompt to send to the LLM (should include JSON format instructions)
             system_prompt: Optional system prompt override
             max_tokens: Maximum tokens to generate (default: config max_tokens or provider default)
+            use_cache: Serve/store the response through the LLM response cache (when configured)
+            refresh_cache: Skip the cache lookup and overwrite the cached response
+            cacheable_prefix: Stable leading text shared by many calls (e.g. epic PRD/RFC context),
+                sent before prompt and marked for provider-side prompt caching where supported
             
         Returns:
             JSON string (guaranteed valid JSON, not wrapped in markdown)
@@ -831,31 +1124,90 @@ class LLMClient:
         else:
             logger.info(f"generate_content_json: Using provided max_tokens={max_tokens}")
         
-        # Temporarily override system prompt if provided
-        original_prompt = None
-        if system_prompt:
-            original_prompt = self.provider.get_system_prompt()
-            self.provider.set_system_prompt(system_prompt)
+        send_prompt, prefix_kwargs, full_prompt = self._with_prefix(prompt, cacheable_prefix)
+        cache = get_llm_cache() if use_cache else None
+        cache_key = None
+        if cache is not None:
+            cache_key = self._cache_key(full_prompt, system_prompt, max_tokens, "json")
+            if not refresh_cache:
+                cached = cache.get(cache_key)
+                if cached is not None:
+                    logger.info(f"generate_content_json: LLM cache hit ({self.provider_name}/{self.provider.model})")
+                    return cached
         
+        # Call provider's generate_json method (pass max_tokens, provider will use config default if None)
+        # System prompt is passed per request (no provider mutation), so one client can be shared across threads
+        logger.info(f"generate_content_json: Calling provider.generate_json with max_tokens={max_tokens}")
+        _response_truncated.set(False)
+        result = self._call_provider(
+            lambda: self.provider.generate_json(send_prompt, max_tokens=max_tokens, system_prompt=system_prompt or None,
+                                                **prefix_kwargs),
+            full_prompt, system_prompt, max_tokens, operation="json"
+        )
+        
+        # Final validation - ensure it's valid JSON
         try:
-            # Call provider's generate_json method (pass max_tokens, provider will use config default if None)
-            logger.info(f"generate_content_json: Calling provider.generate_json with max_tokens={max_tokens}")
-            result = self.provider.generate_json(prompt, max_tokens=max_tokens)
-            
-            # Final validation - ensure it's valid JSON
-            try:
-                json.loads(result)
-                logger.info("✅ Final JSON validation passed")
-            except json.JSONDecodeError as e:
-                logger.error(f"❌ Generated response is not valid JSON: {e}")
-                logger.error(f"Response preview: {result[:500]}")
-                raise ValueError(f"LLM did not return valid JSON: {e}")
-            
-            return result
-        finally:
-            # Restore original system prompt if it was overridden
-            if original_prompt:
-                self.provider.set_system_prompt(original_prompt)
+            json.loads(result)
+            logger.info("✅ Final JSON validation passed")
+        except json.JSONDecodeError as e:
+            logger.error(f"❌ Generated response is not valid JSON: {e}")
+            logger.error(f"Response preview: {result[:500]}")
+            raise ValueError(f"LLM did not return valid JSON: {e}")
+        
+        # Only validated, complete JSON reaches the cache
+        if cache is not None and not _response_truncated.get():
+            cache.set(cache_key, result)
+        return result
+    
+    def stream_content(self, prompt: str, system_prompt: str = None, max_tokens: Optional[int] = None,
+                       use_cache: bool = True, refresh_cache: bool = False,
+                       cacheable_prefix: Optional[str] = None) -> Iterator[str]:
+        """
+        Stream generated content as text chunks as they arrive from the provider
+        
+        Same arguments as generate_content. A cached response is yielded as one chunk; a
+        fully streamed response is stored under the generate_content cache key (not one
+        cut off at max_tokens, failed mid-stream or abandoned by the caller). Opening the
+        stream goes through the rate limiter (429s on connect are retried).
+        
+        Yields:
+            Text chunks in order; their concatenation is the full completion
+        """
+        if max_tokens is None:
+            max_tokens = self.default_max_tokens
+        
+        send_prompt, prefix_kwargs, full_prompt = self._with_prefix(prompt, cacheable_prefix)
+        cache = get_llm_cache() if use_cache else None
+        cache_key = None
+        if cache is not None:
+            cache_key = self._cache_key(full_prompt, system_prompt, max_tokens, "text")
+            if not refresh_cache:
+                cached = cache.get(cache_key)
+                if cached is not None:
+                    logger.info(f"stream_content: LLM cache hit ({self.provider_name}/{self.provider.model})")
+                    yield cached
+                    return
+        
+        def open_stream():
+            # Pull the first chunk inside the limiter so a rate-limited connect is retried
+            stream = self.provider.stream_description(send_prompt, max_tokens=max_tokens, system_prompt=system_prompt or None,
+                                                      **prefix_kwargs)
+            return stream, next(stream, None)
+        
+        _response_truncated.set(False)
+        stream, first_chunk = self._call_provider(open_stream, full_prompt, system_prompt, max_tokens,
+                                                  operation="stream")
+        chunks = []
+        if first_chunk is not None:
+            chunks.append(first_chunk)
+            yield first_chunk
+        for chunk in stream:
+            chunks.append(chunk)
+            yield chunk
+        
+        result = "".join(chunks)
+        if cache is not None and result and not _response_truncated.get():
+            cache.set(cache_key, result)
     
     def test_connection(self) -> bool:
         """Test if the LLM provider is working"""
@@ -0,0 +1,354 @@
+"""
+Rate limiting for LLM provider calls, per (provider, model).
+
+Each key has a requests-per-minute and a tokens-per-minute token bucket plus an adaptive
+concurrency limit. The limit grows additively on success and halves on a 429, and a
+Retry-After from the provider pauses every caller for that key (AIMD). With the Redis
+backend the buckets and the Retry-After cooldown live in Redis, so all API pods and ARQ
+workers draw from one quota; the concurrency window stays per process.
+
+Rate-limited calls are retried here instead of failing the story or falling back to
+template output.
+"""
+import logging
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONCURRENCY = 8
+DEFAULT_MAX_RETRIES = 4
+DEFAULT_BACKOFF_SECONDS = 2.0
+MAX_BACKOFF_SECONDS = 60.0
+
+
+def is_rate_limit_error(error: Exception) -> bool:
+    """True for provider 429 / quota-exhausted errors (OpenAI, Anthropic, Kimi, Gemini SDKs)"""
+    if getattr(error, 'status_code', None) == 429:
+        return True
+    response = getattr(error, 'response', None)
+    if getattr(response, 'status_code', None) == 429:
+        return True
+    name = type(error).__name__
+    return name in ('RateLimitError', 'ResourceExhausted', 'TooManyRequests')
+
+
+def get_retry_after(error: Exception) -> Optional[float]:
+    """Retry-After seconds from a provider error's HTTP response, if present"""
+    headers = getattr(getattr(error, 'response', None), 'headers', None)
+    if not headers:
+        return None
+    for header in ('retry-after-ms', 'retry-after'):
+        value = headers.get(header)
+        if value is None:
+            continue
+        try:
+            seconds = float(value)
+        except (TypeError, ValueError):
+            continue
+        return seconds / 1000.0 if header == 'retry-after-ms' else seconds
+    return None
+
+
+class TokenBucket:
+    """In-process token bucket refilled continuously at capacity per minute"""
+
+    def __init__(self, per_minute: int):
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.tokens = float(per_minute)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def take(self, amount: float) -> float:
+        """Take amount tokens if available; return 0, or the seconds to wait before retrying"""
+        amount = min(amount, self.capacity)  # oversize requests wait for a full bucket, not forever
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= amount:
+                self.tokens -= amount
+                return 0.0
+            return (amount - self.tokens) / self.rate
+
+
+# KEYS[1] = bucket hash; ARGV = capacity, rate per second, amount, now (seconds)
+_REDIS_TAKE_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local amount = math.min(tonumber(ARGV[3]), capacity)
+local now = tonumber(ARGV[4])
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'updated')
+local tokens = tonumber(state[1]) or capacity
+local updated = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - updated) * rate)
+local wait = 0
+if tokens >= amount then
+  tokens = tokens - amount
+else
+  wait = (amount - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'updated', now)
+redis.call('EXPIRE', KEYS[1], 120)
+return tostring(wait)
+"""
+
+
+class RedisTokenBucket:
+    """Token bucket shared through Redis (atomic Lua refill-and-take)"""
+
+    def __init__(self, redis_client: Any, key: str, per_minute: int):
+        self.redis = redis_client
+        self.key = key
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self._script = redis_client.register_script(_REDIS_TAKE_SCRIPT)
+
+    def take(self, amount: float) -> float:
+        return float(self._script(keys=[self.key], args=[self.capacity, self.rate, amount, time.time()]))
+
+
+class AdaptiveConcurrency:
+    """AIMD concurrency window: +1/limit per success, halved on rate limit"""
+
+    def __init__(self, max_limit: int, min_limit: int = 1):
+        self.max_limit = max(1, max_limit)
+        self.min_limit = max(1, min(min_limit, self.max_limit))
+        self.limit = float(self.max_limit)
+        self.in_flight = 0
+        self._cond = threading.Condition()
+
+    def acquire(self) -> None:
+        with self._cond:
+            while self.in_flight >= int(self.limit):
+                self._cond.wait()
+            self.in_flight += 1
+
+    def release(self) -> None:
+        with self._cond:
+            self.in_flight -= 1
+            self._cond.notify_all()
+
+    def on_success(self) -> None:
+        with self._cond:
+            if self.limit < self.max_limit:
+                self.limit = min(self.max_limit, self.limit + 1.0 / self.limit)
+                self._cond.notify_all()
+
+    def on_rate_limited(self) -> None:
+        with self._cond:
+            self.limit = max(self.min_limit, self.limit / 2.0)
+
+
+class _ModelLimits:
+    """Buckets, window and cooldown for one (provider, model)"""
+
+    def __init__(self, rpm: int, tpm: int, max_concurrency: int, min_concurrency: int,
+                 redis_client: Any = None, key: str = ""):
+        self.rpm = rpm
+        self.tpm = tpm
+        self.redis = redis_client
+        self.cooldown_key = f"llm:ratelimit:{key}:cooldown"
+        self.cooldown_until = 0.0
+        if redis_client is not None:
+            self.requests = RedisTokenBucket(redis_client, f"llm:ratelimit:{key}:rpm", rpm) if rpm > 0 else None
+            self.tokens = RedisTokenBucket(redis_client, f"llm:ratelimit:{key}:tpm", tpm) if tpm > 0 else None
+        else:
+            self.requests = TokenBucket(rpm) if rpm > 0 else None
+            self.tokens = TokenBucket(tpm) if tpm > 0 else None
+        self.concurrency = AdaptiveConcurrency(max_concurrency, min_concurrency)
+
+    def cooldown_remaining(self) -> float:
+        remaining = self.cooldown_until - time.time()
+        if self.redis is not None:
+            try:
+                ttl_ms = self.redis.pttl(self.cooldown_key)
+                if ttl_ms and ttl_ms > 0:
+                    remaining = max(remaining, ttl_ms / 1000.0)
+            except Exception as e:
+                logger.debug(f"LLM rate limiter cooldown read failed: {e}")
+        return max(0.0, remaining)
+
+    def start_cooldown(self, seconds: float) -> None:
+        self.cooldown_until = max(self.cooldown_until, time.time() + seconds)
+        if self.redis is not None:
+            try:
+                self.redis.set(self.cooldown_key, "1", px=max(1, int(seconds * 1000)))
+            except Exception as e:
+                logger.debug(f"LLM rate limiter cooldown write failed: {e}")
+
+
+class LLMRateLimiter:
+    """Per (provider, model) RPM/TPM buckets with adaptive concurrency and 429 retry"""
+
+    def __init__(self, default_rpm: int = 0, default_tpm: int = 0,
+                 max_concurrency: int = DEFAULT_MAX_CONCURRENCY, min_concurrency: int = 1,
+                 max_retries: int = DEFAULT_MAX_RETRIES, model_limits: Optional[Dict[str, Dict[str, int]]] = None,
+                 redis_client: Any = None, sleep: Callable[[float], None] = time.sleep):
+        """
+        Args:
+            default_rpm / default_tpm: Per-minute quotas applied to every model (0 = unlimited)
+            max_concurrency / min_concurrency: Bounds of the adaptive in-flight window per model
+            max_retries: Retries after a rate-limit error before it is raised
+            model_limits: Overrides keyed "provider:model" (or "provider") with rpm/tpm/max_concurrency
+            redis_client: Sync Redis client to share quota and cooldowns across processes
+        """
+        self.default_rpm = default_rpm
+        self.default_tpm = default_tpm
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min_concurrency
+        self.max_retries = max_retries
+        self.model_limits = model_limits or {}
+        self.redis = redis_client
+        self._sleep = sleep
+        self._limits: Dict[Tuple[str, str], _ModelLimits] = {}
+        self._lock = threading.Lock()
+        self._stats = {"calls": 0, "rate_limited": 0, "retries": 0, "waited_seconds": 0.0}
+
+    def _get_limits(self, provider: str, model: str) -> _ModelLimits:
+        key = (provider, model)
+        with self._lock:
+            limits = self._limits.get(key)
+            if limits is None:
+                override = self.model_limits.get(f"{provider}:{model}") or self.model_limits.get(provider) or {}
+                limits = _ModelLimits(
+                    rpm=int(override.get('rpm', self.default_rpm) or 0),
+                    tpm=int(override.get('tpm', self.default_tpm) or 0),
+                    max_concurrency=int(override.get('max_concurrency', self.max_concurrency)),
+                    min_concurrency=self.min_concurrency,
+                    redis_client=self.redis,
+                    key=f"{provider}:{model}",
+                )
+                self._limits[key] = limits
+            return limits
+
+    def _wait(self, seconds: float) -> None:
+        with self._lock:
+            self._stats["waited_seconds"] += seconds
+        self._sleep(seconds)
+
+    def _take(self, bucket: Any, amount: float) -> None:
+        """Block until bucket grants amount (bucket errors fail open)"""
+        while bucket is not None:
+            try:
+                wait = bucket.take(amount)
+            except Exception as e:
+                logger.warning(f"LLM rate limiter bucket unavailable, proceeding: {e}")
+                return
+            if wait <= 0:
+                return
+            self._wait(wait)
+
+    def call(self, provider: str, model: str, func: Callable[[], Any], estimated_tokens: int = 0) -> Any:
+        """
+        Run func under the (provider, model) quota, retrying rate-limit errors with
+        Retry-After (or exponential backoff) and shrinking the concurrency window.
+        """
+        limits = self._get_limits(provider, model)
+        backoff = DEFAULT_BACKOFF_SECONDS
+        for attempt in range(self.max_retries + 1):
+            cooldown = limits.cooldown_remaining()
+            if cooldown > 0:
+                self._wait(cooldown)
+            self._take(limits.requests, 1)
+            self._take(limits.tokens, estimated_tokens)
+
+            limits.concurrency.acquire()
+            try:
+                with self._lock:
+                    self._stats["calls"] += 1
+                result = func()
+            except Exception as e:
+                if not is_rate_limit_error(e):
+                    raise
+                limits.concurrency.on_rate_limited()
+                retry_after = get_retry_after(e)
+                delay = retry_after if retry_after is not None else backoff * (1 + random.random() * 0.25)
+                limits.start_cooldown(delay)
+                with self._lock:
+                    self._stats["rate_limited"] += 1
+                if attempt >= self.max_retries:
+                    logger.error(f"{provider}/{model} still rate limited after {attempt + 1} attempts")
+                    raise
+                logger.warning(
+                    f"{provider}/{model} rate limited (attempt {attempt + 1}/{self.max_retries + 1}), "
+                    f"retrying in {delay:.1f}s, concurrency window now {int(limits.concurrency.limit)}"
+                )
+                with self._lock:
+                    self._stats["retries"] += 1
+                backoff = min(backoff * 2, MAX_BACKOFF_SECONDS)
+            else:
+                limits.concurrency.on_success()
+                return result
+            finally:
+                limits.concurrency.release()
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters plus the current concurrency window per model"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["models"] = {
+                f"{provider}:{model}": {
+                    "concurrency_limit": int(limits.concurrency.limit),
+                    "in_flight": limits.concurrency.in_flight,
+                    "rpm": limits.rpm,
+                    "tpm": limits.tpm,
+                }
+                for (provider, model), limits in self._limits.items()
+            }
+        return stats
+
+
+_rate_limiter: Optional[LLMRateLimiter] = None
+
+
+def configure_llm_rate_limiter(limit_config: Dict[str, Any], redis_config: Optional[Dict[str, Any]] = None) -> Optional[LLMRateLimiter]:
+    """
+    Create the process-wide limiter from the `llm_rate_limit:` config section
+    (see Config.get_llm_rate_limit_config). Returns None when disabled.
+    """
+    global _rate_limiter
+    if not limit_config.get('enabled'):
+        _rate_limiter = None
+        logger.info("LLM rate limiter disabled")
+        return None
+
+    redis_client = None
+    if limit_config.get('backend') == 'redis':
+        try:
+            import redis
+            redis_config = redis_config or {}
+            redis_client = redis.Redis(
+                host=redis_config.get('host', 'localhost'),
+                port=int(redis_config.get('port', 6379)),
+                password=redis_config.get('password') or None,
+                db=int(redis_config.get('database', 0)),
+                socket_timeout=2,
+                socket_connect_timeout=2,
+            )
+        except Exception as e:
+            logger.warning(f"LLM rate limiter Redis backend unavailable, using per-process buckets: {e}")
+            redis_client = None
+
+    _rate_limiter = LLMRateLimiter(
+        default_rpm=limit_config.get('rpm', 0),
+        default_tpm=limit_config.get('tpm', 0),
+        max_concurrency=limit_config.get('max_concurrency', DEFAULT_MAX_CONCURRENCY),
+        min_concurrency=limit_config.get('min_concurrency', 1),
+        max_retries=limit_config.get('max_retries', DEFAULT_MAX_RETRIES),
+        model_limits=limit_config.get('models'),
+        redis_client=redis_client,
+    )
+    logger.info(
+        f"LLM rate limiter enabled: rpm={_rate_limiter.default_rpm}, tpm={_rate_limiter.default_tpm}, "
+        f"max_concurrency={_rate_limiter.max_concurrency}, backend={'redis' if redis_client else 'memory'}"
+    )
+    return _rate_limiter
+
+
+def get_llm_rate_limiter() -> Optional[LLMRateLimiter]:
+    """Process-wide LLM rate limiter, or None when not configured/disabled"""
+    return _rate_limiter
@@ -0,0 +1,140 @@
+"""
+Process-wide pool of LLM provider SDK clients.
+
+Creating an LLMClient builds a new OpenAI/Anthropic/Gemini SDK client, each with its own
+HTTP connection pool. The registry keeps one provider per (provider, model, api_key) and
+hands out lightweight copies carrying the request's system prompt, temperature and
+max_tokens, so per-request overrides never rebuild the transport. Providers unused for
+idle_seconds are dropped from the pool; their SDK clients are not closed because copies
+handed out earlier (e.g. the long-lived default LLMClient) may still use them, and are
+reclaimed by the garbage collector once the last copy goes away.
+"""
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from .llm_client import LLMProvider, LLMClient, create_provider
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_IDLE_SECONDS = 900
+DEFAULT_MAX_PROVIDERS = 32
+
+
+class LLMProviderRegistry:
+    """Pooled provider SDK clients keyed by (provider, model, api_key), with idle eviction"""
+
+    def __init__(self, idle_seconds: int = DEFAULT_IDLE_SECONDS, max_providers: int = DEFAULT_MAX_PROVIDERS):
+        self.idle_seconds = idle_seconds
+        self.max_providers = max(1, max_providers)
+        self._providers: "OrderedDict[Tuple[str, str, str], Tuple[LLMProvider, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"created": 0, "reused": 0, "evicted": 0}
+
+    def get_provider(self, config: Dict[str, Any]) -> LLMProvider:
+        """Provider for an LLM config dict, sharing the pooled SDK client for its key"""
+        key = (config['provider'].lower(), config['model'], config.get('api_key') or '')
+        now = time.time()
+        discarded = None
+        with self._lock:
+            self._evict_idle(now)
+            entry = self._providers.get(key)
+            if entry is not None:
+                base = entry[0]
+                self._providers[key] = (base, now)
+                self._providers.move_to_end(key)
+                self._stats["reused"] += 1
+            else:
+                base = None
+
+        if base is None:
+            # Build outside the lock; SDK client construction can be slow
+            created = create_provider(config)
+            with self._lock:
+                entry = self._providers.get(key)
+                if entry is not None:
+                    base = entry[0]  # another thread won the race
+                    discarded = created
+                    self._stats["reused"] += 1
+                else:
+                    base = created
+                    self._stats["created"] += 1
+                    logger.info(f"LLM registry: created {key[0]}/{key[1]} client")
+                self._providers[key] = (base, now)
+                self._providers.move_to_end(key)
+                while len(self._providers) > self.max_providers:
+                    self._providers.popitem(last=False)
+                    self._stats["evicted"] += 1
+
+        if discarded is not None:
+            # Never handed out, so nothing else holds its SDK client
+            _close_provider(discarded)
+
+        return base.with_overrides(
+            system_prompt=config.get('system_prompt'),
+            temperature=config.get('temperature', 0.7),
+            max_tokens=config.get('max_tokens'),
+        )
+
+    def get_client(self, config: Dict[str, Any]) -> LLMClient:
+        """LLMClient backed by a pooled provider"""
+        return LLMClient(config, registry=self)
+
+    def _evict_idle(self, now: float) -> None:
+        """Drop providers idle past idle_seconds (caller holds the lock)"""
+        if self.idle_seconds <= 0:
+            return
+        stale = [key for key, (_, last_used) in self._providers.items() if now - last_used > self.idle_seconds]
+        for key in stale:
+            del self._providers[key]
+            self._stats["evicted"] += 1
+            logger.info(f"LLM registry: evicted idle {key[0]}/{key[1]} client")
+
+    def clear(self) -> None:
+        """Drop all pooled providers (clients already handed out keep working)"""
+        with self._lock:
+            self._providers.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Pool size and created/reused/evicted counters"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["size"] = len(self._providers)
+        stats["idle_seconds"] = self.idle_seconds
+        return stats
+
+
+def _close_provider(provider: LLMProvider) -> None:
+    """Close the provider's SDK client if it supports it"""
+    close = getattr(getattr(provider, 'client', None), 'close', None)
+    if callable(close):
+        try:
+            close()
+        except Exception as e:
+            logger.debug(f"Error closing LLM client: {e}")
+
+
+_registry: Optional[LLMProviderRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def configure_llm_registry(idle_seconds: int = DEFAULT_IDLE_SECONDS,
+                           max_providers: int = DEFAULT_MAX_PROVIDERS) -> LLMProviderRegistry:
+    """Replace the process-wide registry (dropping any pooled clients)"""
+    global _registry
+    with _registry_lock:
+        if _registry is not None:
+            _registry.clear()
+        _registry = LLMProviderRegistry(idle_seconds=idle_seconds, max_providers=max_providers)
+        return _registry
+
+
+def get_llm_registry() -> LLMProviderRegistry:
+    """Process-wide registry, created with defaults on first use"""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = LLMProviderRegistry()
+        return _registry
@@ -0,0 +1,358 @@
+"""
+Metrics
+Prometheus-style counters, gauges and histograms kept in process memory and rendered in the
+Prometheus text exposition format. The API serves them on /metrics; a worker serves them
+from a small exporter (see start_metrics_server).
+
+Outbound calls are recorded here by the clients: requests sessions (JIRA, Confluence,
+Bitbucket) through instrument_session, httpx transports (OpenSandbox) through
+InstrumentedAsyncHTTPTransport, and everything else through observe_outbound /
+track_outbound. LLM calls have their own provider/model-labelled series.
+"""
+import logging
+import math
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+# Outbound calls: milliseconds (cached JIRA reads) to minutes (LLM completions)
+DEFAULT_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+JOB_BUCKETS = (1.0, 5.0, 15.0, 30.0, 60.0, 120.0, 300.0, 600.0, 1200.0, 1800.0, 3600.0, 7200.0)
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels_text(names: Sequence[str], values: Sequence[str], extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(f'{extra[0]}="{_escape(extra[1])}"')
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> Tuple[str, ...]:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} takes labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _samples(self) -> List[str]:
+        raise NotImplementedError
+
+    def render(self) -> str:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        lines.extend(self._samples())
+        return "\n".join(lines)
+
+
+class Counter(_Metric):
+    """Monotonically increasing count"""
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        return [f"{self.name}{_labels_text(self.labelnames, key)} {_format_value(value)}" for key, value in values]
+
+
+class Gauge(_Metric):
+    """Value that goes up and down"""
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def set(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+    def value(self, **labels: str) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        return [f"{self.name}{_labels_text(self.labelnames, key)} {_format_value(value)}" for key, value in values]
+
+
+class Histogram(_Metric):
+    """Distribution of observed values in cumulative buckets"""
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+        self._values: Dict[Tuple[str, ...], List[float]] = {}  # per-bucket counts, then sum, then count
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [0.0] * (len(self.buckets) + 2)
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state[i] += 1
+                    break
+            state[-2] += value
+            state[-1] += 1
+
+    def count(self, **labels: str) -> int:
+        with self._lock:
+            state = self._values.get(self._key(labels))
+            return int(state[-1]) if state else 0
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            values = sorted((key, list(state)) for key, state in self._values.items())
+        lines = []
+        for key, state in values:
+            cumulative = 0.0
+            for bound, bucket_count in zip(self.buckets, state):
+                cumulative += bucket_count
+                lines.append(f"{self.name}_bucket{_labels_text(self.labelnames, key, ('le', _format_value(bound)))} "
+                             f"{_format_value(cumulative)}")
+            labels = _labels_text(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(state[-2])}")
+            lines.append(f"{self.name}_count{labels} {_format_value(state[-1])}")
+        return lines
+
+
+class MetricsRegistry:
+    """Named metrics of this process plus collectors that refresh gauges at render time"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._metrics: Dict[str, _Metric] = {}
+        self._collectors: List[Callable[[], None]] = []
+
+    def _get_or_create(self, cls, name: str, documentation: str, labelnames: Sequence[str], **kwargs) -> _Metric:
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, documentation, labelnames, **kwargs)
+            elif not isinstance(metric, cls) or metric.labelnames != tuple(labelnames):
+                raise ValueError(f"Metric {name} is already registered with a different type or labels")
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._get_or_create(Counter, name, documentation, labelnames)
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._get_or_create(Gauge, name, documentation, labelnames)
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._get_or_create(Histogram, name, documentation, labelnames, buckets=buckets)
+
+    def add_collector(self, collector: Callable[[], None]) -> None:
+        """Run `collector` before each render (e.g. to set gauges from current state)"""
+        with self._lock:
+            self._collectors.append(collector)
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text exposition format"""
+        with self._lock:
+            collectors = list(self._collectors)
+            metrics = sorted(self._metrics.values(), key=lambda metric: metric.name)
+        for collector in collectors:
+            try:
+                collector()
+            except Exception as e:
+                logger.debug(f"Metrics collector failed: {e}")
+        return "\n".join(metric.render() for metric in metrics) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+OUTBOUND_DURATION = REGISTRY.histogram(
+    "outbound_request_duration_seconds", "Latency of outbound calls to external services",
+    ["service", "method"])
+OUTBOUND_ERRORS = REGISTRY.counter(
+    "outbound_request_errors_total", "Outbound calls that raised or returned 429/5xx",
+    ["service", "method", "reason"])
+LLM_DURATION = REGISTRY.histogram(
+    "llm_request_duration_seconds", "Latency of LLM provider calls (each attempt)",
+    ["provider", "model", "operation"])
+LLM_ERRORS = REGISTRY.counter(
+    "llm_request_errors_total", "LLM provider calls that raised",
+    ["provider", "model", "operation", "reason"])
+JOB_DURATION = REGISTRY.histogram(
+    "job_duration_seconds", "Run time of background jobs on workers",
+    ["job_type", "status"], buckets=JOB_BUCKETS)
+SANDBOX_SLOTS_IN_USE = REGISTRY.gauge(
+    "sandbox_slots_in_use", "OpenSandbox sandboxes held by this process (SandboxClient semaphore)")
+SANDBOX_SLOTS_LIMIT = REGISTRY.gauge(
+    "sandbox_slots_limit", "SandboxClient max_concurrent")
+SANDBOX_SLOT_WAIT = REGISTRY.histogram(
+    "sandbox_slot_wait_seconds", "Time spent waiting for a SandboxClient slot")
+
+
+def _error_reason(status_code: Optional[int], error: Optional[BaseException]) -> Optional[str]:
+    if error is not None:
+        return type(error).__name__
+    if status_code is not None and (status_code == 429 or status_code >= 500):
+        return f"http_{status_code}"
+    return None
+
+
+def observe_outbound(service: str, method: str, seconds: float, status_code: Optional[int] = None,
+                     error: Optional[BaseException] = None) -> None:
+    """Record one outbound call (a 429/5xx status or an exception also counts as an error)"""
+    method = method.upper()
+    OUTBOUND_DURATION.observe(seconds, service=service, method=method)
+    reason = _error_reason(status_code, error)
+    if reason is not None:
+        OUTBOUND_ERRORS.inc(service=service, method=method, reason=reason)
+
+
+@contextmanager
+def track_outbound(service: str, method: str) -> Iterator[None]:
+    """Time the enclosed outbound call; an exception is recorded as an error and re-raised"""
+    started = time.perf_counter()
+    try:
+        yield
+    except BaseException as e:
+        observe_outbound(service, method, time.perf_counter() - started, error=e)
+        raise
+    observe_outbound(service, method, time.perf_counter() - started)
+
+
+@contextmanager
+def track_llm(provider: str, model: str, operation: str) -> Iterator[None]:
+    """Time the enclosed LLM provider call; an exception is recorded as an error and re-raised"""
+    started = time.perf_counter()
+    try:
+        yield
+    except BaseException as e:
+        LLM_ERRORS.inc(provider=provider, model=model, operation=operation, reason=type(e).__name__)
+        raise
+    finally:
+        LLM_DURATION.observe(time.perf_counter() - started, provider=provider, model=model, operation=operation)
+
+
+class InstrumentedHTTPAdapter(HTTPAdapter):
+    """requests adapter recording every request a session sends"""
+
+    def __init__(self, service: str, *args, **kwargs):
+        self.service = service
+        super().__init__(*args, **kwargs)
+
+    def send(self, request, *args, **kwargs):
+        started = time.perf_counter()
+        try:
+            response = super().send(request, *args, **kwargs)
+        except Exception as e:
+            observe_outbound(self.service, request.method or "GET", time.perf_counter() - started, error=e)
+            raise
+        observe_outbound(self.service, request.method or "GET", time.perf_counter() - started,
+                         status_code=response.status_code)
+        return response
+
+
+def instrument_session(session: requests.Session, service: str) -> requests.Session:
+    """Record the latency and errors of every request `session` sends under `service`"""
+    adapter = InstrumentedHTTPAdapter(service)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+class InstrumentedAsyncHTTPTransport(httpx.AsyncHTTPTransport):
+    """httpx transport recording every request sent through it"""
+
+    def __init__(self, service: str, *args, **kwargs):
+        self.service = service
+        super().__init__(*args, **kwargs)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        started = time.perf_counter()
+        try:
+            response = await super().handle_async_request(request)
+        except Exception as e:
+            observe_outbound(self.service, request.method, time.perf_counter() - started, error=e)
+            raise
+        observe_outbound(self.service, request.method, time.perf_counter() - started,
+                         status_code=response.status_code)
+        return response
+
+
+def render() -> str:
+    """This process's metrics in the Prometheus text exposition format"""
+    return REGISTRY.render()
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?", 1)[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logger.debug("metrics exporter: " + format, *args)
+
+
+def start_metrics_server(port: int, host: str = "0.0.0.0") -> ThreadingHTTPServer:
+    """Serve GET /metrics on a background thread (for processes without the API, e.g. workers)"""
+    server = ThreadingHTTPServer((host, port), _MetricsHandler)
+    thread = threading.Thread(target=server.serve_forever, name="metrics-exporter", daemon=True)
+    thread.start()
+    logger.info(f"Metrics exporter listening on {host}:{port}/metrics")
+    return server
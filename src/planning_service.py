@@ -4,6 +4,7 @@ Planning Service for Epic Development Planning
 import logging
 import re
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
 
@@ -13,7 +14,7 @@ from .planning_models import (
     TaskScope, TaskTeam
 )
 from .epic_analysis_engine import EpicAnalysisEngine
-from .jira_client import JiraClient
+from .jira_client import JiraClient, LINK_WORKERS
 from .llm_client import LLMClient
 from .bulk_ticket_creator import BulkTicketCreator
 from .confluence_client import ConfluenceClient
@@ -1004,11 +1005,11 @@ class PlanningService:
         self._normalized_summary_to_key = {}
         self._normalized_summary_to_original = {}
         
-        # First pass: Create all tickets
-        for i, task in enumerate(tasks, 1):
-            logger.debug(f"Creating task {i}/{len(tasks)}: {task.summary} (task_id: {task.task_id})")
-            task_key = self._create_task_ticket_only(task)
+        # First pass: Create all tickets with JIRA bulk create
+        for i, (task, created) in enumerate(zip(tasks, self._bulk_create_task_tickets(tasks)), 1):
+            task_key = created["key"]
             if task_key:
+                task.key = task_key
                 created_keys.append(task_key)
                 # Store original summary mapping (backward compatibility)
                 self._task_summary_to_key[task.summary] = task_key
@@ -1031,17 +1032,25 @@ class PlanningService:
                 logger.debug(f"Task {i} created successfully: {task_key}")
             else:
                 failed_count += 1
-                logger.warning(f"Task {i} creation failed: {task.summary}")
+                logger.warning(f"Task {i} creation failed: {task.summary} - {created['error']}")
         
         logger.debug(f"Built dependency mappings: {len(self._task_summary_to_key)} summaries, {len(self._task_id_to_key)} task_ids, {len(self._normalized_summary_to_key)} normalized")
         
-        # Second pass: Create relationships after all tickets exist
-        logger.info(f"Creating relationships for {len(created_keys)} created tasks...")
-        for task in tasks:
-            if task.key:  # Only process successfully created tasks
-                self._create_task_relationships(task, task.key)
-        
-        logger.info(f"Task creation completed: {len(created_keys)} succeeded, {failed_count} failed")
+        # Second pass: Create relationships after all tickets exist, several tasks at a time
+        linked_tasks = [task for task in tasks if task.key]  # Only process successfully created tasks
+        logger.info(f"Creating relationships for {len(linked_tasks)} created tasks...")
+        link_failures = {}
+        if linked_tasks:
+            with ThreadPoolExecutor(max_workers=min(LINK_WORKERS, len(linked_tasks)), thread_name_prefix="jira-link") as executor:
+                outcomes = executor.map(lambda task: self._create_task_relationships(task, task.key), linked_tasks)
+                for task, failed_links in zip(linked_tasks, outcomes):
+                    if failed_links:
+                        link_failures[task.key] = failed_links
+        for task_key, failed_links in link_failures.items():
+            logger.warning(f"Task {task_key}: {len(failed_links)} relationship(s) not created: {failed_links}")
+        
+        logger.info(f"Task creation completed: {len(created_keys)} succeeded, {failed_count} failed, "
+                    f"{len(link_failures)} with missing relationships")
         return created_keys
     
     def _create_story_ticket(self, story: StoryPlan) -> Optional[str]:
@@ -1093,61 +1102,50 @@ class PlanningService:
             logger.exception("Full exception details:")
             return None
     
-    def _create_task_ticket_only(self, task: TaskPlan) -> Optional[str]:
-        """Create a single task ticket without relationships"""
-        try:
-            logger.info(f"Creating JIRA task ticket: {task.summary}")
-            logger.debug(f"Task details - Team: {task.team}, Epic: {task.epic_key}, Story: {getattr(task, 'story_key', 'None')}")
-            
-            # Use the project key from the task's epic or story
+    def _bulk_create_task_tickets(self, tasks: List[TaskPlan]) -> List[Dict[str, Any]]:
+        """Create task tickets without relationships via JIRA bulk create; one {"key", "error"} per task"""
+        results: List[Optional[Dict[str, Any]]] = [None] * len(tasks)
+        
+        # Use the project key from the task's epic or story (e.g., "PROJ-5840" -> "PROJ")
+        indexes_by_project: Dict[str, List[int]] = {}
+        for i, task in enumerate(tasks):
             project_key = None
             if task.epic_key:
-                # Extract project key from epic key (e.g., "PROJ-5840" -> "PROJ")
                 project_key = task.epic_key.split('-')[0]
-            elif hasattr(task, 'story_key') and task.story_key:
-                # Extract project key from story key
+            elif getattr(task, 'story_key', None):
                 project_key = task.story_key.split('-')[0]
             
-            if not project_key:
+            if project_key:
+                indexes_by_project.setdefault(project_key, []).append(i)
+            else:
                 logger.error(f"Cannot determine project key for task: {task.summary}")
-                return None
-            
-            logger.debug(f"Using project key: {project_key}")
-            
-            # Create the ticket using JIRA client
-            # Pass Confluence server URL for image attachment support
-            confluence_server_url = None
-            if self.confluence_client:
-                confluence_server_url = self.confluence_client.server_url
-            
-            task_key = self.jira_client.create_task_ticket(
-                task_plan=task,
-                project_key=project_key,
-                story_key=getattr(task, 'story_key', None),
+                results[i] = {"key": None, "error": "Cannot determine project key"}
+        
+        # Pass Confluence server URL for image attachment support
+        confluence_server_url = None
+        if self.confluence_client:
+            confluence_server_url = self.confluence_client.server_url
+        
+        for project_key, indexes in indexes_by_project.items():
+            logger.info(f"Creating {len(indexes)} JIRA task tickets in project {project_key}")
+            created = self.jira_client.create_task_tickets(
+                [tasks[i] for i in indexes],
+                project_key,
+                [getattr(tasks[i], 'story_key', None) for i in indexes],
                 confluence_server_url=confluence_server_url
             )
-            
-            if task_key:
-                logger.info(f"✅ Successfully created task ticket: {task_key}")
-                # Update the task with the created key
-                task.key = task_key
-                
-                # ❌ SKIP: Don't write generic test cases during task creation
-                # Let enhanced test generation write proper test cases instead
-                if hasattr(task, 'test_cases') and task.test_cases:
-                    logger.info(f"Skipping generic test cases during task creation for {task_key} - enhanced test generation will provide better ones")
-            else:
-                logger.error(f"❌ Failed to create task ticket for: {task.summary}")
-            
-            return task_key
-            
-        except Exception as e:
-            logger.error(f"❌ Error creating task ticket for '{task.summary}': {str(e)}")
-            logger.exception("Full exception details:")
-            return None
+            for i, result in zip(indexes, created):
+                results[i] = result
+                if result["key"]:
+                    logger.info(f"✅ Successfully created task ticket: {result['key']}")
+                else:
+                    logger.error(f"❌ Failed to create task ticket for '{tasks[i].summary}': {result['error']}")
+        
+        return results
 
-    def _create_task_relationships(self, task: TaskPlan, task_key: str):
-        """Create issue links for task relationships"""
+    def _create_task_relationships(self, task: TaskPlan, task_key: str) -> List[str]:
+        """Create issue links for task relationships; returns the relationships that could not be created"""
+        failed_links = []
         try:
             logger.debug(f"📋 Creating relationships for task {task_key}")
             logger.debug(f"   Task details: story_key='{task.story_key}', epic_key='{task.epic_key}', team={task.team.value}")
@@ -1175,9 +1173,11 @@ class PlanningService:
                             dependency_resolved += 1
                         else:
                             logger.warning(f"❌ Failed to create dependency link: {dependency_key} -> {task_key} (dependency: '{dependency_identifier}')")
+                            failed_links.append(f"{dependency_key} blocks {task_key}")
                             dependency_failed += 1
                     else:
                         logger.warning(f"🔍 Could not resolve dependency task: '{dependency_identifier}' (task {task_key} depends on this)")
+                        failed_links.append(f"unresolved dependency '{dependency_identifier}'")
                         dependency_failed += 1
                 
                 # Summary logging
@@ -1195,6 +1195,7 @@ class PlanningService:
                     relationships_created += 1
                 else:
                     logger.warning(f"❌ Failed to create any relationship link: story {task.story_key} -> {task_key}")
+                    failed_links.append(f"{task_key} split from {task.story_key}")
             
             # For tasks without story parent, JIRA client already created native parent relationship to epic
             elif task.epic_key:
@@ -1214,6 +1215,9 @@ class PlanningService:
         except Exception as e:
             logger.error(f"💥 Error creating relationships for task {task_key}: {str(e)}")
             logger.exception("Full exception details:")
+            failed_links.append(f"error: {e}")
+        
+        return failed_links
 
     def _normalize_task_summary(self, summary: str) -> str:
         """
@@ -3647,7 +3651,7 @@ class PlanningService:
         
         try:
             # Get epic issue to access PRD custom field
-            epic_issue = self.jira_client.get_ticket(epic_key)
+            epic_issue = self.jira_client.get_ticket(epic_key, profile='planning')
             if not epic_issue:
                 logger.debug(f"Epic {epic_key} not found, cannot get PRD")
                 return False
@@ -0,0 +1,39 @@
+"""
+Progress reporting from deep inside generation code back to the running job.
+
+Workers install a reporter with `progress_reporter(callback)` around a blocking call;
+run_blocking copies context variables into the worker thread, so code anywhere below
+(e.g. streaming task generation) can call `report_progress(...)` without threading a
+callback through every layer. With no reporter installed, reports are dropped.
+"""
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+ProgressCallback = Callable[[Dict[str, Any]], None]
+
+_reporter: ContextVar[Optional[ProgressCallback]] = ContextVar("progress_reporter", default=None)
+
+
+@contextmanager
+def progress_reporter(callback: Optional[ProgressCallback]) -> Iterator[None]:
+    """Route report_progress() calls made in this context (and copies of it) to callback"""
+    token = _reporter.set(callback)
+    try:
+        yield
+    finally:
+        _reporter.reset(token)
+
+
+def report_progress(**update: Any) -> None:
+    """Send a partial progress update to the current job, if one is listening"""
+    callback = _reporter.get()
+    if callback is None:
+        return
+    try:
+        callback(update)
+    except Exception as e:
+        logger.debug(f"Progress callback failed: {e}")
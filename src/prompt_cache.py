@@ -0,0 +1,126 @@
+"""
+Provider-side prompt prefix caching: hit metrics from response usage.
+
+Planning and test generation resend the same system prompt and epic PRD/RFC context for
+every story. Callers pass that stable text to LLMClient as `cacheable_prefix`. It is sent
+first, so providers with automatic prefix caching (OpenAI, Kimi, Gemini implicit caching)
+can reuse it. Claude also gets an explicit `cache_control` breakpoint. Each response's
+usage block is recorded here, per provider/model, so the savings show up in /health.
+"""
+import logging
+import threading
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def _usage_int(usage: Any, name: str) -> int:
+    """Integer usage field, tolerating missing fields and SDK objects vs dicts"""
+    value = usage.get(name) if isinstance(usage, dict) else getattr(usage, name, None)
+    return value if isinstance(value, int) else 0
+
+
+def extract_prompt_cache_usage(usage: Any) -> Dict[str, int]:
+    """
+    Normalise a provider usage block to input/cached/cache-write token counts.
+
+    Anthropic reports uncached input_tokens plus cache_read/cache_creation tokens;
+    OpenAI/Kimi report prompt_tokens with prompt_tokens_details.cached_tokens (Kimi may
+    use a top-level cached_tokens); Gemini reports prompt_token_count and
+    cached_content_token_count.
+    """
+    if usage is None:
+        return {"input_tokens": 0, "cached_tokens": 0, "cache_write_tokens": 0}
+    cache_read = _usage_int(usage, "cache_read_input_tokens")
+    cache_write = _usage_int(usage, "cache_creation_input_tokens")
+    if cache_read or cache_write or _usage_int(usage, "input_tokens"):
+        return {
+            "input_tokens": _usage_int(usage, "input_tokens") + cache_read + cache_write,
+            "cached_tokens": cache_read,
+            "cache_write_tokens": cache_write,
+        }
+    if _usage_int(usage, "prompt_token_count"):
+        return {
+            "input_tokens": _usage_int(usage, "prompt_token_count"),
+            "cached_tokens": _usage_int(usage, "cached_content_token_count"),
+            "cache_write_tokens": 0,
+        }
+    details = usage.get("prompt_tokens_details") if isinstance(usage, dict) else getattr(usage, "prompt_tokens_details", None)
+    cached = _usage_int(details, "cached_tokens") if details is not None else 0
+    return {
+        "input_tokens": _usage_int(usage, "prompt_tokens"),
+        "cached_tokens": cached or _usage_int(usage, "cached_tokens"),
+        "cache_write_tokens": 0,
+    }
+
+
+class PromptCacheStats:
+    """Thread-safe per provider/model counters of cached vs uncached input tokens"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._models: Dict[str, Dict[str, int]] = {}
+
+    def record(self, provider: str, model: str, input_tokens: int, cached_tokens: int = 0,
+               cache_write_tokens: int = 0) -> None:
+        key = f"{provider}:{model}"
+        with self._lock:
+            stats = self._models.setdefault(key, {
+                "requests": 0, "cache_hits": 0, "input_tokens": 0, "cached_tokens": 0, "cache_write_tokens": 0,
+            })
+            stats["requests"] += 1
+            stats["input_tokens"] += input_tokens
+            stats["cached_tokens"] += cached_tokens
+            stats["cache_write_tokens"] += cache_write_tokens
+            if cached_tokens > 0:
+                stats["cache_hits"] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Totals plus per-model counters; hit_rate is requests served partly from cache"""
+        with self._lock:
+            models = {key: dict(value) for key, value in self._models.items()}
+        for value in models.values():
+            value["hit_rate"] = round(value["cache_hits"] / value["requests"], 3) if value["requests"] else 0.0
+            value["cached_token_ratio"] = (
+                round(value["cached_tokens"] / value["input_tokens"], 3) if value["input_tokens"] else 0.0
+            )
+        requests = sum(value["requests"] for value in models.values())
+        hits = sum(value["cache_hits"] for value in models.values())
+        input_tokens = sum(value["input_tokens"] for value in models.values())
+        cached_tokens = sum(value["cached_tokens"] for value in models.values())
+        return {
+            "requests": requests,
+            "cache_hits": hits,
+            "hit_rate": round(hits / requests, 3) if requests else 0.0,
+            "input_tokens": input_tokens,
+            "cached_tokens": cached_tokens,
+            "cached_token_ratio": round(cached_tokens / input_tokens, 3) if input_tokens else 0.0,
+            "models": models,
+        }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._models.clear()
+
+
+_prompt_cache_stats = PromptCacheStats()
+
+
+def get_prompt_cache_stats() -> PromptCacheStats:
+    """Process-wide provider prompt-cache counters"""
+    return _prompt_cache_stats
+
+
+def record_prompt_cache_usage(provider: str, model: str, usage: Optional[Any]) -> None:
+    """Record one response's usage block (never raises)"""
+    if usage is None:
+        return
+    try:
+        counts = extract_prompt_cache_usage(usage)
+        if not counts["input_tokens"]:
+            return
+        _prompt_cache_stats.record(provider, model, **counts)
+        if counts["cached_tokens"]:
+            logger.debug(f"{provider}/{model} prompt cache hit: {counts['cached_tokens']}/{counts['input_tokens']} input tokens cached")
+    except Exception as e:
+        logger.debug(f"Could not record prompt cache usage for {provider}/{model}: {e}")
@@ -71,6 +71,11 @@ class Prompts:
     # TEAM TASK GENERATION PROMPTS
     # ==========================================
     
+    @staticmethod
+    def get_shared_context_prompt_template() -> str:
+        """Get the template for epic-level context placed before story prompts"""
+        return TeamTasksPrompts.get_shared_context_prompt_template()
+    
     @staticmethod
     def get_team_separation_prompt_template() -> str:
         """Get the template for team-separated task generation"""
@@ -7,6 +7,24 @@ Prompts for generating team-separated tasks and unified task+test generation.
 class TeamTasksPrompts:
     """Prompts for team-based task generation"""
     
+    @staticmethod
+    def get_shared_context_prompt_template() -> str:
+        """
+        Get the template for the epic-level context that leads every story prompt.
+        
+        It precedes the story-specific template so the text is an identical prefix across
+        the stories of one epic (reused by provider-side prompt caching).
+        """
+        return """**SHARED EPIC CONTEXT** (applies to every story in this epic; the story to break down follows):
+
+{document_context}
+
+{additional_context}
+
+---
+
+"""
+    
     @staticmethod
     def get_team_separation_prompt_template() -> str:
         """Get the template for team-separated task generation"""
@@ -20,10 +38,6 @@ class TeamTasksPrompts:
 **ACCEPTANCE CRITERIA:**
 {acceptance_criteria}
 
-{document_context}
-
-{additional_context}
-
 **ANALYSIS REQUIRED:**
 - Analyze the story description and acceptance criteria
 - Identify which teams (Backend/Frontend/Mobile/QA) are actually needed
@@ -149,10 +163,6 @@ Return ONLY a valid JSON array with this exact structure:
 **ACCEPTANCE CRITERIA:**
 {acceptance_criteria}
 
-{document_context}
-
-{additional_context}
-
 **ANALYSIS REQUIRED:**
 - Analyze the story description and acceptance criteria
 - Identify which teams (Backend/Frontend/Mobile/QA) are actually needed
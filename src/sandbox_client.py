@@ -3,9 +3,14 @@ OpenSandbox client: connection pooling, sandbox lifecycle, orphan cleanup.
 """
 import asyncio
 import logging
+import time
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional
 
+from .metrics import (
+    InstrumentedAsyncHTTPTransport, SANDBOX_SLOT_WAIT, SANDBOX_SLOTS_IN_USE, SANDBOX_SLOTS_LIMIT,
+)
+
 logger = logging.getLogger(__name__)
 
 # Optional OpenSandbox SDK imports (app works without them if sandbox disabled)
@@ -94,7 +99,8 @@ class SandboxClient:
             raise SandboxUnavailableError(
                 "OpenSandbox SDK not installed. Install with: pip install opensandbox opensandbox-code-interpreter"
             )
-        self._transport = httpx.AsyncHTTPTransport(
+        self._transport = InstrumentedAsyncHTTPTransport(
+            "opensandbox",
             limits=httpx.Limits(
                 max_connections=max_concurrent * 2,
                 max_keepalive_connections=max_concurrent,
@@ -109,6 +115,7 @@ class SandboxClient:
             transport=self._transport,
         )
         self._semaphore = asyncio.Semaphore(max_concurrent)
+        SANDBOX_SLOTS_LIMIT.set(max_concurrent)
         self._active_sandboxes: Dict[str, str] = {}  # job_id -> sandbox_id
 
     @property
@@ -152,7 +159,10 @@ class SandboxClient:
         Raises:
             SandboxUnavailableError: If creation fails. Semaphore is released before raise.
         """
+        waited_from = time.perf_counter()
         await self._semaphore.acquire()
+        SANDBOX_SLOT_WAIT.observe(time.perf_counter() - waited_from)
+        SANDBOX_SLOTS_IN_USE.inc()
         try:
             sandbox = await Sandbox.create(
                 image,
@@ -166,18 +176,22 @@ class SandboxClient:
             self._active_sandboxes[job_id] = sandbox.id
             return sandbox
         except SandboxException as e:
-            self._semaphore.release()
+            self._release_slot()
             raise SandboxUnavailableError(
                 f"Failed to create sandbox: [{getattr(e, 'error', e).code}] {getattr(getattr(e, 'error', e), 'message', str(e))}"
             ) from e
         except Exception as e:
-            self._semaphore.release()
+            self._release_slot()
             raise SandboxUnavailableError(f"Failed to create sandbox: {e}") from e
 
+    def _release_slot(self) -> None:
+        self._semaphore.release()
+        SANDBOX_SLOTS_IN_USE.dec()
+
     def release_sandbox(self, job_id: str) -> None:
         """Release semaphore and remove tracking entry."""
         self._active_sandboxes.pop(job_id, None)
-        self._semaphore.release()
+        self._release_slot()
 
     async def cleanup_orphaned_sandboxes(self, max_age_minutes: int = 30) -> int:
         """Kill sandboxes older than max_age that aren't tracked."""
@@ -16,6 +16,7 @@ from .sandbox_client import (
     SandboxResultError,
 )
 from .sandbox_git_ops import SandboxGitOps
+from .stage_timings import stage_timer
 
 logger = logging.getLogger(__name__)
 
@@ -244,24 +245,26 @@ class SandboxCodeRunner:
     ) -> Any:
         """Create a long-lived sandbox for APPLY → VERIFY → PACKAGE → DRAFT_PR. Full clone (for push)."""
         self._check_cancelled(cancellation_event)
-        sandbox = await self.sandbox_client.create_sandbox(
-            job_id=f"apply-{job_id}",
-            image=self.image,
-            env=self._build_env(),
-            timeout=timedelta(minutes=self.apply_timeout_minutes),
-            resource={"cpu": "2", "memory": "4Gi"},
-            network_policy=self.network_policy,
-            entrypoint=["/opt/opensandbox/code-interpreter.sh"],
-        )
+        with stage_timer(job_id, "PROVISIONING", "sandbox_create"):
+            sandbox = await self.sandbox_client.create_sandbox(
+                job_id=f"apply-{job_id}",
+                image=self.image,
+                env=self._build_env(),
+                timeout=timedelta(minutes=self.apply_timeout_minutes),
+                resource={"cpu": "2", "memory": "4Gi"},
+                network_policy=self.network_policy,
+                entrypoint=["/opt/opensandbox/code-interpreter.sh"],
+            )
         try:
             git_ops = SandboxGitOps(sandbox)
-            await git_ops.clone(
-                url=repo_url,
-                branch=branch,
-                shallow=False,
-                git_username=self.git_username,
-                git_password=self.git_password,
-            )
+            with stage_timer(job_id, "PROVISIONING", "clone"):
+                await git_ops.clone(
+                    url=repo_url,
+                    branch=branch,
+                    shallow=False,
+                    git_username=self.git_username,
+                    git_password=self.git_password,
+                )
             return sandbox
         except Exception:
             await self._safe_kill(sandbox)
@@ -16,6 +16,7 @@ from .sandbox_code_runner import SandboxCodeRunner
 from .sandbox_verifier import SandboxVerifier
 from .draft_pr_models import PlanSpec, PlanVersion
 from .artifact_store import ArtifactStore
+from .stage_timings import stage_timer
 
 logger = logging.getLogger(__name__)
 
@@ -92,12 +93,15 @@ class SandboxPipelineRunner:
         on_sandbox_created: Optional[SandboxCreatedCallback] = None,
         on_sandbox_released: Optional[SandboxReleasedCallback] = None,
     ) -> Dict[str, Any]:
-        sandbox = await self.runner.create_apply_sandbox(
-            job_id=job_id,
-            repo_url=repo_url,
-            branch=branch,
-            cancellation_event=cancellation_event,
-        )
+        # Stages and sub-steps are timed into the stage timing store (PROVISIONING.sandbox_create,
+        # PROVISIONING.clone, APPLYING.opencode_run, VERIFYING, PACKAGING.push, DRAFTING)
+        with stage_timer(job_id, "PROVISIONING"):
+            sandbox = await self.runner.create_apply_sandbox(
+                job_id=job_id,
+                repo_url=repo_url,
+                branch=branch,
+                cancellation_event=cancellation_event,
+            )
         if on_sandbox_created:
             try:
                 cb = on_sandbox_created(job_id, str(sandbox.id))
@@ -108,9 +112,10 @@ class SandboxPipelineRunner:
         try:
             async with sandbox:
                 git_ops = SandboxGitOps(sandbox)
-                apply_results = await self._apply(
-                    sandbox, git_ops, approved_plan, job_id, cancellation_event
-                )
+                with stage_timer(job_id, "APPLYING"):
+                    apply_results = await self._apply(
+                        sandbox, git_ops, approved_plan, job_id, cancellation_event
+                    )
                 self.artifact_store.store_artifact(
                     job_id, "git_diff", apply_results.get("git_diff", "")
                 )
@@ -119,7 +124,8 @@ class SandboxPipelineRunner:
                         "stage": "FAILED",
                         "error": "No changes produced by OpenCode",
                     }
-                verification_results = await self.verifier.verify(sandbox)
+                with stage_timer(job_id, "VERIFYING"):
+                    verification_results = await self.verifier.verify(sandbox)
                 self.artifact_store.store_artifact(
                     job_id, "validation_logs", verification_results
                 )
@@ -130,23 +136,26 @@ class SandboxPipelineRunner:
                         "apply_results": apply_results,
                         "verification_results": verification_results,
                     }
-                changed_files = await git_ops.get_changed_files()
-                pr_metadata = self._generate_pr_metadata(
-                    approved_plan, verification_results, changed_files
-                )
-                self.artifact_store.store_artifact(job_id, "pr_metadata", pr_metadata)
-                branch_name = self._generate_branch_name(
-                    job_id, story_key, approved_plan
-                )
-                await git_ops.create_branch_and_push(
-                    branch_name, destination_branch
-                )
-                workspace, repo_slug = await git_ops.extract_repo_info()
+                with stage_timer(job_id, "PACKAGING"):
+                    changed_files = await git_ops.get_changed_files()
+                    pr_metadata = self._generate_pr_metadata(
+                        approved_plan, verification_results, changed_files
+                    )
+                    self.artifact_store.store_artifact(job_id, "pr_metadata", pr_metadata)
+                    branch_name = self._generate_branch_name(
+                        job_id, story_key, approved_plan
+                    )
+                    with stage_timer(job_id, "PACKAGING", "push"):
+                        await git_ops.create_branch_and_push(
+                            branch_name, destination_branch
+                        )
+                    workspace, repo_slug = await git_ops.extract_repo_info()
                 await sandbox.kill()
-            pr_results = self._create_pr_via_api(
-                workspace, repo_slug, branch_name,
-                destination_branch, pr_metadata, story_key,
-            )
+            with stage_timer(job_id, "DRAFTING"):
+                pr_results = self._create_pr_via_api(
+                    workspace, repo_slug, branch_name,
+                    destination_branch, pr_metadata, story_key,
+                )
             self.artifact_store.store_artifact(job_id, "pr_metadata", {
                 **pr_metadata, **pr_results,
             })
@@ -187,9 +196,10 @@ class SandboxPipelineRunner:
         checkpoint = await git_ops.create_checkpoint()
         try:
             prompt = self._build_apply_prompt(plan_spec)
-            await self.runner.run_code_application(
-                sandbox, prompt, cancellation_event
-            )
+            with stage_timer(job_id, "APPLYING", "opencode_run"):
+                await self.runner.run_code_application(
+                    sandbox, prompt, cancellation_event
+                )
             changed_files = await git_ops.get_changed_files()
             loc_delta = await git_ops.get_loc_delta()
             self._verify_plan_apply_guard(plan_spec, changed_files, loc_delta)
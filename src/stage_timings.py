@@ -0,0 +1,166 @@
+"""
+Stage timing store for the Draft PR pipeline.
+Every pipeline stage and sandbox sub-step records a span (job, start, end, success) in a
+time-indexed store so analytics can report p50/p95 durations per stage over a date range.
+Uses one Redis sorted set per stage, scored by start time, when Redis is configured
+(spans recorded by workers are then visible to the API); otherwise keeps spans in process.
+"""
+import json
+import logging
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RETENTION_DAYS = 30
+DEFAULT_MAX_LOCAL_SPANS = 10000  # Per stage, in-process backend only
+
+
+def percentile(values: List[float], pct: float) -> Optional[float]:
+    """Nearest-rank percentile of values (None when empty)"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return ordered[int(rank) - 1]
+
+
+def _to_timestamp(value: Optional[Any]) -> Optional[float]:
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return value.timestamp()
+    return float(value)
+
+
+class StageTimingStore:
+    """
+    Time-indexed pipeline stage spans.
+
+    Stage names are pipeline stages (PLANNING, APPLYING, ...) or "<STAGE>.<step>" for
+    sub-steps (APPLYING.clone, PACKAGING.push, ...).
+    """
+
+    KEY_PREFIX = "draft_pr:timings:"
+    STAGES_KEY = "draft_pr:timings"
+
+    def __init__(self, redis_client: Any = None, retention_days: int = DEFAULT_RETENTION_DAYS,
+                 max_local_spans: int = DEFAULT_MAX_LOCAL_SPANS):
+        self.redis = redis_client
+        self.retention_seconds = int(retention_days) * 86400
+        self.max_local_spans = max_local_spans
+        self._spans: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self._lock = threading.Lock()
+
+    def configure(self, redis_client: Any = None, retention_days: Optional[int] = None) -> None:
+        self.redis = redis_client
+        if retention_days is not None:
+            self.retention_seconds = int(retention_days) * 86400
+
+    def record(self, job_id: str, stage: str, started_at: float, ended_at: float, ok: bool = True) -> None:
+        """Store one span; spans older than the retention window are pruned on write"""
+        span = {"job_id": job_id, "started_at": started_at, "ended_at": ended_at,
+                "duration": round(ended_at - started_at, 3), "ok": bool(ok)}
+        cutoff = time.time() - self.retention_seconds
+        if self.redis is not None:
+            key = self.KEY_PREFIX + stage
+            pipe = self.redis.pipeline(transaction=False)
+            pipe.zadd(key, {json.dumps(span, separators=(",", ":")): started_at})
+            pipe.zremrangebyscore(key, "-inf", cutoff)
+            pipe.expire(key, self.retention_seconds)
+            pipe.sadd(self.STAGES_KEY, stage)
+            pipe.execute()
+            return
+        with self._lock:
+            spans = self._spans[stage]
+            spans.append(span)
+            spans.sort(key=lambda s: s["started_at"])
+            drop = next((i for i, s in enumerate(spans) if s["started_at"] >= cutoff), len(spans))
+            drop = max(drop, len(spans) - self.max_local_spans)
+            if drop > 0:
+                del spans[:drop]
+
+    def stages(self) -> List[str]:
+        if self.redis is not None:
+            return sorted(s.decode("utf-8") if isinstance(s, bytes) else s
+                          for s in self.redis.smembers(self.STAGES_KEY))
+        with self._lock:
+            return sorted(stage for stage, spans in self._spans.items() if spans)
+
+    def spans(self, stage: str, start: Optional[Any] = None, end: Optional[Any] = None) -> List[Dict[str, Any]]:
+        """Spans of a stage that started within [start, end] (datetimes or epoch seconds)"""
+        low, high = _to_timestamp(start), _to_timestamp(end)
+        if self.redis is not None:
+            raw = self.redis.zrangebyscore(self.KEY_PREFIX + stage,
+                                           "-inf" if low is None else low,
+                                           "+inf" if high is None else high)
+            return [json.loads(member) for member in raw]
+        with self._lock:
+            return [dict(s) for s in self._spans.get(stage, [])
+                    if (low is None or s["started_at"] >= low) and (high is None or s["started_at"] <= high)]
+
+    def summary(self, start: Optional[Any] = None, end: Optional[Any] = None,
+                job_ids: Optional[set] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Per-stage count, failures, avg, p50 and p95 duration in seconds.
+        Durations are from successful spans only, so fast failures do not skew them;
+        job_ids restricts the spans to those jobs.
+        """
+        result = {}
+        for stage in self.stages():
+            spans = self.spans(stage, start, end)
+            if job_ids is not None:
+                spans = [s for s in spans if s["job_id"] in job_ids]
+            if not spans:
+                continue
+            durations = [s["duration"] for s in spans if s["ok"]]
+            result[stage] = {
+                "count": len(spans),
+                "failed": len(spans) - len(durations),
+                "avg": round(sum(durations) / len(durations), 3) if durations else None,
+                "p50": percentile(durations, 50),
+                "p95": percentile(durations, 95),
+            }
+        return result
+
+    @contextmanager
+    def timer(self, job_id: str, stage: str, step: Optional[str] = None) -> Iterator[None]:
+        """Record the enclosed block as a span; failures and cancellation record ok=False"""
+        name = f"{stage}.{step}" if step else stage
+        started_at = time.time()
+        ok = False
+        try:
+            yield
+            ok = True
+        finally:
+            try:
+                self.record(job_id, name, started_at, time.time(), ok=ok)
+            except Exception as e:
+                logger.warning(f"Failed to record timing for {name} of job {job_id}: {e}")
+
+
+_stage_timings = StageTimingStore()
+
+
+def configure_stage_timings(timing_config: Dict[str, Any], redis_client: Any = None) -> StageTimingStore:
+    """
+    Point the process-wide store at Redis (the job store's client, see configure_job_store)
+    or keep spans in process memory when the job store has no Redis.
+    """
+    _stage_timings.configure(redis_client, timing_config.get("retention_days", DEFAULT_RETENTION_DAYS))
+    logger.info(f"Stage timing store backend: {'redis' if redis_client is not None else 'memory'}")
+    return _stage_timings
+
+
+def get_stage_timings() -> StageTimingStore:
+    """Process-wide stage timing store"""
+    return _stage_timings
+
+
+def stage_timer(job_id: str, stage: str, step: Optional[str] = None):
+    """Time a pipeline stage or sub-step of a job in the process-wide store"""
+    return _stage_timings.timer(job_id, stage, step)
@@ -76,7 +76,7 @@ class StoryCoverageAnalyzer:
                     logger.info(f"[STORY_COVERAGE] Fetching PRD/RFC content from epic: {epic_key}")
                     
                     # Get epic issue
-                    epic_issue = self.jira_client.get_ticket(epic_key)
+                    epic_issue = self.jira_client.get_ticket(epic_key, profile='planning')
                     if epic_issue:
                         # Get PRD content
                         prd_content = self.planning_service._get_prd_content(epic_issue)
@@ -156,7 +156,7 @@ class StoryCoverageAnalyzer:
             
             # Fetch related tasks
             logger.info(f"Fetching tasks for story {story_key}")
-            tasks_data = self.jira_client.get_story_tasks(story_key)
+            tasks_data = self.jira_client.get_story_tasks(story_key, story_data=story_data)
             
             logger.info(f"Found {len(tasks_data)} tasks for story {story_key}")
             
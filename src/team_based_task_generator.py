@@ -12,6 +12,9 @@ from .planning_models import (
 )
 from .planning_prompt_engine import PlanningPromptEngine
 from .llm_client import LLMClient
+from .json_stream import IncrementalJSONArrayParser
+from .progress import report_progress
+from .token_counter import ContextBudget, count_tokens
 from .prompts import Prompts
 
 # Import for test coverage levels
@@ -279,7 +282,7 @@ class TeamBasedTaskGenerator:
         """Generate tasks using AI with team-awareness"""
         try:
             # Create team-aware prompt
-            prompt = self._create_team_separation_prompt(
+            shared_prefix, prompt = self._create_team_separation_prompt_parts(
                 story, story_type, max_cycle_days,
                 prd_content, rfc_content, additional_context
             )
@@ -288,15 +291,17 @@ class TeamBasedTaskGenerator:
             logger.info("=" * 80)
             logger.info("DEBUG: PROMPT SENT TO LLM FOR TASK GENERATION")
             logger.info("=" * 80)
-            logger.info(prompt)
+            logger.info(shared_prefix + prompt)
             logger.info("=" * 80)
             
             # Generate using LLM with enforced JSON mode
             # max_tokens=None uses config default (from LLM_MAX_TOKENS env var)
+            # The epic context prefix is identical across stories, so providers can serve it from their prompt cache
             response = self.llm_client.generate_content_json(
                 prompt=prompt,
                 system_prompt=Prompts.get_team_task_system_prompt(),
-                max_tokens=None
+                max_tokens=None,
+                cacheable_prefix=shared_prefix or None
             )
             
             # DEBUG: Log the response from LLM
@@ -330,79 +335,69 @@ class TeamBasedTaskGenerator:
                                      prd_content: Optional[Dict[str, Any]] = None,
                                      rfc_content: Optional[Dict[str, Any]] = None,
                                      additional_context: Optional[str] = None) -> str:
-        """Create AI prompt for team-separated task generation
+        """Create AI prompt for team-separated task generation (shared epic context first)"""
+        shared_prefix, story_prompt = self._create_team_separation_prompt_parts(
+            story, story_type, max_cycle_days, prd_content, rfc_content, additional_context
+        )
+        return shared_prefix + story_prompt
+    
+    def _create_team_separation_prompt_parts(self, 
+                                           story: StoryPlan, 
+                                           story_type: StoryType,
+                                           max_cycle_days: int,
+                                           prd_content: Optional[Dict[str, Any]] = None,
+                                           rfc_content: Optional[Dict[str, Any]] = None,
+                                           additional_context: Optional[str] = None) -> Tuple[str, str]:
+        """Create the (shared epic context prefix, story prompt) for team-separated task generation
         
         Uses dynamic token-based calculation for additional_context limit.
         """
         acceptance_criteria_text = [ac.format_gwt() for ac in story.acceptance_criteria]
         
-        # Get max_tokens for dynamic additional context limit
+        # Get max_tokens (reserved for the response when budgeting the context window)
         max_tokens = self._get_effective_max_tokens()
         
         # Get centralized template and format it
         template = Prompts.get_team_separation_prompt_template()
         document_context = self._format_document_context(prd_content, rfc_content, story_type) if prd_content or rfc_content else ""
         
-        # Build prompt WITHOUT additional_context first (use empty placeholder)
-        prompt_without_additional = template.format(
+        story_prompt = template.format(
             story_summary=story.summary,
             story_description=story.description,
             story_type=story_type.value,
             max_cycle_days=max_cycle_days,
-            acceptance_criteria=chr(10).join(acceptance_criteria_text),
-            document_context=document_context,
-            additional_context=""  # Placeholder
+            acceptance_criteria=chr(10).join(acceptance_criteria_text)
         )
         
         # Get system prompt for token counting
         system_prompt = Prompts.get_team_task_system_prompt()
         
-        # Count tokens used so far (system prompt + user prompt without additional_context)
-        system_tokens = self._estimate_tokens(system_prompt)
-        prompt_tokens = self._estimate_tokens(prompt_without_additional)
-        total_tokens_used = system_tokens + prompt_tokens
+        # additional_context gets what is left of the context window after the system prompt,
+        # the rest of the prompt and the response reservation (max_tokens)
+        budget = ContextBudget(*self._resolve_provider_model(), max_output_tokens=max_tokens)
+        remaining_tokens = budget.available([system_prompt, story_prompt, self._create_shared_context_prefix(document_context, "")])
+        char_limit = budget.char_limit(additional_context or "", remaining_tokens)
         
-        logger.debug(f"Token usage (team separation): system={system_tokens}, prompt={prompt_tokens}, total={total_tokens_used}")
-        
-        # Calculate remaining budget for additional_context
-        if max_tokens is not None:
-            # Reserve 30% of max_tokens for response generation
-            response_reserve = int(max_tokens * 0.3)
-            available_for_prompt = max_tokens - response_reserve
-            
-            # Calculate remaining tokens for additional_context
-            remaining_tokens = available_for_prompt - total_tokens_used
-            
-            # Ensure we have at least some buffer (don't use 100% of available)
-            remaining_tokens = max(0, remaining_tokens - 100)  # 100 token buffer
-            
-            # Convert tokens to characters (3.5 chars per token, conservative)
-            char_limit = int(remaining_tokens * 3.5)
-            
-            # Ensure non-negative (no cap - trust the dynamic calculation)
-            char_limit = max(0, char_limit)
-            
-            logger.debug(f"Additional context budget (team separation): {remaining_tokens} tokens = ~{char_limit} chars (max_tokens={max_tokens}, available_for_prompt={available_for_prompt})")
-        else:
-            # Fallback to default if max_tokens not available
-            char_limit = 1000
-            logger.debug(f"Using default additional context limit: {char_limit} chars (max_tokens not available)")
+        logger.debug(f"Additional context budget (team separation): {remaining_tokens} tokens = {char_limit} chars ({budget.counter.name}, window={budget.context_window}, max_tokens={max_tokens})")
         
         # Format additional_context with calculated limit
         additional_context_str = self._format_additional_context(additional_context, char_limit=char_limit) if additional_context else ""
         
-        # Build final prompt with properly sized additional_context
-        prompt = template.format(
-            story_summary=story.summary,
-            story_description=story.description,
-            story_type=story_type.value,
-            max_cycle_days=max_cycle_days,
-            acceptance_criteria=chr(10).join(acceptance_criteria_text),
+        return self._create_shared_context_prefix(document_context, additional_context_str), story_prompt
+    
+    def _create_shared_context_prefix(self, document_context: str, additional_context: str) -> str:
+        """
+        Epic-level context (PRD/RFC sections and additional context) that leads the prompt.
+        
+        Stories of one epic share it verbatim, so it is sent as a cacheable prefix ahead of
+        the story-specific text. Empty when there is no shared context.
+        """
+        if not document_context and not additional_context:
+            return ""
+        return Prompts.get_shared_context_prompt_template().format(
             document_context=document_context,
-            additional_context=additional_context_str
+            additional_context=additional_context
         )
-        
-        return prompt
     
     def _parse_team_task_response(self, response: str, story: StoryPlan, generate_test_cases: bool = True) -> List[TaskPlan]:
         """Parse AI JSON response into team-assigned TaskPlan objects"""
@@ -1563,21 +1558,22 @@ class TeamBasedTaskGenerator:
         return f"**ADDITIONAL CONTEXT:**\n{truncated_context}\n"
     
     def _estimate_tokens(self, text: str) -> int:
-        """Estimate token count from text (rough approximation)
-        
-        Uses ~4 characters per token as a conservative estimate.
-        For more accuracy, could use tiktoken library.
+        """Count tokens with the tokenizer for the client's provider/model
         
         Args:
-            text: Text to estimate tokens for
+            text: Text to count tokens for
             
         Returns:
-            Estimated token count
+            Token count (heuristic estimate when no tokenizer is available)
         """
         if not text:
             return 0
-        # Conservative estimate: 4 chars per token (accounts for spaces, punctuation)
-        return len(text) // 4
+        return count_tokens(text, *self._resolve_provider_model())
+    
+    def _resolve_provider_model(self) -> Tuple[Optional[str], Optional[str]]:
+        """Provider and model of the LLM client (for token counting and context window)"""
+        provider = getattr(self.llm_client, 'provider', None)
+        return getattr(self.llm_client, 'provider_name', None), getattr(provider, 'model', None)
     
     def _get_effective_max_tokens(self) -> Optional[int]:
         """Get effective max_tokens from llm_client config or provider defaults
@@ -1630,21 +1626,13 @@ class TeamBasedTaskGenerator:
         """Generate tasks with embedded test cases using unified AI prompt"""
         try:
             # Create unified prompt that generates both tasks and tests
-            prompt = self._create_unified_task_test_prompt(
+            shared_prefix, prompt = self._create_unified_task_test_prompt_parts(
                 story, story_type, max_cycle_days, test_coverage_level,
                 prd_content, rfc_content, additional_context
             )
             
-            # Generate using LLM with enforced JSON mode
-            # max_tokens=None uses config default (from LLM_MAX_TOKENS env var)
-            response = self.llm_client.generate_content_json(
-                prompt=prompt,
-                system_prompt=Prompts.get_unified_task_test_system_prompt(),
-                max_tokens=None
-            )
-            
-            # Parse response into tasks with embedded tests
-            parsed_tasks = self._parse_unified_task_test_response(response, story)
+            # Stream the completion so finished tasks are materialised (and reported) as they arrive
+            parsed_tasks = self._stream_unified_tasks(prompt, story, cacheable_prefix=shared_prefix or None)
             
             if not parsed_tasks:
                 logger.error("Unified task+test parsing returned empty list")
@@ -1657,6 +1645,78 @@ class TeamBasedTaskGenerator:
             logger.error(f"Unified task+test generation failed: {str(e)}")
             return []
     
+    def _stream_unified_tasks(self, prompt: str, story: StoryPlan, cacheable_prefix: Optional[str] = None) -> List[TaskPlan]:
+        """
+        Stream unified task+test generation, building each TaskPlan as soon as its JSON
+        object completes. Tasks finished before a mid-stream failure or truncation are kept;
+        if nothing parsed incrementally, the full text goes through the regular parser, and
+        if that fails too the request is repeated with enforced JSON mode (streaming has none).
+        cacheable_prefix is the shared epic context sent ahead of prompt.
+        """
+        parser = IncrementalJSONArrayParser()
+        tasks: List[TaskPlan] = []
+        chunks: List[str] = []
+        received_chars = 0
+        last_reported_chars = 0
+        story_label = story.summary[:60]
+        
+        def add_tasks(task_dicts: List[Any]) -> None:
+            for task_data in task_dicts:
+                if not isinstance(task_data, dict):
+                    continue
+                try:
+                    task = self._create_task_with_tests_from_dict(task_data, story, len(tasks) + 1)
+                except Exception as e:
+                    logger.error(f"Error parsing streamed task {len(tasks) + 1}: {str(e)}")
+                    continue
+                if task:
+                    tasks.append(task)
+                    report_progress(
+                        message=f"Generating tasks for '{story_label}': {len(tasks)} task(s) ready",
+                        streamed_tasks=len(tasks),
+                        streamed_chars=received_chars
+                    )
+        
+        try:
+            # max_tokens=None uses config default (from LLM_MAX_TOKENS env var)
+            for chunk in self.llm_client.stream_content(
+                prompt=prompt,
+                system_prompt=Prompts.get_unified_task_test_system_prompt(),
+                max_tokens=None,
+                cacheable_prefix=cacheable_prefix
+            ):
+                chunks.append(chunk)
+                received_chars += len(chunk)
+                add_tasks(parser.feed(chunk))
+                if received_chars - last_reported_chars >= 2000:
+                    last_reported_chars = received_chars
+                    report_progress(
+                        message=f"Generating tasks for '{story_label}': {received_chars} characters received",
+                        streamed_tasks=len(tasks),
+                        streamed_chars=received_chars
+                    )
+        except Exception as e:
+            if not tasks:
+                raise
+            logger.warning(f"Unified task+test stream failed after {len(tasks)} completed tasks, keeping them: {str(e)}")
+            return tasks
+        
+        if not parser.finished and tasks:
+            logger.warning(f"Unified task+test response ended before the JSON array closed; keeping {len(tasks)} completed tasks")
+        if not tasks:
+            # Nothing recognisable streamed (e.g. wrapped or fenced JSON); parse the whole response
+            tasks = self._parse_unified_task_test_response("".join(chunks), story)
+        if not tasks:
+            logger.warning("Streamed unified task+test response did not parse; retrying with enforced JSON mode")
+            response = self.llm_client.generate_content_json(
+                prompt=prompt,
+                system_prompt=Prompts.get_unified_task_test_system_prompt(),
+                max_tokens=None,
+                cacheable_prefix=cacheable_prefix
+            )
+            tasks = self._parse_unified_task_test_response(response, story)
+        return tasks
+    
     def _create_unified_task_test_prompt(self, 
                                        story: StoryPlan, 
                                        story_type: StoryType,
@@ -1665,84 +1725,59 @@ class TeamBasedTaskGenerator:
                                        prd_content: Optional[Dict[str, Any]] = None,
                                        rfc_content: Optional[Dict[str, Any]] = None,
                                        additional_context: Optional[str] = None) -> str:
-        """Create comprehensive prompt for unified task and test generation
+        """Create comprehensive prompt for unified task and test generation (shared epic context first)"""
+        shared_prefix, story_prompt = self._create_unified_task_test_prompt_parts(
+            story, story_type, max_cycle_days, test_coverage_level, prd_content, rfc_content, additional_context
+        )
+        return shared_prefix + story_prompt
+    
+    def _create_unified_task_test_prompt_parts(self, 
+                                             story: StoryPlan, 
+                                             story_type: StoryType,
+                                             max_cycle_days: int,
+                                             test_coverage_level: TestCoverageLevel,
+                                             prd_content: Optional[Dict[str, Any]] = None,
+                                             rfc_content: Optional[Dict[str, Any]] = None,
+                                             additional_context: Optional[str] = None) -> Tuple[str, str]:
+        """Create the (shared epic context prefix, story prompt) for unified task and test generation
         
         Uses dynamic token-based calculation for additional_context limit.
         """
         acceptance_criteria_text = [ac.format_gwt() for ac in story.acceptance_criteria]
         test_count = self._get_test_count_for_coverage(test_coverage_level)
         
-        # Get max_tokens for dynamic additional context limit
+        # Get max_tokens (reserved for the response when budgeting the context window)
         max_tokens = self._get_effective_max_tokens()
         
         # Get centralized template and format it
         template = Prompts.get_unified_task_test_prompt_template()
         document_context = self._format_document_context(prd_content, rfc_content, story_type) if prd_content or rfc_content else ""
         
-        # Build prompt WITHOUT additional_context first (use empty placeholder)
-        prompt_without_additional = template.format(
+        story_prompt = template.format(
             story_summary=story.summary,
             story_description=story.description,
             story_type=story_type.value,
             max_cycle_days=max_cycle_days,
             test_coverage_level=test_coverage_level.value,
             test_count=test_count,
-            acceptance_criteria=chr(10).join(acceptance_criteria_text),
-            document_context=document_context,
-            additional_context=""  # Placeholder
+            acceptance_criteria=chr(10).join(acceptance_criteria_text)
         )
         
         # Get system prompt for token counting (use same system prompt as team task)
         system_prompt = Prompts.get_team_task_system_prompt()
         
-        # Count tokens used so far (system prompt + user prompt without additional_context)
-        system_tokens = self._estimate_tokens(system_prompt)
-        prompt_tokens = self._estimate_tokens(prompt_without_additional)
-        total_tokens_used = system_tokens + prompt_tokens
+        # additional_context gets what is left of the context window after the system prompt,
+        # the rest of the prompt and the response reservation (max_tokens)
+        budget = ContextBudget(*self._resolve_provider_model(), max_output_tokens=max_tokens)
+        remaining_tokens = budget.available([system_prompt, story_prompt, self._create_shared_context_prefix(document_context, "")])
+        char_limit = budget.char_limit(additional_context or "", remaining_tokens)
         
-        logger.debug(f"Token usage (unified task/test): system={system_tokens}, prompt={prompt_tokens}, total={total_tokens_used}")
-        
-        # Calculate remaining budget for additional_context
-        if max_tokens is not None:
-            # Reserve 30% of max_tokens for response generation
-            response_reserve = int(max_tokens * 0.3)
-            available_for_prompt = max_tokens - response_reserve
-            
-            # Calculate remaining tokens for additional_context
-            remaining_tokens = available_for_prompt - total_tokens_used
-            
-            # Ensure we have at least some buffer (don't use 100% of available)
-            remaining_tokens = max(0, remaining_tokens - 100)  # 100 token buffer
-            
-            # Convert tokens to characters (3.5 chars per token, conservative)
-            char_limit = int(remaining_tokens * 3.5)
-            
-            # Ensure non-negative (no cap - trust the dynamic calculation)
-            char_limit = max(0, char_limit)
-            
-            logger.debug(f"Additional context budget (unified task/test): {remaining_tokens} tokens = ~{char_limit} chars (max_tokens={max_tokens}, available_for_prompt={available_for_prompt})")
-        else:
-            # Fallback to default if max_tokens not available
-            char_limit = 1000
-            logger.debug(f"Using default additional context limit: {char_limit} chars (max_tokens not available)")
+        logger.debug(f"Additional context budget (unified task/test): {remaining_tokens} tokens = {char_limit} chars ({budget.counter.name}, window={budget.context_window}, max_tokens={max_tokens})")
         
         # Format additional_context with calculated limit
         additional_context_str = self._format_additional_context(additional_context, char_limit=char_limit) if additional_context else ""
         
-        # Build final prompt with properly sized additional_context
-        prompt = template.format(
-            story_summary=story.summary,
-            story_description=story.description,
-            story_type=story_type.value,
-            max_cycle_days=max_cycle_days,
-            test_coverage_level=test_coverage_level.value,
-            test_count=test_count,
-            acceptance_criteria=chr(10).join(acceptance_criteria_text),
-            document_context=document_context,
-            additional_context=additional_context_str
-        )
-        
-        return prompt
+        return self._create_shared_context_prefix(document_context, additional_context_str), story_prompt
     
     def _parse_unified_task_test_response(self, response: str, story: StoryPlan) -> List[TaskPlan]:
         """Parse LLM response containing tasks with embedded test cases"""
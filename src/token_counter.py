@@ -0,0 +1,236 @@
+"""
+Token counting and context-window budgeting for prompt construction.
+
+Counters are chosen per provider and model: OpenAI and Kimi use their tiktoken BPE
+vocabularies, while Claude and Gemini (no local tokenizer published) use cl100k with a
+safety factor. Vocabularies load lazily on first use and are cached for the process.
+Without tiktoken, or when a vocabulary cannot be loaded, a fast regex-based estimate is
+used instead.
+
+ContextBudget splits a model's context window (minus the response reservation and fixed
+prompt parts) across variable prompt sections such as ticket, PRD, RFC, pull requests,
+commits and additional context.
+"""
+import logging
+import math
+import re
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Context windows (input + output tokens) by model-name prefix, longest prefix wins
+CONTEXT_WINDOWS: Dict[str, Dict[str, int]] = {
+    'openai': {'gpt-5': 400000, 'gpt-4.1': 1047576, 'gpt-4o': 128000, 'gpt-4-turbo': 128000,
+               'gpt-4': 8192, 'gpt-3.5': 16385, 'o1': 200000, 'o3': 200000, 'o4': 200000},
+    'claude': {'claude': 200000},
+    'gemini': {'gemini-1.5': 1048576, 'gemini-2': 1048576, 'gemini': 32768},
+    'kimi': {'moonshot-v1-8k': 8192, 'moonshot-v1-32k': 32768, 'moonshot-v1-128k': 131072,
+             'kimi-k2': 262144, 'kimi-latest': 131072},
+}
+DEFAULT_CONTEXT_WINDOW = 32768
+
+# Providers without a public local tokenizer: cl100k count times a safety factor
+_APPROXIMATE_FACTORS = {'claude': 1.15, 'gemini': 1.1}
+
+_WORD_RE = re.compile(r"\w+|[^\w\s]", re.UNICODE)
+
+
+class HeuristicTokenCounter:
+    """Fast estimate: ~4 chars per token for ASCII words, 1 per CJK/non-ASCII char, 1 per symbol"""
+
+    name = "heuristic"
+
+    def count(self, text: str) -> int:
+        if not text:
+            return 0
+        tokens = 0
+        for piece in _WORD_RE.findall(text):
+            if piece.isascii():
+                tokens += math.ceil(len(piece) / 4)
+            else:
+                tokens += len(piece)
+        return tokens
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        """Longest prefix estimated to fit max_tokens"""
+        if max_tokens <= 0:
+            return ""
+        total = self.count(text)
+        if total <= max_tokens:
+            return text
+        return text[:int(len(text) * max_tokens / total)]
+
+
+class TiktokenCounter:
+    """Exact BPE counts from a tiktoken encoding, optionally scaled for other tokenizers"""
+
+    def __init__(self, encoding, factor: float = 1.0):
+        self.encoding = encoding
+        self.factor = factor
+        self.name = encoding.name if factor == 1.0 else f"{encoding.name}~x{factor}"
+
+    def count(self, text: str) -> int:
+        if not text:
+            return 0
+        tokens = len(self.encoding.encode(text, disallowed_special=()))
+        return math.ceil(tokens * self.factor)
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        """Longest prefix (on a token boundary) that fits max_tokens"""
+        if max_tokens <= 0:
+            return ""
+        tokens = self.encoding.encode(text, disallowed_special=())
+        limit = int(max_tokens / self.factor)
+        if len(tokens) <= limit:
+            return text
+        return self.encoding.decode(tokens[:limit])
+
+
+@lru_cache(maxsize=None)
+def _load_encoding(name: str):
+    """Load a tiktoken vocabulary once per process (None if unavailable)"""
+    try:
+        import tiktoken
+        return tiktoken.get_encoding(name)
+    except ImportError:
+        logger.info("tiktoken not installed, using heuristic token counts")
+    except Exception as e:
+        logger.warning(f"Could not load tokenizer '{name}', using heuristic token counts: {e}")
+    return None
+
+
+def _openai_encoding_name(model: str) -> str:
+    if model.startswith(('gpt-4o', 'gpt-4.1', 'gpt-5', 'o1', 'o3', 'o4')):
+        return 'o200k_base'
+    return 'cl100k_base'
+
+
+@lru_cache(maxsize=64)
+def get_token_counter(provider: Optional[str] = None, model: Optional[str] = None):
+    """Token counter for a provider/model (cached; falls back to the heuristic counter)"""
+    provider = str(provider or '').lower()
+    model = str(model or '').lower()
+    if provider == 'openai':
+        encoding = _load_encoding(_openai_encoding_name(model))
+        factor = 1.0
+    elif provider == 'kimi':
+        encoding = _load_encoding('cl100k_base')  # Moonshot's tokenizer is close to cl100k
+        factor = 1.0
+    elif provider in _APPROXIMATE_FACTORS:
+        encoding = _load_encoding('cl100k_base')
+        factor = _APPROXIMATE_FACTORS[provider]
+    else:
+        encoding = None
+        factor = 1.0
+    if encoding is None:
+        return HeuristicTokenCounter()
+    return TiktokenCounter(encoding, factor)
+
+
+def count_tokens(text: str, provider: Optional[str] = None, model: Optional[str] = None) -> int:
+    """Count tokens in text for a provider/model"""
+    return get_token_counter(provider, model).count(text)
+
+
+def get_context_window(provider: Optional[str], model: Optional[str]) -> int:
+    """Context window (tokens) for a provider/model, by longest matching model prefix"""
+    windows = CONTEXT_WINDOWS.get(str(provider or '').lower(), {})
+    model = str(model or '').lower()
+    best = None
+    for prefix, window in windows.items():
+        if model.startswith(prefix) and (best is None or len(prefix) > len(best[0])):
+            best = (prefix, window)
+    return best[1] if best else DEFAULT_CONTEXT_WINDOW
+
+
+def allocate_token_budget(budget: int, demands: Dict[str, int],
+                          weights: Optional[Dict[str, float]] = None) -> Dict[str, int]:
+    """
+    Split budget across sections by weighted water-filling: sections needing less than
+    their weighted share keep everything, and what they leave is shared by the rest.
+
+    Args:
+        budget: Tokens available for all sections together
+        demands: Tokens each section needs untruncated
+        weights: Relative share per section (default 1.0)
+
+    Returns:
+        Token allowance per section (never more than its demand)
+    """
+    weights = weights or {}
+    allocation = {name: 0 for name in demands}
+    remaining = max(0, budget)
+    open_sections = {name for name, need in demands.items() if need > 0}
+    while open_sections and remaining > 0:
+        total_weight = sum(weights.get(name, 1.0) for name in open_sections)
+        satisfied = set()
+        for name in open_sections:
+            share = remaining * weights.get(name, 1.0) / total_weight
+            if demands[name] - allocation[name] <= share:
+                satisfied.add(name)
+        if satisfied:
+            for name in satisfied:
+                remaining -= demands[name] - allocation[name]
+                allocation[name] = demands[name]
+            open_sections -= satisfied
+            continue
+        # Nobody fits: split what is left by weight and stop
+        for name in open_sections:
+            allocation[name] += int(remaining * weights.get(name, 1.0) / total_weight)
+        break
+    return allocation
+
+
+class ContextBudget:
+    """Fit variable prompt sections into a model's context window"""
+
+    def __init__(self, provider: Optional[str], model: Optional[str], max_output_tokens: Optional[int] = None,
+                 safety_margin: float = 0.05, context_window: Optional[int] = None):
+        """
+        Args:
+            provider / model: Select the token counter and context window
+            max_output_tokens: Tokens reserved for the response
+            safety_margin: Fraction of the window left unused (tokenizer/formatting slack)
+            context_window: Override the looked-up window
+        """
+        self.counter = get_token_counter(provider, model)
+        self.context_window = context_window or get_context_window(provider, model)
+        self.max_output_tokens = max_output_tokens or 0
+        self.safety_margin = safety_margin
+
+    def count(self, text: str) -> int:
+        return self.counter.count(text)
+
+    def available(self, fixed_texts: Iterable[str] = ()) -> int:
+        """Tokens left for variable sections after output reservation, margin and fixed text"""
+        usable = int(self.context_window * (1 - self.safety_margin)) - self.max_output_tokens
+        return max(0, usable - sum(self.count(text) for text in fixed_texts if text))
+
+    def allocate(self, sections: Dict[str, str], fixed_texts: Iterable[str] = (),
+                 weights: Optional[Dict[str, float]] = None) -> Dict[str, int]:
+        """Token allowance per section"""
+        demands = {name: self.count(text) for name, text in sections.items()}
+        return allocate_token_budget(self.available(fixed_texts), demands, weights)
+
+    def fit(self, sections: Dict[str, str], fixed_texts: Iterable[str] = (),
+            weights: Optional[Dict[str, float]] = None,
+            truncate: Optional[Callable[[str, int], str]] = None) -> Dict[str, str]:
+        """
+        Sections truncated to their allowance. `truncate(text, char_limit)` lets callers
+        keep their own boundary-aware truncation; the char limit comes from the tokenizer.
+        """
+        allocation = self.allocate(sections, fixed_texts, weights)
+        fitted = {}
+        for name, text in sections.items():
+            if not text or self.count(text) <= allocation[name]:
+                fitted[name] = text
+                continue
+            char_limit = len(self.counter.truncate(text, allocation[name]))
+            fitted[name] = truncate(text, char_limit) if truncate else text[:char_limit]
+            logger.debug(f"Context budget: truncated {name} to {allocation[name]} tokens ({char_limit} chars)")
+        return fitted
+
+    def char_limit(self, text: str, max_tokens: int) -> int:
+        """Characters of text that fit within max_tokens"""
+        return len(self.counter.truncate(text, max_tokens))
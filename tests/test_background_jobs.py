@@ -4,7 +4,7 @@ Tests for ARQ background jobs, job queue, and job management endpoints
 """
 import pytest
 from unittest.mock import Mock, patch, AsyncMock, MagicMock
-from datetime import datetime
+from datetime import datetime, timedelta
 from fastapi.testclient import TestClient
 import uuid
 
@@ -151,6 +151,54 @@ class TestJobStatusEndpoints:
         data = response.json()
         assert len(data["jobs"]) == 2
     
+    def test_list_jobs_cursor_pagination(self, client, clear_jobs):
+        """Test following next_cursor through every job"""
+        for i in range(3):
+            jobs[f"job-{i}"] = JobStatus(
+                job_id=f"job-{i}",
+                job_type="batch",
+                status="completed",
+                progress={},
+                started_at=datetime.now() - timedelta(minutes=i),
+                processed_tickets=0,
+                successful_tickets=0,
+                failed_tickets=0
+            )
+        
+        data = client.get("/jobs?limit=2").json()
+        assert [job["job_id"] for job in data["jobs"]] == ["job-0", "job-1"]
+        assert data["next_cursor"]
+        
+        data = client.get(f"/jobs?limit=2&cursor={data['next_cursor']}").json()
+        assert [job["job_id"] for job in data["jobs"]] == ["job-2"]
+        assert data["next_cursor"] is None
+        assert data["total"] == 3
+        
+        assert client.get("/jobs?cursor=garbage").status_code == 400
+    
+    def test_list_jobs_cursor_ties_and_job_id_filter(self, client, clear_jobs):
+        """Test that jobs started together page by job_id and a job_id filter gets no cursor"""
+        started_at = datetime.now()
+        for job_id in ["job-b", "job-a", "job-c"]:
+            jobs[job_id] = JobStatus(
+                job_id=job_id,
+                job_type="batch",
+                status="completed",
+                progress={},
+                started_at=started_at,
+                processed_tickets=0,
+                successful_tickets=0,
+                failed_tickets=0
+            )
+        
+        first = client.get("/jobs?limit=2").json()
+        second = client.get(f"/jobs?limit=2&cursor={first['next_cursor']}").json()
+        assert [job["job_id"] for job in first["jobs"] + second["jobs"]] == ["job-c", "job-b", "job-a"]
+        
+        data = client.get("/jobs?job_id=job-a&limit=1&offset=0").json()
+        assert [job["job_id"] for job in data["jobs"]] == ["job-a"]
+        assert data["next_cursor"] is None
+    
     def test_list_jobs_filter_by_status(self, client, clear_jobs):
         """Test filtering jobs by status"""
         jobs["job-1"] = JobStatus(
@@ -288,16 +336,8 @@ class TestAsyncModeEndpoints:
             mock_generator = Mock()
             mock_get_gen.return_value = mock_generator
             
-            mock_pool = AsyncMock()
-            mock_job = Mock()
-            mock_job.job_id = "test-job-id"
-            mock_pool.enqueue_job = AsyncMock(return_value=mock_job)
-            
-            # Patch get_redis_pool to return our mock (async function)
-            async def mock_get_redis():
-                return mock_pool
-            
-            with patch('api.routes.generation.get_redis_pool', side_effect=mock_get_redis):
+            # Patch the scheduler so the job is queued without Redis
+            with patch('api.routes.generation.submit_job', AsyncMock(return_value="test-job-id")):
                 response = client.post(
                     "/generate/single",
                     json={
@@ -0,0 +1,86 @@
+"""
+Tests for the blocking-call executor used by ARQ workers
+"""
+import asyncio
+import threading
+import time
+import pytest
+from unittest.mock import patch
+
+from api import blocking_executor
+from api.blocking_executor import run_blocking, configure_executor, shutdown_executor, JobCancelledError
+
+
+@pytest.fixture(autouse=True)
+def fresh_executor():
+    """Give each test its own pool"""
+    configure_executor(4)
+    yield
+    shutdown_executor(wait=True)
+
+
+class TestRunBlocking:
+    """Test run_blocking"""
+
+    def test_returns_result_with_args_and_kwargs(self):
+        """Test that positional and keyword arguments are forwarded"""
+        def add(a, b, scale=1):
+            return (a + b) * scale
+
+        assert asyncio.run(run_blocking(add, 1, 2, scale=3)) == 9
+
+    def test_runs_off_event_loop_thread(self):
+        """Test that the callable does not run on the event loop thread"""
+        async def run():
+            loop_thread = threading.get_ident()
+            call_thread = await run_blocking(threading.get_ident)
+            return loop_thread, call_thread
+
+        loop_thread, call_thread = asyncio.run(run())
+        assert loop_thread != call_thread
+
+    def test_concurrent_calls_overlap(self):
+        """Test that several blocking calls run in parallel instead of serializing"""
+        async def run():
+            t0 = time.perf_counter()
+            await asyncio.gather(*(run_blocking(time.sleep, 0.2) for _ in range(4)))
+            return time.perf_counter() - t0
+
+        assert asyncio.run(run()) < 0.6
+
+    def test_exception_propagates(self):
+        """Test that exceptions from the callable surface to the awaiting job"""
+        def boom():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            asyncio.run(run_blocking(boom))
+
+    def test_cancel_check_raises_job_cancelled(self):
+        """Test that a cancelled job stops waiting on a long call"""
+        async def cancelled():
+            return True
+
+        async def run():
+            with patch.object(blocking_executor, "CANCELLATION_POLL_INTERVAL", 0.05):
+                await run_blocking(time.sleep, 1.0, cancel_check=cancelled)
+
+        t0 = time.perf_counter()
+        with pytest.raises(JobCancelledError):
+            asyncio.run(run())
+        assert time.perf_counter() - t0 < 1.0
+
+    def test_cancel_check_not_cancelled_returns_result(self):
+        """Test that a running job gets its result when not cancelled"""
+        async def not_cancelled():
+            return False
+
+        def slow():
+            time.sleep(0.15)
+            return "done"
+
+        async def run():
+            with patch.object(blocking_executor, "CANCELLATION_POLL_INTERVAL", 0.05):
+                return await run_blocking(slow, cancel_check=not_cancelled)
+
+        assert asyncio.run(run()) == "done"
@@ -25,9 +25,11 @@ class TestBulkTicketCreator:
         """Mock JIRA client"""
         client = Mock(spec=JiraClient)
         client.get_project_key_from_epic.return_value = "TEST"
-        client.create_story_ticket.return_value = "STORY-123"
-        client.create_task_ticket.return_value = "TASK-456"
-        client.create_issue_link.return_value = True
+        client.create_story_tickets.side_effect = lambda plans, *args, **kwargs: [
+            {"key": f"STORY-{123 + i}", "error": None} for i in range(len(plans))]
+        client.create_task_tickets.side_effect = lambda plans, *args, **kwargs: [
+            {"key": f"TASK-{456 + i}", "error": None} for i in range(len(plans))]
+        client.create_issue_links.side_effect = lambda links, *args, **kwargs: [True] * len(links)
         client.validate_ticket_relationships.return_value = {
             "valid": True,
             "issues": []
@@ -157,8 +159,8 @@ class TestBulkTicketCreator:
         
         # Verify JIRA client methods were called
         mock_jira_client.get_project_key_from_epic.assert_called_with("TEST-100")
-        mock_jira_client.create_story_ticket.assert_called_once()
-        mock_jira_client.create_task_ticket.assert_called_once()
+        mock_jira_client.create_story_tickets.assert_called_once()
+        mock_jira_client.create_task_tickets.assert_called_once()
         mock_jira_client.validate_ticket_relationships.assert_called_with("TEST-100")
     
     def test_story_creation_only(self, bulk_creator, sample_epic_plan):
@@ -193,13 +195,42 @@ class TestBulkTicketCreator:
     def test_creation_with_jira_failure(self, bulk_creator, sample_epic_plan, mock_jira_client):
         """Test handling JIRA creation failures"""
         # Mock JIRA failure
-        mock_jira_client.create_story_ticket.return_value = None
+        mock_jira_client.create_story_tickets.side_effect = None
+        mock_jira_client.create_story_tickets.return_value = [{"key": None, "error": "summary: Field is required"}]
         
         result = bulk_creator.create_epic_structure(sample_epic_plan, dry_run=False)
         
         assert result["success"] is False
         assert len(result["failed_creations"]) > 0
         assert result["failed_creations"][0]["type"] == "story"
+        assert result["failed_creations"][0]["error"] == "summary: Field is required"
+        mock_jira_client.create_task_tickets.assert_not_called()
+    
+    def test_partial_task_failure_and_links(self, bulk_creator, mock_jira_client):
+        """Test that tasks are created in one bulk call, failures are reported per task and links run together"""
+        tasks = [
+            TaskPlan(summary=f"Task {n}", purpose="p", scopes=[], expected_outcomes=[],
+                     depends_on_tasks=["Task 1"] if n > 1 else [])
+            for n in (1, 2, 3)
+        ]
+        mock_jira_client.create_task_tickets.side_effect = None
+        mock_jira_client.create_task_tickets.return_value = [
+            {"key": "TASK-1", "error": None},
+            {"key": None, "error": "issuetype: invalid"},
+            {"key": "TASK-3", "error": None},
+        ]
+        mock_jira_client.create_issue_links.side_effect = lambda links, *args, **kwargs: [
+            link["link_type"] == "Blocks" for link in links]
+        
+        result = bulk_creator.create_tasks_only(tasks, ["STORY-1"], dry_run=False)
+        
+        assert result["created_tickets"]["tasks"] == ["TASK-1", "TASK-3"]
+        assert result["failed_creations"] == [{"type": "task", "summary": "Task 2", "parent_story": "STORY-1",
+                                               "error": "issuetype: invalid"}]
+        mock_jira_client.create_issue_links.assert_called_once()
+        assert [(r["from"], r["to"]) for r in result["relationships_created"]] == [("TASK-1", "TASK-3")]
+        assert {r["type"] for r in result["relationships_failed"]} == {"Work item split"}
+        assert len(result["relationships_failed"]) == 2
     
     def test_creation_with_project_key_failure(self, bulk_creator, sample_epic_plan, mock_jira_client):
         """Test handling project key extraction failure"""
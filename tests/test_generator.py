@@ -179,6 +179,57 @@ class TestDescriptionGenerator:
         # Should only include first line of commit message
         assert 'Detailed description' not in formatted
 
+    
+    def test_process_batch_concurrent_preserves_order(self, description_generator, mock_jira_client, sample_ticket_data):
+        """Test concurrent batch mode returns results in search order and streams each result"""
+        keys = [f'TEST-{i}' for i in range(8)]
+        mock_jira_client.iter_search_tickets.return_value = iter([{'key': k} for k in keys])
+        mock_jira_client.get_ticket.side_effect = lambda key, **kwargs: {**sample_ticket_data, 'key': key}
+        streamed = []
+        
+        results = description_generator.process_batch(
+            'project = TEST', dry_run=True, concurrency=4, on_result=lambda r: streamed.append(r.ticket_key)
+        )
+        
+        assert [r.ticket_key for r in results] == keys
+        assert all(r.success for r in results)
+        assert sorted(streamed) == sorted(keys)
+    
+    def test_backend_limiter_caps_llm_calls(self, mock_jira_client, mock_llm_client, sample_ticket_data):
+        """Test that per-backend limits cap in-flight LLM calls across concurrent tickets"""
+        import threading
+        import time
+        from src.backend_limiter import BackendLimiter
+        
+        lock = threading.Lock()
+        in_flight = {'now': 0, 'peak': 0}
+        
+        def slow_generate(prompt, max_tokens=None):
+            with lock:
+                in_flight['now'] += 1
+                in_flight['peak'] = max(in_flight['peak'], in_flight['now'])
+            time.sleep(0.05)
+            with lock:
+                in_flight['now'] -= 1
+            return "**Purpose:** done"
+        
+        mock_llm_client.provider.generate_description.side_effect = slow_generate
+        mock_jira_client.iter_search_tickets.return_value = iter([{'key': f'TEST-{i}'} for i in range(6)])
+        mock_jira_client.get_ticket.side_effect = lambda key, **kwargs: {**sample_ticket_data, 'key': key}
+        generator = DescriptionGenerator(
+            jira_client=mock_jira_client,
+            bitbucket_client=None,
+            confluence_client=None,
+            llm_client=mock_llm_client,
+            prompt_template="Test template: {{ticket_key}}",
+            backend_limiter=BackendLimiter({'llm': 2})
+        )
+        
+        results = generator.process_batch('project = TEST', dry_run=True, concurrency=6)
+        
+        assert len(results) == 6
+        assert in_flight['peak'] == 2
+
 
 if __name__ == '__main__':
     pytest.main([__file__])
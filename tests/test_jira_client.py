@@ -1,4 +1,7 @@
+import threading
+
 import pytest
+import requests
 from unittest.mock import Mock, patch
 from src.jira_client import JiraClient
 
@@ -386,5 +389,249 @@ class TestJiraClient:
         assert result is False
 
 
+class TestBulkTicketFetch:
+
+    @pytest.fixture
+    def jira_client(self):
+        client = JiraClient(
+            server_url="https://test.atlassian.net",
+            username="test@example.com",
+            api_token="test-token",
+            prd_custom_field="customfield_10001"
+        )
+        client.session = Mock()
+        return client
+
+    @staticmethod
+    def _search_response(keys, is_last=True, next_page_token=None):
+        response = Mock()
+        response.raise_for_status.return_value = None
+        response.json.return_value = {
+            'issues': [{'key': key, 'fields': {'summary': f'Summary {key}'}} for key in keys],
+            'isLast': is_last,
+            'nextPageToken': next_page_token,
+        }
+        return response
+
+    def test_get_tickets_uses_one_search_in_input_order(self, jira_client):
+        """Test that keys are fetched with a single `key in (...)` search and returned in input order"""
+        jira_client.session.post.return_value = self._search_response(['PROJ-2', 'PROJ-1', 'PROJ-3'])
+
+        results = jira_client.get_tickets(['PROJ-3', 'PROJ-1', 'PROJ-2', 'PROJ-1'])
+
+        assert list(results) == ['PROJ-3', 'PROJ-1', 'PROJ-2']
+        assert all(r['issue']['key'] == key and r['error'] is None for key, r in results.items())
+        assert jira_client.session.post.call_count == 1
+        payload = jira_client.session.post.call_args[1]['json']
+        assert payload['jql'] == 'key in ("PROJ-3","PROJ-1","PROJ-2")'
+        assert 'issuelinks' in payload['fields']
+        jira_client.session.get.assert_not_called()
+
+    def test_get_tickets_follows_pages_and_chunks(self, jira_client):
+        """Test that large key sets are chunked and each chunk is paginated"""
+        keys = [f'PROJ-{i}' for i in range(150)]
+        responses = {
+            'PROJ-0': [self._search_response(keys[:60], is_last=False, next_page_token='t1'),
+                       self._search_response(keys[60:100])],
+            'PROJ-100': [self._search_response(keys[100:])],
+        }
+
+        def post(url, json=None, timeout=None):
+            first = json['jql'].split('"')[1]
+            return responses[first].pop(0)
+
+        jira_client.session.post.side_effect = post
+        results = jira_client.get_tickets(keys)
+
+        assert jira_client.session.post.call_count == 3
+        assert [r['issue']['key'] for r in results.values()] == keys
+
+    def test_get_tickets_reports_missing_and_invalid_keys(self, jira_client):
+        """Test per-key errors: invalid keys are not sent, missing keys fall back to a single GET"""
+        jira_client.session.post.return_value = self._search_response(['PROJ-1'])
+        not_found = Mock()
+        not_found.raise_for_status.side_effect = requests.exceptions.HTTPError("404")
+        jira_client.session.get.return_value = not_found
+
+        results = jira_client.get_tickets(['PROJ-1', 'PROJ-404', 'bad key"'])
+
+        assert results['PROJ-1']['issue']['key'] == 'PROJ-1'
+        assert results['PROJ-404']['issue'] is None and 'PROJ-404' in results['PROJ-404']['error']
+        assert results['bad key"']['error'].startswith('Invalid ticket key')
+        assert 'bad key' not in jira_client.session.post.call_args[1]['json']['jql']
+
+    def test_get_epic_keys_from_stories(self, jira_client):
+        """Test that epic keys for many stories come from one search over the parent field"""
+        response = Mock()
+        response.raise_for_status.return_value = None
+        response.json.return_value = {'issues': [
+            {'key': 'STORY-1', 'fields': {'parent': {'key': 'EPIC-1'}}},
+            {'key': 'STORY-2', 'fields': {}},
+        ], 'isLast': True}
+        jira_client.session.post.return_value = response
+        jira_client.session.get.return_value = Mock(**{'raise_for_status.side_effect': requests.exceptions.HTTPError("404")})
+
+        assert jira_client.get_epic_keys_from_stories(['STORY-1', 'STORY-2', 'STORY-3']) == {
+            'STORY-1': 'EPIC-1', 'STORY-2': None, 'STORY-3': None}
+        assert 'parent' in jira_client.session.post.call_args[1]['json']['fields']
+
+
+
+class TestFieldProfiles:
+
+    @pytest.fixture
+    def jira_client(self):
+        client = JiraClient(
+            server_url="https://test.atlassian.net",
+            username="test@example.com",
+            api_token="test-token",
+            prd_custom_field="customfield_10001",
+            mandays_custom_field="customfield_10003"
+        )
+        client.session = Mock()
+        return client
+
+    def test_minimal_profile(self, jira_client):
+        assert jira_client._get_fields_list('minimal') == 'key,summary,status,issuetype,parent,updated'
+
+    def test_planning_profile_skips_unconfigured_custom_fields(self, jira_client):
+        """Test that the planning profile carries configured PRD/mandays fields but not description"""
+        fields = jira_client._get_fields_list('planning').split(',')
+        assert 'customfield_10001' in fields and 'customfield_10003' in fields
+        assert 'description' not in fields and 'None' not in fields
+
+    def test_unknown_profile_raises(self, jira_client):
+        with pytest.raises(ValueError):
+            jira_client._get_fields_list('everything')
+
+    def test_get_ticket_with_profile_requests_lean_fields(self, jira_client):
+        """Test that get_ticket sends the profile's projection instead of the wide default"""
+        response = Mock(status_code=200)
+        response.json.return_value = {'key': 'PROJ-1', 'fields': {}}
+        jira_client.session.get.return_value = response
+
+        jira_client.get_ticket('PROJ-1', profile='links')
+        assert jira_client.session.get.call_args[1]['params']['fields'] == \
+            'key,summary,status,issuetype,parent,updated,issuelinks'
+
+
+class TestSearchPagination:
+
+    @pytest.fixture
+    def jira_client(self):
+        client = JiraClient(
+            server_url="https://test.atlassian.net",
+            username="test@example.com",
+            api_token="test-token",
+            prd_custom_field="customfield_10001"
+        )
+        client.session = Mock()
+        return client
+
+    @staticmethod
+    def _page(keys, **extra):
+        response = Mock()
+        response.raise_for_status.return_value = None
+        response.json.return_value = {'issues': [{'key': k} for k in keys], **extra}
+        return response
+
+    def test_iter_search_yields_first_page_while_next_is_fetched(self, jira_client):
+        """Test that the second page is requested in the background after the first is handed out"""
+        first_page_seen = threading.Event()
+        second_page_waited = []
+
+        def get(url, params=None, timeout=None):
+            if 'nextPageToken' not in params:
+                return self._page(['PROJ-1', 'PROJ-2'], isLast=False, nextPageToken='t2')
+            second_page_waited.append(first_page_seen.wait(5))
+            return self._page(['PROJ-3'], isLast=True)
+
+        jira_client.session.get.side_effect = get
+        keys = []
+        for issue in jira_client.iter_search_tickets('project = PROJ', max_results=10):
+            keys.append(issue['key'])
+            first_page_seen.set()
+
+        assert keys == ['PROJ-1', 'PROJ-2', 'PROJ-3']
+        assert second_page_waited == [True]
+
+    def test_search_respects_max_results_across_pages(self, jira_client):
+        jira_client.session.get.side_effect = [
+            self._page(['PROJ-1', 'PROJ-2'], isLast=False, nextPageToken='t2'),
+            self._page(['PROJ-3', 'PROJ-4'], isLast=False, nextPageToken='t3'),
+        ]
+        assert [i['key'] for i in jira_client.search_tickets('project = PROJ', max_results=3)] == \
+            ['PROJ-1', 'PROJ-2', 'PROJ-3']
+        assert jira_client.session.get.call_args[1]['params']['maxResults'] == 1
+
+    def test_deprecated_fallback_fetches_remaining_pages_by_offset(self, jira_client):
+        """Test that the deprecated API reads the total from page one and fetches the rest by startAt"""
+        def get(url, params=None, timeout=None):
+            if url.endswith('/search/jql'):
+                raise requests.exceptions.ConnectionError("enhanced search unavailable")
+            start = params['startAt']
+            return self._page([f'PROJ-{n}' for n in range(start, min(start + 100, 250))], total=250)
+
+        jira_client.session.get.side_effect = get
+        issues = jira_client.search_tickets('project = PROJ', max_results=1000)
+
+        assert [i['key'] for i in issues] == [f'PROJ-{n}' for n in range(250)]
+        starts = sorted(c[1]['params']['startAt'] for c in jira_client.session.get.call_args_list
+                        if c[0][0].endswith('/search'))
+        assert starts == [0, 100, 200]
+        assert [c[1]['params']['maxResults'] for c in jira_client.session.get.call_args_list
+                if c[0][0].endswith('/search') and c[1]['params']['startAt'] == 200] == [50]
+
+
+class TestBulkIssueCreation:
+
+    @pytest.fixture
+    def jira_client(self):
+        client = JiraClient(
+            server_url="https://test.atlassian.net",
+            username="test@example.com",
+            api_token="test-token",
+            prd_custom_field="customfield_10001"
+        )
+        client.session = Mock()
+        return client
+
+    def test_create_issues_chunks_and_maps_partial_failures(self, jira_client):
+        """Test that issues go out in chunks of 50 and failedElementNumber maps errors to their inputs"""
+        def post(url, json=None, timeout=None):
+            chunk = json['issueUpdates']
+            failed = {i for i, issue in enumerate(chunk) if issue['fields']['summary'] == 'bad'}
+            response = Mock(status_code=400 if failed else 201)
+            response.json.return_value = {
+                'issues': [{'key': f"PROJ-{issue['fields']['n']}"} for i, issue in enumerate(chunk) if i not in failed],
+                'errors': [{'status': 400, 'failedElementNumber': i,
+                            'elementErrors': {'errors': {'summary': 'rejected'}}} for i in sorted(failed)],
+            }
+            return response
+
+        jira_client.session.post.side_effect = post
+        issues = [{'fields': {'summary': 'bad' if n in (3, 60) else 'ok', 'n': n}} for n in range(120)]
+        results = jira_client.create_issues(issues)
+
+        assert [len(c[1]['json']['issueUpdates']) for c in jira_client.session.post.call_args_list] == [50, 50, 20]
+        assert results[3] == {'key': None, 'error': 'summary: rejected'}
+        assert results[60]['key'] is None
+        assert results[4]['key'] == 'PROJ-4' and results[61]['key'] == 'PROJ-61' and results[119]['key'] == 'PROJ-119'
+
+    def test_create_issues_reports_failed_chunk_per_item(self, jira_client):
+        response = Mock(status_code=401, text='Unauthorized')
+        response.json.side_effect = ValueError("not json")
+        jira_client.session.post.return_value = response
+
+        results = jira_client.create_issues([{'fields': {}}, {'fields': {}}])
+        assert all(r['key'] is None and '401' in r['error'] for r in results)
+
+    def test_create_issue_links_aligned_with_input(self, jira_client):
+        jira_client.session.post.side_effect = lambda url, json=None, timeout=None: Mock(
+            status_code=201 if json['type']['name'] == 'Blocks' else 400)
+        links = [{'inward_key': f'PROJ-{n}', 'outward_key': 'PROJ-100', 'link_type': 'Blocks' if n % 2 else 'Unknown'}
+                 for n in range(10)]
+        assert jira_client.create_issue_links(links) == [bool(n % 2) for n in range(10)]
+
 if __name__ == '__main__':
     pytest.main([__file__])
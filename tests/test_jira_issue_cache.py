@@ -0,0 +1,135 @@
+"""
+Tests for the JIRA issue cache and its use in JiraClient
+"""
+import time
+
+import pytest
+from unittest.mock import Mock
+
+from src import jira_issue_cache
+from src.jira_client import JiraClient
+from src.jira_issue_cache import JiraIssueCache, configure_jira_issue_cache, fields_digest
+
+
+@pytest.fixture
+def cache():
+    """Process-wide cache for the test, removed afterwards so it does not leak"""
+    cache = configure_jira_issue_cache({"enabled": True, "backend": "memory", "revalidate_after_seconds": 30})
+    yield cache
+    jira_issue_cache._jira_issue_cache = None
+
+
+@pytest.fixture
+def jira_client():
+    client = JiraClient(
+        server_url="https://test.atlassian.net",
+        username="test@example.com",
+        api_token="test-token",
+        prd_custom_field="customfield_10001"
+    )
+    client.session = Mock()
+    return client
+
+
+def issue_response(key, updated, summary="Summary"):
+    response = Mock(status_code=200)
+    response.raise_for_status.return_value = None
+    response.json.return_value = {"key": key, "fields": {"summary": summary, "updated": updated}}
+    return response
+
+
+def expire_freshness(cache):
+    for entry in cache._entries.values():
+        entry["checked_at"] = time.time() - 3600
+
+
+class TestJiraIssueCache:
+
+    def test_fields_digest_ignores_order_and_duplicates(self):
+        assert fields_digest("summary,parent") == fields_digest("parent, summary,parent")
+        assert fields_digest("summary") != fields_digest("summary,description")
+
+    def test_invalidate_drops_every_field_set(self):
+        """Test that invalidating an issue drops all of its cached projections"""
+        cache = JiraIssueCache()
+        cache.put("PROJ-1", "summary", {"key": "PROJ-1", "fields": {"updated": "t1"}})
+        cache.put("PROJ-1", "parent", {"key": "PROJ-1", "fields": {"updated": "t1"}})
+        cache.put("PROJ-2", "summary", {"key": "PROJ-2", "fields": {"updated": "t1"}})
+        cache.invalidate("proj-1")
+        assert cache.get("PROJ-1", "summary") is None and cache.get("PROJ-1", "parent") is None
+        assert cache.get("PROJ-2", "summary") is not None
+
+    def test_disabled_config_returns_none(self):
+        assert configure_jira_issue_cache({"enabled": False}) is None
+        assert jira_issue_cache.get_jira_issue_cache() is None
+
+
+class TestJiraClientCaching:
+
+    def test_repeat_reads_are_served_from_cache(self, cache, jira_client):
+        """Test that a second read within the freshness window makes no request and returns a copy"""
+        jira_client.session.get.return_value = issue_response("PROJ-1", "t1")
+        first = jira_client.get_ticket("PROJ-1")
+        first["fields"]["summary"] = "mutated by caller"
+        second = jira_client.get_ticket("PROJ-1")
+
+        assert jira_client.session.get.call_count == 1
+        assert second["fields"]["summary"] == "Summary"
+        assert "updated" in jira_client.session.get.call_args[1]["params"]["fields"]
+
+    def test_stale_entry_revalidated_with_updated_only_query(self, cache, jira_client):
+        """Test that an unchanged issue is confirmed with a fields=updated GET"""
+        jira_client.session.get.return_value = issue_response("PROJ-1", "t1")
+        jira_client.get_ticket("PROJ-1")
+        expire_freshness(cache)
+
+        assert jira_client.get_ticket("PROJ-1")["key"] == "PROJ-1"
+        assert jira_client.session.get.call_args[1]["params"] == {"fields": "updated"}
+        assert cache.stats()["revalidated"] == 1
+
+    def test_changed_issue_is_refetched(self, cache, jira_client):
+        """Test that a newer `updated` timestamp causes a full fetch"""
+        jira_client.session.get.return_value = issue_response("PROJ-1", "t1")
+        jira_client.get_ticket("PROJ-1")
+        expire_freshness(cache)
+        jira_client.session.get.return_value = issue_response("PROJ-1", "t2", summary="New summary")
+
+        assert jira_client.get_ticket("PROJ-1")["fields"]["summary"] == "New summary"
+        assert jira_client.session.get.call_count == 3
+
+    def test_writes_invalidate(self, cache, jira_client):
+        """Test that updating an issue through the client drops its cached copy"""
+        jira_client.session.get.return_value = issue_response("PROJ-1", "t1")
+        jira_client.get_ticket("PROJ-1")
+        jira_client.session.put.return_value = Mock(status_code=204)
+
+        assert jira_client.update_ticket_summary("PROJ-1", "Renamed") is True
+        jira_client.get_ticket("PROJ-1")
+        assert jira_client.session.get.call_count == 2
+
+    def test_bulk_fetch_only_requests_uncached_and_changed(self, cache, jira_client):
+        """Test that get_tickets serves fresh entries, revalidates stale ones in one search and fetches the rest"""
+        jira_client.session.get.side_effect = [issue_response("PROJ-1", "t1"), issue_response("PROJ-2", "t1")]
+        jira_client.get_ticket("PROJ-1")
+        jira_client.get_ticket("PROJ-2")
+        expire_freshness(cache)
+
+        def search(url, json=None, timeout=None):
+            response = Mock()
+            response.raise_for_status.return_value = None
+            if json["fields"] == ["updated"]:
+                issues = [{"key": "PROJ-1", "fields": {"updated": "t1"}}, {"key": "PROJ-2", "fields": {"updated": "t2"}}]
+            else:
+                issues = [{"key": k.strip('"'), "fields": {"summary": "Fetched", "updated": "t2"}}
+                          for k in json["jql"][8:-1].split(",")]
+            response.json.return_value = {"issues": issues, "isLast": True}
+            return response
+
+        jira_client.session.post.side_effect = search
+        results = jira_client.get_tickets(["PROJ-1", "PROJ-2", "PROJ-3"])
+
+        assert results["PROJ-1"]["issue"]["fields"]["summary"] == "Summary"
+        assert results["PROJ-2"]["issue"]["fields"]["summary"] == "Fetched"
+        assert results["PROJ-3"]["issue"]["fields"]["summary"] == "Fetched"
+        fetch_jql = jira_client.session.post.call_args_list[-1][1]["json"]["jql"]
+        assert sorted(fetch_jql[8:-1].split(",")) == ['"PROJ-2"', '"PROJ-3"']
@@ -0,0 +1,113 @@
+"""
+Tests for checkpointed, resumable batch jobs
+"""
+import asyncio
+import pytest
+from datetime import datetime
+from unittest.mock import AsyncMock, Mock, patch
+from fastapi.testclient import TestClient
+
+from api.main import app
+from api.dependencies import jobs
+from api.job_queue import (load_job_checkpoint, save_job_checkpoint, persist_job_status, retrieve_job_status,
+                           RESUME_CHECKPOINT_FIELD)
+from api.models.generation import JobStatus
+from api.workers import _create_bulk_task_tickets
+
+
+@pytest.fixture
+def redis_pool():
+    fakeredis = pytest.importorskip("fakeredis")
+    pool = fakeredis.FakeAsyncRedis()
+    with patch("api.job_queue.get_redis_pool", AsyncMock(return_value=pool)):
+        yield pool
+
+
+@pytest.fixture
+def arq_pool():
+    pool = AsyncMock()
+    with patch("api.job_queue.get_redis_pool", AsyncMock(return_value=pool)), \
+            patch("api.routes.jobs.get_redis_pool", AsyncMock(return_value=pool)), \
+            patch("api.job_scheduler.get_redis_pool", AsyncMock(return_value=pool)), \
+            patch("api.job_scheduler.get_scheduling_config", return_value={"enabled": False}):
+        yield pool
+
+
+@pytest.fixture
+def job():
+    jobs.clear()
+    jobs["job-1"] = JobStatus(job_id="job-1", job_type="bulk_task_creation", status="failed", progress={},
+                              started_at=datetime.now(), error="Worker timed out")
+    yield jobs["job-1"]
+    jobs.clear()
+
+
+class TestJobCheckpoint:
+
+    def test_created_tickets_not_recreated(self, redis_pool, job):
+        """Test that a rerun only creates tickets missing from the checkpoint, in chunks"""
+        jira_client = Mock()
+        jira_client.bulk_create_tickets.return_value = {"created_tickets": ["PROJ-3"], "failed_tickets": []}
+        not_cancelled = AsyncMock(return_value=False)
+
+        async def run():
+            await save_job_checkpoint("job-1", {
+                "task:0": {"index": 0, "success": True, "ticket_key": "PROJ-1", "error": None, "links_created": []},
+                "task:1": {"index": 1, "success": True, "ticket_key": "PROJ-2", "error": None, "links_created": []},
+            })
+            checkpoint = await load_job_checkpoint("job-1")
+            results = await _create_bulk_task_tickets("job-1", job, jira_client, [0, 1, 2],
+                                                      [{"n": 0}, {"n": 1}, {"n": 2}], checkpoint, not_cancelled)
+            return results, await load_job_checkpoint("job-1", ["task:2"])
+
+        results, saved = asyncio.run(run())
+        jira_client.bulk_create_tickets.assert_called_once_with([{"n": 2}])
+        assert [result["ticket_key"] for result in results] == ["PROJ-1", "PROJ-2", "PROJ-3"]
+        assert saved["task:2"]["ticket_key"] == "PROJ-3"
+
+    def test_resume_reenqueues_with_original_arguments(self, arq_pool, job):
+        """Test that POST /jobs/{job_id}/resume re-runs the worker function from the checkpoint"""
+        kwargs = {"job_id": "job-1", "tasks_data": [{"summary": "t"}], "create_tickets": True}
+        checkpoint = {
+            RESUME_CHECKPOINT_FIELD: {"function": "process_bulk_task_creation_worker", "kwargs": kwargs},
+            "task:0": {"index": 0, "success": True, "ticket_key": "PROJ-1"},
+        }
+
+        with patch("api.job_queue.load_job_checkpoint", AsyncMock(return_value=checkpoint)):
+            response = TestClient(app).post("/jobs/job-1/resume")
+
+        assert response.status_code == 200
+        assert response.json()["checkpointed_items"] == 1
+        assert job.status == "started" and job.error is None
+        args, enqueue_kwargs = arq_pool.enqueue_job.call_args
+        assert args == ("process_bulk_task_creation_worker",)
+        assert enqueue_kwargs["tasks_data"] == kwargs["tasks_data"]
+        assert enqueue_kwargs["_job_id"].startswith("job-1:resume:")
+
+    def test_resume_requires_checkpoint(self, arq_pool, job):
+        """Test that jobs without a checkpoint, or still running, cannot be resumed"""
+        client = TestClient(app)
+        assert client.post("/jobs/job-1/resume").status_code == 400
+        job.status = "processing"
+        assert client.post("/jobs/job-1/resume").status_code == 400
+
+
+class TestPersistJobStatus:
+
+    def test_results_rewritten_when_redis_lost_or_changed_them(self, redis_pool):
+        """Test that unchanged results are only skipped when Redis still holds them"""
+        pytest.importorskip("lupa")
+        status = {"job_id": "job-1", "status": "processing", "results": [{"ticket_key": "PROJ-1"}]}
+
+        async def run():
+            await persist_job_status("job-1", status)
+            await redis_pool.delete("job:status:job-1:results")  # expired, or deleted by another process
+            await persist_job_status("job-1", status)
+            restored = await retrieve_job_status("job-1")
+            await persist_job_status("job-1", {**status, "results": [{"ticket_key": "PROJ-2"}]})  # another process
+            await persist_job_status("job-1", status)
+            return restored, await retrieve_job_status("job-1")
+
+        restored, final = asyncio.run(run())
+        assert restored["results"] == status["results"]
+        assert final["results"] == status["results"]
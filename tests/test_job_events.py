@@ -0,0 +1,101 @@
+"""
+Tests for real-time job progress events
+"""
+import asyncio
+import pytest
+from datetime import datetime
+from fastapi.testclient import TestClient
+
+from api.main import app
+from api.dependencies import jobs
+from api.job_events import JobEventHub
+from api.job_store import JobStore
+from api.models.generation import JobStatus
+
+
+def make_job(job_id, status="processing"):
+    return JobStatus(job_id=job_id, job_type="single", status=status, progress={"message": "queued"},
+                     started_at=datetime.now())
+
+
+async def collect(hub, store, job_id, last_event_id=None):
+    return [event async for event in hub.events(store, job_id, last_event_id, heartbeat=1.0)]
+
+
+class TestJobEventHub:
+
+    def test_streams_updates_until_terminal_status(self):
+        """Test snapshot first, then each update, ending on completion"""
+        store = JobStore()
+        hub = JobEventHub()
+        store["job-1"] = make_job("job-1")
+
+        async def run():
+            await hub.start(store)
+            task = asyncio.create_task(collect(hub, store, "job-1"))
+            while hub.subscriber_count() == 0:
+                await asyncio.sleep(0.01)
+            job = store["job-1"]
+            job.progress = {"message": "halfway"}
+            job.status = "completed"
+            events = await asyncio.wait_for(task, 5)
+            await hub.stop()
+            return events
+
+        events = asyncio.run(run())
+        assert [event["progress"]["message"] for event in events] == ["queued", "halfway", "halfway"]
+        assert events[-1]["status"] == "completed"
+        assert [event["id"] for event in events] == sorted({event["id"] for event in events})
+
+    def test_resume_skips_snapshot_when_current(self):
+        """Test that a client whose last-event-id is current gets no duplicate snapshot"""
+        store = JobStore()
+        store["job-1"] = make_job("job-1", status="completed")
+        current = store.version("job-1")
+        assert asyncio.run(collect(JobEventHub(), store, "job-1", last_event_id=current)) == []
+        assert len(asyncio.run(collect(JobEventHub(), store, "job-1", last_event_id=current - 1))) == 1
+
+    def test_stream_ends_when_job_disappears(self):
+        """Test that a stream for a deleted (or expired) job ends instead of idling forever"""
+        store = JobStore()
+        hub = JobEventHub()
+        store["job-1"] = make_job("job-1")
+
+        async def run():
+            events = hub.events(store, "job-1", heartbeat=0.05)
+            snapshot = await events.__anext__()
+            del store["job-1"]
+            return snapshot, [event async for event in events]
+
+        snapshot, rest = asyncio.run(asyncio.wait_for(run(), 5))
+        assert snapshot["status"] == "processing"
+        assert rest == []
+
+
+class TestJobEventRoutes:
+
+    @pytest.fixture
+    def client(self):
+        jobs.clear()
+        yield TestClient(app)
+        jobs.clear()
+
+    def test_sse_stream_of_finished_job(self, client):
+        """Test that a finished job streams its final state and closes"""
+        jobs["job-1"] = make_job("job-1", status="completed")
+        response = client.get("/jobs/job-1/events")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        assert response.text.startswith(f"id: {jobs.version('job-1')}\nevent: progress\ndata: ")
+        assert '"status": "completed"' in response.text
+
+        resumed = client.get("/jobs/job-1/events", headers={"Last-Event-ID": str(jobs.version("job-1"))})
+        assert resumed.text == ""
+        assert client.get("/jobs/missing/events").status_code == 404
+
+    def test_websocket_stream(self, client):
+        """Test that the WebSocket endpoint sends the same events as JSON"""
+        jobs["job-1"] = make_job("job-1", status="failed")
+        with client.websocket_connect("/jobs/job-1/ws") as websocket:
+            event = websocket.receive_json()
+        assert event["job_id"] == "job-1" and event["status"] == "failed"
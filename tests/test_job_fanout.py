@@ -0,0 +1,155 @@
+"""
+Tests for fanning batch jobs out into child jobs
+"""
+import asyncio
+import pytest
+from datetime import datetime
+from unittest.mock import AsyncMock, Mock, patch
+
+from api.dependencies import jobs
+from api.job_fanout import enqueue_children, get_child_job_ids, record_child_result, start_fanout
+from api.models.generation import JobStatus
+from api.ticket_registry import TicketRegistry
+from api.workers import _hold_claims_for_children, after_job_end, on_job_start, process_batch_ticket_child_worker
+
+
+@pytest.fixture
+def redis_pool():
+    fakeredis = pytest.importorskip("fakeredis")
+    pytest.importorskip("lupa")
+    pool = fakeredis.FakeAsyncRedis()
+    with patch("api.job_fanout.get_redis_pool", AsyncMock(return_value=pool)), \
+            patch("api.job_fanout.is_job_cancelled", AsyncMock(return_value=False)), \
+            patch("api.workers.clear_cancellation_flag", AsyncMock()):
+        yield pool
+
+
+@pytest.fixture
+def batch_job():
+    jobs.clear()
+    jobs["batch-1"] = JobStatus(job_id="batch-1", job_type="batch", status="processing", progress={},
+                                started_at=datetime.now(), total_tickets=2, ticket_keys=["PROJ-1", "PROJ-2"])
+    yield jobs["batch-1"]
+    jobs.clear()
+
+
+@pytest.fixture
+def generator():
+    generator = Mock()
+    with patch("api.workers._initialize_services_if_needed"), \
+            patch("api.workers.get_generator", return_value=generator), \
+            patch("api.workers.unregister_ticket_job"):
+        yield generator
+
+
+def run_child(index, ticket_key):
+    return process_batch_ticket_child_worker({}, "batch-1", index, ticket_key, f"Summary {ticket_key}",
+                                             None, None, update_jira=False)
+
+
+class TestJobFanout:
+
+    def test_child_results_counted_once(self, redis_pool):
+        """Test that a retried child does not double count and only the last result finishes"""
+        async def run():
+            await start_fanout("parent", 2)
+            first = await record_child_result("parent", 0, {"ok": True}, True)
+            retried = await record_child_result("parent", 0, {"ok": True}, True)
+            last = await record_child_result("parent", 1, {"ok": False}, False)
+            return first, retried, last
+
+        first, retried, last = asyncio.run(run())
+        assert (first.done, first.finished) == (1, False)
+        assert (retried.done, retried.finished) == (1, False)
+        assert (last.done, last.succeeded, last.failed, last.finished) == (2, 1, 1, True)
+
+    def test_last_child_completes_parent(self, redis_pool, batch_job, generator):
+        """Test that children aggregate into the parent's JobStatus in ticket order"""
+        generator.process_ticket.side_effect = [
+            Mock(success=True, description=Mock(description="desc 2"), error=None, skipped_reason=None,
+                 llm_provider="openai", llm_model="m"),
+            RuntimeError("LLM down"),
+        ]
+
+        async def run():
+            await start_fanout("batch-1", 2)
+            assert await run_child(1, "PROJ-2") is True
+            assert batch_job.status == "processing" and batch_job.processed_tickets == 1
+            assert await run_child(0, "PROJ-1") is False
+
+        asyncio.run(run())
+
+        assert batch_job.status == "completed"
+        assert (batch_job.successful_tickets, batch_job.failed_tickets) == (1, 1)
+        assert [result["ticket_key"] for result in batch_job.results] == ["PROJ-1", "PROJ-2"]
+        assert batch_job.results[0]["error"] == "LLM down"
+
+    def test_cancelled_parent_skips_work(self, redis_pool, batch_job, generator):
+        """Test that children of a cancelled parent record themselves without generating"""
+        batch_job.status = "cancelled"
+
+        async def run():
+            await start_fanout("batch-1", 2)
+            await run_child(0, "PROJ-1")
+            await run_child(1, "PROJ-2")
+
+        asyncio.run(run())
+
+        generator.process_ticket.assert_not_called()
+        assert batch_job.status == "cancelled"
+        assert [result["skipped_reason"] for result in batch_job.results] == ["cancelled", "cancelled"]
+
+    def test_resumed_fanout_dispatches_unfinished_children(self, redis_pool):
+        """Test that a resumed parent's children are not dropped as duplicates of the first run's"""
+        pytest.importorskip("arq")
+        from arq.constants import result_key_prefix
+        from api.job_scheduler import queue_name_for
+        from tests.test_job_scheduler import scheduling_config
+
+        children = [(0, ("PROJ-1",)), (1, ("PROJ-2",))]
+
+        async def run():
+            await start_fanout("batch-1", 2)
+            await enqueue_children("batch-1", "process_batch_ticket_child_worker", children)
+            first_run = await get_child_job_ids("batch-1")
+            # Both children ran (ARQ keeps their results), only PROJ-1 succeeded; the parent is resumed
+            for child_id in first_run:
+                await redis_pool.zrem(queue_name_for("bulk"), child_id)
+                await redis_pool.set(result_key_prefix + child_id, b"result", ex=3600)
+            await start_fanout("batch-1", 2)
+            await record_child_result("batch-1", 0, {"ticket_key": "PROJ-1"}, True)
+            await enqueue_children("batch-1", "process_batch_ticket_child_worker", children[1:])
+            resumed = await get_child_job_ids("batch-1")
+            ready = [member.decode() for member in await redis_pool.zrange(queue_name_for("bulk"), 0, -1)]
+            return first_run, resumed, ready
+
+        with patch("api.job_scheduler.get_redis_pool", AsyncMock(return_value=redis_pool)), \
+                patch("api.job_scheduler.get_scheduling_config", return_value=scheduling_config(dispatch_limit=10)):
+            first_run, resumed, ready = asyncio.run(run())
+
+        assert len(resumed) == 1 and resumed[0] not in first_run
+        assert ready == resumed
+
+    def test_parent_claims_outlive_the_running_lease(self):
+        """Test that a fanned-out parent's claims keep the queued lease while its children run"""
+        fakeredis = pytest.importorskip("fakeredis")
+        pytest.importorskip("lupa")
+        registry = TicketRegistry(fakeredis.FakeRedis(), lease_seconds=60, queued_lease_seconds=600)
+
+        async def run():
+            await on_job_start({"job_id": "batch-1"})
+            registry.claim_many(["PROJ-1", "PROJ-2"], "batch-1")
+            _hold_claims_for_children("batch-1")
+            await after_job_end({"job_id": "batch-1"})
+            await on_job_start({"job_id": "batch-1:child:run1:0"})
+            registry.renew()
+            await after_job_end({"job_id": "batch-1:child:run1:0"})
+
+        try:
+            with patch("api.workers.ticket_jobs", registry), \
+                    patch("api.workers._scheduling_enabled", return_value=False):
+                asyncio.run(run())
+            for ticket in ("PROJ-1", "PROJ-2"):
+                assert registry.redis.pttl(f"ticket:claim:{ticket}") > 60_000
+        finally:
+            registry.close()
@@ -0,0 +1,148 @@
+"""
+Tests for priority classes and fair dispatch of background jobs
+"""
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from api.job_scheduler import (
+    after_job_end, cancel_pending_job, get_queue_stats, job_class_for, on_job_start, queue_name_for, submit_job,
+)
+
+
+def scheduling_config(dispatch_limit=3, per_user_max=0):
+    classes = {name: {"dispatch_limit": dispatch_limit, "per_user_max": per_user_max, "max_jobs": 0}
+               for name in ("interactive", "bulk", "sandbox")}
+    return {"enabled": True, "classes": classes, "job_type_weights": {}, "user_weights": {}, "job_classes": {},
+            "dispatch_interval_seconds": 5, "stale_after_seconds": 7200}
+
+
+@pytest.fixture
+def redis_pool():
+    pytest.importorskip("arq")
+    fakeredis = pytest.importorskip("fakeredis")
+    pytest.importorskip("lupa")
+    pool = fakeredis.FakeAsyncRedis()
+    with patch("api.job_scheduler.get_redis_pool", AsyncMock(return_value=pool)):
+        yield pool
+
+
+def submit(user, job_id, function_name="process_batch_tickets_worker"):
+    return submit_job(function_name, job_id=job_id, _job_id=job_id, _user=user)
+
+
+async def finish(pool, job_id, job_class="bulk"):
+    """What ARQ does when a job completes, then the after_job_end hook"""
+    await pool.zrem(queue_name_for(job_class), job_id)
+    await after_job_end({"job_id": job_id})
+
+
+async def queued(pool, job_class="bulk"):
+    return sorted(member.decode() for member in await pool.zrange(queue_name_for(job_class), 0, -1))
+
+
+class TestJobScheduler:
+
+    def test_job_types_map_to_classes(self):
+        """Test that bulk and sandbox job types leave the interactive class"""
+        config = scheduling_config()
+        assert job_class_for("single", config) == "interactive"
+        assert job_class_for("batch", config) == "bulk"
+        assert job_class_for("draft_pr", config) == "sandbox"
+        config["job_classes"] = {"draft_pr": "interactive", "single": "nonsense"}
+        assert job_class_for("draft_pr", config) == "interactive"
+        assert job_class_for("single", config) == "interactive"
+
+    def test_waiting_user_goes_before_busy_user(self, redis_pool):
+        """Test that a user with a large backlog does not delay another user's job"""
+        async def run():
+            for i in range(5):
+                await submit("alice", f"a{i}")
+            await submit("bob", "b0")
+            first = await queued(redis_pool)
+            await finish(redis_pool, "a0")
+            return first, await queued(redis_pool)
+
+        with patch("api.job_scheduler.get_scheduling_config", return_value=scheduling_config()):
+            first, after = asyncio.run(run())
+
+        assert first == ["a0", "a1", "a2"]
+        assert after == ["a1", "a2", "b0"]
+
+    def test_per_user_cap(self, redis_pool):
+        """Test that a user never holds more than per_user_max dispatched jobs"""
+        async def run():
+            for i in range(3):
+                await submit("alice", f"a{i}")
+            capped = await queued(redis_pool)
+            await finish(redis_pool, "a0")
+            return capped, await queued(redis_pool)
+
+        with patch("api.job_scheduler.get_scheduling_config",
+                   return_value=scheduling_config(dispatch_limit=10, per_user_max=1)):
+            capped, after = asyncio.run(run())
+
+        assert capped == ["a0"]
+        assert after == ["a1"]
+
+    def test_fanout_children_skip_per_user_cap(self, redis_pool):
+        """Test that a user's fan-out children are not held to per_user_max"""
+        async def run():
+            await submit("alice", "a0")
+            for i in range(3):
+                await submit_job("process_batch_ticket_child_worker", _job_id=f"a0:child:r:{i}", _user="alice",
+                                 _per_user_cap=False)
+            await submit("alice", "a1")
+            return await queued(redis_pool)
+
+        with patch("api.job_scheduler.get_scheduling_config",
+                   return_value=scheduling_config(dispatch_limit=10, per_user_max=1)):
+            dispatched = asyncio.run(run())
+
+        assert dispatched == ["a0", "a0:child:r:0", "a0:child:r:1", "a0:child:r:2"]
+
+    def test_retried_job_keeps_its_slot(self, redis_pool):
+        """Test that a job ARQ is retrying (still in its queue) does not free a slot"""
+        async def run():
+            await submit("alice", "a0")
+            await submit("alice", "a1")
+            await after_job_end({"job_id": "a0"})
+            return await queued(redis_pool)
+
+        with patch("api.job_scheduler.get_scheduling_config", return_value=scheduling_config(dispatch_limit=1)):
+            assert asyncio.run(run()) == ["a0"]
+
+    def test_cancelled_pending_job_is_never_dispatched(self, redis_pool):
+        """Test that cancelling a waiting job removes it, but not a dispatched one"""
+        async def run():
+            await submit("alice", "a0")
+            await submit("alice", "a1")
+            cancelled = (await cancel_pending_job("a0"), await cancel_pending_job("a1"))
+            await finish(redis_pool, "a0")
+            return cancelled, await queued(redis_pool)
+
+        with patch("api.job_scheduler.get_scheduling_config", return_value=scheduling_config(dispatch_limit=1)):
+            cancelled, after = asyncio.run(run())
+
+        assert cancelled == (False, True)
+        assert after == []
+
+    def test_queue_stats(self, redis_pool):
+        """Test queue depth and wait time per class"""
+        async def run():
+            await submit("alice", "a0")
+            await submit("alice", "a1")
+            await submit("bob", "s0", "process_draft_pr_worker")
+            await on_job_start({"job_id": "a0"})
+            return await get_queue_stats()
+
+        with patch("api.job_scheduler.get_scheduling_config", return_value=scheduling_config(dispatch_limit=1)):
+            stats = asyncio.run(run())
+
+        assert stats["bulk"]["pending"] == 1
+        assert stats["bulk"]["dispatched"] == 1 and stats["bulk"]["running"] == 1
+        assert stats["bulk"]["users"]["alice"] == {"pending": 1, "active": 1}
+        assert stats["bulk"]["wait_seconds"]["samples"] == 1
+        assert stats["bulk"]["oldest_pending_seconds"] is not None
+        assert stats["sandbox"]["dispatched"] == 1 and stats["sandbox"]["ready"] == 1
+        assert stats["interactive"]["pending"] == 0
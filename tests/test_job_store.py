@@ -0,0 +1,230 @@
+"""
+Tests for the shared job store
+"""
+import json
+import threading
+import time
+import pytest
+from datetime import datetime, timedelta, timezone
+
+from api.job_store import JobStore, decode_cursor
+from api.models.generation import JobStatus
+
+
+def make_job(job_id, minutes_ago=0, **fields):
+    fields.setdefault("status", "started")
+    return JobStatus(job_id=job_id, progress={"message": "queued"},
+                     started_at=datetime.now() - timedelta(minutes=minutes_ago), **fields)
+
+
+class TestMemoryJobStore:
+
+    def test_behaves_like_a_dict(self):
+        """Test mapping operations without Redis"""
+        store = JobStore()
+        store["a"] = make_job("a")
+        assert "a" in store and store["a"].job_id == "a"
+        assert list(store) == ["a"] and len(store) == 1
+        del store["a"]
+        assert "a" not in store
+        with pytest.raises(KeyError):
+            store["a"]
+
+    def test_query_filters_and_orders_by_started_at(self):
+        """Test that query filters by indexed fields and returns newest first"""
+        store = JobStore()
+        store["old"] = make_job("old", minutes_ago=10, ticket_key="PROJ-1")
+        store["new"] = make_job("new", minutes_ago=1, ticket_keys=["PROJ-1", "PROJ-2"])
+        store["other"] = make_job("other", minutes_ago=5, ticket_key="PROJ-9", status="completed")
+
+        page, total = store.query(ticket_key="PROJ-1")
+        assert [job.job_id for job in page] == ["new", "old"] and total == 2
+        page, total = store.query(status="completed")
+        assert [job.job_id for job in page] == ["other"]
+        page, total = store.query(offset=1, limit=1, descending=False)
+        assert [job.job_id for job in page] == ["other"] and total == 3
+
+    def test_cursor_pages_break_ties_by_job_id(self):
+        """Test that cursor pages follow (started_at, job_id) with no gaps or repeats"""
+        store = JobStore()
+        started = datetime.now()
+        for job_id in ["a", "b", "c", "d"]:
+            store[job_id] = JobStatus(job_id=job_id, status="started", progress={}, started_at=started)
+
+        first = store.page(limit=3)
+        assert [job.job_id for job in first.jobs] == ["d", "c", "b"] and first.total == 4
+        second = store.page(cursor=first.next_cursor, limit=3)
+        assert [job.job_id for job in second.jobs] == ["a"] and second.next_cursor is None
+        with pytest.raises(ValueError):
+            store.page(cursor="not-a-cursor")
+
+
+class TestRedisJobStore:
+
+    @pytest.fixture
+    def redis_client(self):
+        fakeredis = pytest.importorskip("fakeredis")
+        pytest.importorskip("lupa")
+        return fakeredis.FakeRedis()
+
+    @pytest.fixture
+    def stores(self, redis_client):
+        """Two stores sharing one Redis, like an API process and a worker"""
+        api, worker = JobStore(redis_client, flush_interval=0, refresh_interval=0), JobStore(redis_client, refresh_interval=0)
+        yield api, worker
+        api.close()
+        worker.close()
+
+    def test_jobs_visible_across_processes(self, stores):
+        """Test that a job created in one store is read and updated through another"""
+        api, worker = stores
+        api["job-1"] = make_job("job-1", ticket_key="PROJ-1")
+
+        job = worker["job-1"]
+        job.status = "processing"  # written by the flusher without waiting to coalesce
+        job.progress = {"message": "halfway"}
+        worker.flush()
+
+        seen = api["job-1"]
+        assert seen.status == "processing"
+        assert seen.progress == {"message": "halfway"}
+
+    def test_progress_writes_publish_events(self, stores, redis_client):
+        """Test that each written progress change is published once with the job's version"""
+        api, worker = stores
+        api["job-1"] = make_job("job-1")
+        pubsub = redis_client.pubsub()
+        pubsub.subscribe("jobs:events:job-1")
+        pubsub.get_message(timeout=1)  # subscribe confirmation
+
+        job = worker["job-1"]
+        job.progress = {"message": "step 1"}
+        job.progress = {"message": "step 2"}  # coalesced with step 1
+        worker.flush()
+
+        message = pubsub.get_message(timeout=1)
+        event = json.loads(message["data"])
+        assert event["progress"] == {"message": "step 2"} and event["id"] == api.version("job-1")
+        assert pubsub.get_message(timeout=0.1) is None
+
+    def test_status_change_moves_job_between_indexes(self, stores):
+        """Test that the status index follows status updates"""
+        api, worker = stores
+        api["job-1"] = make_job("job-1", job_type="single")
+        api["job-2"] = make_job("job-2", minutes_ago=1, job_type="batch")
+        worker["job-1"].status = "completed"
+        worker.flush()
+
+        completed, total = api.query(status="completed")
+        assert [job.job_id for job in completed] == ["job-1"] and total == 1
+        started, total = api.query(status="started")
+        assert [job.job_id for job in started] == ["job-2"] and total == 1
+        both, total = api.query(status="started", job_type="batch")
+        assert [job.job_id for job in both] == ["job-2"] and total == 1
+
+    def test_status_change_written_off_the_assigning_thread(self, stores):
+        """Test that a status assignment is written promptly by the flusher, not the caller"""
+        api, worker = stores
+        api["job-1"] = make_job("job-1")
+        job = worker["job-1"]
+        worker.flush_interval = 5  # a status change must not wait out the coalescing delay
+        writers = []
+        write = worker._write
+        worker._write = lambda *args: (writers.append(threading.current_thread()), write(*args))
+
+        job.status = "completed"
+        deadline = time.monotonic() + 2
+        while api.query(status="completed")[1] == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert api.query(status="completed")[1] == 1
+        assert writers and threading.current_thread() not in writers
+
+    def test_paginates_in_started_at_order(self, stores):
+        """Test offset/limit paging over the started_at index"""
+        api, _ = stores
+        for i in range(5):
+            api[f"job-{i}"] = make_job(f"job-{i}", minutes_ago=i)
+        page, total = api.query(offset=1, limit=2)
+        assert [job.job_id for job in page] == ["job-1", "job-2"] and total == 5
+
+    def test_query_bounded_by_started_at(self, stores):
+        """Test that a started_at window only returns (and counts) the jobs inside it"""
+        api, _ = stores
+        for i in range(5):
+            api[f"job-{i}"] = make_job(f"job-{i}", minutes_ago=i * 10, job_type="batch" if i % 2 else "single")
+        now = datetime.now(timezone.utc)
+
+        page, total = api.query(started_after=now - timedelta(minutes=25), started_before=now - timedelta(minutes=5),
+                                limit=None)
+        assert [job.job_id for job in page] == ["job-1", "job-2"] and total == 2
+        page, total = api.query(job_type="batch", started_after=now - timedelta(minutes=35), limit=None)
+        assert [job.job_id for job in page] == ["job-1", "job-3"] and total == 2
+
+    def test_cursor_pages_through_filtered_index(self, stores):
+        """Test cursor paging with several filters and an estimated total"""
+        api, _ = stores
+        for i in range(7):
+            api[f"job-{i}"] = make_job(f"job-{i}", minutes_ago=i, job_type="batch" if i % 2 else "single")
+
+        seen, cursor = [], None
+        while True:
+            page = api.page(status="started", job_type="single", cursor=cursor, limit=2, descending=False)
+            seen += [job.job_id for job in page.jobs]
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+        assert seen == ["job-6", "job-4", "job-2", "job-0"]
+
+        page = api.page(job_type="single", limit=2)
+        assert page.total == 4 and not page.total_is_estimate
+        assert decode_cursor(page.next_cursor)[1] == "job-2"
+        assert api.page(status="started", job_type="single", limit=2).total_is_estimate
+
+    def test_expired_jobs_pruned_from_indexes(self, stores, redis_client):
+        """Test that index entries whose hash expired are skipped and removed"""
+        api, worker = stores
+        api["job-1"] = make_job("job-1")
+        api["job-2"] = make_job("job-2", minutes_ago=1)
+        redis_client.delete("job:data:job-2")
+
+        page, _ = worker.query()
+        assert [job.job_id for job in page] == ["job-1"]
+        assert redis_client.zscore("jobs:idx:all", "job-2") is None
+
+    def test_growing_results_are_appended_as_compressed_chunks(self, stores, redis_client):
+        """Test that progress writes leave stored results alone and new results are appended"""
+        api, worker = stores
+        api["job-1"] = make_job("job-1")
+        job = worker["job-1"]
+        job.results = [{"ticket_key": "PROJ-1", "generated_description": "x" * 5000}]
+        worker.flush()
+        job.results = job.results + [{"ticket_key": "PROJ-2"}]
+        job.progress = {"message": "2 done"}
+        worker.flush()
+
+        assert redis_client.llen("job:data:job-1:results") == 2
+        assert redis_client.hget("job:data:job-1", "results") is None
+        job.progress = {"message": "still 2 done"}
+        worker.flush()
+        assert redis_client.llen("job:data:job-1:results") == 2
+
+        seen = api["job-1"]
+        assert [item["ticket_key"] for item in seen.results] == ["PROJ-1", "PROJ-2"]
+        assert seen.progress == {"message": "still 2 done"}
+
+    def test_reordered_results_are_rewritten(self, stores, redis_client):
+        """Test that results that did not just grow replace the stored chunks"""
+        api, worker = stores
+        api["job-1"] = make_job("job-1")
+        job = worker["job-1"]
+        job.results = [{"n": 2}, {"n": 1}]
+        worker.flush()
+        job.results = sorted(job.results, key=lambda item: item["n"])
+        worker.flush()
+        assert redis_client.llen("job:data:job-1:results") == 1
+        assert api["job-1"].results == [{"n": 1}, {"n": 2}]
+
+        job.results = {"summary": "done"}
+        worker.flush()
+        assert api["job-1"].results == {"summary": "done"}
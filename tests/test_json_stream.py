@@ -0,0 +1,30 @@
+"""
+Tests for incremental JSON array parsing
+"""
+from src.json_stream import IncrementalJSONArrayParser
+
+
+class TestIncrementalJSONArrayParser:
+
+    def test_elements_emitted_as_they_complete(self):
+        """Test that each object is returned by the chunk that closes it"""
+        parser = IncrementalJSONArrayParser()
+        assert parser.feed('Here you go:\n```json\n[{"a": 1, "b": {"c": [1, 2]}}') == [{"a": 1, "b": {"c": [1, 2]}}]
+        assert parser.feed(', {"text": "brace } and \\" quote ]"') == []
+        assert parser.feed('}]\n```') == [{"text": 'brace } and " quote ]'}]
+        assert parser.finished
+
+    def test_char_by_char_and_scalars(self):
+        """Test single-character chunks and scalar elements"""
+        parser = IncrementalJSONArrayParser()
+        for ch in '[1, "two", {"x": null}, [3]]':
+            parser.feed(ch)
+        assert parser.elements == [1, "two", {"x": None}, [3]]
+        assert parser.finished
+
+    def test_truncated_array_keeps_completed_elements(self):
+        """Test that an unterminated stream keeps earlier elements"""
+        parser = IncrementalJSONArrayParser()
+        parser.feed('[{"id": 1}, {"id": 2}, {"id": 3, "summ')
+        assert parser.elements == [{"id": 1}, {"id": 2}]
+        assert not parser.finished
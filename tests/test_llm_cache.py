@@ -0,0 +1,129 @@
+"""
+Tests for the LLM response cache and its use in LLMClient
+"""
+import pytest
+from unittest.mock import Mock, patch
+
+from src import llm_cache
+from src.llm_cache import LLMResponseCache, DiskCacheBackend, make_cache_key, configure_llm_cache
+from src.llm_client import LLMClient
+
+
+@pytest.fixture(autouse=True)
+def no_global_cache():
+    """Keep the process-wide cache from leaking between tests"""
+    yield
+    llm_cache._llm_cache = None
+
+
+def make_llm_client() -> LLMClient:
+    """LLMClient with a mocked provider"""
+    with patch.object(LLMClient, "_create_provider") as create_provider:
+        provider = Mock()
+        provider.model = "gpt-test"
+        provider.temperature = 0.7
+        provider.get_system_prompt.return_value = "default system"
+        create_provider.return_value = provider
+        return LLMClient({"provider": "openai", "api_key": "k", "model": "gpt-test", "system_prompt": "default system"})
+
+
+class TestLLMResponseCache:
+
+    def test_key_covers_all_request_parts(self):
+        """Test that changing any request part changes the key"""
+        base = dict(provider="openai", model="m", temperature=0.7, system_prompt="s", prompt="p", max_tokens=100)
+        key = make_cache_key(**base)
+        assert key == make_cache_key(**base)
+        for field, value in [("provider", "claude"), ("model", "m2"), ("temperature", 0.2),
+                             ("system_prompt", "s2"), ("prompt", "p2"), ("max_tokens", 200)]:
+            assert make_cache_key(**{**base, field: value}) != key
+        assert make_cache_key(**base, response_format="json") != key
+
+    def test_lru_eviction_and_counters(self):
+        """Test that the least recently used entry is evicted and hits/misses are counted"""
+        cache = LLMResponseCache(max_entries=2)
+        cache.set("a", "A")
+        cache.set("b", "B")
+        assert cache.get("a") == "A"  # a is now most recent
+        cache.set("c", "C")
+        assert cache.get("b") is None
+        assert cache.get("c") == "C"
+        stats = cache.stats()
+        assert stats["hits"] == 2
+        assert stats["misses"] == 1
+        assert stats["size"] == 2
+
+    def test_ttl_expiry(self):
+        """Test that expired entries are misses"""
+        cache = LLMResponseCache(ttl_seconds=10)
+        with patch("src.llm_cache.time.time", return_value=1000.0):
+            cache.set("a", "A")
+        with patch("src.llm_cache.time.time", return_value=1011.0):
+            assert cache.get("a") is None
+
+    def test_disk_backend_survives_new_process_cache(self, tmp_path):
+        """Test that a fresh in-process cache is filled from the disk tier"""
+        LLMResponseCache(backend=DiskCacheBackend(str(tmp_path))).set("k", "value")
+        cache = LLMResponseCache(backend=DiskCacheBackend(str(tmp_path)))
+        assert cache.get("k") == "value"
+        assert cache.stats()["backend_hits"] == 1
+
+    def test_backend_errors_are_misses(self):
+        """Test that a failing shared backend degrades to the in-process tier"""
+        backend = Mock()
+        backend.get.side_effect = ConnectionError("down")
+        backend.set.side_effect = ConnectionError("down")
+        cache = LLMResponseCache(backend=backend)
+        assert cache.get("k") is None
+        cache.set("k", "v")
+        assert cache.get("k") == "v"
+        assert cache.stats()["errors"] == 2
+
+
+class TestLLMClientCaching:
+
+    def test_generate_content_served_from_cache(self):
+        """Test that an identical request does not call the provider twice"""
+        configure_llm_cache({"enabled": True, "backend": "memory"})
+        client = make_llm_client()
+        client.provider.generate_description.return_value = "answer"
+
+        assert client.generate_content("prompt", system_prompt="sys") == "answer"
+        assert client.generate_content("prompt", system_prompt="sys") == "answer"
+        assert client.provider.generate_description.call_count == 1
+
+        client.generate_content("prompt", system_prompt="other sys")
+        assert client.provider.generate_description.call_count == 2
+
+    def test_refresh_and_opt_out(self):
+        """Test that refresh_cache regenerates and use_cache=False bypasses the cache"""
+        configure_llm_cache({"enabled": True, "backend": "memory"})
+        client = make_llm_client()
+        client.provider.generate_description.side_effect = ["first", "second", "third"]
+
+        assert client.generate_content("prompt") == "first"
+        assert client.generate_content("prompt", refresh_cache=True) == "second"
+        assert client.generate_content("prompt") == "second"
+        assert client.generate_content("prompt", use_cache=False) == "third"
+        assert client.generate_content("prompt") == "second"
+
+    def test_invalid_json_is_not_cached(self):
+        """Test that only validated JSON responses are stored"""
+        configure_llm_cache({"enabled": True, "backend": "memory"})
+        client = make_llm_client()
+        client.provider.generate_json.side_effect = ["not json", '{"ok": true}']
+
+        with pytest.raises(ValueError):
+            client.generate_content_json("prompt")
+        assert client.generate_content_json("prompt") == '{"ok": true}'
+        assert client.generate_content_json("prompt") == '{"ok": true}'
+        assert client.provider.generate_json.call_count == 2
+
+    def test_disabled_cache_always_calls_provider(self):
+        """Test that no cache is used when disabled in config"""
+        configure_llm_cache({"enabled": False})
+        client = make_llm_client()
+        client.provider.generate_description.return_value = "answer"
+        client.generate_content("prompt")
+        client.generate_content("prompt")
+        assert client.provider.generate_description.call_count == 2
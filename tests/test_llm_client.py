@@ -0,0 +1,115 @@
+"""
+Tests for per-request system prompts in LLM providers
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
+
+from src.llm_client import OpenAIProvider, ClaudeProvider, LLMClient, _note_finish_reason
+
+
+def make_openai_provider() -> OpenAIProvider:
+    """OpenAIProvider with a mocked SDK client"""
+    provider = OpenAIProvider("key", "gpt-4o", "default system")
+    provider.client = Mock()
+    choice = Mock()
+    choice.message.content = "answer"
+    choice.finish_reason = "stop"
+    provider.client.chat.completions.create.return_value = Mock(choices=[choice])
+    return provider
+
+
+class TestPerCallSystemPrompt:
+
+    def test_openai_uses_per_call_system_prompt(self):
+        """Test that the override is sent and the provider default is untouched"""
+        provider = make_openai_provider()
+
+        provider.generate_description("hi", system_prompt="custom system")
+        messages = provider.client.chat.completions.create.call_args.kwargs["messages"]
+        assert messages[0] == {"role": "system", "content": "custom system"}
+        assert provider.get_system_prompt() == "default system"
+
+        provider.generate_description("hi")
+        messages = provider.client.chat.completions.create.call_args.kwargs["messages"]
+        assert messages[0]["content"] == "default system"
+
+    def test_concurrent_calls_keep_their_own_system_prompt(self):
+        """Test that a shared client never leaks one call's system prompt into another"""
+        provider = ClaudeProvider("key", "claude-test", "default system")
+        provider.client = Mock()
+        barrier = threading.Barrier(8)
+
+        def create(**kwargs):
+            barrier.wait(timeout=5)  # all calls in flight together
+            return Mock(content=[Mock(text=kwargs["system"])])
+
+        provider.client.messages.create.side_effect = create
+        with patch.object(LLMClient, "_create_provider", return_value=provider):
+            client = LLMClient({"provider": "claude", "api_key": "key", "model": "claude-test", "system_prompt": "default system"})
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(
+                lambda i: client.generate_content(f"prompt {i}", system_prompt=f"system {i}", use_cache=False),
+                range(8)
+            ))
+
+        assert results == [f"system {i}" for i in range(8)]
+        assert provider.get_system_prompt() == "default system"
+
+
+class TestStreamContent:
+
+    def test_stream_yields_chunks_and_fills_cache(self):
+        """Test that streamed chunks arrive in order and the full text is cached"""
+        from src import llm_cache
+        llm_cache.configure_llm_cache({"enabled": True, "backend": "memory"})
+        try:
+            provider = Mock(model="m")
+            provider.get_system_prompt.return_value = "sys"
+            provider.stream_description.return_value = iter(["Hel", "lo"])
+            with patch.object(LLMClient, "_create_provider", return_value=provider):
+                client = LLMClient({"provider": "openai", "api_key": "k", "model": "m", "system_prompt": "sys"})
+
+            assert list(client.stream_content("prompt")) == ["Hel", "lo"]
+            assert list(client.stream_content("prompt")) == ["Hello"]
+            assert client.generate_content("prompt") == "Hello"
+            assert provider.stream_description.call_count == 1
+            provider.generate_description.assert_not_called()
+        finally:
+            llm_cache._llm_cache = None
+
+    def test_truncated_or_abandoned_responses_are_not_cached(self):
+        """Test that completions cut off at max_tokens, and streams read only in part, skip the cache"""
+        from src import llm_cache
+        llm_cache.configure_llm_cache({"enabled": True, "backend": "memory"})
+        try:
+            provider = Mock(model="m")
+            provider.get_system_prompt.return_value = "sys"
+
+            def truncated_stream(*args, **kwargs):
+                yield "Hel"
+                _note_finish_reason("length")
+
+            def truncated_text(*args, **kwargs):
+                _note_finish_reason("max_tokens")
+                return "Hel"
+
+            provider.stream_description.side_effect = truncated_stream
+            provider.generate_description.side_effect = truncated_text
+            with patch.object(LLMClient, "_create_provider", return_value=provider):
+                client = LLMClient({"provider": "claude", "api_key": "k", "model": "m", "system_prompt": "sys"})
+
+            assert list(client.stream_content("prompt")) == ["Hel"]
+            assert client.generate_content("prompt") == "Hel"
+            assert client.generate_content("prompt") == "Hel"
+            assert provider.generate_description.call_count == 2
+
+            provider.stream_description.side_effect = lambda *args, **kwargs: iter(["Hel", "lo"])
+            stream = client.stream_content("other prompt")
+            assert next(stream) == "Hel"
+            stream.close()
+            assert list(client.stream_content("other prompt")) == ["Hel", "lo"]
+            assert provider.stream_description.call_count == 3
+        finally:
+            llm_cache._llm_cache = None
@@ -0,0 +1,102 @@
+"""
+Tests for the per provider/model LLM rate limiter
+"""
+import pytest
+from unittest.mock import Mock, patch
+
+from src import llm_rate_limiter
+from src.llm_rate_limiter import LLMRateLimiter, TokenBucket, AdaptiveConcurrency, get_retry_after, configure_llm_rate_limiter
+from src.llm_client import LLMClient
+
+
+class FakeRateLimitError(Exception):
+    """Shaped like the OpenAI/Anthropic SDK RateLimitError"""
+
+    def __init__(self, retry_after=None):
+        super().__init__("429 Too Many Requests")
+        self.status_code = 429
+        self.response = Mock(headers={"retry-after": retry_after} if retry_after is not None else {})
+
+
+@pytest.fixture(autouse=True)
+def no_global_limiter():
+    yield
+    llm_rate_limiter._rate_limiter = None
+
+
+class TestLLMRateLimiter:
+
+    def test_token_bucket_reports_wait_when_empty(self):
+        """Test that an exhausted bucket returns the refill wait"""
+        bucket = TokenBucket(60)  # one per second
+        assert bucket.take(60) == 0
+        assert bucket.take(1) == pytest.approx(1.0, abs=0.05)
+
+    def test_aimd_window(self):
+        """Test that the window halves on rate limit and grows back additively"""
+        window = AdaptiveConcurrency(max_limit=8)
+        window.on_rate_limited()
+        assert int(window.limit) == 4
+        window.on_rate_limited()
+        assert int(window.limit) == 2
+        for _ in range(3):
+            window.on_success()
+        assert 3 <= window.limit < 4
+
+    def test_retries_after_retry_after(self):
+        """Test that a 429 is retried after the provider's Retry-After"""
+        sleeps = []
+        limiter = LLMRateLimiter(sleep=sleeps.append)
+        func = Mock(side_effect=[FakeRateLimitError(retry_after="3"), "ok"])
+
+        assert limiter.call("openai", "gpt", func) == "ok"
+        assert func.call_count == 2
+        assert sleeps and sleeps[0] == pytest.approx(3.0, abs=0.1)
+        stats = limiter.stats()
+        assert stats["rate_limited"] == 1
+        assert stats["models"]["openai:gpt"]["concurrency_limit"] == 4
+
+    def test_gives_up_after_max_retries(self):
+        """Test that persistent rate limiting is raised to the caller"""
+        limiter = LLMRateLimiter(max_retries=2, sleep=lambda s: None)
+        func = Mock(side_effect=FakeRateLimitError())
+        with pytest.raises(FakeRateLimitError):
+            limiter.call("claude", "m", func)
+        assert func.call_count == 3
+
+    def test_other_errors_not_retried(self):
+        """Test that non-429 errors pass straight through"""
+        limiter = LLMRateLimiter(sleep=lambda s: None)
+        func = Mock(side_effect=ValueError("bad request"))
+        with pytest.raises(ValueError):
+            limiter.call("claude", "m", func)
+        assert func.call_count == 1
+
+    def test_rpm_bucket_throttles(self):
+        """Test that the RPM bucket makes the second call wait"""
+        sleeps = []
+        limiter = LLMRateLimiter(model_limits={"openai:gpt": {"rpm": 1}}, sleep=sleeps.append)
+        limiter.call("openai", "gpt", lambda: "a")
+        with patch.object(TokenBucket, "take", side_effect=[30.0, 0.0, 0.0]):
+            limiter.call("openai", "gpt", lambda: "b")
+        assert sleeps == [30.0]
+
+    def test_retry_after_ms_header(self):
+        """Test that retry-after-ms takes precedence"""
+        error = Exception()
+        error.response = Mock(headers={"retry-after-ms": "1500", "retry-after": "9"})
+        assert get_retry_after(error) == 1.5
+
+    def test_llm_client_goes_through_limiter(self):
+        """Test that LLMClient.generate_content retries a rate-limited provider call"""
+        configure_llm_rate_limiter({"enabled": True, "backend": "memory"})
+        llm_rate_limiter.get_llm_rate_limiter()._sleep = lambda s: None
+        with patch.object(LLMClient, "_create_provider") as create_provider:
+            provider = Mock(model="gpt-test")
+            provider.get_system_prompt.return_value = "sys"
+            provider.generate_description.side_effect = [FakeRateLimitError(), "answer"]
+            create_provider.return_value = provider
+            client = LLMClient({"provider": "openai", "api_key": "k", "model": "gpt-test", "system_prompt": "sys"})
+
+        assert client.generate_content("prompt", use_cache=False) == "answer"
+        assert provider.generate_description.call_count == 2
@@ -0,0 +1,74 @@
+"""
+Tests for the pooled LLM provider registry
+"""
+from unittest.mock import Mock, patch
+
+from src.llm_registry import LLMProviderRegistry
+from src.llm_client import ClaudeProvider
+
+
+def claude_config(**overrides):
+    config = {"provider": "claude", "api_key": "key", "model": "claude-test",
+              "system_prompt": "default system", "temperature": 0.7, "max_tokens": None}
+    config.update(overrides)
+    return config
+
+
+class TestLLMProviderRegistry:
+
+    def test_reuses_sdk_client_across_overrides(self):
+        """Test that per-request settings share one SDK client"""
+        registry = LLMProviderRegistry()
+        first = registry.get_provider(claude_config())
+        second = registry.get_provider(claude_config(system_prompt="other", temperature=0.1, max_tokens=500))
+
+        assert first.client is second.client
+        assert first.system_prompt == "default system"
+        assert (second.system_prompt, second.temperature, second.default_max_tokens) == ("other", 0.1, 500)
+        assert first.default_max_tokens == 8000
+        assert registry.stats()["created"] == 1
+        assert registry.stats()["reused"] == 1
+
+    def test_distinct_keys_get_distinct_clients(self):
+        """Test that model and api_key are part of the pool key"""
+        registry = LLMProviderRegistry()
+        base = registry.get_provider(claude_config())
+        assert registry.get_provider(claude_config(model="claude-other")).client is not base.client
+        assert registry.get_provider(claude_config(api_key="other-key")).client is not base.client
+        assert registry.stats()["size"] == 3
+
+    def test_idle_clients_are_evicted_and_rebuilt(self):
+        """Test that clients unused past idle_seconds are dropped from the pool and rebuilt on next use"""
+        registry = LLMProviderRegistry(idle_seconds=60)
+        with patch("src.llm_registry.time.time", return_value=1000.0):
+            old = registry.get_provider(claude_config())
+        with patch("src.llm_registry.time.time", return_value=1100.0):
+            new = registry.get_provider(claude_config())
+
+        assert new.client is not old.client
+        assert registry.stats()["evicted"] == 1
+
+    def test_client_handed_out_before_eviction_keeps_working(self):
+        """Test that evicting a provider does not close the SDK client held by earlier clients"""
+        registry = LLMProviderRegistry(idle_seconds=60, max_providers=1)
+        with patch("src.llm_registry.time.time", return_value=1000.0):
+            client = registry.get_client(claude_config())
+        with patch("src.llm_registry.time.time", return_value=1100.0):
+            registry.get_provider(claude_config(model="claude-other"))
+
+        sdk_client = client.provider.client
+        assert registry.stats()["evicted"] == 1
+        assert not sdk_client.is_closed()
+        response = Mock(stop_reason="end_turn", content=[Mock(text="still works")], usage=None)
+        with patch.object(sdk_client.messages, "create", return_value=response):
+            assert client.generate_content("prompt", use_cache=False) == "still works"
+
+    def test_get_client_does_not_mutate_pooled_provider(self):
+        """Test that set_system_prompt on one client leaves other clients alone"""
+        registry = LLMProviderRegistry()
+        client_a = registry.get_client(claude_config())
+        client_b = registry.get_client(claude_config())
+        client_a.set_system_prompt("changed")
+
+        assert isinstance(client_b.provider, ClaudeProvider)
+        assert client_b.get_system_prompt() == "default system"
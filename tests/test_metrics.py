@@ -0,0 +1,94 @@
+"""
+Tests for the Prometheus-style metrics registry and outbound call instrumentation
+"""
+import pytest
+import requests
+from unittest.mock import patch
+from requests.adapters import HTTPAdapter
+
+from src.metrics import (
+    LLM_ERRORS, OUTBOUND_DURATION, OUTBOUND_ERRORS, MetricsRegistry, instrument_session, track_llm,
+)
+
+
+class TestMetricsRegistry:
+
+    def test_renders_text_exposition_format(self):
+        """Test counter, gauge and cumulative histogram samples"""
+        registry = MetricsRegistry()
+        calls = registry.counter("calls_total", "Calls", ["service"])
+        depth = registry.gauge("depth", "Depth")
+        latency = registry.histogram("latency_seconds", "Latency", ["service"], buckets=(0.1, 1.0))
+        calls.inc(service="jira")
+        calls.inc(2, service="jira")
+        depth.set(4)
+        for value in (0.05, 0.5, 3.0):
+            latency.observe(value, service="jira")
+
+        text = registry.render()
+        assert "# TYPE calls_total counter" in text
+        assert 'calls_total{service="jira"} 3' in text
+        assert "depth 4" in text
+        assert 'latency_seconds_bucket{service="jira",le="0.1"} 1' in text
+        assert 'latency_seconds_bucket{service="jira",le="1"} 2' in text
+        assert 'latency_seconds_bucket{service="jira",le="+Inf"} 3' in text
+        assert 'latency_seconds_count{service="jira"} 3' in text
+        assert 'latency_seconds_sum{service="jira"} 3.55' in text
+
+    def test_rejects_wrong_labels(self):
+        """Test that label names must match the metric's declaration"""
+        registry = MetricsRegistry()
+        with pytest.raises(ValueError):
+            registry.counter("calls_total", "Calls", ["service"]).inc(host="x")
+        with pytest.raises(ValueError):
+            registry.gauge("calls_total", "Calls")
+
+    def test_collectors_run_before_render(self):
+        """Test that collectors refresh gauges at scrape time"""
+        registry = MetricsRegistry()
+        depth = registry.gauge("depth", "Depth")
+        registry.add_collector(lambda: depth.set(7))
+        assert "depth 7" in registry.render()
+
+
+def http_response(request, status_code):
+    """A real requests.Response for the adapter to return (Session.send runs hooks and cookies on it)"""
+    response = requests.Response()
+    response.status_code = status_code
+    response.request = request
+    response.url = request.url
+    response._content = b""
+    return response
+
+
+class TestOutboundInstrumentation:
+
+    def test_session_requests_are_timed_and_failures_counted(self):
+        """Test that an instrumented session records latency, 5xx responses and exceptions"""
+        session = instrument_session(requests.Session(), "test-confluence")
+        outcomes = iter([200, 503, requests.ConnectionError("down")])
+
+        def send(request, **kwargs):
+            outcome = next(outcomes)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return http_response(request, outcome)
+
+        before = OUTBOUND_DURATION.count(service="test-confluence", method="GET")
+        with patch.object(HTTPAdapter, "send", side_effect=send):
+            session.get("https://example.invalid/a")
+            session.get("https://example.invalid/b")
+            with pytest.raises(requests.ConnectionError):
+                session.get("https://example.invalid/c")
+
+        assert OUTBOUND_DURATION.count(service="test-confluence", method="GET") == before + 3
+        assert OUTBOUND_ERRORS.value(service="test-confluence", method="GET", reason="http_503") == 1
+        assert OUTBOUND_ERRORS.value(service="test-confluence", method="GET", reason="ConnectionError") == 1
+
+    def test_llm_errors_are_labelled_by_provider_and_model(self):
+        """Test that a failing LLM call is counted with its provider, model and exception type"""
+        with pytest.raises(TimeoutError):
+            with track_llm("test-provider", "model-a", "json"):
+                raise TimeoutError("slow")
+        assert LLM_ERRORS.value(provider="test-provider", model="model-a", operation="json",
+                                reason="TimeoutError") == 1
@@ -201,14 +201,8 @@ class TestPRDStorySyncEndpoint:
                 mock_planning_service._get_custom_field_value = Mock(return_value='https://test.atlassian.net/wiki/pages/123')
                 mock_get_generator.return_value = mock_generator
                 
-                # Mock Redis pool
-                mock_redis = AsyncMock()
-                mock_redis.enqueue_job = AsyncMock()
-                
-                async def mock_get_redis():
-                    return mock_redis
-                
-                with patch('api.job_queue.get_redis_pool', side_effect=mock_get_redis):
+                # Mock the job scheduler
+                with patch('api.job_scheduler.submit_job', AsyncMock()):
                     request = PRDStorySyncRequest(
                         epic_key="EPIC-123",
                         dry_run=False,
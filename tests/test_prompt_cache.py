@@ -0,0 +1,75 @@
+"""
+Tests for provider-side prompt prefix caching
+"""
+import pytest
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+from src.prompt_cache import extract_prompt_cache_usage, get_prompt_cache_stats, record_prompt_cache_usage
+from src.llm_client import LLMClient, ClaudeProvider
+
+
+@pytest.fixture(autouse=True)
+def reset_stats():
+    get_prompt_cache_stats().reset()
+    yield
+    get_prompt_cache_stats().reset()
+
+
+def make_client(provider):
+    with patch.object(LLMClient, "_create_provider", return_value=provider):
+        return LLMClient({"provider": "openai", "api_key": "k", "model": "m", "system_prompt": "sys"})
+
+
+class TestPromptCache:
+
+    def test_extracts_anthropic_usage(self):
+        """Test that Anthropic input counts include cache reads and writes"""
+        usage = SimpleNamespace(input_tokens=100, cache_read_input_tokens=900, cache_creation_input_tokens=0)
+        assert extract_prompt_cache_usage(usage) == {"input_tokens": 1000, "cached_tokens": 900, "cache_write_tokens": 0}
+
+    def test_extracts_openai_and_gemini_usage(self):
+        """Test OpenAI prompt_tokens_details and Gemini usage_metadata shapes"""
+        openai_usage = SimpleNamespace(prompt_tokens=2048, prompt_tokens_details=SimpleNamespace(cached_tokens=1024))
+        assert extract_prompt_cache_usage(openai_usage)["cached_tokens"] == 1024
+        gemini_usage = {"prompt_token_count": 500, "cached_content_token_count": 400}
+        assert extract_prompt_cache_usage(gemini_usage) == {"input_tokens": 500, "cached_tokens": 400, "cache_write_tokens": 0}
+
+    def test_stats_hit_rate(self):
+        """Test that hits and cached token ratios are aggregated per model"""
+        record_prompt_cache_usage("openai", "gpt", SimpleNamespace(prompt_tokens=1000, prompt_tokens_details=None))
+        record_prompt_cache_usage("openai", "gpt", SimpleNamespace(prompt_tokens=1000, prompt_tokens_details=SimpleNamespace(cached_tokens=800)))
+        record_prompt_cache_usage("openai", "gpt", Mock())  # unrecognised usage is ignored
+        stats = get_prompt_cache_stats().stats()
+        assert stats["requests"] == 2
+        assert stats["hit_rate"] == 0.5
+        assert stats["models"]["openai:gpt"]["cached_token_ratio"] == 0.4
+
+    def test_prefix_prepended_for_automatic_caching(self):
+        """Test that providers without cache_control get the prefix at the start of the prompt"""
+        provider = Mock(model="m", temperature=0.7, supports_cache_control=False)
+        provider.generate_description.return_value = "ok"
+        client = make_client(provider)
+        client.generate_content("story part", system_prompt="sys", use_cache=False, cacheable_prefix="EPIC CONTEXT\n")
+        args, kwargs = provider.generate_description.call_args
+        assert args[0] == "EPIC CONTEXT\nstory part"
+        assert "cacheable_prefix" not in kwargs
+
+    def test_prefix_passed_to_cache_control_provider(self):
+        """Test that Claude-style providers receive the prefix separately"""
+        provider = Mock(model="m", temperature=0.7, supports_cache_control=True)
+        provider.generate_json.return_value = '{"a": 1}'
+        client = make_client(provider)
+        client.generate_content_json("story part", use_cache=False, cacheable_prefix="EPIC CONTEXT\n")
+        args, kwargs = provider.generate_json.call_args
+        assert args[0] == "story part"
+        assert kwargs["cacheable_prefix"] == "EPIC CONTEXT\n"
+
+    def test_claude_marks_system_and_prefix(self):
+        """Test that Claude requests carry ephemeral cache_control breakpoints"""
+        params = ClaudeProvider._message_params("story part", "sys", "EPIC CONTEXT\n")
+        assert params["system"][0]["cache_control"] == {"type": "ephemeral"}
+        blocks = params["messages"][0]["content"]
+        assert blocks[0] == {"type": "text", "text": "EPIC CONTEXT\n", "cache_control": {"type": "ephemeral"}}
+        assert blocks[1] == {"type": "text", "text": "story part"}
+        assert ClaudeProvider._message_params("p", "sys", None) == {"system": "sys", "messages": [{"role": "user", "content": "p"}]}
@@ -0,0 +1,125 @@
+"""
+Tests for Draft PR stage timings and the analytics service that reports them
+"""
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.analytics import AnalyticsService
+from src.stage_timings import StageTimingStore, percentile
+
+
+@pytest.fixture(params=["memory", "redis"])
+def store(request):
+    if request.param == "memory":
+        return StageTimingStore()
+    fakeredis = pytest.importorskip("fakeredis")
+    return StageTimingStore(fakeredis.FakeRedis())
+
+
+class TestStageTimingStore:
+
+    def test_percentiles_per_stage(self, store):
+        """Test that the summary reports nearest-rank p50/p95 and excludes failed spans from durations"""
+        now = time.time()
+        for i in range(1, 21):
+            store.record(f"job-{i}", "PLANNING", now - 100 + i, now - 100 + i + i, ok=True)
+        store.record("job-x", "PLANNING", now - 50, now - 49, ok=False)
+
+        summary = store.summary()["PLANNING"]
+        assert summary["count"] == 21 and summary["failed"] == 1
+        assert summary["p50"] == 10 and summary["p95"] == 19
+        assert summary["avg"] == 10.5
+
+    def test_date_range_and_job_filter(self, store):
+        """Test that spans are selected by start time and job id"""
+        now = datetime.now()
+        old = (now - timedelta(days=2)).timestamp()
+        recent = (now - timedelta(hours=1)).timestamp()
+        store.record("job-old", "VERIFYING", old, old + 30)
+        store.record("job-new", "VERIFYING", recent, recent + 5)
+        store.record("job-other", "VERIFYING", recent, recent + 7)
+
+        assert store.summary(now - timedelta(days=1))["VERIFYING"]["count"] == 2
+        assert store.summary(now - timedelta(days=1), job_ids={"job-new"})["VERIFYING"]["p95"] == 5
+        assert store.summary(end=now - timedelta(days=1))["VERIFYING"]["p50"] == 30
+
+    def test_timer_records_sub_steps_and_failures(self, store):
+        """Test that the timer names sub-steps and records exceptions as failed spans"""
+        with store.timer("job-1", "APPLYING", "opencode_run"):
+            pass
+        with pytest.raises(RuntimeError):
+            with store.timer("job-1", "PACKAGING", "push"):
+                raise RuntimeError("push rejected")
+
+        assert store.stages() == ["APPLYING.opencode_run", "PACKAGING.push"]
+        assert store.spans("APPLYING.opencode_run")[0]["ok"] is True
+        assert store.spans("PACKAGING.push")[0]["ok"] is False
+
+    def test_retention_prunes_old_spans(self, store):
+        """Test that spans past the retention window are dropped on write"""
+        store.retention_seconds = 3600
+        now = time.time()
+        store.record("job-1", "DRAFTING", now - 7200, now - 7190)
+        store.record("job-2", "DRAFTING", now - 10, now)
+        assert [s["job_id"] for s in store.spans("DRAFTING")] == ["job-2"]
+
+    def test_percentile_of_empty_list(self):
+        assert percentile([], 95) is None
+
+
+class TestAnalyticsService:
+
+    def test_stats_include_stage_durations(self):
+        """Test that stage averages and percentiles come from the timing store for the filtered jobs"""
+        store = StageTimingStore()
+        started = datetime.now() - timedelta(minutes=10)
+        jobs = [
+            {"job_id": "job-1", "status": "completed", "stage": "COMPLETED",
+             "started_at": started, "completed_at": started + timedelta(seconds=100)},
+            {"job_id": "job-2", "status": "failed", "stage": "FAILED", "error": "Verification failed",
+             "started_at": started.isoformat(), "completed_at": (started + timedelta(seconds=50)).isoformat()},
+        ]
+        base = started.timestamp()
+        store.record("job-1", "PLANNING", base, base + 20)
+        store.record("job-2", "PLANNING", base, base + 40)
+        store.record("job-1", "VERIFYING", base + 60, base + 90)
+        store.record("job-unlisted", "PLANNING", base, base + 1000)
+
+        async def retriever():
+            return jobs
+
+        stats = asyncio.run(AnalyticsService(retriever, store).get_stats(start_date=started - timedelta(minutes=1)))
+        assert stats["total_jobs"] == 2 and stats["failed_jobs"] == 1
+        assert stats["avg_duration_seconds"] == 75.0
+        assert stats["avg_planning_duration"] == 30.0
+        assert stats["avg_verifying_duration"] == 30.0
+        assert stats["avg_applying_duration"] is None
+        assert stats["stage_durations"]["PLANNING"]["p95"] == 40
+        assert stats["common_failure_reasons"] == [{"reason": "Verification failed", "count": 1}]
+
+    def test_filters_by_date_and_status(self):
+        """Test that _get_filtered_jobs applies the date range and status"""
+        now = datetime.now()
+        jobs = [
+            {"job_id": "a", "status": "completed", "started_at": now - timedelta(days=3)},
+            {"job_id": "b", "status": "completed", "started_at": now - timedelta(hours=1)},
+            {"job_id": "c", "status": "failed", "started_at": now - timedelta(hours=1)},
+        ]
+        service = AnalyticsService(lambda: jobs)
+        result = asyncio.run(service.get_job_analytics(start_date=now - timedelta(days=1), status="completed"))
+        assert [j["job_id"] for j in result] == ["b"]
+
+    def test_filters_by_timezone_aware_date(self):
+        """Test that aware query dates compare with the naive local times jobs store"""
+        now = datetime.now()
+        jobs = [
+            {"job_id": "a", "status": "completed", "started_at": now - timedelta(days=3)},
+            {"job_id": "b", "status": "completed", "started_at": (now - timedelta(hours=1)).isoformat()},
+        ]
+        service = AnalyticsService(lambda: jobs)
+        start = datetime.now(timezone.utc) - timedelta(days=1)
+        result = asyncio.run(service.get_job_analytics(start_date=start, end_date=start + timedelta(days=2)))
+        assert [j["job_id"] for j in result] == ["b"]
@@ -165,6 +165,27 @@ class TestTeamBasedTaskGenerator:
         assert sample_story.summary in prompt
         assert "3 days" in prompt
 
+    def test_shared_epic_context_leads_prompt(self, task_generator, sample_story):
+        """Test that PRD and additional context form a story-independent prefix"""
+        prd = {"title": "Checkout PRD", "summary": "One-click checkout", "sections": {}}
+        other_story = StoryPlan(summary="Another story", description="Different work", acceptance_criteria=[])
+
+        prefix, prompt = task_generator._create_team_separation_prompt_parts(
+            sample_story, StoryType.USER_WORKFLOW, 3, prd_content=prd, additional_context="Use the payments SDK"
+        )
+        other_prefix, other_prompt = task_generator._create_team_separation_prompt_parts(
+            other_story, StoryType.USER_WORKFLOW, 3, prd_content=prd, additional_context="Use the payments SDK"
+        )
+
+        assert "Checkout PRD" in prefix and "Use the payments SDK" in prefix
+        assert sample_story.summary not in prefix
+        assert prefix == other_prefix
+        assert sample_story.summary in prompt and "Checkout PRD" not in prompt
+        full_prompt = task_generator._create_team_separation_prompt(
+            sample_story, StoryType.USER_WORKFLOW, 3, prd_content=prd, additional_context="Use the payments SDK"
+        )
+        assert full_prompt == prefix + prompt
+
     def test_ai_response_parsing(self, task_generator, sample_story):
         """Test parsing of AI response into tasks"""
         ai_response = """
@@ -627,3 +648,59 @@ Expected Outcome: Comprehensive test coverage
         # Check that dependency relationships were simulated
         blocking_relationships = [r for r in results["relationships_created"] if r["type"] == "Blocks"]
         assert len(blocking_relationships) > 0, "Should have blocking relationships"
+
+
+class TestStreamingUnifiedGeneration:
+    """Test streamed unified task+test generation"""
+
+    TASK_JSON = '{"summary": "%s", "team": "backend", "purpose": "p", "scopes": [], "test_cases": [], "cycle_time_estimate": {"total_days": 1}}'
+
+    @pytest.fixture
+    def story(self):
+        return StoryPlan(summary="Streamed story", description="d", acceptance_criteria=[], test_cases=[], epic_key="EP-1")
+
+    def make_generator(self, chunks):
+        llm_client = Mock(spec=LLMClient)
+        llm_client.stream_content.return_value = iter(chunks)
+        return TeamBasedTaskGenerator(llm_client, Mock(spec=PlanningPromptEngine))
+
+    def test_tasks_materialised_and_reported_as_they_stream(self, story):
+        """Test that each task is built when its object completes and progress is reported"""
+        body = "[" + self.TASK_JSON % "First" + ", " + self.TASK_JSON % "Second" + "]"
+        chunks = [body[i:i + 25] for i in range(0, len(body), 25)]
+        generator = self.make_generator(chunks)
+        updates = []
+
+        from src.progress import progress_reporter
+        with progress_reporter(updates.append):
+            tasks = generator._stream_unified_tasks("prompt", story)
+
+        assert [t.summary for t in tasks] == ["First", "Second"]
+        assert [u["streamed_tasks"] for u in updates if "ready" in u["message"]] == [1, 2]
+
+    def test_truncated_stream_keeps_completed_tasks(self, story):
+        """Test that a response cut off mid-array keeps the tasks that finished"""
+        body = "```json\n[" + self.TASK_JSON % "Done" + ", {\"summary\": \"Cut o"
+        generator = self.make_generator([body])
+
+        tasks = generator._stream_unified_tasks("prompt", story)
+        assert [t.summary for t in tasks] == ["Done"]
+
+    def test_stream_error_after_tasks_keeps_them(self, story):
+        """Test that a mid-stream provider error does not discard finished tasks"""
+        def chunks():
+            yield "[" + self.TASK_JSON % "Kept" + ","
+            raise ConnectionError("stream reset")
+
+        generator = self.make_generator(chunks())
+        tasks = generator._stream_unified_tasks("prompt", story)
+        assert [t.summary for t in tasks] == ["Kept"]
+
+    def test_unparseable_stream_falls_back_to_json_mode(self, story):
+        """Test that a streamed response that does not parse is retried with enforced JSON mode"""
+        generator = self.make_generator(["Here are the tasks you asked for."])
+        generator.llm_client.generate_content_json.return_value = "[" + self.TASK_JSON % "From JSON mode" + "]"
+
+        tasks = generator._stream_unified_tasks("prompt", story, cacheable_prefix="epic context")
+        assert [t.summary for t in tasks] == ["From JSON mode"]
+        assert generator.llm_client.generate_content_json.call_args.kwargs["cacheable_prefix"] == "epic context"
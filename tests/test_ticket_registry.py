@@ -0,0 +1,97 @@
+"""
+Tests for the shared ticket-job registry
+"""
+import pytest
+
+from api.ticket_registry import TicketRegistry
+
+
+@pytest.fixture(params=["memory", "redis"])
+def registry(request):
+    if request.param == "memory":
+        yield TicketRegistry()
+        return
+    fakeredis = pytest.importorskip("fakeredis")
+    pytest.importorskip("lupa")
+    registry = TicketRegistry(fakeredis.FakeRedis(), lease_seconds=60, queued_lease_seconds=600)
+    yield registry
+    registry.close()
+
+
+class TestTicketRegistry:
+
+    def test_claim_conflicts_with_other_job(self, registry):
+        """Test that a ticket held by another job is not claimed, but the holder can re-claim it"""
+        assert registry.claim_many(["PROJ-1", "PROJ-2"], "job-1") == {}
+        assert registry.claim_many(["PROJ-2", "PROJ-3"], "job-2") == {"PROJ-2": "job-1"}
+        assert registry.claim("PROJ-1", "job-1") is None
+        assert registry.get_many(["PROJ-1", "PROJ-2", "PROJ-3", "PROJ-4"]) == {
+            "PROJ-1": "job-1", "PROJ-2": "job-1", "PROJ-3": "job-2", "PROJ-4": None}
+
+    def test_stale_holder_is_taken_over(self, registry):
+        """Test that tickets of a job that is no longer active are taken over"""
+        registry.claim_many(["PROJ-1", "PROJ-2"], "done-job")
+        registry.claim("PROJ-3", "live-job")
+        conflicts = registry.claim_many(["PROJ-1", "PROJ-2", "PROJ-3"], "job-2",
+                                        is_active=lambda job_id: job_id == "live-job")
+        assert conflicts == {"PROJ-3": "live-job"}
+        assert registry["PROJ-1"] == "job-2" and registry["PROJ-2"] == "job-2"
+
+    def test_release_only_own_claims(self, registry):
+        """Test that release with a job id leaves other jobs' claims alone"""
+        registry.claim_many(["PROJ-1", "PROJ-2"], "job-1")
+        registry.claim("PROJ-3", "job-2")
+        assert registry.release_many(["PROJ-1", "PROJ-3"], "job-1") == 1
+        assert "PROJ-1" not in registry and registry["PROJ-3"] == "job-2"
+        assert registry.release_many(job_id="job-1") == 1
+        assert set(registry) == {"PROJ-3"}
+        del registry["PROJ-3"]
+        assert len(registry) == 0
+
+    def test_bulk_claim(self, registry):
+        """Test claiming and releasing a large batch"""
+        tickets = [f"PROJ-{i}" for i in range(5000)]
+        assert registry.claim_many(tickets, "batch") == {}
+        assert len(registry) == 5000
+        assert registry.release_many(job_id="batch") == 5000
+        assert len(registry) == 0
+
+
+class TestRedisLeases:
+
+    @pytest.fixture
+    def redis_registry(self):
+        fakeredis = pytest.importorskip("fakeredis")
+        pytest.importorskip("lupa")
+        registry = TicketRegistry(fakeredis.FakeRedis(), lease_seconds=60, queued_lease_seconds=600)
+        yield registry
+        registry.close()
+
+    def test_queued_then_running_lease(self, redis_registry):
+        """Test that claims get the queued lease until the job runs, then the short running lease"""
+        redis_registry.claim_many(["PROJ-1", "PROJ-2"], "job-1")
+        assert 590_000 < redis_registry.redis.pttl("ticket:claim:PROJ-1") <= 600_000
+
+        redis_registry.track("job-1")
+        for ticket in ("PROJ-1", "PROJ-2"):
+            assert 50_000 < redis_registry.redis.pttl(f"ticket:claim:{ticket}") <= 60_000
+        redis_registry.claim("PROJ-3", "job-1")
+        assert redis_registry.redis.pttl("ticket:claim:PROJ-3") <= 60_000
+        redis_registry.untrack("job-1")
+
+    def test_renew_drops_tickets_taken_by_other_jobs(self, redis_registry):
+        """Test that renewing only extends tickets the job still holds"""
+        redis_registry.claim_many(["PROJ-1", "PROJ-2"], "job-1")
+        redis_registry.redis.delete("ticket:claim:PROJ-2")
+        redis_registry.claim("PROJ-2", "job-2")
+        assert redis_registry.renew(["job-1"]) == 1
+        assert redis_registry.redis.smembers("ticket:held:job-1") == {b"PROJ-1"}
+
+    def test_local_claims_move_to_redis(self):
+        """Test that claims made before Redis is configured are kept"""
+        fakeredis = pytest.importorskip("fakeredis")
+        pytest.importorskip("lupa")
+        registry = TicketRegistry()
+        registry["PROJ-1"] = "job-1"
+        registry.configure(fakeredis.FakeRedis())
+        assert registry.shared and registry["PROJ-1"] == "job-1"
@@ -146,7 +146,7 @@ class TestDuplicatePreventionSingleTicket:
     """Test duplicate prevention for single ticket generation"""
     
     @patch('api.routes.generation.get_generator')
-    @patch('api.routes.generation.get_redis_pool')
+    @patch('api.routes.generation.submit_job', new_callable=AsyncMock)
     @patch('api.routes.generation.get_current_user')
     @patch('api.routes.generation.get_active_job_for_ticket')
     def test_reject_duplicate_single_ticket(self, mock_get_active, mock_user, mock_redis, mock_generator):
@@ -193,7 +193,39 @@ class TestDuplicatePreventionSingleTicket:
         assert response.headers.get("X-Active-Job-Id") == job_id
     
     @patch('api.routes.generation.get_generator')
-    @patch('api.routes.generation.get_redis_pool')
+    @patch('api.routes.generation.submit_job', new_callable=AsyncMock)
+    @patch('api.routes.generation.get_current_user')
+    @patch('api.routes.generation.get_active_job_for_ticket', return_value=None)
+    def test_reject_ticket_claimed_after_check(self, mock_get_active, mock_user, mock_submit, mock_generator):
+        """Test that a job claiming the ticket between the check and the claim wins"""
+        from api.models.generation import SingleTicketRequest
+        
+        ticket_key = "PROJ-123"
+        jobs["other-job"] = JobStatus(
+            job_id="other-job",
+            job_type="single",
+            status="started",
+            progress={"message": "Processing..."},
+            started_at=datetime.now(),
+            ticket_key=ticket_key
+        )
+        register_ticket_job(ticket_key, "other-job")
+        
+        request = SingleTicketRequest(ticket_key=ticket_key, async_mode=True, update_jira=False)
+        response = TestClient(app).post(
+            "/generate/single",
+            json=request.dict(),
+            headers={"Authorization": "Bearer test"}
+        )
+        
+        assert response.status_code == 409
+        assert response.headers.get("X-Active-Job-Id") == "other-job"
+        assert list(jobs.keys()) == ["other-job"]
+        assert get_active_job_for_ticket(ticket_key) == "other-job"
+        mock_submit.assert_not_called()
+    
+    @patch('api.routes.generation.get_generator')
+    @patch('api.routes.generation.submit_job', new_callable=AsyncMock)
     @patch('api.routes.generation.get_current_user')
     def test_allow_reprocessing_after_completion(self, mock_user, mock_redis, mock_generator):
         """Test that tickets can be reprocessed after completion"""
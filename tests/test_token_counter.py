@@ -0,0 +1,81 @@
+"""
+Tests for token counting and context-window budgeting
+"""
+from unittest.mock import Mock, patch
+
+from src import token_counter
+from src.token_counter import (
+    HeuristicTokenCounter, TiktokenCounter, ContextBudget,
+    allocate_token_budget, get_context_window, get_token_counter
+)
+
+
+class FakeEncoding:
+    """One token per whitespace-separated word"""
+    name = "fake"
+
+    def encode(self, text, disallowed_special=()):
+        return text.split()
+
+    def decode(self, tokens):
+        return " ".join(tokens)
+
+
+class TestTokenCounting:
+
+    def test_heuristic_counts_code_and_cjk_denser_than_prose(self):
+        """Test that symbols and non-ASCII characters are not undercounted like len//4"""
+        counter = HeuristicTokenCounter()
+        assert counter.count("") == 0
+        assert counter.count("hello world") == 4
+        assert counter.count("a(b){c};") == 8
+        assert counter.count("你好世界") == 4
+
+    def test_counter_falls_back_without_vocabulary(self):
+        """Test that an unavailable tokenizer yields the heuristic counter"""
+        get_token_counter.cache_clear()
+        try:
+            with patch.object(token_counter, "_load_encoding", return_value=None):
+                assert isinstance(get_token_counter("openai", "gpt-4o"), HeuristicTokenCounter)
+            with patch.object(token_counter, "_load_encoding", return_value=FakeEncoding()):
+                counter = get_token_counter("claude", "claude-sonnet-4-5")
+                assert isinstance(counter, TiktokenCounter)
+                assert counter.count("one two three four") == 5  # 4 * 1.15 rounded up
+        finally:
+            get_token_counter.cache_clear()
+
+    def test_context_window_longest_prefix(self):
+        """Test model-prefix lookup of context windows"""
+        assert get_context_window("kimi", "moonshot-v1-32k") == 32768
+        assert get_context_window("openai", "gpt-4o-mini") == 128000
+        assert get_context_window("openai", "gpt-4") == 8192
+        assert get_context_window("unknown", "x") == token_counter.DEFAULT_CONTEXT_WINDOW
+
+
+class TestContextBudget:
+
+    def test_small_sections_kept_whole_rest_shared(self):
+        """Test weighted water-filling"""
+        allocation = allocate_token_budget(100, {"ticket": 10, "prd": 200, "rfc": 200})
+        assert allocation == {"ticket": 10, "prd": 45, "rfc": 45}
+
+        weighted = allocate_token_budget(90, {"prd": 200, "rfc": 200}, weights={"prd": 2.0})
+        assert weighted == {"prd": 60, "rfc": 30}
+
+    def test_everything_fits(self):
+        """Test that nothing is truncated when the window is large enough"""
+        assert allocate_token_budget(1000, {"a": 10, "b": 0}) == {"a": 10, "b": 0}
+
+    def test_fit_truncates_only_oversized_sections(self):
+        """Test that fit() truncates to the allowance with the caller's truncation"""
+        with patch.object(token_counter, "get_token_counter", return_value=TiktokenCounter(FakeEncoding())):
+            budget = ContextBudget("openai", "gpt-4o", max_output_tokens=0, safety_margin=0, context_window=12)
+        sections = {"ticket": "t1 t2", "prd": " ".join(f"p{i}" for i in range(20))}
+        truncate = Mock(side_effect=lambda text, limit: text[:limit])
+
+        fitted = budget.fit(sections, fixed_texts=["fixed"])
+        assert fitted["ticket"] == "t1 t2"
+        assert fitted["prd"].split() == [f"p{i}" for i in range(9)]
+
+        budget.fit(sections, fixed_texts=["fixed"], truncate=truncate)
+        truncate.assert_called_once()